@@ -14,7 +14,13 @@ from dotenv import load_dotenv, find_dotenv
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from src.scrapers.scraper_factory import ScraperOrchestrator, list_available_scrapers, run_scraper
+from src.scrapers.scraper_daemon import run_daemon
+from src.scrapers.task_worker import run_worker
+from src.scrapers.base_scraper import scholarships_found
+from src.scrapers.http_client import log_connection_stats
 from src.utils_python import ScrapingResult
+from src.utils_python.database_manager import DatabaseManagerFactory
+from src.utils_python.bulk_loader import BulkLoader, BulkLoadResult, read_scholarships_jsonl
 
 # Load environment variables (robustly find repo-root .env)
 # 1) Try to discover via cwd upwards
@@ -87,7 +93,7 @@ def run_single_scraper(scraper_name: str, environment: str = "local") -> Scrapin
     
     if result.success:
         logger.info(f"Scraper {scraper_name} completed successfully")
-        logger.info(f"Found {len(result.scholarships)} scholarships")
+        logger.info(f"Found {scholarships_found(result)} scholarships")
         logger.info(f"Inserted: {result.metadata.get('total_inserted', 0)}")
         logger.info(f"Updated: {result.metadata.get('total_updated', 0)}")
         
@@ -95,6 +101,7 @@ def run_single_scraper(scraper_name: str, environment: str = "local") -> Scrapin
             logger.warning(f"Encountered {len(result.errors)} errors")
             for error in result.errors:
                 logger.warning(f"  - {error}")
+        log_connection_stats()
     else:
         logger.error(f"❌ Scraper '{scraper_name}' failed")
         if "Could not create scraper" in str(result.errors):
@@ -127,8 +134,8 @@ def run_all_scrapers(environment: str = "local"):
     for scraper_name, result in results.items():
         logger.info(f"\n=== {scraper_name.upper()} ===")
         if result.success:
-            logger.info(f"Success: {len(result.scholarships)} scholarships found")
-            total_scholarships += len(result.scholarships)
+            logger.info(f"Success: {scholarships_found(result)} scholarships found")
+            total_scholarships += scholarships_found(result)
             total_inserted += result.metadata.get('total_inserted', 0)
             total_updated += result.metadata.get('total_updated', 0)
         else:
@@ -140,6 +147,26 @@ def run_all_scrapers(environment: str = "local"):
     logger.info(f"Total inserted: {total_inserted}")
     logger.info(f"Total updated: {total_updated}")
     logger.info(f"Total errors: {total_errors}")
+    log_connection_stats()
+
+
+def run_bulk_import(path: str, environment: str = "local") -> BulkLoadResult:
+    """Bulk load scholarships from a JSON Lines file into the scholarships table"""
+    logger.info(f"Bulk importing scholarships from {path} ({environment})")
+    
+    db_manager = DatabaseManagerFactory.create_database_manager(environment)
+    try:
+        result = BulkLoader(db_manager).load(read_scholarships_jsonl(path))
+    finally:
+        db_manager.disconnect()
+    
+    logger.info(f"Rows read: {result.rows}")
+    logger.info(f"Inserted: {result.inserted}")
+    logger.info(f"Updated: {result.updated}")
+    logger.info(f"Unchanged: {result.unchanged}")
+    if result.duplicates:
+        logger.info(f"Duplicate keys in input (last one kept): {result.duplicates}")
+    return result
 
 
 def main():
@@ -153,6 +180,10 @@ Examples:
   python main.py --scraper ai_discovery --environment local
   python main.py --list
   python main.py --all --environment local
+  python main.py --bulk-import scholarships.jsonl --environment local
+  python main.py --daemon --environment local
+  SCRAPER_TASK_QUEUE=1 python main.py --scraper careeronestop
+  python main.py --worker --environment local
   python main.py --lint
   python main.py --lint-fix
         """
@@ -169,6 +200,15 @@ Examples:
                        default='local',
                        choices=['local', 'dev', 'staging', 'prod'],
                        help='Environment to run in (default: local)')
+    parser.add_argument('--bulk-import',
+                       metavar='PATH',
+                       help='Bulk load scholarships from a JSON Lines file (one scholarship object per line)')
+    parser.add_argument('--daemon',
+                       action='store_true',
+                       help='Run scrapers on their website cadence in a long-lived process (health/metrics on SCRAPER_DAEMON_PORT)')
+    parser.add_argument('--worker',
+                       action='store_true',
+                       help='Process queued detail-page tasks from the shared task queue (start one per core/node)')
     parser.add_argument('--setup', 
                        action='store_true',
                        help='Set up local development environment')
@@ -220,6 +260,25 @@ Examples:
             print(f"  - {scraper}")
         return
     
+    # Bulk load a re-sync or replay file
+    if args.bulk_import:
+        try:
+            run_bulk_import(args.bulk_import, args.environment)
+        except Exception as e:
+            logger.error(f"Bulk import failed: {e}")
+            exit(1)
+        return
+    
+    # Long-running scheduler
+    if args.daemon:
+        run_daemon(args.environment)
+        return
+    
+    # Distributed detail-page worker
+    if args.worker:
+        run_worker(args.environment)
+        return
+    
     # Run all scrapers
     if args.all:
         run_all_scrapers(args.environment)
@@ -69,7 +69,7 @@ def run_conservative_ai_scraper():
         if result.success:
             logger.info("✅ Scraping completed successfully!")
             logger.info(f"📈 Results:")
-            logger.info(f"   - Scholarships found: {len(result.scholarships)}")
+            logger.info(f"   - Scholarships found: {result.metadata.get('total_found', len(result.scholarships))}")
             logger.info(f"   - Google API requests made: {scraper.google_requests_made}")
             logger.info(f"   - Processing time: {result.metadata.get('processing_time', 0):.2f} seconds")
             
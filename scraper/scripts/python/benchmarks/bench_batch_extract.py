@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Benchmark: wall time of ContentExtractionPipeline.batch_extract.
+
+Serves synthetic scholarship pages from a local HTTP server with simulated
+network latency, reachable under several loopback host names, and extracts
+them (fallback extraction, no OpenAI key):
+- one URL at a time with a fixed sleep after each (the old batch_extract),
+- the concurrent batch_extract with a per-host rate limit of the same delay,
+  fed from a generator.
+Results must match the sequential run URL for URL and in order (exits
+non-zero otherwise).
+
+Usage:
+    python scripts/python/benchmarks/bench_batch_extract.py --urls 24 --hosts 4 --latency 0.3
+"""
+
+import argparse
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from synthetic_data import SCRAPER_ROOT  # noqa: F401  (puts the scraper root on sys.path)
+
+from src.scrapers.content_extraction_pipeline import ContentExtractionPipeline
+from src.scrapers.rate_limiter import HostRateLimiter
+
+
+def page(index: int) -> bytes:
+    return (f'<html><head><title>Merit Scholarship {index}</title></head><body><main>'
+            f'<h1>Merit Scholarship {index}</h1><p>Award amount: ${1000 + index * 50:,}. '
+            f'Application deadline: March {1 + index % 28}, 2027.</p>'
+            f'<p>Eligibility: open to undergraduate students with a GPA of 3.0.</p>'
+            f'<p>Contact: awards{index}@example.org</p></main></body></html>').encode('utf-8')
+
+
+def make_handler(latency: float):
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            time.sleep(latency)
+            body = page(int(self.path.rsplit('/', 1)[-1]))
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/html; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+    return Handler
+
+
+def comparable(result):
+    return (result.success, [(s.title, s.award_amount, s.deadline, s.url, s.source_type) for s in result.scholarships])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--urls', type=int, default=24)
+    parser.add_argument('--hosts', type=int, default=4, help='Loopback host names (127.0.0.1, 127.0.0.2, ...)')
+    parser.add_argument('--latency', type=float, default=0.3, help='Simulated seconds per response')
+    parser.add_argument('--delay', type=float, default=1.0, help='Old global sleep / new per-host interval')
+    parser.add_argument('--in-flight', type=int, default=8)
+    args = parser.parse_args()
+
+    os.environ.pop('OPENAI_API_KEY', None)
+    server = ThreadingHTTPServer(('0.0.0.0', 0), make_handler(args.latency))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    port = server.server_address[1]
+    urls = [f'http://127.0.0.{1 + i % args.hosts}:{port}/awards/{i}' for i in range(args.urls)]
+    print(f"{args.urls} URLs on {args.hosts} hosts, {args.latency}s latency, {args.delay}s delay")
+
+    pipeline = ContentExtractionPipeline(rate_limiter=HostRateLimiter(args.delay))
+    pipeline.parse_pool.run(len, b'')  # start the parse workers outside the timing
+
+    start = time.perf_counter()
+    expected = []
+    for url in urls:
+        expected.append(pipeline.extract_from_url(url, 'bench'))
+        time.sleep(args.delay)
+    sequential = time.perf_counter() - start
+    print(f"{'sequential + sleep':>20}: {sequential:7.2f}s")
+
+    start = time.perf_counter()
+    results = pipeline.batch_extract((url for url in urls), ('bench' for _ in urls), max_in_flight=args.in_flight)
+    concurrent = time.perf_counter() - start
+    match = [comparable(r) for r in results] == [comparable(r) for r in expected]
+    print(f"{'batch_extract':>20}: {concurrent:7.2f}s  ({sequential / concurrent:.1f}x)  "
+          f"parity: {'ok' if match else 'MISMATCH'}  ({sum(len(r.scholarships) for r in results)} scholarships)")
+
+    pipeline.parse_pool.shutdown()
+    server.shutdown()
+    if not match:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
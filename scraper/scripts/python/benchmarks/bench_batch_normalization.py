@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Benchmark: column-wise batch normalization vs the per-row upsert path.
+
+Checks that `normalize_scholarship_batch` produces exactly the groups the
+per-row `_stamp_row` + `_scholarship_params` path produces, then times both.
+Exits non-zero on any mismatch.
+
+Usage:
+    python scripts/python/benchmarks/bench_batch_normalization.py --rows 50000
+"""
+
+import argparse
+import sys
+import time
+from datetime import datetime
+
+from synthetic_data import make_scholarships
+
+from src.utils_python import ScholarshipBatch
+from src.utils_python.batch_normalizer import normalize_scholarship_batch
+from src.utils_python.database_manager import DatabaseManager
+from src.utils_python.scholarship_batch import scholarship_row
+
+
+def per_row_groups(scholarships, now):
+    groups = {}
+    for scholarship in scholarships:
+        row = DatabaseManager._stamp_row(scholarship_row(scholarship), now)
+        columns, params = DatabaseManager._scholarship_params(row)
+        groups.setdefault(columns, []).append(params)
+    return groups
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Batch normalization parity and throughput')
+    parser.add_argument('--rows', type=int, default=50_000)
+    args = parser.parse_args()
+
+    scholarships = make_scholarships(args.rows)
+    batch = ScholarshipBatch(scholarships)
+    now = datetime(2026, 3, 1, 9, 30, 0)
+
+    start = time.perf_counter()
+    expected = per_row_groups(scholarships, now)
+    per_row_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    actual = normalize_scholarship_batch(batch, now)
+    batch_seconds = time.perf_counter() - start
+
+    if list(expected.keys()) != list(actual.keys()):
+        print("MISMATCH: group column sets or order differ")
+        sys.exit(1)
+    for columns, params in expected.items():
+        if params != actual[columns]:
+            print(f"MISMATCH in group {columns}")
+            sys.exit(1)
+
+    print(f"Parity OK: {args.rows:,} rows, {len(actual)} upsert groups")
+    print(f"  per-row path      {args.rows / per_row_seconds:>12,.0f} rows/s")
+    print(f"  column-wise path  {args.rows / batch_seconds:>12,.0f} rows/s "
+          f"({per_row_seconds / batch_seconds:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
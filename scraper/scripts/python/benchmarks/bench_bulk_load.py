@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Benchmark: batched upserts vs BulkLoader (LOAD DATA LOCAL INFILE + merge).
+
+Always measures how fast `BulkLoader.write_tsv` normalizes and writes synthetic
+scholarships. When a MySQL/MariaDB server is reachable through the MYSQL_*
+variables it also, in a scratch database created from
+server/database/schema.sql:
+- loads the rows with `save_scholarships` in batches and with `BulkLoader`,
+  and checks both leave identical scholarships tables,
+- bulk loads the same rows again (all unchanged), then a copy with some rows
+  changed and some new, and checks the inserted/updated/unchanged counts.
+Exits non-zero on a mismatch. The near-duplicate index is disabled so both
+paths write the exact keys.
+
+A local server for this benchmark:
+    docker run -d --name bench-mysql -p 3306:3306 -e MYSQL_ALLOW_EMPTY_PASSWORD=1 mysql:8 --local-infile=1
+
+Usage:
+    MYSQL_HOST=127.0.0.1 python scripts/python/benchmarks/bench_bulk_load.py --rows 20000
+"""
+
+import argparse
+import io
+import os
+import re
+import sys
+import time
+from dataclasses import replace
+
+from synthetic_data import SCRAPER_ROOT, make_scholarships
+
+os.environ['SCRAPER_NEAR_DUPLICATE_INDEX'] = ''
+
+import pymysql  # noqa: E402
+
+from src.utils_python import Scholarship  # noqa: E402
+from src.utils_python.bulk_loader import BULK_COLUMNS, BulkLoader  # noqa: E402
+from src.utils_python.database_manager import LocalDatabaseManager  # noqa: E402
+
+SCHEMA_PATH = os.path.join(SCRAPER_ROOT, '..', 'server', 'database', 'schema.sql')
+
+
+def scholarships_ddl() -> str:
+    with open(SCHEMA_PATH, 'r', encoding='utf-8') as handle:
+        schema = handle.read()
+    return re.search(r'CREATE TABLE IF NOT EXISTS scholarships \(.*?\n\);', schema, re.S).group(0)
+
+
+def snapshot(db: LocalDatabaseManager):
+    columns = [name for name in BULK_COLUMNS if name not in ('created_at', 'updated_at')]
+    cursor = db.get_connection().cursor()
+    cursor.execute(f"SELECT {', '.join(columns)} FROM scholarships ORDER BY title, organization, deadline")
+    rows = [tuple(str(row[name]) for name in columns) for row in cursor.fetchall()]
+    cursor.close()
+    return rows
+
+
+def truncate(db: LocalDatabaseManager):
+    cursor = db.get_connection().cursor()
+    cursor.execute("TRUNCATE TABLE scholarships")
+    db.get_connection().commit()
+    cursor.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=20_000)
+    parser.add_argument('--batch', type=int, default=1000, help='Rows per save_scholarships call')
+    parser.add_argument('--changed', type=float, default=0.1, help='Share of rows changed in the re-sync')
+    parser.add_argument('--new', type=float, default=0.05, help='Share of new rows in the re-sync')
+    parser.add_argument('--database', default='scholarships_bench', help='Scratch database (dropped afterwards)')
+    args = parser.parse_args()
+
+    rows = make_scholarships(args.rows)
+    offline = BulkLoader(LocalDatabaseManager())
+    start = time.perf_counter()
+    written = offline.write_tsv(rows, io.StringIO())
+    elapsed = time.perf_counter() - start
+    print(f"{'write_tsv':>24}: {written:,} rows in {elapsed:.2f}s ({written / elapsed:,.0f} rows/s)")
+
+    settings = dict(host=os.getenv('MYSQL_HOST', 'localhost'), port=int(os.getenv('MYSQL_PORT', '3306')),
+                    user=os.getenv('MYSQL_USER', 'root'), password=os.getenv('MYSQL_PASSWORD', ''))
+    try:
+        admin = pymysql.connect(charset='utf8mb4', autocommit=True, **settings)
+    except Exception as e:
+        print(f"MySQL not reachable ({e}); skipping the database comparison")
+        return
+
+    ok = True
+    cursor = admin.cursor()
+    cursor.execute(f"DROP DATABASE IF EXISTS {args.database}")
+    cursor.execute(f"CREATE DATABASE {args.database} CHARACTER SET utf8mb4 COLLATE utf8mb4_unicode_ci")
+    cursor.execute(f"USE {args.database}")
+    cursor.execute(scholarships_ddl())
+    cursor.execute("ALTER TABLE scholarships ADD COLUMN org_website VARCHAR(500) AFTER organization")
+    os.environ['MYSQL_DATABASE'] = args.database
+    try:
+        db = LocalDatabaseManager()
+        start = time.perf_counter()
+        for offset in range(0, len(rows), args.batch):
+            db.save_scholarships(rows[offset:offset + args.batch])
+        upsert_time = time.perf_counter() - start
+        expected = snapshot(db)
+        print(f"{'save_scholarships':>24}: {upsert_time:7.2f}s ({len(rows) / upsert_time:,.0f} rows/s)")
+
+        truncate(db)
+        loader = BulkLoader(db)
+        start = time.perf_counter()
+        result = loader.load(rows)
+        bulk_time = time.perf_counter() - start
+        match = snapshot(db) == expected and result.inserted == len(rows)
+        ok &= match
+        print(f"{'BulkLoader':>24}: {bulk_time:7.2f}s ({len(rows) / bulk_time:,.0f} rows/s, "
+              f"{upsert_time / bulk_time:.1f}x)  parity: {'ok' if match else 'MISMATCH'}")
+
+        result = loader.load(rows)
+        match = (result.inserted, result.updated, result.unchanged) == (0, 0, len(rows))
+        ok &= match
+        print(f"{'same rows again':>24}: {result}  {'ok' if match else 'MISMATCH'}")
+
+        changed = int(len(rows) * args.changed)
+        resync = [replace(row, min_award=row.min_award + 1) if i < changed else row for i, row in enumerate(rows)]
+        fresh = int(len(rows) * args.new)
+        resync += [Scholarship(title=f"New Scholarship {i}", organization='Bench Foundation', deadline='2027-05-01')
+                   for i in range(fresh)]
+        result = loader.load(resync)
+        match = (result.inserted, result.updated, result.unchanged) == (fresh, changed, len(rows) - changed)
+        ok &= match
+        print(f"{'re-sync':>24}: {result}  {'ok' if match else 'MISMATCH'}")
+        db.disconnect()
+    finally:
+        cursor.execute(f"DROP DATABASE IF EXISTS {args.database}")
+        admin.close()
+
+    if not ok:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
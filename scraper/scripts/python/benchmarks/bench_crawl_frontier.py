@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Benchmark: duplicate fetches and memory per URL for the crawl frontier.
+
+Replays a synthetic multi-domain link stream in which the same pages show up
+with fragments, trailing slashes, reordered query strings and tracking
+parameters. Compares the old raw-string `set` + `deque` bookkeeping with
+`CrawlFrontier` / `VisitedSet`, and checks that popped URLs are the ones
+that were pushed (the canonical form is only the duplicate key).
+
+Usage:
+    python scripts/python/benchmarks/bench_crawl_frontier.py --pages 200000
+"""
+
+import argparse
+import random
+import sys
+import time
+import tracemalloc
+from collections import deque
+
+from synthetic_data import SCRAPER_ROOT  # noqa: F401  (puts the scraper root on sys.path)
+
+from src.scrapers.crawl_frontier import CrawlFrontier
+
+DOMAINS = [f"https://www.foundation{index}.org" for index in range(40)]
+
+
+def link_stream(pages: int, links: int, seed: int = 7):
+    """Yield `links` hrefs pointing at `pages` distinct pages, in noisy variants."""
+    rng = random.Random(seed)
+    for _ in range(links):
+        page = rng.randrange(pages)
+        base = f"{DOMAINS[page % len(DOMAINS)]}/scholarships/{page}"
+        variant = rng.randrange(6)
+        if variant == 0:
+            yield base
+        elif variant == 1:
+            yield base + '/'
+        elif variant == 2:
+            yield base + f"#section-{rng.randrange(3)}"
+        elif variant == 3:
+            yield base + '?page=1&sort=deadline'
+        elif variant == 4:
+            yield base + '?sort=deadline&page=1'
+        else:
+            yield base + f"?utm_source=newsletter&utm_campaign=c{rng.randrange(50)}"
+
+
+def legacy_frontier(links):
+    crawled = set()
+    queue = deque()
+    for url in links:
+        if url not in crawled:
+            crawled.add(url)
+            queue.append(url)
+    return crawled, queue
+
+
+def check_original_urls() -> bool:
+    """The first variant of each page is fetched as linked; later variants are duplicates."""
+    frontier = CrawlFrontier()
+    pushed = ['https://Apply.Example.org/Awards/?b=2&a=1', 'https://apply.example.org/Awards?a=1&b=2#top',
+              'https://example.org/Scholarships/2026/']
+    queued = frontier.extend(pushed)
+    popped = [frontier.pop() for _ in range(len(frontier))]
+    return (queued == 2 and [entry.url for entry in popped] == [pushed[0], pushed[2]]
+            and popped[0].canonical == 'https://apply.example.org/Awards?a=1&b=2')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Crawl frontier duplicate/memory benchmark')
+    parser.add_argument('--pages', type=int, default=200_000)
+    parser.add_argument('--links', type=int, default=600_000)
+    args = parser.parse_args()
+
+    links = list(link_stream(args.pages, args.links))
+    # Fragment, slash and utm variants collapse onto the page; the two query orders onto one URL
+    expected = len({(link.split('?')[0].split('#')[0].rstrip('/'), 'page=' in link) for link in links})
+
+    # Measure the old bookkeeping over freshly built strings, as a crawl would hold them
+    tracemalloc.start()
+    crawled, queue = legacy_frontier(link_stream(args.pages, args.links))
+    legacy_bytes = tracemalloc.get_traced_memory()[0] - sys.getsizeof(queue) - 8 * len(queue)
+    tracemalloc.stop()
+    legacy_queued = len(crawled)
+    del crawled, queue
+
+    frontier = CrawlFrontier()
+    start = time.perf_counter()
+    queued = frontier.extend(links)
+    frontier_seconds = time.perf_counter() - start
+
+    print(f"{len(links):,} links, {expected:,} distinct canonical URLs across {len(DOMAINS)} domains")
+    print(f"  {'raw set + deque':<16} {legacy_queued:>10,} fetches queued "
+          f"{legacy_bytes / legacy_queued:>8.1f} visited bytes/URL")
+    print(f"  {'CrawlFrontier':<16} {queued:>10,} fetches queued "
+          f"{frontier.visited.nbytes / queued:>8.1f} visited bytes/URL")
+    print(f"  duplicates rejected at enqueue: {frontier.duplicates_rejected:,} "
+          f"({len(links) / frontier_seconds:,.0f} links/s canonicalized and checked)")
+    if queued != expected:
+        print(f"MISMATCH: expected {expected:,} queued URLs")
+        sys.exit(1)
+    originals_ok = check_original_urls()
+    print(f"  original URLs fetched: {'ok' if originals_ok else 'FAILED'}")
+    if not originals_ok:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
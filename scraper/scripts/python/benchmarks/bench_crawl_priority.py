@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Benchmark: pages-to-first-scholarship for FIFO vs priority-scored crawling.
+
+Crawls synthetic foundation/university sites offline: a home page with nav,
+blog and event links, and scholarship listings a few levels down behind
+"Students" / "Financial Aid" pages. Compares the old FIFO frontier (first 20
+links per page, no depth limit) with `CrawlFrontier` ordered by `score_link`
+and bounded by `max_depth` (award pages sit at depth 3-4, so the depth
+limit also decides how many of them are reachable).
+
+Usage:
+    python scripts/python/benchmarks/bench_crawl_priority.py --sites 200 --budget 50
+"""
+
+import argparse
+import random
+import statistics
+from collections import deque
+from typing import Dict, List, Tuple
+
+from synthetic_data import SCRAPER_ROOT  # noqa: F401  (puts the scraper root on sys.path)
+
+from src.scrapers.crawl_frontier import CrawlFrontier, canonicalize_url
+from src.scrapers.link_scorer import score_link
+
+Site = Dict[str, List[Tuple[str, str]]]
+
+NAV = [
+    ('/about', 'About Us'), ('/news', 'News'), ('/events', 'Events'), ('/donate', 'Donate'),
+    ('/contact', 'Contact'), ('/login', 'Member Login'), ('/careers', 'Careers'),
+    ('/programs', 'Our Programs'), ('/students', 'Students'), ('/privacy', 'Privacy Policy'),
+    ('/community', 'Community'), ('/press', 'Press Room'),
+]
+
+
+def build_site(rng: random.Random) -> Tuple[str, Site]:
+    """Return (start URL, page -> [(href, anchor text)]) for one synthetic site."""
+    host = f"https://www.site{rng.randrange(10**6)}.org"
+    nav = NAV[:]
+    rng.shuffle(nav)
+    posts = [(f"/blog/post-{index}", 'Read more') for index in range(rng.randint(10, 40))]
+    events = [(f"/events/{index}", f"Event {index}") for index in range(rng.randint(5, 15))]
+    awards = [(f"/scholarships/award-{index}", f"{rng.choice(['Memorial', 'Leadership', 'STEM'])} Award")
+              for index in range(rng.randint(3, 10))]
+    aid_path = rng.choice(['/students/financial-aid', '/programs/education/tuition-support'])
+
+    pages: Site = {'/': nav + posts[:10]}
+    for path, _ in NAV:
+        pages[path] = nav[:]
+    pages['/news'] = nav + posts
+    pages['/events'] = nav + events
+    pages['/programs'] = nav + [(f"/programs/p-{index}", f"Program {index}") for index in range(6)] + [(aid_path, 'Tuition help')]
+    pages['/students'] = nav + [('/students/housing', 'Housing'), ('/students/clubs', 'Clubs'), (aid_path, 'Financial Aid')]
+    pages[aid_path] = nav + [('/grants', 'Grants'), ('/scholarships', 'Scholarship Opportunities')] + awards[:2]
+    pages['/scholarships'] = nav + awards
+    for path, _ in posts + events + awards:
+        pages[path] = nav + rng.sample(posts, 5)
+    return host + '/', {host + path: [(host + href, text) for href, text in links] for path, links in pages.items()}
+
+
+def is_scholarship_page(url: str) -> bool:
+    return '/scholarships/' in url
+
+
+def crawl_fifo(start: str, site: Site, budget: int) -> Tuple[int, int]:
+    crawled, queue = set(), deque([start])
+    pages, first, found = 0, None, 0
+    while queue and pages < budget:
+        url = queue.popleft()
+        if url in crawled:
+            continue
+        crawled.add(url)
+        pages += 1
+        if is_scholarship_page(url):
+            found += 1
+            first = first or pages
+        queue.extend([href for href, _ in site.get(url, []) if href not in crawled][:20])
+    return first or budget + 1, found
+
+
+def crawl_priority(start: str, site: Site, budget: int, max_depth: int) -> Tuple[int, int]:
+    frontier = CrawlFrontier(max_depth=max_depth)
+    frontier.push(start, score_link(start), 0)
+    pages, first, found = 0, None, 0
+    while frontier and pages < budget:
+        url, depth, _, canonical = frontier.pop()
+        pages += 1
+        if is_scholarship_page(url):
+            found += 1
+            first = first or pages
+        for href, text in site.get(canonical, []) or site.get(url, []):
+            frontier.push(href, score_link(href, text, depth + 1), depth + 1)
+    return first or budget + 1, found
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Crawl ordering benchmark')
+    parser.add_argument('--sites', type=int, default=200)
+    parser.add_argument('--budget', type=int, default=50, help='max_pages_per_domain')
+    parser.add_argument('--max-depth', type=int, default=3)
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    sites = [build_site(rng) for _ in range(args.sites)]
+    # Site maps are keyed by canonical URL so both crawlers resolve pages the same way
+    sites = [(start, {canonicalize_url(url): [(href, text) for href, text in links] for url, links in site.items()})
+             for start, site in sites]
+
+    print(f"{len(sites)} sites, budget {args.budget} pages/site, max_depth {args.max_depth} (priority crawl only)")
+    for label, crawl in (('FIFO, first 20 links', lambda start, site: crawl_fifo(canonicalize_url(start), site, args.budget)),
+                         ('priority + max_depth', lambda start, site: crawl_priority(start, site, args.budget, args.max_depth))):
+        results = [crawl(start, site) for start, site in sites]
+        firsts = [first for first, _ in results]
+        missed = sum(1 for first in firsts if first > args.budget)
+        print(f"  {label:<22} median pages to first scholarship {statistics.median(firsts):>5.1f}  "
+              f"mean {statistics.mean(firsts):>5.1f}  scholarships/site {statistics.mean(f for _, f in results):>5.1f}  "
+              f"sites with none in budget {missed}/{len(sites)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Benchmark: memoized deadline parser vs the strptime loop it replaced.
+
+Replays a weighted sample of the deadline strings in `deadline_corpus.txt`
+through the legacy `normalize_deadline_value` implementation and through
+`parse_deadline` (cold and warm memo), checking that both agree on every
+string first. Exits non-zero on any mismatch.
+
+Usage:
+    python scripts/python/benchmarks/bench_deadline_parser.py --calls 200000
+"""
+
+import argparse
+import os
+import random
+import re
+import sys
+import time
+from datetime import datetime
+from typing import List, Optional
+
+from synthetic_data import SCRAPER_ROOT  # noqa: F401  (puts the scraper root on sys.path)
+
+from src.utils_python.deadline_parser import parse_deadline, clear_deadline_cache, deadline_cache_info
+
+CORPUS_PATH = os.path.join(os.path.dirname(__file__), 'deadline_corpus.txt')
+
+
+def legacy_normalize_deadline_value(value: Optional[str]) -> Optional[str]:
+    """The helper.normalize_deadline_value implementation before the parser module."""
+    if not value:
+        return None
+
+    text = value.strip()
+    if not text:
+        return None
+
+    if re.fullmatch(r"\d{4}-\d{2}-\d{2}", text):
+        return text
+
+    lowered = text.lower()
+    if any(keyword in lowered for keyword in ['rolling', 'varies', 'open', 'ongoing', 'continuous', 'not specified']):
+        return None
+
+    text = re.sub(r"(\d{1,2})(st|nd|rd|th)", r"\1", text, flags=re.IGNORECASE)
+
+    current_year = datetime.now().year
+
+    for fmt in ["%b %d", "%B %d", "%b %d, %Y", "%B %d, %Y"]:
+        try:
+            date_obj = datetime.strptime(text, fmt)
+            if "%Y" not in fmt:
+                date_obj = date_obj.replace(year=current_year)
+            return date_obj.strftime('%Y-%m-%d')
+        except ValueError:
+            continue
+
+    match = re.match(r"^(?P<month>[A-Za-z]+)[\s/-]+(?P<day>\d{1,2})[\s/-]+(?P<year>\d{2,4})$", text)
+    if match:
+        try:
+            month_str = match.group('month')
+            day = int(match.group('day'))
+            year = int(match.group('year'))
+            if year < 100:
+                year += 2000
+            for fmt in ["%b", "%B"]:
+                try:
+                    month_number = datetime.strptime(month_str, fmt).month
+                    date_obj = datetime(year, month_number, day)
+                    return date_obj.strftime('%Y-%m-%d')
+                except ValueError:
+                    continue
+        except ValueError:
+            pass
+
+    return None
+
+
+def load_corpus() -> List[str]:
+    with open(CORPUS_PATH, encoding='utf-8') as handle:
+        lines = [line.rstrip('\n') for line in handle]
+    return [line for line in lines if line.strip() and not line.startswith('#')]
+
+
+def rate(label: str, values: List[str], func) -> float:
+    start = time.perf_counter()
+    for value in values:
+        func(value)
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<28} {len(values) / elapsed:>12,.0f} calls/s")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Deadline parser parity and throughput')
+    parser.add_argument('--calls', type=int, default=200_000)
+    args = parser.parse_args()
+
+    corpus = load_corpus()
+    mismatches = [(text, legacy_normalize_deadline_value(text), parse_deadline(text))
+                  for text in corpus
+                  if legacy_normalize_deadline_value(text) != parse_deadline(text)]
+    for text, expected, actual in mismatches:
+        print(f"MISMATCH {text!r}: legacy={expected!r} parser={actual!r}")
+    if mismatches:
+        sys.exit(1)
+    print(f"Parity OK: {len(corpus)} distinct deadline strings")
+
+    # Scrape output is skewed towards a handful of common deadlines
+    rng = random.Random(7)
+    weights = [1.0 / (rank + 1) for rank in range(len(corpus))]
+    values = rng.choices(corpus, weights=weights, k=args.calls)
+
+    print(f"Throughput over {args.calls:,} calls:")
+    legacy_seconds = rate('legacy strptime loop', values, legacy_normalize_deadline_value)
+
+    clear_deadline_cache()
+    distinct = list(dict.fromkeys(values))
+    rate('parser, every call a miss', distinct * max(1, args.calls // len(distinct)),
+         lambda value: (clear_deadline_cache(), parse_deadline(value)))
+
+    clear_deadline_cache()
+    parser_seconds = rate('parser, warm memo', values, parse_deadline)
+    print(f"  speedup (warm): {legacy_seconds / parser_seconds:.1f}x  {deadline_cache_info()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Benchmark: request latency with a bare `requests.get` per page vs a tuned session.
+
+Starts a local keep-alive HTTP server on localhost that adds --connect-ms to
+every new connection (standing in for the TCP + TLS handshake to a remote
+site) and fetches --requests short pages:
+- bare: `requests.get` per page, a new connection every time (what
+  `_search_google` used to do);
+- tuned: one `create_session()` session, connections kept alive.
+
+Also checks the session's other features against the same server:
+- `connection_stats` reports the reuse,
+- a 503 with `Retry-After` is retried and succeeds, and a long `Retry-After`
+  is capped,
+- connections the server closes are reopened without resolving the host
+  again (DNS cache).
+Exits non-zero if a check fails.
+
+Usage:
+    python scripts/python/benchmarks/bench_http_client.py --requests 200 --connect-ms 20
+"""
+
+import argparse
+import socket
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from synthetic_data import SCRAPER_ROOT  # noqa: F401  (puts the scraper root on sys.path)
+
+import requests
+
+from src.scrapers import http_client
+from src.scrapers.http_client import connection_stats, create_session
+
+PAGE = b'<html><body>' + b'<p>Scholarship listing row</p>' * 50 + b'</body></html>'
+
+
+def start_server(connect_delay: float):
+    attempts = {}
+    lock = threading.Lock()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def setup(self):
+            time.sleep(connect_delay)
+            # Headers and body go out in separate writes; don't let Nagle hold the body back
+            self.request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            super().setup()
+
+        def do_GET(self):
+            with lock:
+                attempts[self.path] = attempts.get(self.path, 0) + 1
+                attempt = attempts[self.path]
+            if self.path.startswith('/busy') and attempt == 1:
+                retry_after = '3600' if 'long' in self.path else '1'
+                self.send_response(503)
+                self.send_header('Retry-After', retry_after)
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+                return
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/html')
+            self.send_header('Content-Length', str(len(PAGE)))
+            if self.path.startswith('/close'):
+                self.send_header('Connection', 'close')
+                self.close_connection = True
+            self.end_headers()
+            self.wfile.write(PAGE)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--requests', type=int, default=200)
+    parser.add_argument('--connect-ms', type=float, default=20.0)
+    args = parser.parse_args()
+
+    server = start_server(args.connect_ms / 1000)
+    base = f'http://localhost:{server.server_address[1]}'
+    host = 'localhost'
+
+    start = time.perf_counter()
+    for i in range(args.requests):
+        requests.get(f'{base}/page/{i}', timeout=10).raise_for_status()
+    bare = time.perf_counter() - start
+
+    session = create_session()
+    start = time.perf_counter()
+    for i in range(args.requests):
+        session.get(f'{base}/page/{i}', timeout=10).raise_for_status()
+    tuned = time.perf_counter() - start
+    reuse = connection_stats()[host]
+
+    print(f"{args.requests} requests, {args.connect_ms:.0f} ms connection setup")
+    print(f"{'bare requests.get':>18}: {bare:6.2f}s ({bare / args.requests * 1000:6.1f} ms/request)")
+    print(f"{'tuned session':>18}: {tuned:6.2f}s ({tuned / args.requests * 1000:6.1f} ms/request, "
+          f"{bare / tuned:.1f}x)  {reuse['connections']} connections, {reuse['reuse_ratio']:.0%} reused")
+
+    start = time.perf_counter()
+    retried = session.get(f'{base}/busy/short')
+    retry_wait = time.perf_counter() - start
+    http_client.HTTP_MAX_RETRY_AFTER_SEC = 0.2
+    start = time.perf_counter()
+    capped = session.get(f'{base}/busy/long')
+    capped_wait = time.perf_counter() - start
+
+    lookups = []
+    real_getaddrinfo = socket.getaddrinfo
+
+    def counting_getaddrinfo(*a, **kw):
+        lookups.append(a[0])
+        return real_getaddrinfo(*a, **kw)
+
+    socket.getaddrinfo = counting_getaddrinfo
+    try:
+        http_client.dns_cache.forget('localhost', server.server_address[1])
+        for i in range(5):
+            session.get(f'{base}/close/{i}').raise_for_status()
+    finally:
+        socket.getaddrinfo = real_getaddrinfo
+    server.shutdown()
+
+    checks = {
+        'faster': tuned < bare,
+        'connections reused': reuse['reuse_ratio'] >= 0.9,
+        'retry-after honoured': retried.status_code == 200 and retry_wait >= 0.9,
+        'retry-after capped': capped.status_code == 200 and capped_wait < 5,
+        'dns cached': lookups.count('localhost') == 1,
+    }
+    print(f"{'checks':>18}: " + ', '.join(f"{name} {'ok' if passed else 'FAILED'}" for name, passed in checks.items()))
+    if not all(checks.values()):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Benchmark: cost of progress reporting on the scraping thread.
+
+Runs a scrape loop of --pages pages (--work-ms each, --rows-per-page rows
+saved per page) against an in-memory stand-in for the jobs table whose
+writes take --db-ms:
+- writing progress to the job row synchronously after every page,
+- `JobHeartbeat`, which only bumps counters on the scraping thread and
+  records a snapshot every --interval seconds from its own thread.
+Reports loop time, DB writes and the last recorded snapshot, which must carry
+the final page and row counts (exits non-zero otherwise).
+
+Usage:
+    python scripts/python/benchmarks/bench_job_heartbeat.py --pages 200 --db-ms 40
+"""
+
+import argparse
+import sys
+import time
+
+from synthetic_data import SCRAPER_ROOT  # noqa: F401  (puts the scraper root on sys.path)
+
+from src.utils_python.job_heartbeat import JobHeartbeat
+
+
+class SlowJobsTable:
+    """Records progress writes with a fixed round-trip latency."""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.writes = []
+
+    def record_job_progress(self, job_id, progress) -> bool:
+        time.sleep(self.latency)
+        self.writes.append(progress)
+        return True
+
+    def disconnect(self):
+        pass
+
+
+def scrape_loop(pages: int, rows_per_page: int, work: float, on_page):
+    start = time.perf_counter()
+    for _ in range(pages):
+        time.sleep(work)
+        on_page(rows_per_page)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--pages', type=int, default=200)
+    parser.add_argument('--rows-per-page', type=int, default=25)
+    parser.add_argument('--work-ms', type=float, default=10.0, help='Scraping time per page')
+    parser.add_argument('--db-ms', type=float, default=40.0, help='Round trip of one progress write')
+    parser.add_argument('--interval', type=float, default=0.5, help='Heartbeat interval')
+    args = parser.parse_args()
+    work, latency = args.work_ms / 1000, args.db_ms / 1000
+    print(f"{args.pages} pages, {args.work_ms} ms each, {args.db_ms} ms per progress write")
+
+    table = SlowJobsTable(latency)
+    done = {'pages': 0, 'rows': 0}
+
+    def write_each_page(rows):
+        done['pages'] += 1
+        done['rows'] += rows
+        table.record_job_progress('bench', dict(done))
+
+    baseline = scrape_loop(args.pages, args.rows_per_page, 0, lambda rows: None) + args.pages * work
+    elapsed = scrape_loop(args.pages, args.rows_per_page, work, write_each_page)
+    print(f"{'write per page (sync)':>24}: {elapsed:6.2f}s  ({elapsed - baseline:+.2f}s)  {len(table.writes)} DB writes")
+
+    table = SlowJobsTable(latency)
+    heartbeat = JobHeartbeat(table, 'bench', interval=args.interval, pages_total=args.pages)
+    heartbeat.start()
+
+    def count_page(rows):
+        heartbeat.page_done()
+        heartbeat.add_rows(rows)
+
+    elapsed = scrape_loop(args.pages, args.rows_per_page, work, count_page)
+    heartbeat.stop()
+    heartbeat.beat()  # what the next heartbeat would have recorded
+    last = table.writes[-1]
+    print(f"{'JobHeartbeat':>24}: {elapsed:6.2f}s  ({elapsed - baseline:+.2f}s)  {len(table.writes)} DB writes")
+    print(f"{'last snapshot':>24}: {last}")
+
+    expected = (args.pages, args.pages * args.rows_per_page)
+    if (last['pages_done'], last['rows_saved']) != expected or len(table.writes) < 2:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
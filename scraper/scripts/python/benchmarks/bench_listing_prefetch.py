@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Benchmark: listing collection time, one page after another vs prefetched.
+
+A simulated listing server answers each page after --latency seconds; every
+page shows a pager and an "of N results" caption, and the last page holds
+only --last-rows rows. Collects --pages listing pages:
+- sequential: fetch, then sleep --sleep before the next page (the old loop);
+- prefetch: `PaginationController.ahead` + `ListingPrefetcher`, every request
+  spaced by a `HostRateLimiter` (--interval), as the listing scrapers do now.
+Times are scaled down 10x from production (0.5 s latency, 2 s page sleep,
+1 s host spacing) to keep the run short.
+
+Checks that both runs return the same rows in page order, that the page
+count read from the pager matches --pages (the short last page must not
+inflate it), and that no two requests to the host went out closer than
+--interval; exits non-zero otherwise.
+
+Usage:
+    python scripts/python/benchmarks/bench_listing_prefetch.py --pages 20
+"""
+
+import argparse
+import sys
+import threading
+import time
+
+from synthetic_data import SCRAPER_ROOT  # noqa: F401  (puts the scraper root on sys.path)
+
+from src.scrapers.pagination import ListingPrefetcher, PaginationController, pager_page_count
+from src.scrapers.rate_limiter import HostRateLimiter
+
+HOST_URL = 'https://listing.example.org/scholarships'
+
+
+class ListingServer:
+    """Pages of --rows rows (--last-rows on the last) behind a fixed latency; records request times."""
+
+    def __init__(self, pages: int, rows: int, last_rows: int, latency: float):
+        self.pages, self.rows, self.last_rows, self.latency = pages, rows, last_rows, latency
+        self.total = (pages - 1) * rows + last_rows
+        self.sent = []
+        self._lock = threading.Lock()
+
+    def get(self, page: int) -> bytes:
+        with self._lock:
+            self.sent.append(time.monotonic())
+        time.sleep(self.latency)
+        if page > self.pages:
+            return b'<p>No results</p>'
+        count = self.last_rows if page == self.pages else self.rows
+        rows = ''.join(f'<tr><td>row {page}-{i}</td></tr>' for i in range(count))
+        # The pager links a window of two pages, so the count comes from the caption
+        window = min(page + 2, self.pages)
+        return (f'<p>Showing page {page} of {self.total:,} results</p><table>{rows}</table>'
+                f'<a href="?page={window}">Next</a>').encode()
+
+
+def parse(html: bytes):
+    return [cell.split('</td>')[0] for cell in html.decode().split('<td>')[1:]]
+
+
+def sequential(server: ListingServer, max_pages: int, sleep: float):
+    rows, page = [], 1
+    while page <= max_pages:
+        page_rows = parse(server.get(page))
+        if not page_rows:
+            break
+        rows.extend(page_rows)
+        page += 1
+        time.sleep(sleep)
+    return rows
+
+
+def prefetched(server: ListingServer, max_pages: int, interval: float):
+    limiter = HostRateLimiter(interval)
+
+    def fetch(page):
+        limiter.wait(HOST_URL)
+        return server.get(page)
+
+    pager = PaginationController(max_pages, None, 'bench')
+    prefetcher = ListingPrefetcher(fetch)
+    rows, page, page_count, page_size = [], 1, None, 0
+    try:
+        while page <= pager.page_limit:
+            html = prefetcher.take(page)
+            page_rows = parse(html)
+            page_size = max(page_size, len(page_rows))
+            page_count = max(page_count or 0, pager_page_count(html, None, 'page', page_size) or 0) or None
+            rows.extend(page_rows)
+            if not pager.observe(page, page_rows):
+                break
+            prefetcher.schedule(pager.ahead(page, page_count))
+            page += 1
+    finally:
+        prefetcher.close()
+    return rows, page_count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--pages', type=int, default=20)
+    parser.add_argument('--rows', type=int, default=25)
+    parser.add_argument('--last-rows', type=int, default=5)
+    parser.add_argument('--latency', type=float, default=0.05)
+    parser.add_argument('--sleep', type=float, default=0.2)
+    parser.add_argument('--interval', type=float, default=0.1)
+    args = parser.parse_args()
+
+    server = ListingServer(args.pages, args.rows, args.last_rows, args.latency)
+    start = time.perf_counter()
+    baseline_rows = sequential(server, args.pages, args.sleep)
+    baseline = time.perf_counter() - start
+
+    server = ListingServer(args.pages, args.rows, args.last_rows, args.latency)
+    start = time.perf_counter()
+    rows, page_count = prefetched(server, args.pages, args.interval)
+    elapsed = time.perf_counter() - start
+    gaps = [b - a for a, b in zip(server.sent, server.sent[1:])]
+
+    print(f"{args.pages} listing pages, {args.latency * 1000:.0f} ms latency, "
+          f"{args.interval * 1000:.0f} ms host spacing")
+    print(f"{'sequential + sleep':>20}: {baseline:6.2f}s")
+    print(f"{'prefetched':>20}: {elapsed:6.2f}s ({baseline / elapsed:.1f}x)")
+    checks = {
+        'same rows in order': rows == baseline_rows and len(rows) == server.total,
+        'pager page count': page_count == args.pages,
+        # The limiter sleeps before sending; allow for timer jitter
+        'host spacing': min(gaps) >= args.interval * 0.9,
+    }
+    print(f"{'checks':>20}: " + ', '.join(f"{name} {'ok' if passed else 'FAILED'}" for name, passed in checks.items()))
+    if not all(checks.values()):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Benchmark: scholarship coverage and prompt tokens for LLM extraction input.
+
+Builds synthetic long listing pages (news posts, then many scholarships under
+headings, plus navigation and legal boilerplate) and compares what reaches the
+model:
+- the old single prompt with `content[:3000]`,
+- the chunked extractor (`split_into_chunks` + relevance pre-filter).
+A scholarship counts as covered when its title and award amount land in the
+same prompt. Token counts use the extractor's estimate, so no API calls are made.
+
+Also checks that `parse_json_items` salvages complete items from a reply
+that hit `max_tokens` mid-array, and that `split_into_chunks` keeps the short
+detail lines scholarships share (award, deadline, organization) while
+dropping a repeated disclaimer (exits non-zero if either fails).
+
+Usage:
+    python scripts/python/benchmarks/bench_llm_chunking.py --pages 50 --scholarships 40
+"""
+
+import argparse
+import json
+import random
+import sys
+
+from synthetic_data import SCRAPER_ROOT  # noqa: F401  (puts the scraper root on sys.path)
+
+from src.scrapers.chunked_extractor import (
+    ChunkedLLMExtractor, estimate_tokens, parse_json_items, split_into_chunks, DEFAULT_CHUNK_TOKEN_BUDGET,
+)
+from src.scrapers.content_extraction_pipeline import parse_html_page
+from src.scrapers.relevance_scorer import RelevanceScorer
+
+OLD_CONTENT_CHARS = 3000
+OLD_COMPLETION_TOKENS = 1000
+# Prompt template around the page content (instructions + JSON schema); reply size per item
+PROMPT_OVERHEAD_TOKENS = 260
+TOKENS_PER_ITEM_REPLY = 120
+
+FIELDS = ['Engineering', 'Nursing', 'Education', 'Business', 'Agriculture', 'Music', 'Computer Science']
+
+
+def build_page(page: int, count: int, rng: random.Random):
+    nav = ''.join(f'<li><a href="/s{i}">Section {i}</a></li>' for i in range(40))
+    # Intro and news posts above the listing, as on most foundation and college pages
+    body = ['<h2>Latest news</h2>'] + [
+        f'<h3>Campus update {page}-{post}</h3><p>{"The library extended its weekend hours for finals week. " * 8}</p>'
+        for post in range(6)
+    ]
+    body.append('<h2>Available scholarships</h2>')
+    expected = []
+    for index in range(count):
+        if rng.random() < 0.1:
+            body.append(f'<h3>Campus news {page}-{index}</h3><p>{"The library extended its weekend hours. " * 6}</p>')
+        title = f"{rng.choice(FIELDS)} Leaders Scholarship {page}-{index}"
+        amount = f"${rng.choice([500, 1000, 2500, 5000]):,}"
+        expected.append((title, amount))
+        body.append(
+            f'<h3>{title}</h3>'
+            f'<p>Awarded by the Foundation for {rng.choice(FIELDS)} to students who show leadership. '
+            f'Award amount: {amount}. Deadline: March {1 + index % 28}, 2027.</p>'
+            f'<ul><li>Minimum GPA of 3.{index % 10}</li><li>Open to full-time undergraduate students</li></ul>'
+        )
+    html = (
+        f'<html><head><title>Scholarships page {page}</title></head><body>'
+        f'<nav><ul>{nav}</ul></nav><div class="breadcrumbs"><a href="/">Home</a> / Scholarships</div>'
+        f'<main>{"".join(body)}</main>'
+        f'<div class="legal">We use cookies to improve your experience. Privacy Policy. Terms of Use.</div>'
+        f'<footer>Copyright 2026 Example Foundation. All rights reserved.</footer></body></html>'
+    )
+    return html.encode('utf-8'), expected
+
+
+def covered(prompts, expected):
+    return sum(1 for title, amount in expected if any(title in prompt and amount in prompt for prompt in prompts))
+
+
+def check_truncated_reply() -> bool:
+    items = [{'title': f'Award {i}', 'award_amount': '$1,000', 'confidence': 0.9} for i in range(5)]
+    reply = json.dumps(items, indent=2)
+    cut = reply[:reply.index('Award 4') + 4]  # stop inside the last object
+    salvaged = parse_json_items(cut)
+    return [item['title'] for item in salvaged] == [f'Award {i}' for i in range(4)]
+
+
+def check_repeated_details() -> bool:
+    disclaimer = ('Award amounts and deadlines are set by each sponsor and may change without notice, '
+                  'so always confirm the details on the official application page before applying.')
+    details = ['Smith Foundation', 'Award: $1,000', 'Deadline: March 1, 2026', disclaimer]
+    blocks = ['Home', 'Scholarships', 'Home']
+    for index in range(3):
+        blocks += [f'## Smith Scholarship {index}'] + details
+    text = '\n'.join(split_into_chunks(blocks))
+    return (all(text.count(line) == 3 for line in details[:3]) and text.count(disclaimer) == 1
+            and text.count('Home') == 1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--pages', type=int, default=50)
+    parser.add_argument('--scholarships', type=int, default=40, help='Scholarships per page')
+    parser.add_argument('--chunk-tokens', type=int, default=DEFAULT_CHUNK_TOKEN_BUDGET)
+    args = parser.parse_args()
+
+    rng = random.Random(5)
+    extractor = ChunkedLLMExtractor(client=None, chunk_token_budget=args.chunk_tokens, max_chunks=10_000,
+                                    is_relevant=RelevanceScorer().is_relevant)
+
+    totals = {'expected': 0, 'old_covered': 0, 'old_tokens': 0, 'new_covered': 0, 'new_tokens': 0,
+              'chunks_total': 0, 'chunks_sent': 0}
+    for page in range(args.pages):
+        html, expected = build_page(page, args.scholarships, rng)
+        doc = parse_html_page(html, 'utf-8')
+        text, blocks = doc.normalized_text, doc.blocks
+        totals['expected'] += len(expected)
+
+        old_prompt = text[:OLD_CONTENT_CHARS]
+        old_covered = covered([old_prompt], expected)
+        totals['old_covered'] += old_covered
+        totals['old_tokens'] += PROMPT_OVERHEAD_TOKENS + estimate_tokens(old_prompt)
+        totals['old_tokens'] += min(OLD_COMPLETION_TOKENS, TOKENS_PER_ITEM_REPLY * old_covered)
+
+        chunks = extractor.select_chunks(blocks)
+        totals['chunks_total'] += len(split_into_chunks(blocks, args.chunk_tokens))
+        totals['chunks_sent'] += len(chunks)
+        page_covered = covered(chunks, expected)
+        totals['new_covered'] += page_covered
+        totals['new_tokens'] += sum(PROMPT_OVERHEAD_TOKENS + estimate_tokens(chunk) for chunk in chunks)
+        totals['new_tokens'] += TOKENS_PER_ITEM_REPLY * page_covered
+    extractor.shutdown()
+
+    expected = totals['expected']
+    print(f"{args.pages} pages, {expected} scholarships, chunk budget {args.chunk_tokens} tokens")
+    for label, key in (('content[:3000]', 'old'), ('chunked', 'new')):
+        found = totals[f'{key}_covered']
+        tokens = totals[f'{key}_tokens']
+        per = tokens / found if found else float('inf')
+        print(f"{label:>15}: coverage {found:5d}/{expected} ({found / expected:6.1%})  "
+              f"~{tokens:9,d} tokens  ~{per:7.0f} tokens/scholarship")
+    print(f"{'':>15}  {totals['chunks_sent']} of {totals['chunks_total']} chunks sent after the relevance filter")
+
+    salvage_ok = check_truncated_reply()
+    print(f"truncated reply salvage: {'ok' if salvage_ok else 'FAILED'}")
+    details_ok = check_repeated_details()
+    print(f"repeated details kept: {'ok' if details_ok else 'FAILED'}")
+    if not (salvage_ok and details_ok):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
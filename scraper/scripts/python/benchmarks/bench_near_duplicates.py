@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Benchmark: near-duplicate scholarship merging across sources.
+
+Indexes N synthetic stored scholarships, then looks up how other sources would
+spell them (CareerOneStop-style "Inc." organizations, "The ... Program" titles
+with http/www/trailing-slash URL changes, AI-discovered upper-cased or
+"Award" titles with abbreviated organizations and no URL, titles without the
+donor name, titles with a typo) mixed with new scholarships that share an
+organization or title pattern. Reports:
+- merges found by the old exact (title, organization) key vs `NearDuplicateIndex`,
+  as precision/recall against the true source scholarship,
+- index build rate and lookup time per candidate vs a linear scan comparing
+  every stored signature (sampled); every index match must be a scan match,
+- that a saved and reloaded index gives the same answers,
+- that a stored key is kept as is and a dated scholarship is never written
+  under an undated row's key (or the reverse),
+- that two indexes saving to one file at once keep each other's entries.
+Exits non-zero on a disagreement.
+
+Usage:
+    python scripts/python/benchmarks/bench_near_duplicates.py --rows 100000
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+
+from synthetic_data import SCRAPER_ROOT  # noqa: F401  (puts the scraper root on sys.path)
+
+from src.utils_python.near_duplicates import NearDuplicateIndex, ScholarshipSignature
+
+ORG_PATTERNS = ['Rotary Club of {}', '{} Community Foundation', 'Society of {} Engineers', '{} Elks Lodge',
+                '{} Farm Bureau', '{} Medical Association', '{} Bar Association', 'Friends of {} Library']
+PLACES = ['Austin', 'Dallas', 'Denver', 'Boston', 'Fresno', 'Tulsa', 'Omaha', 'Reno', 'Salem', 'Akron',
+          'Provo', 'Macon', 'Flint', 'Tampa', 'Miami', 'Boise', 'Ogden', 'Yuma', 'Waco', 'Erie']
+FIELDS = ['Engineering', 'Nursing', 'Education', 'Business', 'Agriculture', 'Music', 'Computer Science',
+          'Journalism', 'Law', 'Art', 'Biology', 'Chemistry', 'Accounting', 'Welding', 'Aviation']
+KINDS = ['Merit', 'Leadership', 'Memorial', 'Community Service', 'First Generation', 'Need-Based',
+         'Excellence', 'Women in', 'Veterans', 'Rural Students', 'Transfer', 'Graduate Research']
+NAMES = ['Smith', 'Garcia', 'Johnson', 'Lee', 'Brown', 'Nguyen', 'Patel', 'Miller', 'Davis', 'Lopez',
+         'Wilson', 'Clark', 'Young', 'King', 'Hill', 'Green', 'Adams', 'Baker', 'Nelson', 'Carter']
+DESCRIPTIONS = ['Supports students pursuing {} degrees.', 'Awarded annually to outstanding {} students.',
+                'Helps {} majors with tuition and fees.']
+
+
+def stored_rows(count: int, rng: random.Random):
+    rows, seen = [], set()
+    while len(rows) < count:
+        field = rng.choice(FIELDS)
+        organization = rng.choice(ORG_PATTERNS).format(rng.choice(PLACES))
+        title = f"{rng.choice(NAMES)} {rng.choice(KINDS)} {field} Scholarship"
+        if (title, organization) in seen:
+            continue
+        seen.add((title, organization))
+        url = f"https://www.example{len(rows) % 997}.org/apply/{len(rows)}"
+        rows.append((title, organization, '', rng.choice(DESCRIPTIONS).format(field), url))
+    return rows
+
+
+def variant(row, rng: random.Random):
+    title, organization, deadline, description, url = row
+    kind = rng.randrange(5)
+    if kind == 3:  # donor name dropped, same apply URL
+        return title.split(' ', 1)[1], organization, deadline, None, url
+    if kind == 4:  # typo in the title, no URL
+        words = title.split(' ')
+        word = words[1]
+        words[1] = word[:-2] + word[-1] + word[-2]
+        return ' '.join(words), organization, deadline, description, None
+    if kind == 0:
+        return title, f"{organization}, Inc.", deadline, description, url
+    if kind == 1:
+        return (f"The {title} Program", organization, deadline, description.lower(),
+                url.replace('https://www.', 'http://') + '/')
+    return (title.upper() if rng.random() < 0.5 else title.replace('Scholarship', 'Award'),
+            organization.replace('Foundation', 'Fdn').replace('Association', 'Assn'), deadline, None, None)
+
+
+def linear_matches(signatures, keys, signature):
+    return {key for stored, key in zip(signatures, keys) if signature.matches(stored)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=100_000, help='Stored scholarships')
+    parser.add_argument('--lookups', type=int, default=5000, help='Incoming records (half are variants)')
+    parser.add_argument('--linear-sample', type=int, default=200, help='Lookups repeated as a linear scan')
+    args = parser.parse_args()
+
+    rng = random.Random(23)
+    rows = stored_rows(args.rows + args.lookups // 2, rng)
+    stored, fresh = rows[:args.rows], rows[args.rows:]
+
+    index = NearDuplicateIndex(path=None)
+    start = time.perf_counter()
+    index.add_rows(stored)
+    build = time.perf_counter() - start
+    print(f"{args.rows:,} stored scholarships indexed in {build:.1f}s ({args.rows / build:,.0f} rows/s)")
+
+    incoming = [(variant(row, rng), (row[0], row[1], row[2])) for row in rng.sample(stored, args.lookups // 2)]
+    incoming += [(row, None) for row in fresh]
+    rng.shuffle(incoming)
+
+    exact_keys = {(title.lower(), organization.lower()) for title, organization, *_ in stored}
+    exact_hits = sum(1 for (title, organization, *_), truth in incoming
+                     if truth and (title.lower(), organization.lower()) in exact_keys)
+
+    signatures = [ScholarshipSignature.of(*record[:2], *record[3:]) for record, _ in incoming]
+    start = time.perf_counter()
+    found = [index.find(signature, record[2]) for signature, (record, _) in zip(signatures, incoming)]
+    lookup = time.perf_counter() - start
+
+    true_merges = sum(1 for key, (_, truth) in zip(found, incoming) if key and key == truth)
+    merges = sum(1 for key in found if key)
+    duplicates = sum(1 for _, truth in incoming if truth)
+    print(f"{len(incoming):,} incoming records, {duplicates:,} of them other sources' spellings")
+    print(f"{'exact key (old)':>18}: merged {exact_hits:5,d}  precision 100.0%  recall {exact_hits / duplicates:6.1%}")
+    print(f"{'NearDuplicateIndex':>18}: merged {merges:5,d}  precision {true_merges / max(merges, 1):6.1%}  "
+          f"recall {true_merges / duplicates:6.1%}  {lookup / len(incoming) * 1e6:7.0f} us/lookup")
+
+    stored_signatures = [ScholarshipSignature.of(*row[:2], *row[3:]) for row in stored]
+    stored_keys = [(row[0], row[1], row[2]) for row in stored]
+    sample = range(min(args.linear_sample, len(incoming)))
+    start = time.perf_counter()
+    linear = [linear_matches(stored_signatures, stored_keys, signatures[i]) for i in sample]
+    scan = time.perf_counter() - start
+    # The index may miss a match the full scan finds, but must never return a non-match
+    wrong = sum(1 for i in sample if found[i] is not None and found[i] not in linear[i])
+    scan_found = sum(1 for i in sample if linear[i])
+    index_found = sum(1 for i in sample if found[i] is not None)
+    print(f"{'linear scan':>18}: {scan / len(sample) * 1e6:7.0f} us/lookup  "
+          f"(index finds {index_found}/{scan_found} of its matches on {len(sample)} sampled lookups, "
+          f"{wrong} disagreements)")
+
+    handle, path = tempfile.mkstemp(suffix='.json')
+    os.close(handle)
+    try:
+        index.path = path
+        index.save()
+        reloaded = NearDuplicateIndex(path)
+    finally:
+        os.unlink(path)
+        if os.path.exists(f"{path}.lock"):
+            os.unlink(f"{path}.lock")
+    roundtrip_ok = all(reloaded.find(signatures[i], incoming[i][0][2]) == found[i] for i in sample)
+    print(f"saved index reload: {'ok' if roundtrip_ok else 'MISMATCH'}")
+
+    title, organization = 'Smith Family Engineering Scholarship', 'Smith Foundation'
+    cycles = NearDuplicateIndex(None)
+    cycles.add_rows([(title, organization, '', None, None), (title, organization, '2026-03-01', None, None)])
+    deadlines_ok = (
+        cycles.canonical_key(title, organization, '2026-03-01') == (title, organization, '2026-03-01')
+        and cycles.canonical_key(title, organization, '2027-03-01') == (title, organization, '2027-03-01')
+        and cycles.canonical_key(f'The {title}', f'{organization} Inc', '2028-03-01')[2] == '2028-03-01'
+        and cycles.canonical_key(f'The {title}', f'{organization} Inc', '') == (title, organization, '')
+    )
+    print(f"deadline keys kept: {'ok' if deadlines_ok else 'FAILED'}")
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'index.json')
+        writers = [NearDuplicateIndex(path), NearDuplicateIndex(path)]
+
+        def fill(writer, name):
+            for i in range(100):
+                writer.add_rows([(f'{name} Award {i}', 'Shared Foundation', '', None, None)])
+                writer.save()
+
+        threads = [threading.Thread(target=fill, args=(writer, name)) for writer, name in zip(writers, 'AB')]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        concurrent_ok = len(NearDuplicateIndex(path)) == 200
+    print(f"  concurrent saves: {'ok' if concurrent_ok else 'LOST ENTRIES'}")
+
+    if wrong or not roundtrip_ok or not deadlines_ok or not concurrent_ok:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
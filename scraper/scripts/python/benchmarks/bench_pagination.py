@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Benchmark: listing pages fetched per night with the pagination controller.
+
+Simulates --days nightly runs over a newest-first listing of --rows rows,
+--page-size rows per page. Each night a Poisson number of new rows (mean
+--new-per-day) is added at the top, with a burst of --burst rows every
+--burst-every nights, and a few old rows are removed. Runs are compared:
+- static: pages 1..--max-pages, as before;
+- controller: `PaginationController` over a `ListingIndex` in a temporary
+  file, stopping after K known pages, with a full walk every --full-walk-days.
+
+Reports listing pages fetched per night and new rows missed (new rows the
+run never saw). Checks that the controller misses no new rows, including on
+burst nights that overflow --max-pages, and fetches fewer pages than the
+static walk; exits non-zero otherwise.
+
+Usage:
+    python scripts/python/benchmarks/bench_pagination.py --days 60 --max-pages 5
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+
+from synthetic_data import SCRAPER_ROOT  # noqa: F401  (puts the scraper root on sys.path)
+
+from src.scrapers.pagination import ListingIndex, PaginationController
+
+
+def walk(listing, page_size: int, pager: PaginationController) -> int:
+    """Fetch pages until the controller stops; returns pages fetched."""
+    page = 1
+    while page <= pager.page_limit:
+        keys = listing[(page - 1) * page_size:page * page_size]
+        if not pager.observe(page, keys):
+            break
+        page += 1
+    pager.finish()
+    return page
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=2000)
+    parser.add_argument('--page-size', type=int, default=25)
+    parser.add_argument('--max-pages', type=int, default=5)
+    parser.add_argument('--days', type=int, default=60)
+    parser.add_argument('--new-per-day', type=float, default=8.0)
+    parser.add_argument('--burst', type=int, default=300)
+    parser.add_argument('--burst-every', type=int, default=20)
+    parser.add_argument('--full-walk-days', type=int, default=7)
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+    rng = random.Random(args.seed)
+
+    listing = [f'row-{i}' for i in range(args.rows)]
+    next_id = args.rows
+    fd, path = tempfile.mkstemp(suffix='.json')
+    os.close(fd)
+    os.remove(path)
+    index = ListingIndex(path)
+    static_seen = set(listing[:args.max_pages * args.page_size])
+    controller_seen = set(listing)
+    # Night 0: a first walk, plus everything already in the database from earlier scrapes
+    walk(listing, args.page_size, PaginationController(args.max_pages, index, 'bench'))
+    index.record('bench', listing)
+
+    static_pages = controller_pages = static_missed = controller_missed = 0
+    try:
+        for day in range(1, args.days + 1):
+            # Binomial(10n, 0.1) stands in for Poisson(n)
+            count = args.burst if day % args.burst_every == 0 else \
+                sum(rng.random() < 0.1 for _ in range(int(args.new_per_day * 10)))
+            new = [f'row-{next_id + i}' for i in range(count)]
+            next_id += count
+            for _ in range(min(3, len(listing))):
+                listing.pop(rng.randrange(len(listing)))
+            listing = new + listing
+
+            pages = min(args.max_pages, -(-len(listing) // args.page_size))
+            static_pages += pages
+            static_seen.update(listing[:pages * args.page_size])
+            static_missed += sum(key not in static_seen for key in new)
+
+            full_walk = day % args.full_walk_days == 0
+            pager = PaginationController(args.max_pages, index, 'bench',
+                                         full_walk_interval=0 if full_walk else float('inf'))
+            controller_pages += walk(listing, args.page_size, pager)
+            controller_seen.update(pager.seen)
+            controller_missed += sum(key not in controller_seen for key in new)
+    finally:
+        if os.path.exists(path):
+            os.remove(path)
+
+    print(f"{len(listing)} listing rows, {args.page_size}/page, {args.days} nightly runs, "
+          f"burst of {args.burst} every {args.burst_every} nights")
+    print(f"{'static max_pages':>22}: {static_pages / args.days:6.2f} pages/night  {static_missed:5d} new rows missed")
+    print(f"{'pagination controller':>22}: {controller_pages / args.days:6.2f} pages/night  "
+          f"{controller_missed:5d} new rows missed")
+    checks = {
+        'no new rows missed': controller_missed == 0,
+        'fewer pages': controller_pages < static_pages,
+    }
+    print(f"{'checks':>22}: " + ', '.join(f"{name} {'ok' if passed else 'FAILED'}" for name, passed in checks.items()))
+    if not all(checks.values()):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Benchmark: HTML parse throughput inline vs in the process-pool parse stage.
+
+Generates synthetic CareerOneStop listing/detail pages and generic scholarship
+pages, then parses them:
+- inline on one core (what the scrapers did before),
+- through `ParsePool.imap` with 1..N worker processes.
+Scholarships and extracted text from every pool size must match the inline
+run exactly.
+
+Usage:
+    python scripts/python/benchmarks/bench_parse_pool.py --pages 200 --workers 1,2,4,8
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+from synthetic_data import SCRAPER_ROOT  # noqa: F401  (puts the scraper root on sys.path)
+
+from src.scrapers.careeronestop_scraper import parse_listing_page, parse_detail_page
+from src.scrapers.content_extraction_pipeline import parse_html_page
+from src.scrapers.parse_pool import ParsePool
+
+LEVELS = ["Bachelor's Degree", 'Graduate Degree', 'High School', 'Associates Degree', 'Certificate']
+FOCUS = ['Engineering, Computer Science', 'Nursing', 'General studies/Field of study not specified',
+         'Business; Finance', 'Art and Music']
+CRITERIA = [
+    'Applicants must have a minimum GPA of 3.0 or higher. Must demonstrate financial need.',
+    'Must be attending "State" college or university. Open to Hispanic American students.',
+    'Open to high school seniors who plan to enroll full time.',
+]
+BOILERPLATE = ''.join(
+    f'<li><a href="/Toolkit/section{i}.aspx">Navigation link {i}</a><span class="tip">Helpful text {i}</span></li>'
+    for i in range(100)
+)
+
+
+def detail_page(index: int, rng: random.Random) -> bytes:
+    rows = [
+        ('Organization', f'<div>Foundation {index % 37}</div><div>123 Main St</div>'),
+        ('Level of Study', rng.choice(LEVELS)),
+        ('Award Type', 'Scholarship' if rng.random() < 0.9 else 'Grant'),
+        ('Focus', rng.choice(FOCUS)),
+        ('Purpose', f'To support students in program {index}. ' * 5),
+        ('Criteria', rng.choice(CRITERIA)),
+        ('Funds', rng.choice(['$1,000', '$500 - $2,500', 'Varies'])),
+        ('Deadline', rng.choice(['March 1, 2027', 'Varies', '04/15/2027'])),
+        ('To Apply', 'Submit an application and two letters of recommendation.'),
+        ('For more information', f'https://example.org/awards/{index}'),
+    ]
+    table = ''.join(f'<tr><td><strong>{label}</strong></td><td>{value}</td></tr>' for label, value in rows)
+    return (f'<html><head><title>Award {index}</title></head><body><header><ul>{BOILERPLATE}</ul></header>'
+            f'<table>{table}</table><footer><ul>{BOILERPLATE}</ul></footer></body></html>').encode('utf-8')
+
+
+def listing_page(count: int) -> bytes:
+    rows = ''.join(
+        f'<tr><td><a href="/Toolkit/Training/scholarship-detail.aspx?id={i}">Merit Award {i}</a>'
+        f'<br>Organization: Foundation {i % 37}<br>Purposes: Education</td><td>$1,000</td>'
+        f'<td>Scholarship</td><td>Undergraduate</td><td>March 1</td></tr>'
+        for i in range(count)
+    )
+    return f'<html><body><ul>{BOILERPLATE}</ul><table>{rows}</table></body></html>'.encode('utf-8')
+
+
+def run(pool: ParsePool, listing: bytes, details, pages):
+    start = time.perf_counter()
+    rows = pool.run(parse_listing_page, listing, 'utf-8')
+    jobs = ((row, html, 'utf-8', row.source_url) for row, html in zip(rows, details))
+    scholarships = [s for s in pool.imap(parse_detail_page, jobs) if s]
+    texts = list(pool.imap(parse_html_page, ((page, 'utf-8') for page in pages)))
+    return time.perf_counter() - start, scholarships, texts
+
+
+def comparable(scholarship):
+    data = scholarship.to_dict()
+    data.pop('created_at', None)
+    data.pop('updated_at', None)
+    return data
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--pages', type=int, default=200, help='Detail pages (and generic pages) to parse')
+    parser.add_argument('--workers', default='1,2,4,8', help='Comma-separated pool sizes to try')
+    args = parser.parse_args()
+
+    rng = random.Random(11)
+    listing = listing_page(args.pages)
+    details = [detail_page(i, rng) for i in range(args.pages)]
+    documents = len(details) * 2 + 1
+    size_mb = (len(listing) + 2 * sum(map(len, details))) / 1e6
+    print(f"{documents} documents, {size_mb:.1f} MB of HTML, {os.cpu_count()} CPUs")
+
+    with ParsePool(max_workers=0) as inline:
+        elapsed, expected, expected_texts = run(inline, listing, details, details)
+    expected = [comparable(s) for s in expected]
+    print(f"{'inline':>10}: {elapsed:7.2f}s  {documents / elapsed:8.0f} docs/s  ({len(expected)} scholarships)")
+
+    failed = False
+    for workers in (int(value) for value in args.workers.split(',')):
+        with ParsePool(max_workers=workers) as pool:
+            pool.run(parse_html_page, b'<html></html>', None)  # start the workers outside the timing
+            elapsed, scholarships, texts = run(pool, listing, details, details)
+        match = [comparable(s) for s in scholarships] == expected and texts == expected_texts
+        failed |= not match
+        print(f"{workers:>3} workers: {elapsed:7.2f}s  {documents / elapsed:8.0f} docs/s  "
+              f"parity: {'ok' if match else 'MISMATCH'}")
+
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Benchmark: per-page CPU time of the old extraction helpers vs one `ParsedDocument`.
+
+Builds --pages synthetic link-heavy pages (--links links each, some to PDFs,
+inside nav/header/footer boilerplate and a scholarship body) and times:
+- crawler: the old `EthicalCrawler._process_html_page` (two `find_all('a')`
+  walks, title/meta lookups, `get_text`) vs `ParsedDocument.parse`;
+- pipeline: the old `parse_html_page` (title/meta lookups, decompose,
+  `get_text`, a second walk for the LLM blocks) vs `ParsedDocument.parse`.
+Walks are timed over pre-built trees (`ParsedDocument.from_soup`); parsing
+(html.parser building the tree) is timed separately, since it is the same for
+both and is not what changed.
+
+Checks that the document returns exactly what the old helpers did (links,
+anchor texts, PDF links, title, meta, text, normalized text, blocks) and
+that its walk is faster; exits non-zero otherwise.
+
+Usage:
+    python scripts/python/benchmarks/bench_parsed_document.py --pages 100 --links 400
+"""
+
+import argparse
+import random
+import sys
+import time
+from urllib.parse import urljoin
+
+from synthetic_data import SCRAPER_ROOT  # noqa: F401  (puts the scraper root on sys.path)
+
+from bs4 import BeautifulSoup, NavigableString
+
+from src.scrapers.chunked_extractor import HEADING_MARKER
+from src.scrapers.parsed_document import BLOCK_TAGS, HEADING_TAGS, ParsedDocument
+
+URL = 'https://foundation.example.org/awards/'
+
+
+def build_page(number: int, links: int, rng: random.Random) -> str:
+    def link(i):
+        href = f'/files/guide-{number}-{i}.pdf' if rng.random() < 0.1 else f'/awards/{number}/{i}?ref=list'
+        return f'<li><a href="{href}" title="Award {i}">Award {i} <span>details</span></a></li>'
+
+    nav = ''.join(link(i) for i in range(links // 2))
+    body = ''.join(
+        f'<h2>Merit Scholarship {i}</h2><p>Award: ${rng.randint(5, 50) * 100}\nDeadline: March {i % 28 + 1}, 2026</p>'
+        f'<p>Eligibility: undergraduate students. {link(links // 2 + i)}</p>'
+        for i in range(links // 2)
+    )
+    return (f'<html><head><title>Scholarships {number}</title><meta name="description" content="Awards list">'
+            f'<script>var x = {number};</script><style>p {{ color: red }}</style></head><body>'
+            f'<header><h1>Foundation</h1></header><nav><ul>{nav}</ul></nav><main>{body}</main>'
+            f'<footer>Contact: awards@example.org</footer></body></html>')
+
+
+def old_crawler(soup: BeautifulSoup, url: str):
+    """What `_process_html_page` and `_extract_scholarship_data` used to read."""
+    title = soup.find('title')
+    title_text = title.get_text() if title else ""
+    meta_desc = soup.find('meta', attrs={'name': 'description'})
+    meta_text = meta_desc.get('content', '') if meta_desc else ""
+    text = soup.get_text()
+    links, link_texts = [], {}
+    for a in soup.find_all('a', href=True):
+        full_url = urljoin(url, a['href'])
+        links.append(full_url)
+        anchor_text = a.get_text(' ', strip=True) or a.get('title', '')
+        if anchor_text:
+            link_texts[full_url] = f"{link_texts.get(full_url, '')} {anchor_text}".strip()
+    pdf_links = [urljoin(url, a['href']) for a in soup.find_all('a', href=True) if a['href'].lower().endswith('.pdf')]
+    return title_text, meta_text, text, links, link_texts, pdf_links
+
+
+def old_pipeline(soup: BeautifulSoup):
+    """The old `parse_html_page` after parsing: decompose, get_text, block walk."""
+    title_tag = soup.find('title')
+    title = title_tag.get_text() if title_tag else ""
+    meta_desc = soup.find('meta', attrs={'name': 'description'})
+    meta_text = meta_desc.get('content', '') if meta_desc else ""
+    for script in soup(["script", "style", "nav", "footer", "header"]):
+        script.decompose()
+    text_content = ' '.join(soup.get_text().split())
+    blocks, parts, current = [], [], None
+    for string in soup.find_all(string=True):
+        if type(string) is not NavigableString:
+            continue
+        text = ' '.join(string.split())
+        if not text:
+            continue
+        block = string.parent
+        while block is not None and block.name not in BLOCK_TAGS:
+            block = block.parent
+        if block is not current and parts:
+            blocks.append(' '.join(parts))
+            parts = []
+        if block is not current and block is not None and block.name in HEADING_TAGS:
+            parts.append(HEADING_MARKER.rstrip())
+        current = block
+        parts.append(text)
+    if parts:
+        blocks.append(' '.join(parts))
+    return text_content, title, meta_text, blocks
+
+
+def timed(fn, items):
+    start = time.perf_counter()
+    results = [fn(item) for item in items]
+    return time.perf_counter() - start, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--pages', type=int, default=100)
+    parser.add_argument('--links', type=int, default=400)
+    args = parser.parse_args()
+
+    rng = random.Random(3)
+    pages = [build_page(i, args.links, rng) for i in range(args.pages)]
+    per_page = 1000 / args.pages
+
+    timed(lambda html: BeautifulSoup(html, 'html.parser'), pages[:5])  # warm up before timing
+    parse_time, _ = timed(lambda html: BeautifulSoup(html, 'html.parser'), pages)
+    soups = [BeautifulSoup(html, 'html.parser') for html in pages]
+    crawler_time, crawler = timed(lambda soup: old_crawler(soup, URL), soups)
+    soups = [BeautifulSoup(html, 'html.parser') for html in pages]
+    pipeline_time, pipeline = timed(old_pipeline, soups)
+    soups = [BeautifulSoup(html, 'html.parser') for html in pages]
+    document_walk, documents = timed(lambda soup: ParsedDocument.from_soup(soup, URL), soups)
+    document_time = parse_time + document_walk
+
+    print(f"{args.pages} pages, {args.links} links each, parsing {parse_time * per_page:6.1f} ms/page")
+    print(f"{'old crawler walks':>22}: {crawler_time * per_page:6.1f} ms/page")
+    print(f"{'old pipeline walks':>22}: {pipeline_time * per_page:6.1f} ms/page")
+    print(f"{'ParsedDocument walk':>22}: {document_walk * per_page:6.1f} ms/page (serves both)")
+    print(f"{'crawler page total':>22}: {(parse_time + crawler_time) * per_page:6.1f} -> "
+          f"{document_time * per_page:6.1f} ms/page")
+
+    crawler_match = all(
+        (doc.title, doc.meta_description, doc.text, doc.links, doc.link_texts, doc.pdf_links) == old
+        for doc, old in zip(documents, crawler))
+    pipeline_match = all(
+        (doc.normalized_text, doc.title, doc.meta_description, doc.blocks) == old
+        for doc, old in zip(documents, pipeline))
+    checks = {
+        'crawler parity': crawler_match,
+        'pipeline parity': pipeline_match,
+        'faster walk': document_walk < min(crawler_time, pipeline_time),
+    }
+    print(f"{'checks':>22}: " + ', '.join(f"{name} {'ok' if passed else 'FAILED'}" for name, passed in checks.items()))
+    if not all(checks.values()):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
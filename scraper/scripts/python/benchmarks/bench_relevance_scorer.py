@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Benchmark: precision/recall of the LLM relevance gate.
+
+Builds a labelled synthetic corpus of pages that all pass the old keyword check
+(scholarship listings, detail, fellowship and landing pages vs news posts,
+recipient announcements, research grant news, about/event/careers/shop pages) plus search-result
+snippets, then compares which ones would reach the LLM:
+- the old keyword check (`_is_scholarship_page`),
+- `RelevanceScorer` with its default weights,
+- `RelevanceScorer.fit` trained on half of the corpus (scored on the other half).
+Also reports pages/s, and checks that a model saved and reloaded scores the
+same (exits non-zero if it does not, or if default-weight recall drops below
+--min-recall).
+
+Usage:
+    python scripts/python/benchmarks/bench_relevance_scorer.py --pages 2000
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+from synthetic_data import SCRAPER_ROOT  # noqa: F401  (puts the scraper root on sys.path)
+
+from src.scrapers.content_extraction_pipeline import ContentExtractionPipeline
+from src.scrapers.relevance_scorer import RelevanceScorer
+
+FIELDS = ['Engineering', 'Nursing', 'Education', 'Business', 'Agriculture', 'Music', 'Computer Science']
+ORGS = ['Rotary Club', 'Community Foundation', 'Society of Women Engineers', 'Elks Lodge', 'Farm Bureau']
+FILLER = [
+    'The organization has served the region for more than forty years.',
+    'Volunteers meet on the first Tuesday of each month.',
+    'Contact the office with any questions.',
+    'Parking is available behind the main building.',
+    'Thank you to all of our sponsors and partners.',
+]
+
+
+def filler(rng: random.Random, count: int) -> str:
+    return ' '.join(rng.choice(FILLER) for _ in range(count))
+
+
+def scholarship_entry(rng: random.Random, with_amount: bool = True) -> str:
+    field = rng.choice(FIELDS)
+    parts = [f'{rng.choice(ORGS)} {field} Scholarship.',
+             f'Open to {rng.choice(["undergraduate", "graduate", "high school senior"])} students in {field}.']
+    if with_amount:
+        parts.append(f'Award amount: ${rng.choice([500, 1000, 2500, 5000]):,}.')
+    parts.append(f'Deadline: March {rng.randint(1, 28)}, 2027.')
+    if rng.random() < 0.6:
+        parts.append(f'Applicants must have a minimum GPA of 3.{rng.randint(0, 9)}.')
+    return ' '.join(parts)
+
+
+def positive_page(rng: random.Random) -> str:
+    kind = rng.randrange(5)
+    if kind == 4:  # short landing page that links to the program
+        return (f'Scholarships. The {rng.choice(ORGS)} supports local students each year. '
+                f'Apply online. {filler(rng, 2)}')
+    if kind == 0:  # listing
+        return 'Available scholarships. ' + ' '.join(scholarship_entry(rng) for _ in range(rng.randint(3, 30)))
+    if kind == 1:  # detail page
+        return (f'{scholarship_entry(rng)} How to apply: submit the application form, a transcript and two '
+                f'letters of recommendation. Eligibility requirements are listed below. {filler(rng, 3)}')
+    if kind == 2:  # fellowship without amounts
+        return (f'The {rng.choice(FIELDS)} Fellowship awards a stipend to graduate students for one academic year. '
+                f'Applications open in September and are due December 1. Eligible applicants must be '
+                f'enrolled full-time. {filler(rng, 4)}')
+    # financial aid office page with a news sidebar
+    return (f'Financial aid and institutional scholarships. {scholarship_entry(rng, with_amount=rng.random() < 0.5)} '
+            f'{scholarship_entry(rng)} Latest news: the library extended its hours. Read more. {filler(rng, 2)}')
+
+
+def negative_page(rng: random.Random) -> str:
+    kind = rng.randrange(7)
+    if kind == 6:  # news about last year's recipients
+        return (f'News. Congratulations to our {rng.choice(FIELDS).lower()} scholarship recipients! Posted on '
+                f'June {rng.randint(1, 28)}. The students will be honored at our awards event. Read more. '
+                f'{filler(rng, 3)}')
+    if kind == 0:  # news post about an award
+        return (f'News. Posted on May {rng.randint(1, 28)} by the communications team. Our award-winning '
+                f'{rng.choice(FIELDS).lower()} program was featured in the press. Read more about upcoming events. '
+                f'{filler(rng, 5)}')
+    if kind == 1:  # research grant announcement
+        return (f'Press release: the lab received a research grant of ${rng.randint(1, 9)},000,000 from the '
+                f'national institute. The grant funding supports three years of work. {filler(rng, 4)}')
+    if kind == 2:  # about page
+        return (f'About us. Our mission is to serve the community. Our history began in 19{rng.randint(10, 99)}. '
+                f'Meet our team and the board of directors. Each year we award volunteers for their service. '
+                f'{filler(rng, 4)}')
+    if kind == 3:  # event page
+        return (f'Events. Join our free webinar on financial aid for families on April {rng.randint(1, 28)}. '
+                f'Register for the event online. {filler(rng, 3)}')
+    if kind == 4:  # careers page
+        return (f'Careers. Job openings at the foundation include a grant writer and a program assistant. '
+                f'Apply through our careers portal. {filler(rng, 3)}')
+    return (f'Shop. Custom award plaques and trophies from ${rng.randint(20, 90)}. Add to cart. '
+            f'Free shipping on orders over $50. {filler(rng, 2)}')
+
+
+def search_result(rng: random.Random, positive: bool):
+    slug = rng.choice(FIELDS).lower().replace(' ', '-')
+    if positive:
+        return (f'https://example.org/{rng.choice(["scholarships", "programs", "financial-aid"])}/{slug}',
+                f'{rng.choice(ORGS)} {rng.choice(FIELDS)} Scholarship',
+                rng.choice([f'Apply for a ${rng.choice([1000, 2500])} scholarship for students. Deadline March 1.',
+                            'Scholarship program for undergraduate students. Eligibility and application details.',
+                            'Annual awards for students pursuing a degree in the field.']))
+    return (f'https://example.org/{rng.choice(["news", "about", "blog", "events"])}/{slug}',
+            rng.choice(['Award-winning program featured', 'Our history and mission', 'Grant funding announced']),
+            rng.choice(['Read more news from our team.', 'Posted on May 3 by staff. Research grant awarded.',
+                        'Join our webinar on financial aid.']))
+
+
+def report(label: str, predictions, labels, elapsed: float):
+    true_pos = sum(1 for p, y in zip(predictions, labels) if p and y)
+    sent = sum(predictions)
+    positives = sum(labels)
+    precision = true_pos / sent if sent else 0.0
+    recall = true_pos / positives if positives else 0.0
+    rate = len(labels) / elapsed if elapsed else float('inf')
+    print(f"{label:>26}: precision {precision:6.1%}  recall {recall:6.1%}  "
+          f"LLM calls {sent:5d}/{len(labels)}  {rate:9,.0f} items/s")
+    return recall
+
+
+def timed(fn, items):
+    start = time.perf_counter()
+    results = [fn(item) for item in items]
+    return results, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--pages', type=int, default=2000)
+    parser.add_argument('--positive-share', type=float, default=0.3, help='Share of pages that are scholarship pages')
+    parser.add_argument('--min-recall', type=float, default=0.95)
+    args = parser.parse_args()
+
+    rng = random.Random(17)
+    labels = [rng.random() < args.positive_share for _ in range(args.pages)]
+    pages = [positive_page(rng) if label else negative_page(rng) for label in labels]
+    assert all(ContentExtractionPipeline._is_scholarship_page(page) for page in pages)
+    split = len(pages) // 2
+    test_pages, test_labels = pages[split:], labels[split:]
+
+    default = RelevanceScorer()
+    trained = RelevanceScorer().fit(pages[:split], labels[:split])
+
+    print(f"{len(test_pages)} pages scored ({sum(test_labels)} scholarship pages), "
+          f"every one passes the old keyword check")
+    predictions, elapsed = timed(ContentExtractionPipeline._is_scholarship_page, test_pages)
+    report('keyword check (old)', predictions, test_labels, elapsed)
+    predictions, elapsed = timed(default.is_relevant, test_pages)
+    default_recall = report('RelevanceScorer default', predictions, test_labels, elapsed)
+    predictions, elapsed = timed(trained.is_relevant, test_pages)
+    report('RelevanceScorer trained', predictions, test_labels, elapsed)
+
+    source_labels = [rng.random() < 0.5 for _ in range(args.pages // 2)]
+    sources = [search_result(rng, label) for label in source_labels]
+    print(f"\n{len(sources)} search results ({sum(source_labels)} scholarship providers)")
+    predictions, elapsed = timed(lambda source: True, sources)
+    report('no filter (old)', predictions, source_labels, elapsed)
+    predictions, elapsed = timed(lambda source: default.is_relevant_source(*source), sources)
+    report('RelevanceScorer default', predictions, source_labels, elapsed)
+
+    handle, path = tempfile.mkstemp(suffix='.json')
+    os.close(handle)
+    try:
+        trained.save(path)
+        reloaded = RelevanceScorer.load(path)
+    finally:
+        os.unlink(path)
+    roundtrip_ok = all(abs(trained.score(page) - reloaded.score(page)) < 1e-3 for page in test_pages[:200])
+    print(f"\nsaved model reload: {'ok' if roundtrip_ok else 'MISMATCH'}")
+
+    if not roundtrip_ok or default_recall < args.min_recall:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Benchmark: detail-page fetches per night with the adaptive revisit policy.
+
+Simulates --days nightly runs over --pages detail pages whose content changes
+at random (Poisson) with a mix of rates: 5% about daily, 15% weekly, 30%
+monthly and 50% twice a year. Each page has a deadline spread over the
+simulated period (some none). The policy's own scheduling (`advance`,
+`interval`, the due slack) decides which pages a run fetches; the
+`page_revisits` table is replaced by a dict, so no database is needed.
+
+Reports fetches per night (steady state, second half) against refetching
+everything, and freshness: the share of pages whose stored copy matches the
+live page right after a run. Checks that pages with a deadline inside the
+window are fresh after every run and expired pages are fetched at most
+about once per max interval; exits non-zero otherwise.
+
+Usage:
+    python scripts/python/benchmarks/bench_revisit_policy.py --pages 2000 --days 120
+"""
+
+import argparse
+import math
+import random
+import sys
+from datetime import datetime, timedelta
+
+from synthetic_data import SCRAPER_ROOT  # noqa: F401  (puts the scraper root on sys.path)
+
+from src.utils_python.revisit_policy import DUE_SLACK_SEC, RevisitPolicy
+
+CHANGE_RATES = [(0.05, 1.0), (0.15, 1 / 7), (0.30, 1 / 30), (0.50, 1 / 180)]  # (share, changes per day)
+
+
+def change_times(rate: float, days: int, rng: random.Random):
+    times, t = [], rng.expovariate(rate)
+    while t < days:
+        times.append(t)
+        t += rng.expovariate(rate)
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--pages', type=int, default=2000)
+    parser.add_argument('--days', type=int, default=120)
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+    rng = random.Random(args.seed)
+    policy = RevisitPolicy(db_manager=None)
+    start = datetime(2026, 1, 1, 2, 0)
+
+    pages = []
+    for i in range(args.pages):
+        pick, rate = rng.random(), CHANGE_RATES[-1][1]
+        for share, candidate in CHANGE_RATES:
+            if pick < share:
+                rate = candidate
+                break
+            pick -= share
+        deadline_day = rng.randint(0, args.days + 60) if rng.random() < 0.8 else None
+        deadline = (start + timedelta(days=deadline_day)).strftime('%Y-%m-%d') if deadline_day is not None else None
+        pages.append({'changes': change_times(rate, args.days, rng), 'deadline': deadline,
+                      'deadline_day': deadline_day, 'history': None, 'next_due': None, 'stored': None,
+                      'late_fetches': 0})
+
+    fetches, fresh, window_stale = [], [], 0
+    for day in range(args.days):
+        now = start + timedelta(days=day)
+        cutoff = now + timedelta(seconds=DUE_SLACK_SEC)
+        fetched = 0
+        for page in pages:
+            version = sum(1 for t in page['changes'] if t <= day)
+            if page['next_due'] is None or page['next_due'] <= cutoff:
+                fetched += 1
+                page['history'] = policy.advance(page['history'], str(version), now)
+                page['next_due'] = now + timedelta(seconds=policy.interval(page['history'], page['deadline'], now))
+                page['stored'] = version
+                if page['deadline_day'] is not None and page['deadline_day'] < day - 1 and day >= args.days // 2:
+                    page['late_fetches'] += 1
+            if page['deadline_day'] is not None and 0 <= page['deadline_day'] - day <= policy.deadline_window_days:
+                window_stale += page['stored'] != version
+        fetches.append(fetched)
+        fresh.append(sum(page['stored'] == sum(1 for t in page['changes'] if t <= day) for page in pages) / len(pages))
+
+    half = args.days // 2
+    steady = sum(fetches[half:]) / (args.days - half)
+    freshness = sum(fresh[half:]) / (args.days - half)
+    print(f"{args.pages} pages, {args.days} nightly runs (steady state: last {args.days - half})")
+    print(f"{'refetch everything':>22}: {args.pages:8.0f} fetches/night  freshness 100.0%")
+    print(f"{'revisit policy':>22}: {steady:8.0f} fetches/night  freshness {freshness * 100:5.1f}%  "
+          f"({args.pages / steady:.1f}x fewer fetches)")
+
+    max_late = math.ceil((args.days - half) * 86400 / policy.max_interval) + 1
+    checks = {
+        'deadline window fresh': window_stale == 0,
+        'expired pages rarely fetched': max(page['late_fetches'] for page in pages) <= max_late,
+    }
+    print(f"{'checks':>22}: " + ', '.join(f"{name} {'ok' if passed else 'FAILED'}" for name, passed in checks.items()))
+    if not all(checks.values()):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Benchmark: robots.txt checks for 100k URLs against large robots files.
+
+Builds a robots.txt with thousands of prefix, `$`-anchored and `*` rules and
+checks URLs three ways:
+- the old `can_fetch` (linear prefix scan, no wildcards or precedence),
+- a brute-force RFC 9309 reference (every rule as a regex, longest match),
+- the compiled `RobotsMatcher` used by `RobotsTxtRules.can_fetch`.
+The compiled matcher must agree with the reference on every URL, and with
+the expected answers on percent-encoding cases (RFC 9309 2.2.2).
+
+Usage:
+    python scripts/python/benchmarks/bench_robots_matcher.py --urls 100000 --rules 5000
+"""
+
+import argparse
+import random
+import re
+import sys
+import time
+from urllib.parse import urlparse
+
+from synthetic_data import SCRAPER_ROOT  # noqa: F401  (puts the scraper root on sys.path)
+
+from src.scrapers.robots_txt import normalize_robots_path, parse_robots_txt
+
+SECTIONS = ['scholarships', 'news', 'events', 'students', 'admin', 'search', 'media', 'programs', 'about', 'shop']
+
+# (rule, path, allowed): escapes of unreserved characters equal the characters, hex case
+# does not matter, non-ASCII equals its UTF-8 escapes, %2A/%24 are literal `*`/`$`
+ENCODING_CASES = [
+    ('/%7Ejoe', '/~joe/index.html', False),
+    ('/~joe', '/%7ejoe/index.html', False),
+    ('/foo/bar/%62%61%7A', '/foo/bar/baz', False),
+    ('/foo/bar/\u30c4', '/foo/bar/%E3%83%84', False),
+    ('/foo/bar/%e3%83%84', '/foo/bar/\u30c4', False),
+    ('/path/file-with-a-%2A.html', '/path/file-with-a-*.html', False),
+    ('/path/file-with-a-%2A.html', '/path/file-with-a-x.html', True),
+    ('/path/foo-%24', '/path/foo-$', False),
+    ('/a%2Fb', '/a/b', True),
+]
+
+
+def build_robots(rule_count: int, rng: random.Random) -> str:
+    lines = ['User-agent: *']
+    for index in range(rule_count):
+        section = rng.choice(SECTIONS)
+        kind = rng.random()
+        directive = 'Allow' if rng.random() < 0.3 else 'Disallow'
+        if kind < 0.7:
+            lines.append(f"{directive}: /{section}/{index}")
+        elif kind < 0.8:
+            lines.append(f"{directive}: /{section}/{index}.html$")
+        else:
+            lines.append(f"{directive}: /{section}/*{rng.choice(['.pdf$', '?sessionid=', '/print', '-draft'])}{index % 7}")
+    lines += ['Disallow: /admin', 'Allow: /admin/public', 'Disallow: /*?replytocom=',
+              'Disallow: /%7estaff', 'Allow: /~staff/%70ublic']
+    return '\n'.join(lines)
+
+
+def build_urls(count: int, rule_count: int, rng: random.Random):
+    suffixes = ['', '.html', '/page', '.pdf', '?sessionid=3', '/print1', '-draft4', '?replytocom=9']
+    staff = ['~staff/cv', '%7Estaff/public/x', '~staff/public']
+    return [f"https://www.example.org/{rng.choice(staff)}" if rng.random() < 0.01 else
+            f"https://www.example.org/{rng.choice(SECTIONS)}/{rng.randrange(rule_count)}{rng.choice(suffixes)}"
+            for _ in range(count)]
+
+
+def legacy_can_fetch(url, allowed, disallowed):
+    """The RobotsTxtParser.can_fetch implementation before the compiled matcher."""
+    path = urlparse(url).path
+    for rule in disallowed:
+        if path.startswith(rule):
+            return False
+    if allowed:
+        for rule in allowed:
+            if path.startswith(rule):
+                return True
+        return False
+    return True
+
+
+def reference_checker(rules):
+    compiled = []
+    for pattern, allow in rules:
+        pattern = normalize_robots_path(pattern, pattern=True)
+        anchored = pattern.endswith('$')
+        body = pattern[:-1] if anchored else pattern
+        regex = '.*'.join(re.escape(part) for part in body.split('*')) + (r'\Z' if anchored else '')
+        compiled.append((len(pattern), allow, re.compile(regex, re.DOTALL)))
+
+    def is_allowed(url):
+        parts = urlparse(url)
+        path = normalize_robots_path((parts.path or '/') + (f"?{parts.query}" if parts.query else ''))
+        best = None
+        for length, allow, regex in compiled:
+            if regex.match(path) and (best is None or length > best[0] or (length == best[0] and allow)):
+                best = (length, allow)
+        return best is None or best[1]
+    return is_allowed
+
+
+def rate(label: str, urls, check) -> float:
+    start = time.perf_counter()
+    results = [check(url) for url in urls]
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<30} {len(urls) / elapsed:>12,.0f} URLs/s  ({sum(results):,} allowed)")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Robots.txt matcher benchmark')
+    parser.add_argument('--urls', type=int, default=100_000)
+    parser.add_argument('--rules', type=int, default=5_000)
+    parser.add_argument('--reference-urls', type=int, default=5_000,
+                        help='URLs checked against the brute-force reference (it is slow)')
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    rules = parse_robots_txt(build_robots(args.rules, rng), 'ScholarshipTrackerBot/1.0')
+    urls = build_urls(args.urls, args.rules, rng)
+
+    print(f"{len(rules.rules):,} rules, {len(urls):,} URLs")
+    rate('legacy prefix scan', urls[:args.reference_urls], lambda url: legacy_can_fetch(url, rules.allowed, rules.disallowed))
+    expected = rate('RFC 9309 brute-force reference', urls[:args.reference_urls], reference_checker(rules.rules))
+
+    start = time.perf_counter()
+    rules.can_fetch(urls[0])
+    print(f"  compile matcher                {(time.perf_counter() - start) * 1000:>12.1f} ms")
+    actual = rate('compiled RobotsMatcher', urls, rules.can_fetch)
+
+    mismatches = [url for url, want, got in zip(urls, expected, actual) if want != got]
+    if mismatches:
+        print(f"MISMATCH on {len(mismatches)} URLs, e.g. {mismatches[:3]}")
+        sys.exit(1)
+    print(f"Parity OK against the reference on {len(expected):,} URLs")
+
+    wrong = [(rule, path) for rule, path, allowed in ENCODING_CASES
+             if parse_robots_txt(f"User-agent: *\nDisallow: {rule}", 'ScholarshipTrackerBot/1.0')
+             .can_fetch(f"https://www.example.org{path}") != allowed]
+    if wrong:
+        print(f"WRONG on percent-encoding cases: {wrong}")
+        sys.exit(1)
+    print(f"Percent-encoding OK on {len(ENCODING_CASES)} RFC 9309 cases")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Benchmark: memory per row and DB-tuple conversion rate for scholarship batches.
+
+Compares the legacy dict-backed dataclass layout, the slotted `Scholarship`
+and the columnar `ScholarshipBatch` on synthetic rows. Conversion is timed on
+the synthetic rows, whose list fields repeat across rows as scraped ones do,
+and again with every list value made distinct (no JSON cache hits).
+
+Checks that cached conversion matches uncached normalization and that
+`_scholarship_params` outruns the legacy path in both cases; exits non-zero
+otherwise.
+
+Usage:
+    python scripts/python/benchmarks/bench_scholarship_memory.py --rows 100000
+"""
+
+import argparse
+import sys
+import time
+import tracemalloc
+from dataclasses import fields, make_dataclass
+
+from synthetic_data import make_scholarships
+
+from src.utils_python import Scholarship, ScholarshipBatch, SCHOLARSHIP_FIELDS
+from src.utils_python.database_manager import COLLECTION_FIELDS, DatabaseManager
+from src.utils_python.scholarship_batch import scholarship_row
+
+# The pre-slots layout: same fields, per-instance __dict__
+LegacyScholarship = make_dataclass(
+    'LegacyScholarship', [(f.name, f.type, f.default) for f in fields(Scholarship)]
+)
+
+
+def measure_bytes(build) -> tuple:
+    """Return (object, bytes allocated while building it)."""
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    built = build()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    allocated = sum(stat.size_diff for stat in after.compare_to(before, 'filename'))
+    return built, allocated
+
+
+def legacy_params(scholarship) -> tuple:
+    """The per-row dict path `save_scholarship` used before batching."""
+    data = {k: v for k, v in scholarship.__dict__.items() if v is not None}
+    for name in ('subject_areas', 'eligibility', 'academic_level', 'geographic_restrictions', 'ethnicity'):
+        if name in data:
+            normalized = DatabaseManager._normalize_string_collection(data[name], lowercase=True)
+            if normalized is None:
+                data.pop(name, None)
+            else:
+                data[name] = normalized
+    return tuple(data.keys()), list(data.values())
+
+
+def distinct_value(value, index: int):
+    """Tag every item of a list field (or a comma-separated string) with the row index."""
+    if isinstance(value, str):
+        return ', '.join(f"{item} {index}" for item in value.split(','))
+    return [f"{item} {index}" for item in value]
+
+
+def distinct_collections(source):
+    """Copies of `source` whose list fields hold values no other row has."""
+    rows = []
+    for index, scholarship in enumerate(source):
+        row = scholarship_row(scholarship)
+        rows.append(Scholarship(*(
+            distinct_value(value, index) if name in COLLECTION_FIELDS and value else value
+            for name, value in zip(SCHOLARSHIP_FIELDS, row)
+        )))
+    return rows
+
+
+def uncached_params(row) -> tuple:
+    """`_scholarship_params` with every list field normalized from scratch."""
+    columns, params = [], []
+    for name, value in zip(SCHOLARSHIP_FIELDS, row):
+        if name in COLLECTION_FIELDS and value is not None:
+            value = DatabaseManager._normalize_string_collection(value, lowercase=True)
+        columns.append(name)
+        params.append(value)
+    return DatabaseManager._scholarship_params(params)
+
+
+def rate(label: str, count: int, func, repeat: int = 3) -> float:
+    """Print and return the best rows/s of `repeat` runs."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    rows_per_sec = count / best
+    print(f"  {label:<34} {rows_per_sec:>12,.0f} rows/s")
+    return rows_per_sec
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Scholarship memory/throughput benchmark')
+    parser.add_argument('--rows', type=int, default=100_000)
+    args = parser.parse_args()
+
+    source = make_scholarships(args.rows)
+    rows = [scholarship_row(s) for s in source]
+
+    legacy, legacy_bytes = measure_bytes(lambda: [LegacyScholarship(*row) for row in rows])
+    slotted, slotted_bytes = measure_bytes(lambda: [Scholarship(*row) for row in rows])
+    batch, batch_bytes = measure_bytes(lambda: ScholarshipBatch(slotted))
+
+    print(f"Container overhead for {args.rows:,} rows (field values shared, not counted):")
+    print(f"  {'dict-backed dataclass':<34} {legacy_bytes / args.rows:>8.1f} bytes/row")
+    print(f"  {'slotted Scholarship':<34} {slotted_bytes / args.rows:>8.1f} bytes/row")
+    print(f"  {'ScholarshipBatch (columnar)':<34} {batch_bytes / args.rows:>8.1f} bytes/row")
+
+    print("Conversion to DB parameter tuples:")
+    legacy_rate = rate('legacy __dict__ + normalize', args.rows, lambda: [legacy_params(s) for s in legacy])
+    slotted_rate = rate('slotted -> _scholarship_params', args.rows,
+                        lambda: [DatabaseManager._scholarship_params(scholarship_row(s)) for s in slotted])
+    rate('batch -> _scholarship_params', args.rows,
+         lambda: [DatabaseManager._scholarship_params(row) for row in batch.iter_rows()])
+    rate('batch -> to_param_tuples (raw)', args.rows, lambda: batch.to_param_tuples(SCHOLARSHIP_FIELDS))
+
+    distinct = distinct_collections(source)
+    distinct_legacy = [LegacyScholarship(*scholarship_row(s)) for s in distinct]
+    print("Conversion with distinct list values in every row:")
+    distinct_legacy_rate = rate('legacy __dict__ + normalize', args.rows,
+                                lambda: [legacy_params(s) for s in distinct_legacy])
+    distinct_rate = rate('slotted -> _scholarship_params', args.rows,
+                         lambda: [DatabaseManager._scholarship_params(scholarship_row(s)) for s in distinct])
+
+    checks = {
+        'cached = uncached params': all(
+            DatabaseManager._scholarship_params(scholarship_row(s)) == uncached_params(scholarship_row(s))
+            for s in slotted[:5000]
+        ),
+        'faster than legacy': slotted_rate > legacy_rate,
+        'faster than legacy (distinct)': distinct_rate > distinct_legacy_rate,
+    }
+    print(f"  {'checks':<34} " + ', '.join(f"{name} {'ok' if passed else 'FAILED'}" for name, passed in checks.items()))
+    if not all(checks.values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
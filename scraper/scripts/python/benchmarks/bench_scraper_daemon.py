@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Benchmark: per-run overhead of cron-style runs vs the scraper daemon.
+
+- Cold: starts --runs fresh interpreters that import the scraper stack and
+  build a CareerOneStop scraper, which is what every cron run of main.py
+  pays before scraping anything.
+- Warm: `ScraperDaemon` with a small registered scraper on a sub-second
+  cadence; reports per-run overhead, checks the scraper instance is reused,
+  reads /healthz and /metrics, then sends itself SIGTERM mid-run and checks
+  the daemon drains (the run in progress completes) before exiting.
+No database is needed; job status writes fail fast and are ignored. Exits
+non-zero if a check fails.
+
+Usage:
+    python scripts/python/benchmarks/bench_scraper_daemon.py --runs 5
+"""
+
+import argparse
+import json
+import logging
+import os
+import signal
+import socket
+import subprocess
+import sys
+import threading
+import time
+import urllib.request
+
+from synthetic_data import SCRAPER_ROOT
+
+os.environ['SCRAPER_HEARTBEAT_SEC'] = '0'
+
+from src.scrapers.base_scraper import BaseScraper  # noqa: E402
+from src.scrapers.scraper_daemon import ScraperDaemon  # noqa: E402
+from src.scrapers.scraper_factory import ScraperFactory  # noqa: E402
+from src.utils_python import Scholarship, ScrapingResult  # noqa: E402
+
+COLD_RUN = ("import os, logging; logging.disable(logging.CRITICAL); "
+            "from src.scrapers.scraper_factory import ScraperFactory; "
+            "ScraperFactory.create_scraper('careeronestop')")
+
+
+class BenchScraper(BaseScraper):
+    instances = 0
+    work = 0.2
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        BenchScraper.instances += 1
+        self.runs = 0
+        self.finished = 0
+
+    def scrape(self) -> ScrapingResult:
+        self.runs += 1
+        time.sleep(self.work)
+        self.finished += 1
+        return ScrapingResult(success=True, scholarships=[Scholarship(title=f'Run {self.runs}')],
+                              errors=[], metadata={'total_found': 1})
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def get(url: str):
+    try:
+        with urllib.request.urlopen(url, timeout=5) as response:
+            return response.status, response.read().decode('utf-8')
+    except urllib.error.HTTPError as e:
+        return e.code, e.read().decode('utf-8')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--cadence', type=float, default=0.5, help='Seconds between daemon runs')
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+
+    start = time.perf_counter()
+    for _ in range(args.runs):
+        subprocess.run([sys.executable, '-c', COLD_RUN], cwd=SCRAPER_ROOT, check=True)
+    cold = (time.perf_counter() - start) / args.runs
+    print(f"{'cold start (cron)':>22}: {cold * 1000:8.1f} ms per run before scraping")
+
+    ScraperFactory.register_scraper('bench', BenchScraper)
+    port = free_port()
+    daemon = ScraperDaemon(cadences={'bench': args.cadence}, metrics_port=port)
+    daemon.install_signal_handlers()
+    checks = {}
+
+    def drive():
+        deadline = time.time() + 30
+        while time.time() < deadline:
+            scraper = daemon.scrapers.get('bench')
+            if scraper and scraper.finished >= args.runs and daemon.running == 'bench':
+                break
+            time.sleep(0.01)
+        status, body = get(f'http://127.0.0.1:{port}/healthz')
+        checks['health'] = status == 200 and json.loads(body)['running'] == 'bench'
+        status, body = get(f'http://127.0.0.1:{port}/metrics')
+        checks['metrics'] = status == 200 and f'scraper_runs_total{{website="bench",status="success"}} {args.runs}' in body
+        os.kill(os.getpid(), signal.SIGTERM)  # mid-run: must drain
+        status, body = get(f'http://127.0.0.1:{port}/healthz')
+        checks['draining'] = status == 503 and json.loads(body)['status'] == 'draining'
+
+    threading.Thread(target=drive, daemon=True).start()
+    start = time.perf_counter()
+    daemon.serve_forever()
+    elapsed = time.perf_counter() - start
+
+    stats = daemon.stats['bench']
+    runs = stats.runs_succeeded
+    idle = (runs - 1) * args.cadence + runs * BenchScraper.work
+    overhead = max(elapsed - idle, 0) / runs
+    checks['drained'] = runs == args.runs + 1
+    checks['reused'] = BenchScraper.instances == 1
+    print(f"{'daemon (warm)':>22}: {overhead * 1000:8.1f} ms per run overhead over {runs} runs "
+          f"({BenchScraper.instances} scraper instance)")
+    print(f"{'checks':>22}: " + ', '.join(f"{name} {'ok' if passed else 'FAILED'}" for name, passed in checks.items()))
+    if not all(checks.values()):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
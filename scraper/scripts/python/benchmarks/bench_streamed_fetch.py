@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Benchmark: bytes downloaded, peak memory and decoding of buffered vs streamed page fetches.
+
+Starts a local HTTP server with the kinds of URL the discovery path runs into:
+- a --video-mb MB video and a --huge-mb MB HTML page,
+- ordinary pages: UTF-8 without a charset anywhere, latin-1 declared only in
+  <meta charset>, windows-1252 declared nowhere, and UTF-8 declared in the header.
+Each URL is fetched two ways:
+- buffered: `session.get` then `response.text`, the whole body read before
+  anything is decided (requests falls back to ISO-8859-1 for text/* without
+  a header charset);
+- streamed: `stream=True`, `media_type` checked from the headers, then
+  `read_text` with the --cap-mb cap, as `EthicalCrawler._crawl_page` and
+  `ContentExtractionPipeline.extract_from_url` do now.
+
+Reports bytes the server got to send, peak traced memory and time. Checks
+that the video body is never read, the huge page is abandoned near the cap,
+every ordinary page decodes to its source text and streaming peaks lower;
+exits non-zero otherwise.
+
+Usage:
+    python scripts/python/benchmarks/bench_streamed_fetch.py --video-mb 200 --huge-mb 50
+"""
+
+import argparse
+import socket
+import sys
+import threading
+import time
+import tracemalloc
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from synthetic_data import SCRAPER_ROOT  # noqa: F401  (puts the scraper root on sys.path)
+
+from src.scrapers.http_client import (HTML_MEDIA_TYPES, ResponseTooLargeError, create_session, media_type,
+                                      read_text)
+
+ROW = 'Bourse d’études – Fundación Niño award, deadline 1 March. '
+PAGES = {
+    '/utf8-undeclared.html': ('text/html', 'utf-8', ''),
+    '/latin1-meta.html': ('text/html', 'latin-1', '<meta charset="iso-8859-1">'),
+    '/cp1252-undeclared.html': ('text/html', 'cp1252', ''),
+    '/utf8-header.html': ('text/html; charset=utf-8', 'utf-8', ''),
+}
+
+
+def page_text(meta: str, encoding: str) -> str:
+    row = ROW if encoding != 'latin-1' else ROW.replace('’', "'").replace('–', '-')
+    return f'<html><head>{meta}<title>Awards</title></head><body>' + f'<p>{row}</p>' * 4000 + '</body></html>'
+
+
+def start_server(video_bytes: int, huge_bytes: int):
+    sent = {}
+    lock = threading.Lock()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def setup(self):
+            super().setup()
+            self.request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+        def stream(self, content_type: str, size: int, chunk: bytes):
+            self.send_response(200)
+            self.send_header('Content-Type', content_type)
+            self.send_header('Connection', 'close')
+            self.end_headers()
+            self.close_connection = True
+            written = 0
+            try:
+                while written < size:
+                    self.wfile.write(chunk)
+                    written += len(chunk)
+            except (BrokenPipeError, ConnectionResetError):
+                pass
+            with lock:
+                sent[self.path] = sent.get(self.path, 0) + written
+
+        def do_GET(self):
+            if self.path == '/video.mp4':
+                return self.stream('video/mp4', video_bytes, b'\0' * 65536)
+            if self.path == '/huge.html':
+                return self.stream('text/html', huge_bytes, b'<p>filler row</p>' * 4096)
+            content_type, encoding, meta = PAGES[self.path]
+            body = page_text(meta, encoding).encode(encoding)
+            self.send_response(200)
+            self.send_header('Content-Type', content_type)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            with lock:
+                sent[self.path] = sent.get(self.path, 0) + len(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, sent
+
+
+def buffered(session, url: str, cap: int):
+    response = session.get(url, timeout=30)
+    response.raise_for_status()
+    if 'text/html' not in response.headers.get('Content-Type', ''):
+        response.content  # already downloaded; the type check came too late
+        return None
+    return response.text
+
+
+def streamed(session, url: str, cap: int):
+    with session.get(url, timeout=30, stream=True) as response:
+        response.raise_for_status()
+        if media_type(response) not in HTML_MEDIA_TYPES:
+            return None
+        try:
+            return read_text(response, cap)[0]
+        except ResponseTooLargeError:
+            return None
+
+
+def run(fetch, base: str, sent: dict, cap: int):
+    sent.clear()
+    session = create_session()
+    texts = {}
+    tracemalloc.start()
+    start = time.perf_counter()
+    for path in ['/video.mp4', '/huge.html'] + list(PAGES):
+        texts[path] = fetch(session, base + path, cap)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    time.sleep(0.2)  # let the server threads notice the closed connections
+    return texts, elapsed, peak, dict(sent)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--video-mb', type=float, default=200.0)
+    parser.add_argument('--huge-mb', type=float, default=50.0)
+    parser.add_argument('--cap-mb', type=float, default=5.0)
+    args = parser.parse_args()
+    mb = 1024 * 1024
+    cap = int(args.cap_mb * mb)
+
+    server, sent = start_server(int(args.video_mb * mb), int(args.huge_mb * mb))
+    base = f'http://127.0.0.1:{server.server_address[1]}'
+    runs = {name: run(fetch, base, sent, cap) for name, fetch in (('buffered', buffered), ('streamed', streamed))}
+    server.shutdown()
+
+    expected = {path: page_text(meta, encoding) for path, (_, encoding, meta) in PAGES.items()}
+    for name, (texts, elapsed, peak, sent_bytes) in runs.items():
+        decoded = sum(texts[path] == text for path, text in expected.items())
+        print(f"{name:>10}: {elapsed:6.2f}s  peak {peak / mb:7.1f} MB  sent: video {sent_bytes.get('/video.mp4', 0) / mb:6.1f} MB, "
+              f"huge page {sent_bytes.get('/huge.html', 0) / mb:6.1f} MB  pages decoded {decoded}/{len(expected)}")
+
+    (_, _, buffered_peak, _), (texts, _, streamed_peak, sent_bytes) = runs['buffered'], runs['streamed']
+    checks = {
+        # Socket buffers may take a few MB before the client hangs up
+        'video not read': sent_bytes.get('/video.mp4', 0) < 16 * mb,
+        'huge page capped': texts['/huge.html'] is None and sent_bytes.get('/huge.html', 0) < cap + 16 * mb,
+        'pages decoded': all(texts[path] == text for path, text in expected.items()),
+        'lower peak': streamed_peak < buffered_peak,
+    }
+    print(f"{'checks':>10}: " + ', '.join(f"{name} {'ok' if passed else 'FAILED'}" for name, passed in checks.items()))
+    if not all(checks.values()):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Benchmark: peak memory and time to first saved row, materialized vs streaming scrape.
+
+A synthetic listing scraper produces --pages pages of --rows scholarships
+(with some repeats across pages), each page taking --page-ms to "fetch".
+- materialized: the old `scrape()` shape, collecting every page, de-duplicating
+  the list and saving at the end;
+- streaming: `iter_scholarships()` consumed by `BaseScraper.scrape`, which
+  de-duplicates and saves each row as it arrives.
+`save_scholarship` is replaced by a counter, so no database is needed.
+
+Reports peak traced memory (tracemalloc) and when the first row was saved.
+Checks that both save the same rows and that streaming peaks lower and saves
+its first row earlier; exits non-zero otherwise.
+
+Usage:
+    python scripts/python/benchmarks/bench_streaming_scrape.py --pages 200
+"""
+
+import argparse
+import sys
+import time
+import tracemalloc
+
+from synthetic_data import SCRAPER_ROOT, make_scholarships  # noqa: F401  (puts the scraper root on sys.path)
+
+from src.scrapers.base_scraper import BaseScraper, dedupe_key
+from src.utils_python import ScrapingResult
+
+
+class SyntheticScraper(BaseScraper):
+    """Pages of synthetic rows; records what gets saved and when."""
+
+    def __init__(self, pages: int, rows: int, page_sec: float):
+        super().__init__(environment='local')
+        self.pages, self.rows, self.page_sec = pages, rows, page_sec
+        self.saved_keys = []
+        self.started = self.first_saved = 0.0
+
+    def page(self, number: int):
+        time.sleep(self.page_sec)
+        rows = make_scholarships(self.rows, seed=number)
+        for index, row in enumerate(rows):
+            # Every tenth row repeats one from the previous page
+            row.title = f"Award {number - 1 if index % 10 == 0 else number}-{index}"
+        return rows
+
+    def save_scholarship(self, scholarship) -> bool:
+        if not self.saved_keys:
+            self.first_saved = time.perf_counter() - self.started
+        self.saved_keys.append(dedupe_key(scholarship))
+        return True
+
+
+class MaterializedScraper(SyntheticScraper):
+    def scrape(self) -> ScrapingResult:
+        scholarships = []
+        for number in range(1, self.pages + 1):
+            scholarships.extend(self.page(number))
+        seen, unique = set(), []
+        for scholarship in scholarships:
+            key = dedupe_key(scholarship)
+            if key not in seen:
+                seen.add(key)
+                unique.append(scholarship)
+        for scholarship in unique:
+            self.save_scholarship(scholarship)
+        return ScrapingResult(success=True, scholarships=unique, errors=[], metadata={'total_found': len(unique)})
+
+
+class StreamingScraper(SyntheticScraper):
+    def iter_scholarships(self):
+        for number in range(1, self.pages + 1):
+            yield from self.page(number)
+
+
+def measure(scraper: SyntheticScraper):
+    tracemalloc.start()
+    scraper.started = time.perf_counter()
+    result = scraper.scrape()
+    elapsed = time.perf_counter() - scraper.started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--pages', type=int, default=200)
+    parser.add_argument('--rows', type=int, default=25)
+    parser.add_argument('--page-ms', type=float, default=5.0)
+    args = parser.parse_args()
+
+    runs = {}
+    for name, cls in (('materialized', MaterializedScraper), ('streaming', StreamingScraper)):
+        scraper = cls(args.pages, args.rows, args.page_ms / 1000)
+        result, elapsed, peak = measure(scraper)
+        runs[name] = (scraper, peak)
+        print(f"{name:>14}: {elapsed:6.2f}s  peak {peak / 1e6:7.2f} MB  first row saved after "
+              f"{scraper.first_saved * 1000:8.1f} ms  ({result.metadata['total_found']} rows)")
+
+    (materialized, materialized_peak), (streaming, streaming_peak) = runs['materialized'], runs['streaming']
+    checks = {
+        'same rows saved': materialized.saved_keys == streaming.saved_keys,
+        'lower peak': streaming_peak < materialized_peak,
+        'earlier first row': streaming.first_saved < materialized.first_saved,
+    }
+    print(f"{'checks':>14}: " + ', '.join(f"{name} {'ok' if passed else 'FAILED'}" for name, passed in checks.items()))
+    if not all(checks.values()):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
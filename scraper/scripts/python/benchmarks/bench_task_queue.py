@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Benchmark: detail-page throughput of the MySQL task queue with more workers.
+
+Needs a MySQL 8 server (SKIP LOCKED) reachable through the MYSQL_* variables.
+In a scratch database it queues --tasks tasks spread over --hosts hosts and
+drains them with 1 and then --workers `TaskQueue` workers (threads with their
+own connections standing in for `main.py --worker` processes on other nodes),
+each task taking --work-ms. Checks:
+- every task is done exactly once,
+- a batch whose worker dies is claimed again after its lease expires,
+- a failing task is retried and then marked failed after max_attempts,
+- `reserve_host_slot` spaces one host's requests --interval apart across all
+  workers.
+Exits non-zero if a check fails.
+
+A local server for this benchmark:
+    docker run -d --name bench-mysql -p 3306:3306 -e MYSQL_ALLOW_EMPTY_PASSWORD=1 mysql:8
+
+Usage:
+    MYSQL_HOST=127.0.0.1 python scripts/python/benchmarks/bench_task_queue.py --tasks 400 --workers 8
+"""
+
+import argparse
+import os
+import sys
+import threading
+import time
+
+from synthetic_data import SCRAPER_ROOT  # noqa: F401  (puts the scraper root on sys.path)
+
+import pymysql
+
+from src.utils_python.database_manager import LocalDatabaseManager
+from src.utils_python.task_queue import TaskQueue
+
+
+def queue(**kwargs) -> TaskQueue:
+    return TaskQueue(LocalDatabaseManager(), **kwargs)
+
+
+def drain(workers: int, work: float, batch: int):
+    """Process every queued task with `workers` threads; returns (seconds, processed task ids)."""
+    processed = []
+    lock = threading.Lock()
+
+    def worker(name):
+        tasks_queue = queue()
+        while True:
+            tasks = tasks_queue.claim(name, batch)
+            if not tasks:
+                break
+            for task in tasks:
+                time.sleep(work)
+                with lock:
+                    processed.append(task.task_id)
+            tasks_queue.complete([task.task_id for task in tasks], name)
+        tasks_queue.db_manager.disconnect()
+
+    start = time.perf_counter()
+    threads = [threading.Thread(target=worker, args=(f'bench-{i}',)) for i in range(workers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - start, processed
+
+
+def reset(admin_cursor):
+    admin_cursor.execute("DELETE FROM scrape_tasks")
+    admin_cursor.execute("DELETE FROM scrape_host_slots")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--tasks', type=int, default=400)
+    parser.add_argument('--hosts', type=int, default=20)
+    parser.add_argument('--workers', type=int, default=8)
+    parser.add_argument('--work-ms', type=float, default=20.0, help='Fetch + parse time per task')
+    parser.add_argument('--batch', type=int, default=5, help='Tasks claimed per round trip')
+    parser.add_argument('--interval', type=float, default=0.05, help='Per-host spacing for the slot check')
+    parser.add_argument('--database', default='scholarships_bench', help='Scratch database (dropped afterwards)')
+    args = parser.parse_args()
+
+    settings = dict(host=os.getenv('MYSQL_HOST', 'localhost'), port=int(os.getenv('MYSQL_PORT', '3306')),
+                    user=os.getenv('MYSQL_USER', 'root'), password=os.getenv('MYSQL_PASSWORD', ''))
+    try:
+        admin = pymysql.connect(charset='utf8mb4', autocommit=True, **settings)
+    except Exception as e:
+        print(f"MySQL not reachable ({e}); nothing to measure without a server")
+        return
+
+    checks = {}
+    cursor = admin.cursor()
+    cursor.execute(f"DROP DATABASE IF EXISTS {args.database}")
+    cursor.execute(f"CREATE DATABASE {args.database} CHARACTER SET utf8mb4 COLLATE utf8mb4_unicode_ci")
+    cursor.execute(f"USE {args.database}")
+    os.environ['MYSQL_DATABASE'] = args.database
+    try:
+        setup = queue()
+        setup.ensure_tables()
+        items = [(f'https://host{i % args.hosts}.example.org/scholarship/{i}', {'row': i}) for i in range(args.tasks)]
+        print(f"{args.tasks} tasks on {args.hosts} hosts, {args.work_ms} ms each, batches of {args.batch}")
+
+        baseline = None
+        for workers in (1, args.workers):
+            reset(cursor)
+            setup.enqueue('bench_detail', items)
+            elapsed, processed = drain(workers, args.work_ms / 1000, args.batch)
+            baseline = baseline or elapsed
+            exact = len(processed) == len(set(processed)) == args.tasks and setup.counts() == {'done': args.tasks}
+            checks[f'exactly once x{workers}'] = exact
+            print(f"{f'{workers} worker(s)':>24}: {elapsed:6.2f}s ({args.tasks / elapsed:7.1f} tasks/s, "
+                  f"{baseline / elapsed:.1f}x)")
+
+        # A worker claims a batch and dies; the lease expires and another worker gets it
+        reset(cursor)
+        setup.enqueue('bench_detail', items[:5])
+        queue(lease_sec=0.5).claim('dead-worker', 5)
+        early = queue().claim('rescuer', 5)
+        time.sleep(0.6)
+        rescuer = queue()
+        late = rescuer.claim('rescuer', 5)
+        rescuer.complete([task.task_id for task in late], 'rescuer')
+        checks['lease expiry'] = not early and len(late) == 5 and all(t.attempts == 2 for t in late)
+
+        # Failing task: retried after backoff, then failed for good
+        reset(cursor)
+        setup.enqueue('bench_detail', items[:1], max_attempts=2)
+        failing = queue(retry_delay=0.1)
+        task = failing.claim('w', 1)[0]
+        failing.fail(task, 'HTTP 503', 'w')
+        hidden = failing.claim('w', 1)
+        time.sleep(0.15)
+        task = failing.claim('w', 1)[0]
+        failing.fail(task, 'HTTP 503', 'w')
+        checks['retry then fail'] = not hidden and task.attempts == 2 and setup.counts() == {'failed': 1}
+
+        # Shared per-host spacing across workers
+        reset(cursor)
+        slots, lock = [], threading.Lock()
+
+        def reserve():
+            slot_queue = queue()
+            for _ in range(5):
+                at = time.time() + slot_queue.reserve_host_slot('host0.example.org', args.interval)
+                with lock:
+                    slots.append(at)
+            slot_queue.db_manager.disconnect()
+
+        threads = [threading.Thread(target=reserve) for _ in range(args.workers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        slots.sort()
+        gaps = [b - a for a, b in zip(slots, slots[1:])]
+        # Slot times come from the DB clock; allow for the round trip seen by each thread
+        checks['host spacing'] = min(gaps) >= args.interval * 0.5 and \
+            slots[-1] - slots[0] >= args.interval * (len(slots) - 1) * 0.9
+        print(f"{'host slots':>24}: {len(slots)} reservations over {slots[-1] - slots[0]:.2f}s, "
+              f"min gap {min(gaps) * 1000:.0f} ms")
+        setup.db_manager.disconnect()
+    finally:
+        cursor.execute(f"DROP DATABASE IF EXISTS {args.database}")
+        admin.close()
+
+    print(f"{'checks':>24}: " + ', '.join(f"{name} {'ok' if passed else 'FAILED'}" for name, passed in checks.items()))
+    if not all(checks.values()):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
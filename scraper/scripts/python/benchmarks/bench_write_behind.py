@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Benchmark: scrape-loop time with synchronous saves vs the write-behind writer.
+
+Times a scrape loop that spends --work-ms per scholarship and saves each one to
+an in-memory stand-in for the database with --db-ms of round-trip latency,
+which becomes unavailable for --outage seconds part way through:
+- the old path: `save_scholarship` per row behind the same tenacity retry
+  (3 attempts, 4-10 s exponential waits) the scraper used,
+- `WriteBehindWriter`, once with the outage over before the run ends and once
+  with the database still down at shutdown, in which case a second writer (the
+  next run) replays the journal after the outage.
+Times cover the scrape loop; the writer drains on close. Every scholarship
+must end up stored (exits non-zero otherwise).
+
+Also checks that rows the database rejects (a pymysql `DataError`, like a
+data-too-long column) are isolated: the good rows in their batches are
+written, the rejected ones go to the dead-letter file, and nothing is
+journaled. Any other error (a bug) journals the rows instead of
+dead-lettering them, and queueing something that is not a `Scholarship`
+raises TypeError.
+
+Usage:
+    python scripts/python/benchmarks/bench_write_behind.py --rows 400 --outage 3
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+
+from synthetic_data import SCRAPER_ROOT  # noqa: F401  (puts the scraper root on sys.path)
+
+import pymysql
+from tenacity import retry, stop_after_attempt, wait_exponential
+
+from src.utils_python import Scholarship
+from src.utils_python.write_behind import WriteBehindWriter
+
+
+class FlakyDatabase:
+    """Keyed row store with per-statement latency and an outage window."""
+
+    def __init__(self, latency: float, per_row: float):
+        self.latency = latency
+        self.per_row = per_row
+        self.rows = {}
+        self.down_until = 0.0
+        self.rejected_titles = set()
+        self.broken = False
+        self._lock = threading.Lock()
+
+    def fail_for(self, seconds: float):
+        self.down_until = time.monotonic() + seconds
+
+    def _statement(self, count: int):
+        time.sleep(self.latency + self.per_row * count)
+        if time.monotonic() < self.down_until:
+            raise ConnectionError('Lost connection to MySQL server')
+
+    def save_scholarship(self, scholarship: Scholarship) -> bool:
+        self._statement(1)
+        with self._lock:
+            self.rows[(scholarship.title, scholarship.organization, scholarship.deadline)] = scholarship
+        return True
+
+    def save_scholarships(self, scholarships) -> int:
+        scholarships = list(scholarships)
+        self._statement(len(scholarships))
+        # Like a failing executemany, one rejected row rolls back the whole statement
+        if any(s.title in self.rejected_titles for s in scholarships):
+            raise pymysql.err.DataError(1406, "Data too long for column 'title'")
+        if self.broken:
+            raise AttributeError("'NoneType' object has no attribute 'executemany'")
+        with self._lock:
+            for scholarship in scholarships:
+                self.rows[(scholarship.title, scholarship.organization, scholarship.deadline)] = scholarship
+        return len(scholarships)
+
+    def disconnect(self):
+        pass
+
+
+def scholarships(count: int):
+    return [Scholarship(title=f'Merit Scholarship {i}', organization=f'Foundation {i % 37}',
+                        deadline=f'2027-03-{1 + i % 28:02d}', min_award=500.0 + i,
+                        subject_areas=['engineering'], apply_url=f'https://example.org/apply/{i}')
+            for i in range(count)]
+
+
+def scrape_loop(rows, save, work: float, db: FlakyDatabase, outage: float):
+    """Save each row after `work` seconds of scraping; the DB drops out at the midpoint."""
+    stalled = 0.0
+    for i, scholarship in enumerate(rows):
+        time.sleep(work)
+        if i == len(rows) // 2:
+            db.fail_for(outage)
+        start = time.perf_counter()
+        save(scholarship)
+        stalled = max(stalled, time.perf_counter() - start)
+    return stalled
+
+
+def report(label: str, elapsed: float, stalled: float, db: FlakyDatabase, rows):
+    stored = sum(1 for s in rows if (s.title, s.organization, s.deadline) in db.rows)
+    print(f"{label:>32}: {elapsed:6.2f}s  longest save {stalled * 1000:7.1f} ms  stored {stored}/{len(rows)}")
+    return stored == len(rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=400)
+    parser.add_argument('--work-ms', type=float, default=5.0, help='Scraping time per scholarship')
+    parser.add_argument('--db-ms', type=float, default=15.0, help='DB round trip per statement')
+    parser.add_argument('--outage', type=float, default=3.0, help='Seconds the DB is unavailable mid-run')
+    args = parser.parse_args()
+
+    rows = scholarships(args.rows)
+    work, latency = args.work_ms / 1000, args.db_ms / 1000
+    print(f"{args.rows} scholarships, {args.work_ms} ms scraping and {args.db_ms} ms DB round trip each, "
+          f"{args.outage}s outage at the midpoint")
+    ok = True
+
+    db = FlakyDatabase(latency, per_row=0.00005)
+    old_save = retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=4, max=10))(db.save_scholarship)
+    start = time.perf_counter()
+    stalled = scrape_loop(rows, old_save, work, db, args.outage)
+    ok &= report('synchronous save + retry (old)', time.perf_counter() - start, stalled, db, rows)
+
+    with tempfile.TemporaryDirectory() as directory:
+        db = FlakyDatabase(latency, per_row=0.00005)
+        writer = WriteBehindWriter(db, os.path.join(directory, 'journal.jsonl'), flush_interval=0.5,
+                                   retry_interval=args.outage / 2)
+        start = time.perf_counter()
+        stalled = scrape_loop(rows, writer.enqueue, work, db, args.outage)
+        elapsed = time.perf_counter() - start
+        # outlast the outage before shutting down, as a longer scrape would
+        time.sleep(max(0.0, db.down_until - time.monotonic()) + args.outage / 2)
+        writer.close()
+        ok &= report('write-behind', elapsed, stalled, db, rows)
+
+        db = FlakyDatabase(latency, per_row=0.00005)
+        journal = os.path.join(directory, 'journal-down.jsonl')
+        writer = WriteBehindWriter(db, journal, flush_interval=0.5, retry_interval=60)
+        start = time.perf_counter()
+        stalled = scrape_loop(rows, writer.enqueue, work, db, outage=3600)
+        elapsed = time.perf_counter() - start
+        writer.close()
+        journaled = writer.journaled
+        db.down_until = 0.0
+        next_run = WriteBehindWriter(db, journal)
+        next_run.start()
+        next_run.close()
+        ok &= report('write-behind, DB down at exit', elapsed, stalled, db, rows)
+        journal_left = os.path.exists(next_run.journal_path)
+        print(f"{'':>32}  {journaled} journaled, {next_run.replayed} replayed by the next run, "
+              f"journal left: {'yes' if journal_left else 'no'}")
+        ok &= not journal_left
+
+        db = FlakyDatabase(0.0, per_row=0.0)
+        bad = {rows[i].title for i in (3, 150, 151, 399) if i < len(rows)}
+        db.rejected_titles = bad
+        dead_letter = os.path.join(directory, 'dead_letter.jsonl')
+        writer = WriteBehindWriter(db, os.path.join(directory, 'journal-bad.jsonl'), flush_interval=0.1,
+                                   dead_letter_path=dead_letter)
+        writer.enqueue_many(rows)
+        writer.close()
+        good = [s for s in rows if s.title not in bad]
+        with open(dead_letter, encoding='utf-8') as handle:
+            dead = {json.loads(line)['scholarship']['title'] for line in handle}
+        isolated = (all((s.title, s.organization, s.deadline) in db.rows for s in good) and dead == bad
+                    and writer.journaled == 0 and not os.path.exists(writer.journal_path))
+        print(f"{'rejected rows':>32}: {writer.written} written, {writer.dead_lettered} dead-lettered, "
+              f"{writer.journaled} journaled  {'ok' if isolated else 'FAILED'}")
+        ok &= isolated
+
+        db = FlakyDatabase(0.0, per_row=0.0)
+        db.broken = True
+        writer = WriteBehindWriter(db, os.path.join(directory, 'journal-bug.jsonl'), flush_interval=0.1,
+                                   dead_letter_path=os.path.join(directory, 'dead_letter-bug.jsonl'))
+        try:
+            writer.enqueue({'title': 'not a Scholarship'})
+            type_checked = False
+        except TypeError:
+            type_checked = True
+        writer.enqueue_many(rows[:10])
+        writer.close()
+        kept = writer.journaled == 10 and writer.dead_lettered == 0
+        print(f"{'unexpected errors':>32}: {writer.journaled} journaled, {writer.dead_lettered} dead-lettered, "
+              f"non-Scholarship {'rejected' if type_checked else 'queued'}  "
+              f"{'ok' if kept and type_checked else 'FAILED'}")
+        ok &= kept and type_checked
+
+    if not ok:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Synthetic scholarship rows shared by the benchmark scripts.
+
+Values are drawn from small pools so the batches look like real scrape output:
+lots of repeated organizations, deadlines and eligibility lists.
+"""
+
+import os
+import random
+import sys
+from datetime import datetime
+from typing import List
+
+# Make the scraper package importable when run from anywhere
+SCRAPER_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+sys.path.insert(0, SCRAPER_ROOT)
+
+from src.utils_python import Scholarship  # noqa: E402
+
+ORGANIZATIONS = [
+    'American Chemical Society', 'Rotary International', 'Elks National Foundation',
+    'Hispanic Scholarship Fund', 'United Negro College Fund', 'Society of Women Engineers',
+    'National FFA Organization', 'Coca-Cola Scholars Foundation', '  Local Community Trust  ', '',
+]
+DEADLINES = [
+    'Mar 1', 'April 15, 2026', 'Jan 31st', '2026-05-01', 'Rolling', 'Varies',
+    'Dec 15', 'February 1, 2026', 'Oct 1', 'No deadline specified', 'Sept 30', None,
+]
+ELIGIBILITY = [
+    ['High School Senior', 'US Citizen'], ['Undergraduate', ' Minimum GPA 3.0 '],
+    '["graduate", "Women"]', 'first-generation, low income', [], None, ('Veteran',),
+]
+ACADEMIC_LEVELS = [['undergraduate'], ['graduate'], ['High School'], 'undergraduate, graduate', None]
+SUBJECTS = [['Engineering', 'Computer Science'], ['Nursing'], 'business,finance', None, ['Art ', ' Music']]
+GEO = [['Texas'], ['California', 'Oregon'], None, 'nationwide']
+ETHNICITY = [['Hispanic'], ['African American'], None, ['asian']]
+GPAS = [None, 3.0, '3.25', 2.675, '', 'n/a', 3.5, 4]
+
+
+def make_scholarships(count: int, seed: int = 7) -> List[Scholarship]:
+    """Build `count` synthetic scholarships deterministically."""
+    rng = random.Random(seed)
+    now = datetime(2026, 1, 1, 12, 0, 0)
+    scholarships = []
+    for index in range(count):
+        scholarships.append(Scholarship(
+            title=f"  Scholarship Award #{index}  ",
+            description=f"Award number {index} for students pursuing higher education.",
+            organization=rng.choice(ORGANIZATIONS),
+            target_type=rng.choice(['need', 'merit', None]),
+            subject_areas=rng.choice(SUBJECTS),
+            min_award=float(rng.choice([500, 1000, 2500])),
+            max_award=float(rng.choice([1000, 5000, 10000])),
+            deadline=rng.choice(DEADLINES),
+            eligibility=rng.choice(ELIGIBILITY),
+            ethnicity=rng.choice(ETHNICITY),
+            academic_level=rng.choice(ACADEMIC_LEVELS),
+            geographic_restrictions=rng.choice(GEO),
+            renewable=rng.choice([True, False, None]),
+            apply_url=f"https://example.org/apply/{index}",
+            source_url=f"https://example.org/scholarship/{index}",
+            source=rng.choice(['CareerOneStop', 'CollegeScholarships']),
+            country='US',
+            active=True,
+            min_gpa=rng.choice(GPAS),
+            created_at=now,
+            updated_at=now,
+        ))
+    return scholarships
@@ -80,6 +80,50 @@ CREATE TABLE IF NOT EXISTS websites (
     INDEX idx_scraper_type (scraper_type)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
 
+-- Distributed detail-page work (main.py --worker); see src/utils_python/task_queue.py
+CREATE TABLE IF NOT EXISTS scrape_tasks (
+    task_id BIGINT AUTO_INCREMENT PRIMARY KEY,
+    kind VARCHAR(100) NOT NULL,
+    url VARCHAR(2048) NOT NULL,
+    url_hash CHAR(40) NOT NULL,
+    payload JSON,
+    job_id VARCHAR(100),
+    status ENUM('pending', 'leased', 'done', 'failed') NOT NULL DEFAULT 'pending',
+    attempts INT NOT NULL DEFAULT 0,
+    max_attempts INT NOT NULL DEFAULT 5,
+    available_at DATETIME(3) NOT NULL DEFAULT CURRENT_TIMESTAMP(3),
+    leased_by VARCHAR(255),
+    last_error TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    
+    UNIQUE KEY uq_kind_url (kind, url_hash),
+    INDEX idx_claim (status, available_at)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- Next free request slot per host, shared by all workers
+CREATE TABLE IF NOT EXISTS scrape_host_slots (
+    host VARCHAR(255) PRIMARY KEY,
+    next_slot_at DATETIME(3) NOT NULL
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- Change history per fetched page, used to schedule revisits; see src/utils_python/revisit_policy.py
+CREATE TABLE IF NOT EXISTS page_revisits (
+    url_hash CHAR(40) PRIMARY KEY,
+    url VARCHAR(2048) NOT NULL,
+    fingerprint CHAR(40) NOT NULL,
+    deadline DATE NULL,
+    fetches INT NOT NULL DEFAULT 1,
+    changes INT NOT NULL DEFAULT 0,
+    change_rate_per_day DOUBLE NULL,
+    first_fetched_at DATETIME NOT NULL,
+    last_fetched_at DATETIME NOT NULL,
+    last_changed_at DATETIME NOT NULL,
+    next_due_at DATETIME NOT NULL,
+    
+    INDEX idx_next_due (next_due_at)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
 -- Insert some default website configurations
 INSERT IGNORE INTO websites (website_id, name, url, enabled, scraper_type) VALUES
 -- TypeScript scrapers (production)
@@ -40,7 +40,7 @@ def test_local_mode():
         
         if result.success:
             logger.info(f"✅ Local mode test successful!")
-            logger.info(f"   Found: {len(result.scholarships)} scholarships")
+            logger.info(f"   Found: {result.metadata.get('total_found', len(result.scholarships))} scholarships")
             logger.info(f"   Inserted: {result.metadata.get('total_inserted', 0)}")
             logger.info(f"   Updated: {result.metadata.get('total_updated', 0)}")
         else:
@@ -68,7 +68,7 @@ def test_cloud_mode():
         
         if result.success:
             logger.info(f"✅ Cloud mode test successful!")
-            logger.info(f"   Found: {len(result.scholarships)} scholarships")
+            logger.info(f"   Found: {result.metadata.get('total_found', len(result.scholarships))} scholarships")
             logger.info(f"   Inserted: {result.metadata.get('total_inserted', 0)}")
             logger.info(f"   Updated: {result.metadata.get('total_updated', 0)}")
         else:
@@ -33,6 +33,10 @@ from .source_discovery_engine import SourceDiscoveryEngine
 from .content_extraction_pipeline import ContentExtractionPipeline, ExtractedScholarship
 from .config.config_loader import SourceCategoryConfig
 from ..utils_python import ScrapingResult, Scholarship
+from ..utils_python.task_queue import Task
+
+# Queued discovered source to crawl and extract (payload: title, category, confidence)
+SOURCE_TASK_KIND = 'ai_discovery_source'
 
 logger = logging.getLogger(__name__)
 
@@ -49,6 +53,8 @@ class DiscoveryStats:
 class AIDiscoveryScraper(BaseScraper):
     """AI-powered scholarship discovery scraper"""
     
+    task_kinds = (SOURCE_TASK_KIND,)
+    
     def __init__(self, 
                  openai_api_key: str,
                  google_api_key: str,
@@ -67,7 +73,7 @@ class AIDiscoveryScraper(BaseScraper):
             google_cse_id=google_cse_id
         )
         
-        self.crawler = EthicalCrawler(CrawlConfig())
+        self.crawler = EthicalCrawler(CrawlConfig(), revisit_policy=self.revisit_policy)
         self.extraction_pipeline = ContentExtractionPipeline(openai_api_key)
         self.config = SourceCategoryConfig()
         
@@ -117,6 +123,9 @@ class AIDiscoveryScraper(BaseScraper):
             logger.info("Stage 1: Discovering scholarship sources...")
             discovered_sources = self._discover_sources(categories)
             
+            if self.distributed:
+                return self._enqueue_sources(discovered_sources, start_time)
+            
             # Stage 2: Crawling
             logger.info("Stage 2: Crawling discovered sources...")
             crawled_pages = self._crawl_sources(discovered_sources)
@@ -133,7 +142,7 @@ class AIDiscoveryScraper(BaseScraper):
             
             for scholarship in extracted_scholarships:
                 try:
-                    if self.save_scholarship(scholarship):
+                    if self.save_scholarship(self._to_scholarship(scholarship)):
                         inserted += 1
                     else:
                         updated += 1
@@ -150,25 +159,7 @@ class AIDiscoveryScraper(BaseScraper):
             logger.info(f"Scraping complete: {len(extracted_scholarships)} scholarships extracted")
             
             # Convert ExtractedScholarship objects to Scholarship objects
-            scholarships = []
-            for extracted_scholarship in extracted_scholarships:
-                scholarship = Scholarship(
-                    title=extracted_scholarship.title,
-                    description=extracted_scholarship.description,
-                    organization=extracted_scholarship.organization,
-                    min_award=extracted_scholarship.amount,
-                    max_award=extracted_scholarship.amount,
-                    deadline=extracted_scholarship.deadline,
-                    eligibility=extracted_scholarship.eligibility,
-                    apply_url=extracted_scholarship.application_url,
-                    source_url=extracted_scholarship.source_url,
-                    source="AI Discovery",
-                    country="US",
-                    active=True,
-                    created_at=datetime.now(),
-                    updated_at=datetime.now()
-                )
-                scholarships.append(scholarship)
+            scholarships = [self._to_scholarship(extracted) for extracted in extracted_scholarships]
             
             return ScrapingResult(
                 success=True,
@@ -259,7 +250,7 @@ class AIDiscoveryScraper(BaseScraper):
             sources: Verified discovery results to crawl.
 
         Returns:
-            A list of dicts with url, title, content, category, and confidence.
+            A list of page dicts (see `_crawled_page`).
         """
         
         crawled_pages = []
@@ -272,13 +263,8 @@ class AIDiscoveryScraper(BaseScraper):
                 crawl_result = self.crawler.crawl_url(source.url)
                 
                 if crawl_result and crawl_result.get('content'):
-                    crawled_pages.append({
-                        'url': source.url,
-                        'title': source.title,
-                        'content': crawl_result['content'],
-                        'category': source.category,
-                        'confidence': source.confidence
-                    })
+                    crawled_pages.append(self._crawled_page(source.url, crawl_result, source.title,
+                                                            source.category, source.confidence))
                 
                 # Rate limiting
                 time.sleep(self.crawl_delay)
@@ -289,6 +275,96 @@ class AIDiscoveryScraper(BaseScraper):
         
         return crawled_pages
     
+    def _enqueue_sources(self, sources: List, start_time: float) -> ScrapingResult:
+        """Queue discovered sources for `main.py --worker` processes to crawl and extract.
+
+        Parameters:
+            sources: Verified discovery results.
+            start_time: When this run started, for the reported processing time.
+
+        Returns:
+            `ScrapingResult` with no scholarships yet and the number of queued tasks.
+        """
+        queued = self.task_queue.enqueue(SOURCE_TASK_KIND, [
+            (source.url, {'title': source.title, 'category': source.category, 'confidence': source.confidence})
+            for source in sources
+        ], job_id=self.job_id)
+        self.stats.total_sources_discovered = len(sources)
+        self.stats.processing_time = time.time() - start_time
+        return ScrapingResult(
+            success=True,
+            scholarships=[],
+            errors=[],
+            metadata={
+                'total_found': 0,
+                'total_processed': 0,
+                'total_inserted': 0,
+                'total_updated': 0,
+                'total_queued': queued,
+                'processing_time': self.stats.processing_time,
+                'sources_discovered': self.stats.total_sources_discovered,
+                'categories_searched': self.stats.categories_searched
+            }
+        )
+    
+    def process_task(self, task: Task) -> List[Scholarship]:
+        """Worker side of distributed mode: crawl one queued source and extract its scholarships.
+
+        Parameters:
+            task: A `SOURCE_TASK_KIND` task; the payload carries the source's
+                title, category and confidence.
+
+        Returns:
+            Scholarships extracted from the source page.
+        """
+        crawl_result = self.crawler.crawl_url(task.url)
+        if not crawl_result or not crawl_result.get('content'):
+            return []
+        page = self._crawled_page(task.url, crawl_result, task.payload.get('title'),
+                                  task.payload.get('category'), task.payload.get('confidence'))
+        return [self._to_scholarship(extracted) for extracted in self._extract_scholarships([page])]
+    
+    @staticmethod
+    def _crawled_page(url: str, crawl_result: Dict, title: Optional[str], category: Optional[str],
+                      confidence: Optional[float]) -> Dict:
+        """Page payload for `_extract_scholarships` from a successful `crawl_url` result.
+
+        The page's own title is preferred over the search result's.
+        """
+        return {
+            'url': url,
+            'title': crawl_result.get('title') or title,
+            'meta_description': crawl_result.get('meta_description', ''),
+            'content': crawl_result['content'],
+            'blocks': crawl_result.get('blocks'),
+            'category': category,
+            'confidence': confidence
+        }
+    
+    def release_workers(self):
+        """Stop the crawler's and extraction pipeline's worker pools."""
+        self.crawler.close()
+        self.extraction_pipeline.close()
+    
+    def _to_scholarship(self, extracted_scholarship: ExtractedScholarship) -> Scholarship:
+        """Map an extracted scholarship to the DB model."""
+        return Scholarship(
+            title=extracted_scholarship.title,
+            description=extracted_scholarship.description,
+            organization=extracted_scholarship.organization,
+            min_award=extracted_scholarship.min_award,
+            max_award=extracted_scholarship.max_award,
+            deadline=extracted_scholarship.deadline,
+            eligibility=extracted_scholarship.eligibility,
+            apply_url=extracted_scholarship.application_url,
+            source_url=extracted_scholarship.url,
+            source="AI Discovery",
+            country="US",
+            active=True,
+            created_at=datetime.now(),
+            updated_at=datetime.now()
+        )
+    
     def _extract_scholarships(self, crawled_pages: List[Dict]) -> List[ExtractedScholarship]:
         """Extract structured scholarships from crawled HTML content.
 
@@ -301,6 +377,7 @@ class AIDiscoveryScraper(BaseScraper):
         """
         
         all_scholarships = []
+        self.heartbeat.pages_total = len(crawled_pages)
         
         for page in crawled_pages:
             try:
@@ -310,8 +387,12 @@ class AIDiscoveryScraper(BaseScraper):
                 extraction_result = self.extraction_pipeline.extract_scholarships(
                     content=page['content'],
                     source_url=page['url'],
-                    category=page['category']
+                    category=page['category'],
+                    title=page.get('title'),
+                    meta_description=page.get('meta_description', ''),
+                    blocks=page.get('blocks')
                 )
+                self.heartbeat.page_done()
                 
                 if extraction_result.success and extraction_result.scholarships:
                     all_scholarships.extend(extraction_result.scholarships)
@@ -7,20 +7,54 @@ import os
 import time
 import logging
 import uuid
-from abc import ABC, abstractmethod
-from typing import List, Optional
-from tenacity import retry, stop_after_attempt, wait_exponential
+from abc import ABC
+from typing import Iterator, List, Optional, Tuple
 
 from ..utils_python import Scholarship, ScrapingResult, ScrapingMetadata
 from .constants import SCRAPER_MIN_REQUEST_DELAY_SEC, MAX_CAREERONESTOP_PAGES
 from ..utils_python.database_manager import DatabaseManagerFactory
+from ..utils_python.write_behind import WriteBehindWriter, DEFAULT_WRITE_JOURNAL_PATH
+from ..utils_python.job_heartbeat import JobHeartbeat, heartbeat_interval
+from ..utils_python.task_queue import Task, TaskQueue, task_queue_enabled, ENQUEUE_CHUNK_ROWS
+from ..utils_python.revisit_policy import RevisitPolicy, fingerprint, revisit_policy_enabled
+from .pagination import ListingIndex, PaginationController, DEFAULT_LISTING_INDEX_PATH, LISTING_INDEX_ENV
+
+# Path of the journal that holds scholarships the DB could not take; empty disables spilling
+WRITE_JOURNAL_ENV = 'SCRAPER_WRITE_JOURNAL'
 
 logger = logging.getLogger(__name__)
 
 
+def _revisit_data(scholarship: Optional[Scholarship]) -> Optional[dict]:
+    """Parsed fields of a detail page, without the per-run timestamps."""
+    if scholarship is None:
+        return None
+    data = scholarship.to_dict()
+    data.pop('created_at', None)
+    data.pop('updated_at', None)
+    return data
+
+
+def scholarships_found(result: ScrapingResult) -> int:
+    """Scholarships a run found; streaming runs report the count without the rows."""
+    if isinstance(result.metadata, dict):
+        return result.metadata.get('total_found', len(result.scholarships))
+    return getattr(result.metadata, 'records_found', 0) or len(result.scholarships)
+
+
+def dedupe_key(scholarship: Scholarship) -> str:
+    """In-run duplicate key: the same title from the same organization."""
+    return f"{(scholarship.title or '').lower()}-{(scholarship.organization or '').lower()}"
+
+
 class BaseScraper(ABC):
     """Base class for all scrapers"""
     
+    # Task kinds this scraper handles in `process_task` (main.py --worker)
+    task_kinds: Tuple[str, ...] = ()
+    # Kind of the tasks queued for rows with a detail link in distributed mode
+    detail_task_kind: Optional[str] = None
+    
     def __init__(self, 
                  scholarships_table: str = "",
                  jobs_table: str = "",
@@ -49,6 +83,27 @@ class BaseScraper(ABC):
         
         # Create database manager using factory
         self.db_manager = DatabaseManagerFactory.create_database_manager(environment)
+        # Keep the DB connection and writer open between runs (daemon mode)
+        self.persistent = False
+        # Background writer for scholarships, created on first save
+        self._writer: Optional[WriteBehindWriter] = None
+        # Queue detail pages for `main.py --worker` processes instead of fetching them here
+        self.distributed = task_queue_enabled()
+        self._task_queue: Optional[TaskQueue] = None
+        # Skip detail pages that are not due for a revisit (SCRAPER_REVISIT_POLICY=0 fetches everything)
+        self.revisit_policy: Optional[RevisitPolicy] = (
+            RevisitPolicy(self.db_manager) if revisit_policy_enabled() else None
+        )
+        # Progress heartbeats on the job row, written from their own thread and connection
+        self.heartbeat = JobHeartbeat(
+            DatabaseManagerFactory.create_database_manager(environment),
+            job_id,
+            interval=heartbeat_interval(),
+            pages_total=self.max_pages
+        )
+        
+        # Errors of the current run that did not stop it (page failures and the like)
+        self.scrape_errors: List[str] = []
         
         # Rate limiting
         self.last_call_time = 0
@@ -91,22 +146,158 @@ class BaseScraper(ABC):
         """
         return f"sch_{uuid.uuid4().hex[:16]}"
     
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=4, max=10))
+    @property
+    def writer(self) -> WriteBehindWriter:
+        """Write-behind writer persisting this scraper's scholarships.
+
+        It gets its own database manager (and connection) because it writes
+        from a background thread while `db_manager` serves job status updates.
+        """
+        if self._writer is None:
+            self._writer = WriteBehindWriter(
+                DatabaseManagerFactory.create_database_manager(self.environment),
+                journal_path=os.getenv(WRITE_JOURNAL_ENV, DEFAULT_WRITE_JOURNAL_PATH),
+                name=type(self).__name__.lower()
+            )
+        return self._writer
+    
     def save_scholarship(self, scholarship: Scholarship) -> bool:
-        """Save a scholarship using the configured database manager.
+        """Queue a scholarship for the background writer.
 
         Parameters:
             scholarship: The populated `Scholarship` domain object to persist.
 
         Returns:
-            True if the operation succeeded (insert or upsert), otherwise raises
-            an exception propagated from the DB layer.
+            True once queued. The writer upserts it in a batch, or journals it
+            locally while the database is unavailable, so a slow database no
+            longer stalls the scrape.
+
+        Raises:
+            TypeError: `scholarship` is not a `Scholarship` (convert extracted
+                records first).
         """
-        try:
-            return self.db_manager.save_scholarship(scholarship)
-        except Exception as e:
-            logger.error(f"Error saving scholarship: {e}")
-            raise
+        self.writer.enqueue(scholarship)
+        self.heartbeat.add_rows()
+        return True
+    
+    @property
+    def task_queue(self) -> TaskQueue:
+        """Distributed task queue, on the scraper's own DB connection."""
+        if self._task_queue is None:
+            self._task_queue = TaskQueue(self.db_manager)
+            self._task_queue.ensure_tables()
+        return self._task_queue
+    
+    def paginator(self) -> PaginationController:
+        """Pagination controller for one run over this scraper's listing.
+
+        Known rows come from the listing index (SCRAPER_LISTING_INDEX, a JSON
+        file; set it empty to walk up to `max_pages` as before).
+        """
+        path = os.getenv(LISTING_INDEX_ENV, DEFAULT_LISTING_INDEX_PATH)
+        index = ListingIndex(path) if path else None
+        return PaginationController(self.max_pages, index, scope=type(self).__name__)
+    
+    def due_rows(self, rows: List[Scholarship]) -> List[Scholarship]:
+        """Drop listing rows whose detail page is not due for a revisit.
+
+        Rows without a detail link are kept; they have nothing to fetch.
+        """
+        if self.revisit_policy is None:
+            return rows
+        due = self.revisit_policy.due(row.source_url for row in rows if row.source_url)
+        kept = [row for row in rows if not row.source_url or row.source_url in due]
+        if len(kept) < len(rows):
+            logger.info(f"Skipping {len(rows) - len(kept)} detail pages not due for a revisit")
+        return kept
+    
+    def record_revisits(self, pages: List[Tuple[str, Optional[Scholarship]]]):
+        """Record fetched detail pages and what they parsed to (None when skipped).
+
+        Parameters:
+            pages: (detail URL, parsed scholarship) pairs for pages fetched this run.
+        """
+        if self.revisit_policy is None or not pages:
+            return
+        self.revisit_policy.record_many([
+            (url, fingerprint(_revisit_data(scholarship)), scholarship.deadline if scholarship else None)
+            for url, scholarship in pages
+        ])
+    
+    def enqueue_detail_tasks(self, rows: List[Scholarship]) -> int:
+        """Queue listing rows for workers to complete from their detail pages.
+
+        Parameters:
+            rows: Listing rows with a detail link; each becomes a
+                `detail_task_kind` task carrying the row.
+
+        Returns:
+            Number of tasks queued.
+        """
+        if not rows:
+            return 0
+        return self.task_queue.enqueue(self.detail_task_kind, [(row.source_url, row.to_dict()) for row in rows],
+                                       job_id=self.job_id)
+    
+    def process_task(self, task: Task) -> List[Scholarship]:
+        """Process one queued task (see `task_kinds`) and return the scholarships to save.
+
+        Raising marks the attempt as failed; the queue retries it with backoff.
+        """
+        raise NotImplementedError(f"{self.__class__.__name__} does not process {task.kind} tasks")
+    
+    def flush_scholarships(self):
+        """Wait for queued scholarships to be written (or journaled).
+
+        The writer is stopped afterwards unless the scraper is persistent.
+        """
+        if self._writer is None:
+            return
+        if self.persistent:
+            self._writer.flush()
+        else:
+            self._writer.close()
+            self._writer = None
+    
+    def _writer_counts(self) -> Tuple[int, int, int]:
+        """(written, journaled, dead-lettered) so far; a persistent writer counts across runs."""
+        if self._writer is None:
+            return 0, 0, 0
+        return self._writer.written, self._writer.journaled, self._writer.dead_lettered
+    
+    @staticmethod
+    def _report_written(result: ScrapingResult, writer: WriteBehindWriter, counts_before: Tuple[int, int, int]):
+        """Replace the queued-row count in `result` with the rows the writer wrote this run.
+
+        Rows journaled during an outage are written by a later run, and
+        rejected rows are dead-lettered; both are reported separately.
+        """
+        written, journaled, dead_lettered = (
+            after - before
+            for after, before in zip((writer.written, writer.journaled, writer.dead_lettered), counts_before)
+        )
+        if isinstance(result.metadata, dict):
+            result.metadata['total_inserted'] = written
+            result.metadata['total_journaled'] = journaled
+            result.metadata['total_dead_lettered'] = dead_lettered
+        elif hasattr(result.metadata, 'records_inserted'):
+            result.metadata.records_inserted = written
+    
+    def release_workers(self):
+        """Stop the worker pools (parse, PDF) this scraper started; they restart on next use.
+
+        Called after each run of a one-shot scraper and from `close()` of a
+        persistent one. Scrapers that own pools override it.
+        """
+    
+    def close(self):
+        """Release the writer, heartbeat, worker pools and DB connection of a persistent scraper."""
+        self.heartbeat.stop()
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        self.release_workers()
+        self.close_db_connection()
     
     def update_job_status(self, status: str, metadata: ScrapingMetadata):
         """Update job status in the backing store via the database manager.
@@ -156,14 +347,74 @@ class BaseScraper(ABC):
         
         return None
     
-    @abstractmethod
+    def iter_scholarships(self) -> Iterator[Scholarship]:
+        """Yield scholarships as they are parsed.
+
+        Streaming scrapers implement this and inherit `scrape`, which saves
+        each row as it arrives; errors that do not end the run go to
+        `self.scrape_errors`. In distributed mode rows with a detail link may
+        be listing rows that workers complete (see `detail_task_kind`).
+
+        The default is a shim for scrapers that implement `scrape` instead:
+        it runs it (which saves the rows) and yields the rows it returned.
+        """
+        if type(self).scrape is BaseScraper.scrape:
+            raise NotImplementedError(f"{type(self).__name__} implements neither scrape() nor iter_scholarships()")
+        result = self.scrape()
+        self.scrape_errors.extend(result.errors)
+        yield from result.scholarships
+    
     def scrape(self) -> ScrapingResult:
-        """Main scraping method implemented by subclasses.
+        """Consume `iter_scholarships`, dropping duplicates and saving rows as they arrive.
+
+        Rows go to the write-behind writer one by one (it persists them in
+        batches), or, in distributed mode, to the task queue a chunk at a
+        time, so nothing waits for the end of the run.
 
         Returns:
-            A `ScrapingResult` containing scholarships, errors, and metadata.
+            `ScrapingResult` with errors and counts. The rows themselves are
+            not kept (they are already persisted, and holding them would
+            grow memory with the run); `total_found` counts them.
         """
-        pass
+        self.scrape_errors = []
+        seen = set()
+        found = saved = queued = duplicates = 0
+        detail_rows: List[Scholarship] = []
+        queue_details = self.distributed and self.detail_task_kind is not None
+        
+        for scholarship in self.iter_scholarships():
+            key = dedupe_key(scholarship)
+            if key in seen:
+                duplicates += 1
+                logger.debug(f"Duplicate found: {scholarship.title} - {scholarship.organization}")
+                continue
+            seen.add(key)
+            found += 1
+            if queue_details and scholarship.source_url:
+                detail_rows.append(scholarship)
+                if len(detail_rows) >= ENQUEUE_CHUNK_ROWS:
+                    queued += self.enqueue_detail_tasks(detail_rows)
+                    detail_rows = []
+                continue
+            try:
+                self.save_scholarship(scholarship)
+                saved += 1
+            except Exception as e:
+                self.scrape_errors.append(f"Error saving scholarship {scholarship.title}: {str(e)}")
+        queued += self.enqueue_detail_tasks(detail_rows)
+        
+        if duplicates:
+            logger.info(f"Removed {duplicates} duplicate scholarships")
+        metadata = {
+            'total_found': found,
+            'total_processed': saved,
+            'total_inserted': saved,
+            'total_updated': 0
+        }
+        if queue_details:
+            logger.info(f"Queued {queued} detail pages for workers, saved {saved} listing-only rows")
+            metadata['total_queued'] = queued
+        return ScrapingResult(success=True, scholarships=[], errors=list(self.scrape_errors), metadata=metadata)
     
     def run(self) -> ScrapingResult:
         """Main entry point orchestrating status updates and error handling.
@@ -186,10 +437,20 @@ class BaseScraper(ABC):
             
             # Update job status to running
             self.update_job_status('running', job_metadata)
+            self.heartbeat.job_id = self.job_id
+            self.heartbeat.start()
             
             # Perform scraping
+            counts_before = self._writer_counts()
             result = self.scrape()
             
+            # Report completion only once the scraped rows are persisted, counting
+            # what the database took rather than what was queued
+            writer = self._writer
+            self.flush_scholarships()
+            if writer is not None:
+                self._report_written(result, writer, counts_before)
+            
             # Add job information to result metadata
             if hasattr(result.metadata, '__dict__'):
                 result.metadata.job_id = self.job_id
@@ -218,7 +479,7 @@ class BaseScraper(ABC):
             # Update job status to completed
             self.update_job_status('completed', completed_metadata)
             
-            logger.info(f"Scraping completed successfully. Found {len(result.scholarships)} scholarships")
+            logger.info(f"Scraping completed successfully. Found {scholarships_found(result)} scholarships")
             return result
             
         except Exception as e:
@@ -246,5 +507,9 @@ class BaseScraper(ABC):
                 }
             )
         finally:
-            # Clean up database connection
-            self.close_db_connection()
+            # Clean up the heartbeat, writer and database connection
+            self.heartbeat.stop()
+            self.flush_scholarships()
+            if not self.persistent:
+                self.release_workers()
+                self.close_db_connection()
@@ -7,183 +7,69 @@ Scrapes scholarships from CareerOneStop.org using BeautifulSoup
 import os
 import logging
 import re
-import requests
-import time
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional, Set, Tuple
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin, urlparse
 from datetime import datetime
 from .base_scraper import BaseScraper
-from ..utils_python import Scholarship, ScrapingResult, ScrapingMetadata, normalize_deadline_value
+from .http_client import BROWSER_HEADERS, create_session
+from .parse_pool import ParsePool, response_encoding
+from .pagination import ListingPrefetcher, listing_key, pager_page_count
+from .rate_limiter import HostRateLimiter
+from ..utils_python.task_queue import Task
+from ..utils_python import Scholarship, normalize_deadline_value
 
 logger = logging.getLogger(__name__)
 
+# Queued detail page of a listing row (payload: the listing scholarship)
+DETAIL_TASK_KIND = 'careeronestop_detail'
 
-class CareerOneStopScraper(BaseScraper):
-    """CareerOneStop.org scraper using BeautifulSoup"""
-    
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.base_url = "https://www.careeronestop.org"
-        self.search_url = "https://www.careeronestop.org/Toolkit/Training/find-scholarships.aspx"
-        self.session = requests.Session()
-        
-        # No longer using keyword-by-keyword approach - using efficient broad search
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-        })
-    
-    def scrape(self) -> ScrapingResult:
-        """Entry point: paginate, parse rows, and persist scholarships.
 
-        Returns:
-            `ScrapingResult` with totals, errors, and collected scholarships.
-        """
-        logger.info("Starting CareerOneStop scraping...")
-        
-        try:
-            scholarships = []
-            errors = []
-            
-            # Use efficient approach - search with broad terms
-            logger.info("Using efficient broad search approach")
-            
-            page = 1
-            max_pages = self.max_pages  # Centralized default, overridable per instance
-            logger.info(f"Will scrape up to {max_pages} pages")
-            
-            while page <= max_pages:
-                try:
-                    logger.info(f"Scraping page {page}")
-                    page_scholarships = self._scrape_page(page)
-                    logger.info(f"Found {len(page_scholarships)} scholarships on page {page}, total so far: {len(scholarships) + len(page_scholarships)}")
-                    scholarships.extend(page_scholarships)
-                    
-                    if not page_scholarships:
-                        logger.info(f"No more scholarships found on page {page}, stopping pagination")
-                        break
-                    
-                    page += 1
-                    time.sleep(2)  # Be respectful to the server
-                    
-                except Exception as e:
-                    error_msg = f"Error scraping page {page}: {str(e)}"
-                    logger.error(error_msg)
-                    errors.append(error_msg)
-                    break
-            
-            logger.info(f"Finished scraping. Total pages processed: {page - 1}, Total scholarships collected: {len(scholarships)}")
-            
-            # Remove duplicates
-            logger.info(f"Total scholarships found before deduplication: {len(scholarships)}")
-            unique_scholarships = self._remove_duplicates(scholarships)
-            logger.info(f"Total unique scholarships after deduplication: {len(unique_scholarships)}")
-            
-            # Process and save scholarships
-            inserted = 0
-            updated = 0
-            process_errors = []
-            
-            for scholarship in unique_scholarships:
-                try:
-                    if self.save_scholarship(scholarship):
-                        inserted += 1
-                    else:
-                        updated += 1
-                except Exception as e:
-                    process_errors.append(f"Error saving scholarship {scholarship.title}: {str(e)}")
-            
-            errors.extend(process_errors)
-            
-            return ScrapingResult(
-                success=True,
-                scholarships=unique_scholarships,
-                errors=errors,
-                metadata={
-                    'total_found': len(unique_scholarships),
-                    'total_processed': len(unique_scholarships),
-                    'total_inserted': inserted,
-                    'total_updated': updated
-                }
-            )
-            
-        except Exception as e:
-            error_msg = f"CareerOneStop scraper failed: {str(e)}"
-            logger.error(error_msg)
-            
-            return ScrapingResult(
-                success=False,
-                scholarships=[],
-                errors=[error_msg],
-                metadata={
-                    'total_found': 0,
-                    'total_processed': 0,
-                    'total_inserted': 0,
-                    'total_updated': 0
-                }
-            )
+class CareerOneStopParser:
+    """Network-free CareerOneStop page parsing, usable inside parse workers"""
     
-    def _scrape_page(self, page: int) -> List[Scholarship]:
-        """Scrape a single result page and map rows to scholarships.
+    base_url = "https://www.careeronestop.org"
+    
+    def parse_listing_html(self, html: bytes, encoding: Optional[str] = None) -> List[Scholarship]:
+        """Parse a search results page into scholarships without detail fields.
 
         Parameters:
-            page: One-based page index to fetch from CareerOneStop.
+            html: Raw page bytes.
+            encoding: Charset declared by the response, if any.
 
         Returns:
-            A list of `Scholarship` domain objects for this page.
+            A list of `Scholarship` objects, one per scholarship row.
         """
         scholarships = []
+        soup = BeautifulSoup(html, 'html.parser', from_encoding=encoding)
         
-        try:
-            # Construct search URL with pagination
-            params = {
-                'keyword': 'scholarship',  # Use broad search term
-                'curPage': page
-            }
-            
-            response = self.session.get(self.search_url, params=params, timeout=30)
-            response.raise_for_status()
-            
-            # Store raw HTML
-            self._store_raw_data(f"careeronestop_page_{page}.html", response.text, 'text/html')
-            
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Find scholarship listings - use table structure like TypeScript version
-            scholarship_elements = soup.find_all('table')
-            if not scholarship_elements:
-                # Fallback to other selectors
-                scholarship_elements = soup.find_all('div', class_='scholarship-item') or \
-                                     soup.find_all('div', class_='result-item') or \
-                                     soup.find_all('tr', class_='scholarship-row')
-            
-            # Parse table rows like TypeScript version
-            for table in scholarship_elements:
-                rows = table.find_all('tr')
-                for row in rows:
-                    try:
-                        scholarship = self._parse_table_row(row)
-                        if scholarship:
-                            scholarships.append(scholarship)
-                    except Exception as e:
-                        logger.warning(f"Error parsing table row: {str(e)}")
-                        continue
-            
-            logger.info(f"Found {len(scholarships)} scholarships on page {page}")
-            
-        except Exception as e:
-            logger.error(f"Error scraping page {page}: {str(e)}")
+        # Find scholarship listings - use table structure like TypeScript version
+        scholarship_elements = soup.find_all('table')
+        if not scholarship_elements:
+            # Fallback to other selectors
+            scholarship_elements = soup.find_all('div', class_='scholarship-item') or \
+                                 soup.find_all('div', class_='result-item') or \
+                                 soup.find_all('tr', class_='scholarship-row')
+        
+        # Parse table rows like TypeScript version
+        for table in scholarship_elements:
+            rows = table.find_all('tr')
+            for row in rows:
+                try:
+                    scholarship = self._parse_table_row(row)
+                    if scholarship:
+                        scholarships.append(scholarship)
+                except Exception as e:
+                    logger.warning(f"Error parsing table row: {str(e)}")
+                    continue
         
         return scholarships
     
     def _parse_table_row(self, row) -> Optional[Scholarship]:
         """Parse a HTML table row into a `Scholarship` if valid.
 
+        Detail page fields are filled in afterwards by `apply_detail_data`.
+
         Parameters:
             row: BeautifulSoup element representing a scholarship table row.
 
@@ -252,114 +138,183 @@ class CareerOneStopScraper(BaseScraper):
                 updated_at=datetime.now()
             )
             
-            # Fetch detail page to get additional information
-            if full_url:
-                detail_data = self._fetch_detail_data(full_url)
-                if detail_data:
-                    # Check Award Type - only process if it's a Scholarship
-                    award_type_raw = detail_data.get('award_type')
-                    award_type = award_type_raw.strip() if isinstance(award_type_raw, str) else ''
-                    if award_type and award_type.lower() != 'scholarship':
-                        return None  # Skip grants and fellowships
-                    
-                    # Map Level of Study to academic_level
-                    level_of_study = detail_data.get('level_of_study')
-                    if level_of_study:
-                        mapped_level = self._map_academic_level(level_of_study)
-                        if mapped_level:
-                            scholarship.academic_level = [mapped_level]
-                    
-                    # Extract Focus for subject_areas
-                    focus = detail_data.get('focus')
-                    if focus:
-                        subject_areas = self._parse_focus_to_subject_areas(focus)
-                        if subject_areas:
-                            scholarship.subject_areas = subject_areas
-                    
-                    # Determine target_type (merit if "merit" is in scholarship name)
-                    target_type = self._determine_target_type(clean_title)
-                    if target_type:
-                        scholarship.target_type = target_type
-                    
-                    # Update other fields from detail page
-                    if detail_data.get('deadline'):
-                        detail_deadline = self._clean_text(detail_data['deadline'])
-                        normalized_deadline = normalize_deadline_value(detail_deadline)
-                        if normalized_deadline:
-                            scholarship.deadline = normalized_deadline
-                    
-                    # Parse Funds field for min_award and max_award
-                    # If two values found in Funds, first is min_award and second is max_award
-                    if detail_data.get('min_award') is not None:
-                        scholarship.min_award = detail_data['min_award']
-                    if detail_data.get('max_award') is not None:
-                        scholarship.max_award = detail_data['max_award']
-                    
-                    if detail_data.get('purpose'):
-                        purpose = self._clean_text(detail_data['purpose'])
-                        if purpose:
-                            scholarship.description = purpose[:500]
-                    
-                    if detail_data.get('qualifications'):
-                        qualifications = self._clean_text(detail_data['qualifications'])
-                        if qualifications:
-                            # Parse qualifications to extract specific fields
-                            parsed_qualifications = self._parse_qualifications(qualifications)
-                            
-                            # Set min_gpa if found
-                            if parsed_qualifications.get('min_gpa') is not None:
-                                scholarship.min_gpa = parsed_qualifications['min_gpa']
-                            
-                            # Set ethnicity if found
-                            if parsed_qualifications.get('ethnicity'):
-                                scholarship.ethnicity = parsed_qualifications['ethnicity']
-                            
-                            # Set target_type if financial need found
-                            if parsed_qualifications.get('financial_need'):
-                                scholarship.target_type = 'need'
-                            
-                            # Build eligibility list from parsed qualifications
-                            eligibility_entries = []
-                            
-                            # Add college/university attendance requirement to eligibility
-                            if parsed_qualifications.get('college_requirement'):
-                                eligibility_entries.append(parsed_qualifications['college_requirement'].lower())
-                            
-                            # Add other eligibility items (everything except GPA and college requirement)
-                            if parsed_qualifications.get('other_eligibility'):
-                                eligibility_entries.extend([item.lower() for item in parsed_qualifications['other_eligibility']])
-                            
-                            # If we have any eligibility items, set them
-                            if eligibility_entries:
-                                scholarship.eligibility = eligibility_entries
-                    
-                    # Check "To Apply" field for recommendation requirement
-                    if detail_data.get('to_apply'):
-                        to_apply_text = detail_data['to_apply'].lower()
-                        if 'recommendation' in to_apply_text:
-                            scholarship.recommendation_required = True
-                    
-                    # Set apply_url from "For more information" field
-                    if detail_data.get('for_more_information'):
-                        for_more_info = detail_data['for_more_information']
-                        # Check if it's already a URL (starts with http)
-                        if for_more_info.startswith('http://') or for_more_info.startswith('https://'):
-                            scholarship.apply_url = for_more_info
-                        else:
-                            # Extract URL from the text if it contains a URL
-                            url_pattern = r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+'
-                            url_match = re.search(url_pattern, for_more_info)
-                            if url_match:
-                                scholarship.apply_url = url_match.group(0)
-                else:
-                    logger.warning(f"No detail data returned for: {full_url}")
-            
             return scholarship
             
         except Exception as e:
             logger.error(f"Error parsing table row: {str(e)}")
             return None
     
+    def parse_detail_html(self, html: bytes, encoding: Optional[str], detail_url: str) -> Dict[str, Any]:
+        """Parse a scholarship detail page.
+        
+        Parameters:
+            html: Raw detail page bytes.
+            encoding: Charset declared by the response, if any.
+            detail_url: URL of the detail page (used to resolve relative links).
+            
+        Returns:
+            Dictionary with extracted detail data.
+        """
+        soup = BeautifulSoup(html, 'html.parser', from_encoding=encoding)
+        
+        # Parse all bold labels once at the start for efficiency
+        self.bold_label_map = self._parse_bold_labels(soup)
+        
+        detail_data: Dict[str, Any] = {}
+        
+        # Extract organization from first line (usually appears first in the detail page)
+        # Look for organization field
+        detail_data['organization'] = self._extract_detail_value(soup, ['Organization'])
+        
+        # Extract Level of Study
+        detail_data['level_of_study'] = self._extract_detail_value(soup, ['Level of Study'])
+        
+        # Extract Award Type - critical for filtering
+        detail_data['award_type'] = self._extract_detail_value(soup, ['Award Type'])
+        
+        # Extract Focus for subject_areas
+        detail_data['focus'] = self._extract_detail_value(soup, ['Focus'])
+        
+        # Extract Purpose
+        detail_data['purpose'] = self._extract_detail_value(soup, ['Purpose'])
+        
+        # Extract Qualifications
+        detail_data['qualifications'] = self._extract_detail_value(soup, ['Criteria'])
+        
+        # Extract "To Apply" field
+        detail_data['to_apply'] = self._extract_detail_value(soup, ['To Apply'])
+        
+        # Extract "For more information" for apply_url
+        for_more_info = self._extract_detail_value(soup, ['For more information'])
+        # Also try to extract a link from that section
+        if for_more_info:
+            detail_data['for_more_information'] = for_more_info
+        else:
+            # Try to find a link near "For more information" text
+            for_more_link = self._extract_link_near_label(soup, ['For more information', 'For More Information'], detail_url)
+            if for_more_link:
+                detail_data['for_more_information'] = for_more_link
+        
+        # Extract Deadline
+        detail_data['deadline'] = self._extract_detail_value(soup, ['Deadline'])
+        
+        # Extract Funds (award amount) if not already found
+        funds = self._extract_detail_value(soup, ['Funds'])
+        if funds:
+            self._set_awards(funds, detail_data)
+        
+        logger.debug(f"Extracted detail data keys: {list(detail_data.keys())}")
+        logger.debug(f"Detail data values: {detail_data}")
+        return detail_data
+    
+    def apply_detail_data(self, scholarship: Scholarship, detail_data: Dict[str, Any]) -> Optional[Scholarship]:
+        """Merge parsed detail page fields into a listing scholarship.
+        
+        Parameters:
+            scholarship: Scholarship parsed from the listing row.
+            detail_data: Output of `parse_detail_html`.
+            
+        Returns:
+            The updated scholarship, or None if the award is not a scholarship.
+        """
+        # Check Award Type - only process if it's a Scholarship
+        award_type_raw = detail_data.get('award_type')
+        award_type = award_type_raw.strip() if isinstance(award_type_raw, str) else ''
+        if award_type and award_type.lower() != 'scholarship':
+            return None  # Skip grants and fellowships
+        
+        # Map Level of Study to academic_level
+        level_of_study = detail_data.get('level_of_study')
+        if level_of_study:
+            mapped_level = self._map_academic_level(level_of_study)
+            if mapped_level:
+                scholarship.academic_level = [mapped_level]
+        
+        # Extract Focus for subject_areas
+        focus = detail_data.get('focus')
+        if focus:
+            subject_areas = self._parse_focus_to_subject_areas(focus)
+            if subject_areas:
+                scholarship.subject_areas = subject_areas
+        
+        # Determine target_type (merit if "merit" is in scholarship name)
+        target_type = self._determine_target_type(scholarship.title)
+        if target_type:
+            scholarship.target_type = target_type
+        
+        # Update other fields from detail page
+        if detail_data.get('deadline'):
+            detail_deadline = self._clean_text(detail_data['deadline'])
+            normalized_deadline = normalize_deadline_value(detail_deadline)
+            if normalized_deadline:
+                scholarship.deadline = normalized_deadline
+        
+        # Parse Funds field for min_award and max_award
+        # If two values found in Funds, first is min_award and second is max_award
+        if detail_data.get('min_award') is not None:
+            scholarship.min_award = detail_data['min_award']
+        if detail_data.get('max_award') is not None:
+            scholarship.max_award = detail_data['max_award']
+        
+        if detail_data.get('purpose'):
+            purpose = self._clean_text(detail_data['purpose'])
+            if purpose:
+                scholarship.description = purpose[:500]
+        
+        if detail_data.get('qualifications'):
+            qualifications = self._clean_text(detail_data['qualifications'])
+            if qualifications:
+                # Parse qualifications to extract specific fields
+                parsed_qualifications = self._parse_qualifications(qualifications)
+                
+                # Set min_gpa if found
+                if parsed_qualifications.get('min_gpa') is not None:
+                    scholarship.min_gpa = parsed_qualifications['min_gpa']
+                
+                # Set ethnicity if found
+                if parsed_qualifications.get('ethnicity'):
+                    scholarship.ethnicity = parsed_qualifications['ethnicity']
+                
+                # Set target_type if financial need found
+                if parsed_qualifications.get('financial_need'):
+                    scholarship.target_type = 'need'
+                
+                # Build eligibility list from parsed qualifications
+                eligibility_entries = []
+                
+                # Add college/university attendance requirement to eligibility
+                if parsed_qualifications.get('college_requirement'):
+                    eligibility_entries.append(parsed_qualifications['college_requirement'].lower())
+                
+                # Add other eligibility items (everything except GPA and college requirement)
+                if parsed_qualifications.get('other_eligibility'):
+                    eligibility_entries.extend([item.lower() for item in parsed_qualifications['other_eligibility']])
+                
+                # If we have any eligibility items, set them
+                if eligibility_entries:
+                    scholarship.eligibility = eligibility_entries
+        
+        # Check "To Apply" field for recommendation requirement
+        if detail_data.get('to_apply'):
+            to_apply_text = detail_data['to_apply'].lower()
+            if 'recommendation' in to_apply_text:
+                scholarship.recommendation_required = True
+        
+        # Set apply_url from "For more information" field
+        if detail_data.get('for_more_information'):
+            for_more_info = detail_data['for_more_information']
+            # Check if it's already a URL (starts with http)
+            if for_more_info.startswith('http://') or for_more_info.startswith('https://'):
+                scholarship.apply_url = for_more_info
+            else:
+                # Extract URL from the text if it contains a URL
+                url_pattern = r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+'
+                url_match = re.search(url_pattern, for_more_info)
+                if url_match:
+                    scholarship.apply_url = url_match.group(0)
+        
+        return scholarship
+    
     def _clean_text(self, text: str) -> str:
         """Clean text by removing extra whitespace and quotes"""
         if not text:
@@ -432,41 +387,6 @@ class CareerOneStopScraper(BaseScraper):
         except:
             return None, None
     
-    
-    
-    def _remove_duplicates(self, scholarships: List[Scholarship]) -> List[Scholarship]:
-        """Remove in-batch duplicates on (title, organization) heuristic.
-
-        Parameters:
-            scholarships: Collection potentially containing duplicates.
-
-        Returns:
-            A list with duplicate titles for the same organization removed.
-        """
-        seen = set()
-        unique = []
-        duplicates_count = 0
-        
-        for scholarship in scholarships:
-            key = f"{scholarship.title.lower()}-{scholarship.organization.lower()}"
-            if key not in seen:
-                seen.add(key)
-                unique.append(scholarship)
-            else:
-                duplicates_count += 1
-                logger.debug(f"Duplicate found: {scholarship.title} - {scholarship.organization}")
-        
-        if duplicates_count > 0:
-            logger.info(f"Removed {duplicates_count} duplicate scholarships")
-        
-        return unique
-    
-    def _store_raw_data(self, filename: str, content: str, content_type: str):
-        """Store raw data (placeholder for S3 storage)"""
-        # In a real implementation, this would store to S3
-        # For now, just log that we would store it
-        logger.debug(f"Would store raw data: {filename} ({len(content)} bytes)")
-    
     def _set_awards(self, funds: str, detail_data: Dict[str, Any]):
         """Parse Funds field and set min_award and max_award in detail_data.
         
@@ -505,84 +425,6 @@ class CareerOneStopScraper(BaseScraper):
             detail_data['min_award'] = amounts[0]
             detail_data['max_award'] = amounts[0]
     
-    def _fetch_detail_data(self, detail_url: str) -> Dict[str, Any]:
-        """Fetch and parse detail page for a scholarship.
-        
-        Parameters:
-            detail_url: URL of the scholarship detail page.
-            
-        Returns:
-            Dictionary with extracted detail data.
-        """
-        if not detail_url:
-            return {}
-        
-        try:
-            time.sleep(1)  # Be respectful to the server
-            logger.debug(f"Fetching URL: {detail_url}")
-            response = self.session.get(detail_url, timeout=30)
-            response.raise_for_status()
-            logger.debug(f"Response status: {response.status_code}, length: {len(response.text)}")
-            
-            sanitized = self._sanitize_filename(detail_url)
-            self._store_raw_data(f"careeronestop_detail_{sanitized}.html", response.text, 'text/html')
-            
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Parse all bold labels once at the start for efficiency
-            self.bold_label_map = self._parse_bold_labels(soup)
-            
-            detail_data: Dict[str, Any] = {}
-            
-            # Extract organization from first line (usually appears first in the detail page)
-            # Look for organization field
-            detail_data['organization'] = self._extract_detail_value(soup, ['Organization'])
-            
-            # Extract Level of Study
-            detail_data['level_of_study'] = self._extract_detail_value(soup, ['Level of Study'])
-            
-            # Extract Award Type - critical for filtering
-            detail_data['award_type'] = self._extract_detail_value(soup, ['Award Type'])
-            
-            # Extract Focus for subject_areas
-            detail_data['focus'] = self._extract_detail_value(soup, ['Focus'])
-            
-            # Extract Purpose
-            detail_data['purpose'] = self._extract_detail_value(soup, ['Purpose'])
-            
-            # Extract Qualifications
-            detail_data['qualifications'] = self._extract_detail_value(soup, ['Criteria'])
-            
-            # Extract "To Apply" field
-            detail_data['to_apply'] = self._extract_detail_value(soup, ['To Apply'])
-            
-            # Extract "For more information" for apply_url
-            for_more_info = self._extract_detail_value(soup, ['For more information'])
-            # Also try to extract a link from that section
-            if for_more_info:
-                detail_data['for_more_information'] = for_more_info
-            else:
-                # Try to find a link near "For more information" text
-                for_more_link = self._extract_link_near_label(soup, ['For more information', 'For More Information'], detail_url)
-                if for_more_link:
-                    detail_data['for_more_information'] = for_more_link
-            
-            # Extract Deadline
-            detail_data['deadline'] = self._extract_detail_value(soup, ['Deadline'])
-            
-            # Extract Funds (award amount) if not already found
-            funds = self._extract_detail_value(soup, ['Funds'])
-            if funds:
-                self._set_awards(funds, detail_data)
-            
-            logger.debug(f"Extracted detail data keys: {list(detail_data.keys())}")
-            logger.debug(f"Detail data values: {detail_data}")
-            return detail_data
-            
-        except Exception as e:
-            logger.warning(f"Failed to fetch detail data for {detail_url}: {e}")
-            return {}
-    
     def _parse_bold_labels(self, soup: BeautifulSoup) -> Dict[str, str]:
         """Parse all bold/strong tags that contain labels and their corresponding values.
         
@@ -972,6 +814,272 @@ class CareerOneStopScraper(BaseScraper):
         
         # Otherwise leave blank (return None)
         return None
+
+
+# Parse-worker entry points. They run in `ParsePool` processes, so they are
+# module-level and reuse one parser per process.
+_worker_parser: Optional[CareerOneStopParser] = None
+
+
+def _get_worker_parser() -> CareerOneStopParser:
+    global _worker_parser
+    if _worker_parser is None:
+        _worker_parser = CareerOneStopParser()
+    return _worker_parser
+
+
+def parse_listing_page(html: bytes, encoding: Optional[str] = None,
+                       base_url: str = CareerOneStopParser.base_url) -> List[Scholarship]:
+    """Worker: parse a CareerOneStop search results page into scholarships."""
+    parser = _get_worker_parser()
+    parser.base_url = base_url
+    return parser.parse_listing_html(html, encoding)
+
+
+def parse_detail_page(scholarship: Scholarship, html: Optional[bytes], encoding: Optional[str],
+                      detail_url: str) -> Optional[Scholarship]:
+    """Worker: complete a listing scholarship from its detail page.
+
+    Returns:
+        The scholarship (unchanged if the detail page is missing or unparseable),
+        or None if it should be skipped.
+    """
+    parser = _get_worker_parser()
+    detail_data: Dict[str, Any] = {}
+    if html is not None:
+        try:
+            detail_data = parser.parse_detail_html(html, encoding, detail_url)
+        except Exception as e:
+            logger.warning(f"Failed to parse detail data for {detail_url}: {e}")
+    
+    if not detail_data:
+        if detail_url:
+            logger.warning(f"No detail data returned for: {detail_url}")
+        return scholarship
+    
+    try:
+        return parser.apply_detail_data(scholarship, detail_data)
+    except Exception as e:
+        logger.error(f"Error parsing table row: {str(e)}")
+        return None
+
+
+class CareerOneStopScraper(BaseScraper, CareerOneStopParser):
+    """CareerOneStop.org scraper using BeautifulSoup"""
+    
+    task_kinds = (DETAIL_TASK_KIND,)
+    detail_task_kind = DETAIL_TASK_KIND
+    
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.base_url = "https://www.careeronestop.org"
+        self.search_url = "https://www.careeronestop.org/Toolkit/Training/find-scholarships.aspx"
+        self.session = create_session(BROWSER_HEADERS)
+        self.parse_pool = ParsePool()
+        # Keys of the rows on the last listing page, before revisit filtering (none ends pagination)
+        self.listing_keys: List[str] = []
+        # Pages shown by the listing pager so far (None until a pager is seen)
+        self.listing_page_count: Optional[int] = None
+        # Rows on a full listing page (the most seen so far); a short last page must not set it
+        self.listing_page_size = 0
+        # Listing and detail requests share the per-host spacing; pages ahead are prefetched
+        self.rate_limiter = HostRateLimiter()
+        self.listing_pages = ListingPrefetcher(self._fetch_listing)
+    
+    def release_workers(self):
+        """Stop the parse worker processes."""
+        self.parse_pool.shutdown()
+    
+    def iter_scholarships(self) -> Iterator[Scholarship]:
+        """Entry point: paginate, parse rows, and yield scholarships page by page.
+
+        `BaseScraper.scrape` de-duplicates and saves them as they arrive; in
+        distributed mode the listing rows are yielded for workers instead.
+        """
+        logger.info("Starting CareerOneStop scraping...")
+        # Use efficient approach - search with broad terms
+        logger.info("Using efficient broad search approach")
+        
+        page = 1
+        found = 0
+        # Stops early on known pages and raises the limit while new rows keep appearing
+        pager = self.paginator()
+        self.listing_page_count = None
+        self.listing_page_size = 0
+        logger.info(f"Will scrape up to {pager.page_limit} pages")
+        
+        try:
+            while page <= pager.page_limit:
+                try:
+                    logger.info(f"Scraping page {page}")
+                    page_scholarships = self._scrape_page(page)
+                    self.heartbeat.page_done()
+                except Exception as e:
+                    error_msg = f"Error scraping page {page}: {str(e)}"
+                    logger.error(error_msg)
+                    self.scrape_errors.append(error_msg)
+                    break
+                found += len(page_scholarships)
+                logger.info(f"Found {len(page_scholarships)} scholarships on page {page}, total so far: {found}")
+                yield from page_scholarships
+                
+                if not pager.observe(page, self.listing_keys):
+                    logger.info(f"Stopping pagination after page {page}: {pager.stop_reason}")
+                    break
+                self.heartbeat.pages_total = pager.page_limit
+                # Fetch the next pages concurrently once the pager shows how many there are
+                self.listing_pages.schedule(pager.ahead(page, self.listing_page_count))
+                
+                page += 1
+        finally:
+            # Release the prefetch threads (and the parse workers of a one-shot scraper)
+            # even if the consumer stops early; a persistent scraper keeps its workers warm
+            if not self.persistent:
+                self.parse_pool.shutdown()
+            self.listing_pages.close()
+        
+        pager.finish()
+        if pager.adaptive:
+            logger.info(f"{pager.new_rows} new listing rows on {len(pager.seen)} seen")
+        logger.info(f"Finished scraping at page {page}, total scholarships collected: {found}")
+    
+    def _scrape_page(self, page: int) -> List[Scholarship]:
+        """Scrape a single result page and map rows to scholarships.
+
+        The listing comes from `self.listing_pages` (prefetched once the pager
+        shows the page count); each detail page is fetched on this thread and
+        parsed in `self.parse_pool` while the next detail page downloads.
+
+        Parameters:
+            page: One-based page index to fetch from CareerOneStop.
+
+        Returns:
+            A list of `Scholarship` domain objects for this page.
+        """
+        scholarships = []
+        self.listing_keys = []
+        
+        try:
+            content, encoding = self.listing_pages.take(page)
+            rows = self.parse_pool.run(parse_listing_page, content, encoding, self.base_url)
+            self.listing_page_size = max(self.listing_page_size, len(rows))
+            page_count = pager_page_count(content, encoding, 'curPage', self.listing_page_size)
+            if page_count:
+                self.listing_page_count = max(self.listing_page_count or 0, page_count)
+            self.listing_keys = [listing_key(row) for row in rows]
+            rows = self.due_rows(rows)
+            if self.distributed:
+                return rows  # detail pages are fetched by workers
+            
+            fetched: Set[str] = set()
+            revisits = []
+            details = self.parse_pool.imap(parse_detail_page, self._iter_detail_pages(rows, fetched))
+            for row, scholarship in zip(rows, details):
+                if row.source_url in fetched:
+                    revisits.append((row.source_url, scholarship))
+                if scholarship:
+                    scholarships.append(scholarship)
+            self.record_revisits(revisits)
+            
+            logger.info(f"Found {len(scholarships)} scholarships on page {page}")
+            
+        except Exception as e:
+            logger.error(f"Error scraping page {page}: {str(e)}")
+        
+        return scholarships
+    
+    def _fetch_listing(self, page: int) -> Tuple[bytes, Optional[str]]:
+        """Fetch one listing page (called from prefetch threads too).
+
+        Parameters:
+            page: One-based page index.
+
+        Returns:
+            (page bytes, declared charset).
+        """
+        # Construct search URL with pagination
+        params = {
+            'keyword': 'scholarship',  # Use broad search term
+            'curPage': page
+        }
+        
+        self.rate_limiter.wait(self.search_url)
+        response = self.session.get(self.search_url, params=params, timeout=30)
+        response.raise_for_status()
+        
+        # Store raw HTML
+        self._store_raw_data(f"careeronestop_page_{page}.html", response.content, 'text/html')
+        
+        return response.content, response_encoding(response)
+    
+    def _iter_detail_pages(self, rows: List[Scholarship],
+                           fetched: Optional[Set[str]] = None) -> Iterator[Tuple[Scholarship, Optional[bytes], Optional[str], str]]:
+        """Fetch the detail page of each listing row as the parse pool asks for it.
+
+        Parameters:
+            rows: Scholarships parsed from a listing page.
+            fetched: Collects the URLs whose detail page was fetched.
+
+        Returns:
+            Iterator of `parse_detail_page` arguments; the page bytes are None
+            when a row has no detail link or the fetch failed.
+        """
+        for scholarship in rows:
+            if scholarship.source_url:
+                self.rate_limiter.wait(scholarship.source_url)  # Be respectful to the server
+            html, encoding = self._fetch_detail_html(scholarship.source_url)
+            if html is not None and fetched is not None:
+                fetched.add(scholarship.source_url)
+            yield scholarship, html, encoding, scholarship.source_url
+    
+    def _fetch_detail_html(self, detail_url: str) -> Tuple[Optional[bytes], Optional[str]]:
+        """Fetch a scholarship detail page.
+        
+        Parameters:
+            detail_url: URL of the scholarship detail page.
+            
+        Returns:
+            (page bytes, declared charset), or (None, None) if it could not be fetched.
+        """
+        if not detail_url:
+            return None, None
+        
+        try:
+            logger.debug(f"Fetching URL: {detail_url}")
+            response = self.session.get(detail_url, timeout=30)
+            response.raise_for_status()
+            logger.debug(f"Response status: {response.status_code}, length: {len(response.content)}")
+            
+            sanitized = self._sanitize_filename(detail_url)
+            self._store_raw_data(f"careeronestop_detail_{sanitized}.html", response.content, 'text/html')
+            
+            return response.content, response_encoding(response)
+            
+        except Exception as e:
+            logger.warning(f"Failed to fetch detail data for {detail_url}: {e}")
+            return None, None
+    
+    def process_task(self, task: Task) -> List[Scholarship]:
+        """Worker side of distributed mode: complete a queued listing row from its detail page.
+
+        Parameters:
+            task: A `DETAIL_TASK_KIND` task; the payload is the listing scholarship.
+
+        Returns:
+            The completed scholarship, or nothing if it should be skipped.
+        """
+        html, encoding = self._fetch_detail_html(task.url)
+        if html is None:
+            raise ConnectionError(f"Could not fetch detail page {task.url}")
+        scholarship = parse_detail_page(Scholarship.from_dict(dict(task.payload)), html, encoding, task.url)
+        self.record_revisits([(task.url, scholarship)])
+        return [scholarship] if scholarship else []
+    
+    def _store_raw_data(self, filename: str, content: bytes, content_type: str):
+        """Store raw data (placeholder for S3 storage)"""
+        # In a real implementation, this would store to S3
+        # For now, just log that we would store it
+        logger.debug(f"Would store raw data: {filename} ({len(content)} bytes)")
     
     def _sanitize_filename(self, url: str) -> str:
         """Sanitize URL for use in filename.
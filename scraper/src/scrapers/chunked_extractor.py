@@ -0,0 +1,367 @@
+#!/usr/bin/env python3
+"""
+Chunked LLM Extractor
+Splits long pages into token-budgeted chunks and extracts scholarships from each concurrently
+"""
+
+import re
+import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LLM_MODEL = "gpt-3.5-turbo"
+
+# Rough English average; only used to size chunks, never to bill
+CHARS_PER_TOKEN = 4
+
+# Prompt text per chunk (page content only), and completion bounds
+DEFAULT_CHUNK_TOKEN_BUDGET = 1500
+MIN_RESPONSE_TOKENS = 400
+MAX_RESPONSE_TOKENS = 1500
+DEFAULT_MAX_CHUNKS = 8
+DEFAULT_CHUNK_WORKERS = 4
+
+# Lines starting with this marker are headings (see ParsedDocument.blocks)
+HEADING_MARKER = '## '
+
+BOILERPLATE_PATTERNS = re.compile(
+    r'cookie|privacy policy|terms of (use|service)|all rights reserved|copyright|©|'
+    r'subscribe|newsletter|sign (in|up)|log ?in|follow us|share (this|on)|skip to (main )?content|'
+    r'back to top|javascript',
+    re.IGNORECASE,
+)
+# Blocks shorter than this with no number or award term are navigation-like labels
+MIN_BLOCK_WORDS = 4
+# Blocks at least this long are dropped when repeated (disclaimers, repeated intros);
+# shorter ones ("Award: $1,000", an organization name) legitimately repeat per scholarship
+MIN_DEDUPE_WORDS = 20
+AWARD_TERMS = re.compile(r'scholarship|award|grant|fellowship|prize|bursary|deadline|eligib', re.IGNORECASE)
+
+SENTENCE_BOUNDARY = re.compile(r'(?<=[.!?])\s+(?=[A-Z0-9$])')
+
+
+def estimate_tokens(text: str) -> int:
+    """Approximate token count of `text`."""
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
+def blocks_from_plain_text(text: str) -> List[str]:
+    """Split text with no markup (e.g. from a PDF) into blocks.
+
+    Uses line breaks when the text has them, otherwise sentence boundaries.
+    """
+    lines = [line.strip() for line in text.splitlines() if line.strip()]
+    if len(lines) > 1:
+        return lines
+    return [sentence for sentence in SENTENCE_BOUNDARY.split(text) if sentence.strip()]
+
+
+def is_boilerplate(block: str) -> bool:
+    """Check whether a text block is legal/account chrome rather than content."""
+    if block.startswith(HEADING_MARKER):
+        return False
+    return len(block.split()) < MIN_DEDUPE_WORDS and bool(BOILERPLATE_PATTERNS.search(block))
+
+
+def is_navigation_like(block: str) -> bool:
+    """Check whether a block is a short label (menu entry, breadcrumb) with no number or award term."""
+    return (len(block.split()) < MIN_BLOCK_WORDS and not any(char.isdigit() for char in block)
+            and not AWARD_TERMS.search(block))
+
+
+def split_into_chunks(blocks: Sequence[str], token_budget: int = DEFAULT_CHUNK_TOKEN_BUDGET) -> List[str]:
+    """Group content blocks into chunks of at most `token_budget` tokens.
+
+    Boilerplate is dropped, and so are repeats of long blocks and of
+    navigation-like labels outside a heading's section; short blocks under a
+    heading are kept even when repeated, since each scholarship may have the
+    same "Award: $1,000" line. A heading always starts a new chunk once the
+    current one is half full, so a scholarship's heading stays with its
+    details; blocks larger than the budget are split on sentences.
+
+    Parameters:
+        blocks: Page text, one block-level element (or line) per entry.
+        token_budget: Maximum estimated tokens of page text per chunk.
+
+    Returns:
+        Chunk texts in page order.
+    """
+    chunks: List[str] = []
+    current: List[str] = []
+    current_tokens = 0
+    seen = set()
+    in_section = False
+
+    def flush():
+        nonlocal current, current_tokens
+        if current:
+            chunks.append('\n'.join(current))
+        current = []
+        current_tokens = 0
+
+    for block in blocks:
+        block = block.strip()
+        if not block or is_boilerplate(block):
+            continue
+        if block.startswith(HEADING_MARKER):
+            in_section = True
+        elif len(block.split()) >= MIN_DEDUPE_WORDS or (not in_section and is_navigation_like(block)):
+            if block in seen:
+                continue
+            seen.add(block)
+
+        pieces = [block]
+        if estimate_tokens(block) > token_budget:
+            pieces = SENTENCE_BOUNDARY.split(block)
+
+        for piece in pieces:
+            tokens = estimate_tokens(piece)
+            starts_section = piece.startswith(HEADING_MARKER) and current_tokens > token_budget // 2
+            if current and (current_tokens + tokens > token_budget or starts_section):
+                flush()
+            if tokens > token_budget:
+                # A single sentence over budget: hard-split it
+                step = token_budget * CHARS_PER_TOKEN
+                chunks.extend(piece[start:start + step] for start in range(0, len(piece), step))
+                continue
+            current.append(piece)
+            current_tokens += tokens
+
+    flush()
+    return chunks
+
+
+def parse_json_items(content: str) -> List[Dict[str, Any]]:
+    """Read the JSON objects out of an LLM reply.
+
+    Accepts a bare array, an object wrapping an array, code fences, and
+    replies cut off mid-array (every complete object before the cut is kept).
+    """
+    text = content.strip()
+    if text.startswith('```'):
+        text = re.sub(r'^```(?:json)?\s*|\s*```$', '', text)
+
+    try:
+        data = json.loads(text)
+    except ValueError:
+        data = None
+
+    if isinstance(data, list):
+        return [item for item in data if isinstance(item, dict)]
+    if isinstance(data, dict):
+        for value in data.values():
+            if isinstance(value, list):
+                return [item for item in value if isinstance(item, dict)]
+        return [data] if data.get('title') else []
+
+    # Truncated reply: decode objects one at a time until the text runs out
+    start = text.find('[')
+    if start < 0:
+        return []
+    decoder = json.JSONDecoder()
+    items: List[Dict[str, Any]] = []
+    position = start + 1
+    while True:
+        position = text.find('{', position)
+        if position < 0:
+            break
+        try:
+            item, position = decoder.raw_decode(text, position)
+        except ValueError:
+            break
+        if isinstance(item, dict):
+            items.append(item)
+    return items
+
+
+def _dedupe_key(item: Dict[str, Any]) -> str:
+    title = re.sub(r'[^a-z0-9]+', ' ', str(item.get('title') or '').lower()).strip()
+    organization = re.sub(r'[^a-z0-9]+', ' ', str(item.get('organization') or '').lower()).strip()
+    return f"{title}|{organization}"
+
+
+def _confidence(item: Dict[str, Any]) -> float:
+    try:
+        return float(item.get('confidence') or 0)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def merge_items(items: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Merge scholarships reported by several chunks.
+
+    Items with the same normalized title and organization are combined: the
+    higher-confidence item wins and empty fields are filled from the others.
+    Items without a title are dropped.
+    """
+    merged: Dict[str, Dict[str, Any]] = {}
+    for item in items:
+        if not str(item.get('title') or '').strip():
+            continue
+        key = _dedupe_key(item)
+        existing = merged.get(key)
+        if existing is None:
+            merged[key] = dict(item)
+            continue
+        primary, secondary = (item, existing) if _confidence(item) > _confidence(existing) else (existing, item)
+        combined = dict(primary)
+        for name, value in secondary.items():
+            if combined.get(name) in (None, '', []):
+                combined[name] = value
+        merged[key] = combined
+    return list(merged.values())
+
+
+@dataclass
+class ChunkedExtraction:
+    """Merged LLM output for one page and what it cost"""
+    items: List[Dict[str, Any]] = field(default_factory=list)
+    chunks_total: int = 0
+    chunks_sent: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    truncated_replies: int = 0
+    failed_chunks: int = 0
+
+    def to_metadata(self) -> Dict[str, Any]:
+        return {
+            'chunks_total': self.chunks_total,
+            'chunks_sent': self.chunks_sent,
+            'prompt_tokens': self.prompt_tokens,
+            'completion_tokens': self.completion_tokens,
+            'truncated_replies': self.truncated_replies,
+            'failed_chunks': self.failed_chunks,
+        }
+
+
+class ChunkedLLMExtractor:
+    """Extract scholarships from long pages one chunk at a time.
+
+    The page is split into chunks of about `chunk_token_budget` tokens;
+    chunks rejected by `is_relevant` are never sent. The rest (at most
+    `max_chunks`, in page order) go to the model concurrently, each with a
+    completion budget sized to the chunk, and the JSON replies are merged.
+    """
+
+    def __init__(self, client: Any, model: str = DEFAULT_LLM_MODEL,
+                 chunk_token_budget: int = DEFAULT_CHUNK_TOKEN_BUDGET,
+                 max_chunks: int = DEFAULT_MAX_CHUNKS, max_workers: int = DEFAULT_CHUNK_WORKERS,
+                 is_relevant: Optional[Callable[[str], bool]] = None):
+        self.client = client
+        self.model = model
+        self.chunk_token_budget = chunk_token_budget
+        self.max_chunks = max_chunks
+        self.max_workers = max_workers
+        self.is_relevant = is_relevant
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='llm-chunk')
+
+    def select_chunks(self, blocks: Sequence[str]) -> List[str]:
+        """Chunks of the page that would be sent to the model, in page order."""
+        return self._select(split_into_chunks(blocks, self.chunk_token_budget))
+
+    def _select(self, chunks: List[str]) -> List[str]:
+        if self.is_relevant is not None:
+            chunks = [chunk for chunk in chunks if self.is_relevant(chunk)]
+        return chunks[:self.max_chunks]
+
+    def extract(self, blocks: Sequence[str], url: str, source_type: str,
+                title: str = "", meta_description: str = "") -> ChunkedExtraction:
+        """Run extraction over a page.
+
+        Parameters:
+            blocks: Page text split into blocks (headings prefixed with `## `).
+            url: Page URL, included in the prompt.
+            source_type: Discovery source type, included in the prompt.
+            title: Page title.
+            meta_description: Page meta description.
+
+        Returns:
+            ChunkedExtraction with the merged items and token usage.
+        """
+        all_chunks = split_into_chunks(blocks, self.chunk_token_budget)
+        chunks = self._select(all_chunks)
+
+        result = ChunkedExtraction(chunks_total=len(all_chunks), chunks_sent=len(chunks))
+        futures = [
+            self._executor.submit(self._extract_chunk, chunk, index, len(chunks), url, source_type, title, meta_description)
+            for index, chunk in enumerate(chunks, 1)
+        ]
+
+        items: List[Dict[str, Any]] = []
+        for future in futures:
+            try:
+                chunk_items, usage, truncated = future.result()
+            except Exception as e:
+                logger.error(f"Error in AI extraction chunk for {url}: {e}")
+                result.failed_chunks += 1
+                continue
+            items.extend(chunk_items)
+            result.prompt_tokens += usage[0]
+            result.completion_tokens += usage[1]
+            result.truncated_replies += int(truncated)
+
+        if result.failed_chunks and result.failed_chunks == len(chunks):
+            raise RuntimeError(f"All {len(chunks)} extraction chunks failed for {url}")
+
+        result.items = merge_items(items)
+        return result
+
+    def _build_prompt(self, chunk: str, index: int, total: int, url: str, source_type: str,
+                      title: str, meta_description: str) -> str:
+        return f"""Extract scholarship information from this webpage content.
+
+URL: {url}
+Source Type: {source_type}
+Page Title: {title}
+Meta Description: {meta_description}
+
+Content (part {index} of {total}):
+{chunk}
+
+Extract ALL scholarship opportunities mentioned in this part of the page. Return as JSON array:
+
+[
+  {{
+    "title": "scholarship title",
+    "organization": "organization name",
+    "description": "brief description",
+    "award_amount": "award amount (e.g., $1000, $500-$2000, varies)",
+    "deadline": "application deadline",
+    "eligibility": "eligibility requirements",
+    "requirements": ["list", "of", "requirements"],
+    "academic_level": "undergraduate/graduate/high school",
+    "geographic_restrictions": "geographic limitations if any",
+    "contact_info": "contact information",
+    "application_url": "application URL if mentioned",
+    "confidence": 0.0-1.0
+  }}
+]
+
+If no scholarships found, return empty array []. Be accurate and don't make up information. Keep descriptions short."""
+
+    def _extract_chunk(self, chunk: str, index: int, total: int, url: str, source_type: str,
+                       title: str, meta_description: str):
+        prompt = self._build_prompt(chunk, index, total, url, source_type, title, meta_description)
+        max_tokens = max(MIN_RESPONSE_TOKENS, min(MAX_RESPONSE_TOKENS, estimate_tokens(chunk)))
+        response = self.client.chat.completions.create(
+            model=self.model,
+            messages=[{"role": "user", "content": prompt}],
+            temperature=0.1,
+            max_tokens=max_tokens
+        )
+
+        choice = response.choices[0]
+        truncated = getattr(choice, 'finish_reason', None) == 'length'
+        if truncated:
+            logger.warning(f"AI reply for chunk {index}/{total} of {url} hit max_tokens; keeping complete items")
+
+        usage = getattr(response, 'usage', None)
+        tokens = (getattr(usage, 'prompt_tokens', 0) or 0, getattr(usage, 'completion_tokens', 0) or 0)
+        return parse_json_items(choice.message.content or ''), tokens, truncated
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
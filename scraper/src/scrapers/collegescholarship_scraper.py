@@ -6,180 +6,62 @@ Scrapes scholarships from CollegeScholarships.org using BeautifulSoup
 
 import logging
 import re
-import requests
-import time
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional, Set, Tuple
 from bs4 import BeautifulSoup
 from bs4.element import Tag, NavigableString
 from urllib.parse import urljoin, urlparse
 from datetime import datetime
 from .base_scraper import BaseScraper
-from ..utils_python import Scholarship, ScrapingResult, ScrapingMetadata, normalize_deadline_value
+from .http_client import BROWSER_HEADERS, create_session
+from .parse_pool import ParsePool, response_encoding
+from .pagination import ListingPrefetcher, listing_key, pager_page_count
+from .rate_limiter import HostRateLimiter
+from ..utils_python.task_queue import Task
+from ..utils_python import Scholarship, normalize_deadline_value
 
 logger = logging.getLogger(__name__)
 
+# Queued detail page of a listing row (payload: the listing scholarship)
+DETAIL_TASK_KIND = 'collegescholarship_detail'
 
-class CollegeScholarshipScraper(BaseScraper):
-    """CollegeScholarships.org scraper using BeautifulSoup"""
-    
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.base_url = "https://www.collegescholarships.org"
-        self.search_url = "https://www.collegescholarships.org/financial-aid/"
-        self.session = requests.Session()
-        
 
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-        })
+class CollegeScholarshipParser:
+    """Network-free CollegeScholarships.org page parsing, usable inside parse workers"""
     
-    def scrape(self) -> ScrapingResult:
-        """Entry point: paginate list pages, parse items, persist results.
-
-        Returns:
-            `ScrapingResult` with totals, errors, and collected scholarships.
-        """
-        logger.info("Starting CollegeScholarship scraping...")
-        
-        try:
-            # Update job status
-            self.update_job_status('running', ScrapingMetadata())
-            
-            scholarships = []
-            errors = []
-            
-            page = 1
-            max_pages = self.max_pages  # Centralized default, overridable per instance
-            
-            while page <= max_pages:
-                try:
-                    logger.info(f"Scraping page {page}")
-                    page_scholarships = self._scrape_page(page)
-                    scholarships.extend(page_scholarships)
-                    
-                    if not page_scholarships:
-                        logger.info(f"No more scholarships found on page {page}")
-                        break
-                    
-                    page += 1
-                    time.sleep(3)  # Be respectful to the server
-                    
-                except Exception as e:
-                    error_msg = f"Error scraping page {page}: {str(e)}"
-                    logger.error(error_msg)
-                    errors.append(error_msg)
-                    break
-            
-            # Remove duplicates
-            unique_scholarships = self._remove_duplicates(scholarships)
-            
-            # Process and save scholarships
-            inserted = 0
-            updated = 0
-            process_errors = []
-            
-            for scholarship in unique_scholarships:
-                try:
-                    if self.save_scholarship(scholarship):
-                        inserted += 1
-                    else:
-                        updated += 1
-                except Exception as e:
-                    process_errors.append(f"Error saving scholarship {scholarship.title}: {str(e)}")
-            
-            errors.extend(process_errors)
-            
-            # Update job status
-            self.update_job_status('completed', ScrapingMetadata(
-                records_found=len(unique_scholarships),
-                records_processed=len(unique_scholarships),
-                records_inserted=inserted,
-                records_updated=updated
-            ))
-            
-            return ScrapingResult(
-                success=True,
-                scholarships=unique_scholarships,
-                errors=errors,
-                metadata={
-                    'total_found': len(unique_scholarships),
-                    'total_processed': len(unique_scholarships),
-                    'total_inserted': inserted,
-                    'total_updated': updated
-                }
-            )
-            
-        except Exception as e:
-            error_msg = f"CollegeScholarship scraper failed: {str(e)}"
-            logger.error(error_msg)
-            
-            self.update_job_status('failed', ScrapingMetadata(errors=[error_msg]))
-            
-            return ScrapingResult(
-                success=False,
-                scholarships=[],
-                errors=[error_msg],
-                metadata={
-                    'total_found': 0,
-                    'total_processed': 0,
-                    'total_inserted': 0,
-                    'total_updated': 0
-                }
-            )
+    base_url = "https://www.collegescholarships.org"
     
-    def _scrape_page(self, page: int) -> List[Scholarship]:
-        """Scrape a single page from CollegeScholarships.org listings.
+    def parse_listing_html(self, html: bytes, encoding: Optional[str] = None) -> List[Scholarship]:
+        """Parse a listing page into scholarships without detail fields.
 
         Parameters:
-            page: One-based page index. Page 1 uses the base search URL.
+            html: Raw page bytes.
+            encoding: Charset declared by the response, if any.
 
         Returns:
-            A list of `Scholarship` domain objects for this page.
+            A list of `Scholarship` objects, one per listing row.
         """
         scholarships = []
+        soup = BeautifulSoup(html, 'html.parser', from_encoding=encoding)
         
-        try:
-            # Construct search URL with pagination
-            if page == 1:
-                url = self.search_url
-            else:
-                url = f"{self.search_url}?page={page}"
-            
-            response = self.session.get(url, timeout=30)
-            response.raise_for_status()
-            
-            # Store raw HTML
-            self._store_raw_data(f"collegescholarship_page_{page}.html", response.text, 'text/html')
-            
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Find scholarship listings using TypeScript structure
-            scholarship_elements = soup.find_all('div', class_='row')
-            
-            for element in scholarship_elements:
-                try:
-                    scholarship = self._parse_row_element(element)
-                    if scholarship:
-                        scholarships.append(scholarship)
-                except Exception as e:
-                    logger.warning(f"Error parsing row element: {str(e)}")
-                    continue
-            
-            logger.info(f"Found {len(scholarships)} scholarships on page {page}")
-            
-        except Exception as e:
-            logger.error(f"Error scraping page {page}: {str(e)}")
+        # Find scholarship listings using TypeScript structure
+        scholarship_elements = soup.find_all('div', class_='row')
+        
+        for element in scholarship_elements:
+            try:
+                scholarship = self._parse_row_element(element)
+                if scholarship:
+                    scholarships.append(scholarship)
+            except Exception as e:
+                logger.warning(f"Error parsing row element: {str(e)}")
+                continue
         
         return scholarships
-    
+
     def _parse_row_element(self, element) -> Optional[Scholarship]:
         """Parse a listing row element into a `Scholarship` if valid.
 
+        Detail page fields are filled in afterwards by `apply_detail_data`.
+
         Parameters:
             element: BeautifulSoup element representing a scholarship row.
 
@@ -325,169 +207,152 @@ class CollegeScholarshipScraper(BaseScraper):
                 min_gpa=min_gpa
             )
 
-            # the detailed url takes you to a page with more details about the scholarship
-            if detail_url:
-                detail_data = self._fetch_detail_data(detail_url)
-            else:
-                detail_data = {}
-
-            if detail_data:
-                if detail_data.get('deadline'):
-                    detail_deadline = self._clean_text(detail_data['deadline'])
-                    normalized_detail_deadline = normalize_deadline_value(detail_deadline)
-                    if normalized_detail_deadline:
-                        scholarship.deadline = normalized_detail_deadline
-                    elif detail_deadline:
-                        scholarship.deadline = detail_deadline
-
-                if detail_data.get('min_award') is not None:
-                    scholarship.min_award = detail_data['min_award']
-
-                if detail_data.get('max_award') is not None:
-                    scholarship.max_award = detail_data['max_award']
-
-                if detail_data.get('renewable') is not None:
-                    scholarship.renewable = detail_data['renewable']
-
-                if detail_data.get('ethnicity'):
-                    ethnicity_value = self._clean_text(detail_data['ethnicity'])
-                    if ethnicity_value:
-                        normalized_ethnicity = ethnicity_value.lower()
-                        scholarship.ethnicity = [normalized_ethnicity]
-
-                if detail_data.get('organization'):
-                    scholarship.organization = self._clean_text(detail_data['organization'])[:255]
-
-                if detail_data.get('apply_url'):
-                    scholarship.apply_url = detail_data['apply_url']
-
-                # Map Enrollment level to academic_level
-                if detail_data.get('enrollment_level'):
-                    enrollment_level = self._clean_text(detail_data['enrollment_level'])
-                    if enrollment_level:
-                        mapped_level = self._map_enrollment_level(enrollment_level)
-                        if mapped_level:
-                            existing_academic = scholarship.academic_level or []
-                            combined_academic = []
-                            for entry in existing_academic + [mapped_level]:
-                                if entry and entry not in combined_academic:
-                                    combined_academic.append(entry)
-                            scholarship.academic_level = combined_academic if combined_academic else None
-                
-                # Parse Major field for subject_areas
-                if detail_data.get('major'):
-                    major = self._clean_text(detail_data['major'])
-                    if major:
-                        subject_areas = self._parse_major_to_subject_areas(major)
-                        if subject_areas:
-                            scholarship.subject_areas = subject_areas
-
-                if detail_data.get('eligibility_notes'):
-                    extra_notes: List[str] = []
-                    for note in detail_data['eligibility_notes']:
-                        normalized_note = self._normalize_eligibility_text(self._clean_text(note))
-                        if normalized_note:
-                            normalized_lower = normalized_note.lower()
-                            # Exclude "all majors eligible"
-                            if normalized_lower != 'all majors eligible':
-                                extra_notes.append(normalized_lower)
-
-                    if extra_notes:
-                        existing = scholarship.eligibility or []
-                        combined: List[str] = []
-                        for entry in existing + extra_notes:
-                            if entry and entry not in combined:
-                                combined.append(entry)
-                        scholarship.eligibility = combined if combined else None
-
-                if detail_data.get('min_gpa') is not None:
-                    scholarship.min_gpa = detail_data['min_gpa']
-                
-                # Check final description for "financial need" to set target_type
-                # (in case description was updated from detail page)
-                if scholarship.description and 'financial need' in scholarship.description.lower():
-                    scholarship.target_type = 'need'
-                
-                # Check Purpose field for "financial Need" (with capital N)
-                if detail_data.get('purpose'):
-                    purpose_text = detail_data['purpose']
-                    if 'financial Need' in purpose_text or 'financial need' in purpose_text.lower():
-                        scholarship.target_type = 'need'
-                
-                # Check To Apply field for "financial Need" (with capital N)
-                if detail_data.get('to_apply'):
-                    to_apply_text = detail_data['to_apply']
-                    if 'financial Need' in to_apply_text or 'financial need' in to_apply_text.lower():
-                        scholarship.target_type = 'need'
-                
-                # Extract GPA from final description if not already set
-                # (in case description was updated from detail page)
-                if scholarship.min_gpa is None and scholarship.description:
-                    extracted_gpa = self._extract_gpa_from_text(scholarship.description)
-                    if extracted_gpa is not None:
-                        scholarship.min_gpa = extracted_gpa
-            
             return scholarship
             
         except Exception as e:
             logger.error(f"Error parsing row element: {str(e)}")
             return None
 
-    def _fetch_detail_data(self, detail_url: str) -> Dict[str, Any]:
-        if not detail_url:
-            return {}
-
-        try:
-            time.sleep(1)
-            response = self.session.get(detail_url, timeout=30)
-            response.raise_for_status()
-
-            sanitized = self._sanitize_filename(detail_url)
-            self._store_raw_data(f"collegescholarship_detail_{sanitized}.html", response.text, 'text/html')
-
-            soup = BeautifulSoup(response.text, 'html.parser')
-
-            detail_data: Dict[str, Any] = {}
-
-            detail_data['apply_url'] = self._extract_apply_link(soup, detail_url)
-            detail_data['deadline'] = self._extract_detail_value(soup, ['Deadline'])
-
-            min_award_text = self._extract_detail_value(soup, ['Min. award', 'Min award'])
-            max_award_text = self._extract_detail_value(soup, ['Max. award', 'Max award'])
-
-            detail_data['min_award'] = self._parse_currency_value(min_award_text)
-            detail_data['max_award'] = self._parse_currency_value(max_award_text)
-
-            renewable_text = self._extract_detail_value(soup, ['Renewable'])
-            detail_data['renewable'] = self._parse_boolean_value(renewable_text)
-
-            race_value = self._extract_detail_value(soup, ['Race'])
-            if race_value:
-                cleaned_race = self._clean_text(race_value).lower()
-            else:
-                cleaned_race = None
+    def parse_detail_html(self, html: bytes, encoding: Optional[str], detail_url: str) -> Dict[str, Any]:
+        """Parse a scholarship detail page into a dict of detail fields."""
+        soup = BeautifulSoup(html, 'html.parser', from_encoding=encoding)
 
-            detail_data['ethnicity'] = cleaned_race
-            detail_data['enrollment_level'] = self._extract_detail_value(soup, ['Enrollment level'])
-            detail_data['major'] = self._extract_detail_value(soup, ['Major'])
-            detail_data['purpose'] = self._extract_detail_value(soup, ['Purpose'])
-            detail_data['to_apply'] = self._extract_detail_value(soup, ['To Apply', 'To apply'])
+        detail_data: Dict[str, Any] = {}
 
-            min_gpa = self._extract_detail_value(soup, ['Min. GPA', 'Minimum GPA'])
-            _award_type = self._extract_detail_value(soup, ['Award type'])  # intentionally ignored
+        detail_data['apply_url'] = self._extract_apply_link(soup, detail_url)
+        detail_data['deadline'] = self._extract_detail_value(soup, ['Deadline'])
 
-            detail_data['min_gpa'] = self._parse_gpa_value(min_gpa)
+        min_award_text = self._extract_detail_value(soup, ['Min. award', 'Min award'])
+        max_award_text = self._extract_detail_value(soup, ['Max. award', 'Max award'])
 
-            eligibility_notes: List[str] = []
+        detail_data['min_award'] = self._parse_currency_value(min_award_text)
+        detail_data['max_award'] = self._parse_currency_value(max_award_text)
 
-            detail_data['eligibility_notes'] = eligibility_notes
-            detail_data['organization'] = self._extract_sponsor_organization(soup)
+        renewable_text = self._extract_detail_value(soup, ['Renewable'])
+        detail_data['renewable'] = self._parse_boolean_value(renewable_text)
 
-            return detail_data
+        race_value = self._extract_detail_value(soup, ['Race'])
+        if race_value:
+            cleaned_race = self._clean_text(race_value).lower()
+        else:
+            cleaned_race = None
+
+        detail_data['ethnicity'] = cleaned_race
+        detail_data['enrollment_level'] = self._extract_detail_value(soup, ['Enrollment level'])
+        detail_data['major'] = self._extract_detail_value(soup, ['Major'])
+        detail_data['purpose'] = self._extract_detail_value(soup, ['Purpose'])
+        detail_data['to_apply'] = self._extract_detail_value(soup, ['To Apply', 'To apply'])
+
+        min_gpa = self._extract_detail_value(soup, ['Min. GPA', 'Minimum GPA'])
+        _award_type = self._extract_detail_value(soup, ['Award type'])  # intentionally ignored
+
+        detail_data['min_gpa'] = self._parse_gpa_value(min_gpa)
+
+        eligibility_notes: List[str] = []
+
+        detail_data['eligibility_notes'] = eligibility_notes
+        detail_data['organization'] = self._extract_sponsor_organization(soup)
+
+        return detail_data
+
+    def apply_detail_data(self, scholarship: Scholarship, detail_data: Dict[str, Any]) -> Scholarship:
+        """Merge parsed detail page fields into a listing scholarship."""
+        if detail_data.get('deadline'):
+            detail_deadline = self._clean_text(detail_data['deadline'])
+            normalized_detail_deadline = normalize_deadline_value(detail_deadline)
+            if normalized_detail_deadline:
+                scholarship.deadline = normalized_detail_deadline
+            elif detail_deadline:
+                scholarship.deadline = detail_deadline
+
+        if detail_data.get('min_award') is not None:
+            scholarship.min_award = detail_data['min_award']
+
+        if detail_data.get('max_award') is not None:
+            scholarship.max_award = detail_data['max_award']
+
+        if detail_data.get('renewable') is not None:
+            scholarship.renewable = detail_data['renewable']
+
+        if detail_data.get('ethnicity'):
+            ethnicity_value = self._clean_text(detail_data['ethnicity'])
+            if ethnicity_value:
+                normalized_ethnicity = ethnicity_value.lower()
+                scholarship.ethnicity = [normalized_ethnicity]
+
+        if detail_data.get('organization'):
+            scholarship.organization = self._clean_text(detail_data['organization'])[:255]
+
+        if detail_data.get('apply_url'):
+            scholarship.apply_url = detail_data['apply_url']
+
+        # Map Enrollment level to academic_level
+        if detail_data.get('enrollment_level'):
+            enrollment_level = self._clean_text(detail_data['enrollment_level'])
+            if enrollment_level:
+                mapped_level = self._map_enrollment_level(enrollment_level)
+                if mapped_level:
+                    existing_academic = scholarship.academic_level or []
+                    combined_academic = []
+                    for entry in existing_academic + [mapped_level]:
+                        if entry and entry not in combined_academic:
+                            combined_academic.append(entry)
+                    scholarship.academic_level = combined_academic if combined_academic else None
+        
+        # Parse Major field for subject_areas
+        if detail_data.get('major'):
+            major = self._clean_text(detail_data['major'])
+            if major:
+                subject_areas = self._parse_major_to_subject_areas(major)
+                if subject_areas:
+                    scholarship.subject_areas = subject_areas
+
+        if detail_data.get('eligibility_notes'):
+            extra_notes: List[str] = []
+            for note in detail_data['eligibility_notes']:
+                normalized_note = self._normalize_eligibility_text(self._clean_text(note))
+                if normalized_note:
+                    normalized_lower = normalized_note.lower()
+                    # Exclude "all majors eligible"
+                    if normalized_lower != 'all majors eligible':
+                        extra_notes.append(normalized_lower)
+
+            if extra_notes:
+                existing = scholarship.eligibility or []
+                combined: List[str] = []
+                for entry in existing + extra_notes:
+                    if entry and entry not in combined:
+                        combined.append(entry)
+                scholarship.eligibility = combined if combined else None
+
+        if detail_data.get('min_gpa') is not None:
+            scholarship.min_gpa = detail_data['min_gpa']
+        
+        # Check final description for "financial need" to set target_type
+        # (in case description was updated from detail page)
+        if scholarship.description and 'financial need' in scholarship.description.lower():
+            scholarship.target_type = 'need'
+        
+        # Check Purpose field for "financial Need" (with capital N)
+        if detail_data.get('purpose'):
+            purpose_text = detail_data['purpose']
+            if 'financial Need' in purpose_text or 'financial need' in purpose_text.lower():
+                scholarship.target_type = 'need'
+        
+        # Check To Apply field for "financial Need" (with capital N)
+        if detail_data.get('to_apply'):
+            to_apply_text = detail_data['to_apply']
+            if 'financial Need' in to_apply_text or 'financial need' in to_apply_text.lower():
+                scholarship.target_type = 'need'
+        
+        # Extract GPA from final description if not already set
+        # (in case description was updated from detail page)
+        if scholarship.min_gpa is None and scholarship.description:
+            extracted_gpa = self._extract_gpa_from_text(scholarship.description)
+            if extracted_gpa is not None:
+                scholarship.min_gpa = extracted_gpa
 
-        except Exception as e:
-            logger.warning(f"Failed to fetch detail data for {detail_url}: {e}")
-            return {}
+        return scholarship
 
     def _extract_detail_value(self, soup: BeautifulSoup, labels: List[str]) -> Optional[str]:
         for label in labels:
@@ -609,15 +474,6 @@ class CollegeScholarshipScraper(BaseScraper):
             return False
         return None
 
-    def _sanitize_filename(self, url: str) -> str:
-        parsed = urlparse(url)
-        path = parsed.path.strip('/') or 'scholarship'
-        path = path.replace('/', '_')
-        if parsed.query:
-            path = f"{path}_{parsed.query.replace('=', '-').replace('&', '_')}"
-        sanitized = re.sub(r'[^A-Za-z0-9_.-]', '_', path)
-        return sanitized[:200]
-    
     def _clean_text(self, text: str) -> str:
         """Clean text by removing extra whitespace and quotes"""
         if not text:
@@ -638,7 +494,7 @@ class CollegeScholarshipScraper(BaseScraper):
         normalized = re.sub(r"\b([A-Za-z’'`-]+?)-level study\b", r"\1", text, flags=re.IGNORECASE)
         normalized = re.sub(r"\s{2,}", " ", normalized).strip()
         return normalized
-    
+
     def _map_enrollment_level(self, enrollment_level: str) -> Optional[str]:
         """Map Enrollment level to standardized academic_level values.
         
@@ -667,7 +523,7 @@ class CollegeScholarshipScraper(BaseScraper):
         
         # Default: return None for unrecognized levels
         return None
-    
+
     def _parse_major_to_subject_areas(self, major: str) -> Optional[List[str]]:
         """Parse Major field into subject_areas array.
         
@@ -694,7 +550,7 @@ class CollegeScholarshipScraper(BaseScraper):
                 subject_areas.append(cleaned)
         
         return subject_areas if subject_areas else None
-    
+
     def _extract_gpa_from_text(self, text: str) -> Optional[float]:
         """Extract GPA value from text (e.g., "minimum x.y GPA").
         
@@ -731,7 +587,7 @@ class CollegeScholarshipScraper(BaseScraper):
                     continue
         
         return None
-    
+
     def _extract_text(self, element, selectors: List[str]) -> Optional[str]:
         """Extract text using multiple possible selectors"""
         for selector in selectors:
@@ -741,7 +597,7 @@ class CollegeScholarshipScraper(BaseScraper):
                 if text:
                     return text
         return None
-    
+
     def _extract_url(self, element) -> Optional[str]:
         """Extract URL from element"""
         # Look for links
@@ -753,7 +609,7 @@ class CollegeScholarshipScraper(BaseScraper):
             else:
                 return urljoin(self.base_url, href)
         return None
-    
+
     def _parse_amount(self, amount_text: Optional[str]) -> tuple[Optional[float], Optional[float]]:
         """Parse amount text to extract min and max awards"""
         if not amount_text:
@@ -775,30 +631,271 @@ class CollegeScholarshipScraper(BaseScraper):
                 return None, None
         except:
             return None, None
+
+
+# Parse-worker entry points. They run in `ParsePool` processes, so they are
+# module-level and reuse one parser per process.
+_worker_parser: Optional[CollegeScholarshipParser] = None
+
+
+def _get_worker_parser() -> CollegeScholarshipParser:
+    global _worker_parser
+    if _worker_parser is None:
+        _worker_parser = CollegeScholarshipParser()
+    return _worker_parser
+
+
+def parse_listing_page(html: bytes, encoding: Optional[str] = None,
+                       base_url: str = CollegeScholarshipParser.base_url) -> List[Scholarship]:
+    """Worker: parse a CollegeScholarships.org listing page into scholarships."""
+    parser = _get_worker_parser()
+    parser.base_url = base_url
+    return parser.parse_listing_html(html, encoding)
+
+
+def parse_detail_page(scholarship: Scholarship, html: Optional[bytes], encoding: Optional[str],
+                      detail_url: str) -> Optional[Scholarship]:
+    """Worker: complete a listing scholarship from its detail page.
+
+    Returns:
+        The scholarship (unchanged if the detail page is missing or unparseable),
+        or None if it should be skipped.
+    """
+    parser = _get_worker_parser()
+    detail_data: Dict[str, Any] = {}
+    if html is not None:
+        try:
+            detail_data = parser.parse_detail_html(html, encoding, detail_url)
+        except Exception as e:
+            logger.warning(f"Failed to parse detail data for {detail_url}: {e}")
+    
+    if not detail_data:
+        return scholarship
+    
+    try:
+        return parser.apply_detail_data(scholarship, detail_data)
+    except Exception as e:
+        logger.error(f"Error parsing row element: {str(e)}")
+        return None
+
+
+class CollegeScholarshipScraper(BaseScraper, CollegeScholarshipParser):
+    """CollegeScholarships.org scraper using BeautifulSoup"""
+    
+    task_kinds = (DETAIL_TASK_KIND,)
+    detail_task_kind = DETAIL_TASK_KIND
+    
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.base_url = "https://www.collegescholarships.org"
+        self.search_url = "https://www.collegescholarships.org/financial-aid/"
+        self.session = create_session(BROWSER_HEADERS)
+        self.parse_pool = ParsePool()
+        # Keys of the rows on the last listing page, before revisit filtering (none ends pagination)
+        self.listing_keys: List[str] = []
+        # Pages shown by the listing pager so far (None until a pager is seen)
+        self.listing_page_count: Optional[int] = None
+        # Rows on a full listing page (the most seen so far); a short last page must not set it
+        self.listing_page_size = 0
+        # Listing and detail requests share the per-host spacing; pages ahead are prefetched
+        self.rate_limiter = HostRateLimiter()
+        self.listing_pages = ListingPrefetcher(self._fetch_listing)
+    
+    def release_workers(self):
+        """Stop the parse worker processes."""
+        self.parse_pool.shutdown()
     
+    def iter_scholarships(self) -> Iterator[Scholarship]:
+        """Entry point: paginate, parse rows, and yield scholarships page by page.
+
+        `BaseScraper.scrape` de-duplicates and saves them as they arrive; in
+        distributed mode the listing rows are yielded for workers instead.
+        """
+        logger.info("Starting CollegeScholarship scraping...")
+        
+        page = 1
+        found = 0
+        # Stops early on known pages and raises the limit while new rows keep appearing
+        pager = self.paginator()
+        self.listing_page_count = None
+        self.listing_page_size = 0
+        logger.info(f"Will scrape up to {pager.page_limit} pages")
+        
+        try:
+            while page <= pager.page_limit:
+                try:
+                    logger.info(f"Scraping page {page}")
+                    page_scholarships = self._scrape_page(page)
+                    self.heartbeat.page_done()
+                except Exception as e:
+                    error_msg = f"Error scraping page {page}: {str(e)}"
+                    logger.error(error_msg)
+                    self.scrape_errors.append(error_msg)
+                    break
+                found += len(page_scholarships)
+                logger.info(f"Found {len(page_scholarships)} scholarships on page {page}, total so far: {found}")
+                yield from page_scholarships
+                
+                if not pager.observe(page, self.listing_keys):
+                    logger.info(f"Stopping pagination after page {page}: {pager.stop_reason}")
+                    break
+                self.heartbeat.pages_total = pager.page_limit
+                # Fetch the next pages concurrently once the pager shows how many there are
+                self.listing_pages.schedule(pager.ahead(page, self.listing_page_count))
+                
+                page += 1
+        finally:
+            # Release the prefetch threads (and the parse workers of a one-shot scraper)
+            # even if the consumer stops early; a persistent scraper keeps its workers warm
+            if not self.persistent:
+                self.parse_pool.shutdown()
+            self.listing_pages.close()
+        
+        pager.finish()
+        if pager.adaptive:
+            logger.info(f"{pager.new_rows} new listing rows on {len(pager.seen)} seen")
+        logger.info(f"Finished scraping at page {page}, total scholarships collected: {found}")
+    
+    def _scrape_page(self, page: int) -> List[Scholarship]:
+        """Scrape a single page from CollegeScholarships.org listings.
+
+        The listing comes from `self.listing_pages` (prefetched once the pager
+        shows the page count); each detail page is fetched on this thread and
+        parsed in `self.parse_pool` while the next detail page downloads.
+
+        Parameters:
+            page: One-based page index. Page 1 uses the base search URL.
+
+        Returns:
+            A list of `Scholarship` domain objects for this page.
+        """
+        scholarships = []
+        self.listing_keys = []
+        
+        try:
+            content, encoding = self.listing_pages.take(page)
+            rows = self.parse_pool.run(parse_listing_page, content, encoding, self.base_url)
+            self.listing_page_size = max(self.listing_page_size, len(rows))
+            page_count = pager_page_count(content, encoding, 'page', self.listing_page_size)
+            if page_count:
+                self.listing_page_count = max(self.listing_page_count or 0, page_count)
+            self.listing_keys = [listing_key(row) for row in rows]
+            rows = self.due_rows(rows)
+            if self.distributed:
+                return rows  # detail pages are fetched by workers
+            
+            fetched: Set[str] = set()
+            revisits = []
+            details = self.parse_pool.imap(parse_detail_page, self._iter_detail_pages(rows, fetched))
+            for row, scholarship in zip(rows, details):
+                if row.source_url in fetched:
+                    revisits.append((row.source_url, scholarship))
+                if scholarship:
+                    scholarships.append(scholarship)
+            self.record_revisits(revisits)
+            
+            logger.info(f"Found {len(scholarships)} scholarships on page {page}")
+            
+        except Exception as e:
+            logger.error(f"Error scraping page {page}: {str(e)}")
+        
+        return scholarships
     
+    def _fetch_listing(self, page: int) -> Tuple[bytes, Optional[str]]:
+        """Fetch one listing page (called from prefetch threads too).
+
+        Parameters:
+            page: One-based page index.
+
+        Returns:
+            (page bytes, declared charset).
+        """
+        # Construct search URL with pagination
+        if page == 1:
+            url = self.search_url
+        else:
+            url = f"{self.search_url}?page={page}"
+        
+        self.rate_limiter.wait(url)
+        response = self.session.get(url, timeout=30)
+        response.raise_for_status()
+        
+        # Store raw HTML
+        self._store_raw_data(f"collegescholarship_page_{page}.html", response.content, 'text/html')
+        
+        return response.content, response_encoding(response)
     
-    def _remove_duplicates(self, scholarships: List[Scholarship]) -> List[Scholarship]:
-        """Remove in-batch duplicates on (title, organization) heuristic.
+    def _iter_detail_pages(self, rows: List[Scholarship],
+                           fetched: Optional[Set[str]] = None) -> Iterator[Tuple[Scholarship, Optional[bytes], Optional[str], str]]:
+        """Fetch the detail page of each listing row as the parse pool asks for it.
 
         Parameters:
-            scholarships: Collection potentially containing duplicates.
+            rows: Scholarships parsed from a listing page.
+            fetched: Collects the URLs whose detail page was fetched.
 
         Returns:
-            A list with duplicate titles for the same organization removed.
+            Iterator of `parse_detail_page` arguments; the page bytes are None
+            when a row has no detail link or the fetch failed.
         """
-        seen = set()
-        unique = []
+        for scholarship in rows:
+            if scholarship.source_url:
+                self.rate_limiter.wait(scholarship.source_url)  # Be respectful to the server
+            html, encoding = self._fetch_detail_html(scholarship.source_url)
+            if html is not None and fetched is not None:
+                fetched.add(scholarship.source_url)
+            yield scholarship, html, encoding, scholarship.source_url
+    
+    def _fetch_detail_html(self, detail_url: str) -> Tuple[Optional[bytes], Optional[str]]:
+        """Fetch a scholarship detail page.
         
-        for scholarship in scholarships:
-            key = f"{scholarship.title.lower()}-{scholarship.organization.lower()}"
-            if key not in seen:
-                seen.add(key)
-                unique.append(scholarship)
+        Parameters:
+            detail_url: URL of the scholarship detail page.
+            
+        Returns:
+            (page bytes, declared charset), or (None, None) if it could not be fetched.
+        """
+        if not detail_url:
+            return None, None
         
-        return unique
+        try:
+            response = self.session.get(detail_url, timeout=30)
+            response.raise_for_status()
+            
+            sanitized = self._sanitize_filename(detail_url)
+            self._store_raw_data(f"collegescholarship_detail_{sanitized}.html", response.content, 'text/html')
+            
+            return response.content, response_encoding(response)
+            
+        except Exception as e:
+            logger.warning(f"Failed to fetch detail data for {detail_url}: {e}")
+            return None, None
+    
+    def process_task(self, task: Task) -> List[Scholarship]:
+        """Worker side of distributed mode: complete a queued listing row from its detail page.
+
+        Parameters:
+            task: A `DETAIL_TASK_KIND` task; the payload is the listing scholarship.
+
+        Returns:
+            The completed scholarship, or nothing if it should be skipped.
+        """
+        html, encoding = self._fetch_detail_html(task.url)
+        if html is None:
+            raise ConnectionError(f"Could not fetch detail page {task.url}")
+        scholarship = parse_detail_page(Scholarship.from_dict(dict(task.payload)), html, encoding, task.url)
+        self.record_revisits([(task.url, scholarship)])
+        return [scholarship] if scholarship else []
+    
+    def _sanitize_filename(self, url: str) -> str:
+        parsed = urlparse(url)
+        path = parsed.path.strip('/') or 'scholarship'
+        path = path.replace('/', '_')
+        if parsed.query:
+            path = f"{path}_{parsed.query.replace('=', '-').replace('&', '_')}"
+        sanitized = re.sub(r'[^A-Za-z0-9_.-]', '_', path)
+        return sanitized[:200]
     
-    def _store_raw_data(self, filename: str, content: str, content_type: str):
+    def _store_raw_data(self, filename: str, content: bytes, content_type: str):
         """Store raw data (placeholder for S3 storage)"""
         # In a real implementation, this would store to S3
         # For now, just log that we would store it
@@ -18,6 +18,42 @@ GOOGLE_MIN_INTERVAL_BETWEEN_REQUESTS_SEC = 3.0  # Throttle between requests
 # Generic scraper request throttling (per-scraper minimum delay between requests)
 SCRAPER_MIN_REQUEST_DELAY_SEC = 1.0
 
+# Shared HTTP client (src/scrapers/http_client.py): kept-alive connections per host and
+# hosts per session, urllib3 retries for connection errors and 5xx/429 (backoff factor,
+# longest Retry-After honoured), split connect/read timeouts and the DNS cache lifetime
+HTTP_POOL_MAXSIZE = 8
+HTTP_POOL_CONNECTIONS = 16
+HTTP_MAX_RETRIES = 3
+HTTP_BACKOFF_FACTOR = 0.5
+HTTP_MAX_RETRY_AFTER_SEC = 60.0
+HTTP_CONNECT_TIMEOUT_SEC = 5.0
+HTTP_READ_TIMEOUT_SEC = 30.0
+HTTP_DNS_CACHE_TTL_SEC = 300.0
+
+# Streamed page bodies: largest HTML page read before the fetch is abandoned, and the
+# bytes scanned for a <meta charset> when the Content-Type header names no charset
+HTTP_MAX_BODY_BYTES = 5 * 1024 * 1024
+HTTP_CHARSET_SNIFF_BYTES = 1024
+
 MAX_CAREERONESTOP_PAGES = 5
 
+# Listing pagination (src/scrapers/pagination.py): stop after this many consecutive pages
+# with no new rows, never raise the page limit past the ceiling, and walk every page
+# (no early stop) at least this often so deep rows are still seen
+LISTING_KNOWN_PAGES_TO_STOP = 2
+LISTING_MAX_PAGES_CEILING = 50
+LISTING_FULL_WALK_INTERVAL_SEC = 7 * 24 * 3600.0
+# Listing pages fetched at once once the pager shows the page count (still spaced per host)
+LISTING_PREFETCH_WORKERS = 4
+
+
+
+# Daemon mode (main.py --daemon): cadence for websites without a `cadence_minutes`
+# entry in their config, how often the websites table is re-read, and the
+# localhost port of the health/metrics endpoint (0 disables it)
+DAEMON_DEFAULT_CADENCE_MIN = 360
+DAEMON_SCHEDULE_REFRESH_SEC = 300
+DAEMON_METRICS_PORT = 8787
 
+# Worker mode (main.py --worker): seconds to wait before polling an empty task queue again
+WORKER_POLL_INTERVAL_SEC = 2.0
@@ -5,20 +5,43 @@ AI-enhanced extraction of scholarship details from various content types
 """
 
 import os
-import json
 import logging
 import requests
-import time
 import re
-from typing import List, Dict, Any, Optional, Tuple, Union
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import List, Dict, Any, Deque, Iterable, Iterator, Optional, Tuple, Union
 from urllib.parse import urljoin, urlparse
 from datetime import datetime
 from dataclasses import dataclass, asdict
-from bs4 import BeautifulSoup
 import hashlib
 
+from .parsed_document import ParsedDocument
+from .pdf_extractor import PdfTextExtractor
+from .parse_pool import ParsePool
+from .chunked_extractor import ChunkedLLMExtractor, blocks_from_plain_text
+from .relevance_scorer import RelevanceScorer, default_relevance_scorer
+from .rate_limiter import HostRateLimiter
+from .constants import HTTP_MAX_BODY_BYTES
+from .http_client import HTML_MEDIA_TYPES, ResponseTooLargeError, create_session, media_type, read_text
+
 logger = logging.getLogger(__name__)
 
+# URLs a batch works on at once (fetching, parsing or waiting on the LLM)
+DEFAULT_BATCH_IN_FLIGHT = 8
+
+
+def parse_html_page(html: Union[str, bytes], encoding: Optional[str] = None, url: str = "") -> ParsedDocument:
+    """Worker: reduce an HTML page to what extraction needs.
+
+    Runs in a `ParsePool` process so BeautifulSoup does not hold the GIL of the
+    process doing network and OpenAI calls.
+
+    Returns:
+        ParsedDocument (normalized body text, title, meta description, text blocks for chunking, ...)
+    """
+    return ParsedDocument.parse(html, url, encoding)
+
 
 @dataclass
 class ExtractedScholarship:
@@ -73,7 +96,9 @@ class ExtractionResult:
 class ContentExtractionPipeline:
     """AI-enhanced content extraction pipeline"""
     
-    def __init__(self, openai_api_key: str = None):
+    def __init__(self, openai_api_key: str = None, pdf_extractor: Optional[PdfTextExtractor] = None,
+                 parse_pool: Optional[ParsePool] = None, relevance_scorer: Optional[RelevanceScorer] = None,
+                 rate_limiter: Optional[HostRateLimiter] = None):
         self.openai_api_key = openai_api_key or os.getenv('OPENAI_API_KEY')
         
         # Initialize OpenAI client if available
@@ -86,14 +111,42 @@ class ContentExtractionPipeline:
                 logger.warning("OpenAI package not installed. Install with: pip install openai")
         
         # Session for requests
-        self.session = requests.Session()
-        self.session.headers.update({
+        self.session = create_session({
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
         })
         
+        # HTML pages larger than this are abandoned mid-download
+        self.max_page_bytes = HTTP_MAX_BODY_BYTES
+        
+        # Batch fetches are spaced out per host rather than globally
+        self.rate_limiter = rate_limiter or HostRateLimiter()
+        
+        # PDF text extraction (worker pool is only started when a PDF shows up)
+        self.pdf_extractor = pdf_extractor or PdfTextExtractor()
+        
+        # HTML parsing runs in worker processes (started on first page)
+        self.parse_pool = parse_pool or ParsePool()
+        
+        # Worker pools created here are stopped by close(); shared ones belong to the caller
+        self._owned_pools = [pool for pool, given in ((self.pdf_extractor, pdf_extractor),
+                                                      (self.parse_pool, parse_pool)) if given is None]
+        
+        # Local relevance model that decides which pages and chunks are worth an LLM call
+        self.relevance_scorer = relevance_scorer or default_relevance_scorer()
+        
+        # Long pages are sent to the model in relevant, token-budgeted chunks
+        self.llm_extractor = None
+        if self.openai_client:
+            self.llm_extractor = ChunkedLLMExtractor(self.openai_client, is_relevant=self.relevance_scorer.is_relevant)
+        
         # Extraction patterns
         self.extraction_patterns = self._initialize_extraction_patterns()
     
+    def close(self):
+        """Stop the PDF and parse worker pools this pipeline started (they restart on next use)."""
+        for pool in self._owned_pools:
+            pool.shutdown()
+    
     def _initialize_extraction_patterns(self) -> Dict[str, Dict[str, Any]]:
         """Initialize extraction patterns for different content types"""
         return {
@@ -133,22 +186,32 @@ class ContentExtractionPipeline:
         try:
             logger.info(f"Extracting content from: {url}")
             
-            # Fetch content
-            response = self.session.get(url, timeout=30)
-            response.raise_for_status()
-            
-            content_type = response.headers.get('Content-Type', '').lower()
-            
-            if 'text/html' in content_type:
-                return self._extract_from_html(response.text, url, source_type)
-            elif 'application/pdf' in content_type:
-                return self._extract_from_pdf(response.content, url, source_type)
-            else:
-                return ExtractionResult(
-                    success=False,
-                    scholarships=[],
-                    errors=[f"Unsupported content type: {content_type}"]
-                )
+            # Fetch content (streamed: PDFs go straight to disk, HTML is capped and
+            # decoded as it arrives, anything else is rejected before its body is read)
+            with self.session.get(url, timeout=30, stream=True) as response:
+                response.raise_for_status()
+                
+                content_type = media_type(response)
+                
+                if content_type in HTML_MEDIA_TYPES:
+                    try:
+                        html_content, _ = read_text(response, self.max_page_bytes)
+                    except ResponseTooLargeError as e:
+                        logger.info(f"Skipping page: {e}")
+                        return ExtractionResult(
+                            success=True,
+                            scholarships=[],
+                            metadata={'reason': f'Page over size limit ({self.max_page_bytes} bytes)'}
+                        )
+                    return self._extract_from_html(html_content, url, source_type)
+                elif content_type == 'application/pdf':
+                    return self._extract_from_pdf(response, url, source_type)
+                else:
+                    return ExtractionResult(
+                        success=False,
+                        scholarships=[],
+                        errors=[f"Unsupported content type: {content_type}"]
+                    )
                 
         except Exception as e:
             error_msg = f"Error extracting from {url}: {str(e)}"
@@ -159,40 +222,30 @@ class ContentExtractionPipeline:
                 errors=[error_msg]
             )
     
-    def _extract_from_html(self, html_content: str, url: str, source_type: str) -> ExtractionResult:
-        """Extract scholarship information from HTML content"""
+    def extract_scholarships(self, content: str, source_url: str, category: str = "unknown",
+                             title: Optional[str] = None, meta_description: str = "",
+                             blocks: Optional[List[str]] = None) -> ExtractionResult:
+        """Extract scholarship information from text a crawler has already fetched and parsed"""
         try:
-            soup = BeautifulSoup(html_content, 'html.parser')
-            
-            # Clean content
-            for script in soup(["script", "style", "nav", "footer", "header"]):
-                script.decompose()
-            
-            # Get text content
-            text_content = soup.get_text()
-            text_content = ' '.join(text_content.split())
-            
-            # Check if page contains scholarship-related content
-            if not self._is_scholarship_page(text_content):
-                return ExtractionResult(
-                    success=True,
-                    scholarships=[],
-                    raw_content=text_content[:1000],
-                    metadata={'reason': 'No scholarship content detected'}
-                )
-            
-            # Extract using AI if available
-            if self.openai_client:
-                scholarships = self._ai_extract_scholarships(text_content, url, source_type, soup)
-            else:
-                scholarships = self._fallback_extract_scholarships(text_content, url, source_type, soup)
-            
+            return self._extract_from_text(content, source_url, category, title=title,
+                                           meta_description=meta_description, blocks=blocks or None)
+        except Exception as e:
+            error_msg = f"Error extracting from {source_url}: {str(e)}"
+            logger.error(error_msg)
             return ExtractionResult(
-                success=True,
-                scholarships=scholarships,
-                raw_content=text_content[:1000],
-                metadata={'extraction_method': 'ai' if self.openai_client else 'fallback'}
+                success=False,
+                scholarships=[],
+                errors=[error_msg]
             )
+    
+    def _extract_from_html(self, html_content: Union[str, bytes], url: str, source_type: str,
+                           encoding: Optional[str] = None) -> ExtractionResult:
+        """Extract scholarship information from HTML content"""
+        try:
+            doc = self.parse_pool.run(parse_html_page, html_content, encoding, url)
+            
+            return self._extract_from_text(doc.normalized_text, url, source_type, title=doc.title,
+                                           meta_description=doc.meta_description, blocks=doc.blocks)
             
         except Exception as e:
             error_msg = f"Error extracting from HTML: {str(e)}"
@@ -203,18 +256,27 @@ class ContentExtractionPipeline:
                 errors=[error_msg]
             )
     
-    def _extract_from_pdf(self, pdf_content: bytes, url: str, source_type: str) -> ExtractionResult:
-        """Extract scholarship information from PDF content"""
+    def _extract_from_pdf(self, response: requests.Response, url: str, source_type: str) -> ExtractionResult:
+        """Extract scholarship information from a streamed PDF response"""
         try:
-            # TODO: Implement PDF text extraction
-            # For now, return a placeholder result
-            logger.info(f"PDF extraction not yet implemented for {url}")
+            pdf_text = self.pdf_extractor.extract_response(url, response)
+            if pdf_text is None:
+                return ExtractionResult(
+                    success=True,
+                    scholarships=[],
+                    metadata={'reason': 'PDF skipped (extraction unavailable or over size limit)'}
+                )
             
-            return ExtractionResult(
-                success=True,
-                scholarships=[],
-                metadata={'reason': 'PDF extraction not implemented'}
-            )
+            # Chunk on the PDF's own lines; detection and fallback patterns read the flat text
+            result = self._extract_from_text(' '.join(pdf_text.text.split()), url, source_type,
+                                             title=pdf_text.title, blocks=blocks_from_plain_text(pdf_text.text))
+            result.metadata.update({
+                'content_type': 'application/pdf',
+                'pdf_pages_read': pdf_text.pages_read,
+                'pdf_total_pages': pdf_text.total_pages,
+                'pdf_truncated': pdf_text.truncated,
+            })
+            return result
             
         except Exception as e:
             error_msg = f"Error extracting from PDF: {str(e)}"
@@ -225,7 +287,48 @@ class ContentExtractionPipeline:
                 errors=[error_msg]
             )
     
-    def _is_scholarship_page(self, content: str) -> bool:
+    def _extract_from_text(self, text_content: str, url: str, source_type: str,
+                           title: Optional[str] = None, meta_description: str = "",
+                           blocks: Optional[List[str]] = None) -> ExtractionResult:
+        """Run scholarship detection and AI/fallback extraction on page text (HTML or PDF)"""
+        # Check if page contains scholarship-related content
+        if not self._is_scholarship_page(text_content):
+            return ExtractionResult(
+                success=True,
+                scholarships=[],
+                raw_content=text_content[:1000],
+                metadata={'reason': 'No scholarship content detected'}
+            )
+        
+        # Extract using AI if available, for pages the local scorer considers relevant
+        metadata: Dict[str, Any] = {'extraction_method': 'ai' if self.openai_client else 'fallback'}
+        if self.openai_client:
+            relevance = self.relevance_scorer.score(text_content)
+            metadata['relevance_score'] = round(relevance, 3)
+            if relevance < self.relevance_scorer.threshold:
+                metadata['reason'] = 'Below relevance threshold'
+                return ExtractionResult(
+                    success=True,
+                    scholarships=[],
+                    raw_content=text_content[:1000],
+                    metadata=metadata
+                )
+            
+            scholarships, ai_stats = self._ai_extract_scholarships(text_content, url, source_type, title,
+                                                                   meta_description, blocks)
+            metadata.update(ai_stats)
+        else:
+            scholarships = self._fallback_extract_scholarships(text_content, url, source_type, title)
+        
+        return ExtractionResult(
+            success=True,
+            scholarships=scholarships,
+            raw_content=text_content[:1000],
+            metadata=metadata
+        )
+    
+    @staticmethod
+    def _is_scholarship_page(content: str) -> bool:
         """Check if page contains scholarship-related content"""
         scholarship_keywords = [
             'scholarship', 'award', 'grant', 'financial aid', 'student funding',
@@ -235,60 +338,22 @@ class ContentExtractionPipeline:
         content_lower = content.lower()
         return any(keyword in content_lower for keyword in scholarship_keywords)
     
-    def _ai_extract_scholarships(self, content: str, url: str, source_type: str, soup: BeautifulSoup) -> List[ExtractedScholarship]:
-        """Extract scholarship information using AI"""
-        try:
-            # Get page title and meta description
-            title = soup.find('title')
-            title_text = title.get_text() if title else ""
-            
-            meta_desc = soup.find('meta', attrs={'name': 'description'})
-            meta_text = meta_desc.get('content', '') if meta_desc else ""
-            
-            # Prepare content for AI
-            ai_content = content[:3000]  # Limit for API
-            
-            prompt = f"""Extract scholarship information from this webpage content.
-
-URL: {url}
-Source Type: {source_type}
-Page Title: {title_text}
-Meta Description: {meta_text}
-
-Content: {ai_content}
-
-Extract ALL scholarship opportunities mentioned on this page. Return as JSON array:
+    def _ai_extract_scholarships(self, content: str, url: str, source_type: str, title: Optional[str] = None,
+                                 meta_description: str = "",
+                                 blocks: Optional[List[str]] = None) -> Tuple[List[ExtractedScholarship], Dict[str, Any]]:
+        """Extract scholarship information using AI, one relevant chunk of the page at a time.
 
-[
-  {{
-    "title": "scholarship title",
-    "organization": "organization name",
-    "description": "brief description",
-    "award_amount": "award amount (e.g., $1000, $500-$2000, varies)",
-    "deadline": "application deadline",
-    "eligibility": "eligibility requirements",
-    "requirements": ["list", "of", "requirements"],
-    "academic_level": "undergraduate/graduate/high school",
-    "geographic_restrictions": "geographic limitations if any",
-    "contact_info": "contact information",
-    "application_url": "application URL if mentioned",
-    "confidence": 0.0-1.0
-  }}
-]
-
-If no scholarships found, return empty array []. Be accurate and don't make up information."""
-
-            response = self.openai_client.chat.completions.create(
-                model="gpt-3.5-turbo",
-                messages=[{"role": "user", "content": prompt}],
-                temperature=0.1,
-                max_tokens=1000
-            )
+        Returns:
+            (scholarships, chunk/token statistics for the result metadata)
+        """
+        try:
+            if blocks is None:
+                blocks = blocks_from_plain_text(content)
             
-            ai_data = json.loads(response.choices[0].message.content)
+            extraction = self.llm_extractor.extract(blocks, url, source_type, title or "", meta_description or "")
             
             scholarships = []
-            for item in ai_data:
+            for item in extraction.items:
                 try:
                     scholarship = self._create_scholarship_from_ai_data(item, url, source_type)
                     if scholarship:
@@ -297,20 +362,20 @@ If no scholarships found, return empty array []. Be accurate and don't make up i
                     logger.error(f"Error creating scholarship from AI data: {e}")
                     continue
             
-            return scholarships
+            return scholarships, extraction.to_metadata()
             
         except Exception as e:
             logger.error(f"Error in AI extraction: {str(e)}")
-            return self._fallback_extract_scholarships(content, url, source_type, soup)
+            return self._fallback_extract_scholarships(content, url, source_type, title), {'ai_error': str(e)}
     
-    def _fallback_extract_scholarships(self, content: str, url: str, source_type: str, soup: BeautifulSoup) -> List[ExtractedScholarship]:
+    def _fallback_extract_scholarships(self, content: str, url: str, source_type: str,
+                                       title: Optional[str] = None) -> List[ExtractedScholarship]:
         """Fallback extraction using pattern matching"""
         scholarships = []
         
         try:
             # Extract basic information
-            title = soup.find('title')
-            title_text = title.get_text() if title else ""
+            title_text = title or ""
             
             # Extract organization from URL
             domain = urlparse(url).netloc
@@ -466,32 +531,62 @@ If no scholarships found, return empty array []. Be accurate and don't make up i
                 return matches[0][:100]  # Limit length
         return None
     
-    def batch_extract(self, urls: List[str], source_types: List[str] = None) -> List[ExtractionResult]:
-        """Extract scholarship information from multiple URLs"""
+    def batch_extract(self, urls: Iterable[str], source_types: Optional[Iterable[str]] = None,
+                      max_in_flight: int = DEFAULT_BATCH_IN_FLIGHT) -> List[ExtractionResult]:
+        """Extract scholarship information from multiple URLs concurrently.
+
+        Parameters:
+            urls: URLs to extract; may be a generator.
+            source_types: Source type per URL (default 'unknown').
+            max_in_flight: Most URLs being fetched, parsed or sent to the LLM at once.
+
+        Returns:
+            One ExtractionResult per URL, in input order.
+        """
+        return list(self.iter_extract(urls, source_types, max_in_flight))
+    
+    def iter_extract(self, urls: Iterable[str], source_types: Optional[Iterable[str]] = None,
+                     max_in_flight: int = DEFAULT_BATCH_IN_FLIGHT) -> Iterator[ExtractionResult]:
+        """Extract from URLs concurrently, yielding results in input order as they complete.
+
+        Each URL runs on a worker thread: the fetch waits only on its own
+        host's rate limit, parsing goes to the parse pool and AI extraction to
+        the LLM threads, so one URL's LLM call overlaps the next one's fetch.
+        URLs are pulled from `urls` lazily and at most `max_in_flight` results
+        are held back waiting for an earlier, slower URL.
+        """
         if source_types is None:
-            source_types = ['unknown'] * len(urls)
-        
-        results = []
-        
-        for i, (url, source_type) in enumerate(zip(urls, source_types)):
-            try:
-                logger.info(f"Processing {i+1}/{len(urls)}: {url}")
-                result = self.extract_from_url(url, source_type)
-                results.append(result)
-                
-                # Rate limiting
-                time.sleep(1)
-                
-            except Exception as e:
-                error_msg = f"Error processing {url}: {str(e)}"
-                logger.error(error_msg)
-                results.append(ExtractionResult(
-                    success=False,
-                    scholarships=[],
-                    errors=[error_msg]
-                ))
+            jobs = ((url, 'unknown') for url in urls)
+        else:
+            jobs = zip(urls, source_types)
         
-        return results
+        executor = ThreadPoolExecutor(max_workers=max_in_flight, thread_name_prefix='extract')
+        pending: Deque[Future] = deque()
+        try:
+            for i, (url, source_type) in enumerate(jobs):
+                if len(pending) >= max_in_flight:
+                    yield pending.popleft().result()
+                pending.append(executor.submit(self._batch_extract_one, i, url, source_type))
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=False)
+    
+    def _batch_extract_one(self, index: int, url: str, source_type: str) -> ExtractionResult:
+        try:
+            logger.info(f"Processing {index + 1}: {url}")
+            self.rate_limiter.wait(url)
+            return self.extract_from_url(url, source_type)
+        except Exception as e:
+            error_msg = f"Error processing {url}: {str(e)}"
+            logger.error(error_msg)
+            return ExtractionResult(
+                success=False,
+                scholarships=[],
+                errors=[error_msg]
+            )
 
 
 # Example usage
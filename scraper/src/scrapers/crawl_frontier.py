@@ -0,0 +1,342 @@
+#!/usr/bin/env python3
+"""
+Crawl Frontier
+URL canonicalization and compact duplicate detection for the ethical crawler
+"""
+
+import math
+import heapq
+import hashlib
+import itertools
+import logging
+from array import array
+from typing import Iterable, List, NamedTuple, Optional, Tuple
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+logger = logging.getLogger(__name__)
+
+# Query parameters that only track campaigns/sessions and never change content
+TRACKING_PARAMS = frozenset({
+    'gclid', 'dclid', 'fbclid', 'msclkid', 'yclid', 'mc_cid', 'mc_eid',
+    '_ga', '_gl', '_hsenc', '_hsmi', 'igshid', 'ref_src', 'sessionid', 'phpsessid', 'jsessionid',
+})
+TRACKING_PREFIXES = ('utm_',)
+
+DEFAULT_PORTS = {'http': 80, 'https': 443}
+
+
+def canonicalize_url(url: str) -> str:
+    """Reduce a URL to the form used for duplicate detection.
+
+    Lowercases the scheme and host, drops default ports, fragments, tracking
+    parameters and trailing slashes, and sorts the remaining query parameters.
+
+    Parameters:
+        url: Absolute URL.
+
+    Returns:
+        Canonical URL string (the input unchanged if it cannot be parsed).
+    """
+    try:
+        parts = urlsplit(url.strip())
+        scheme = parts.scheme.lower()
+        host = (parts.hostname or '').rstrip('.')
+        port = parts.port
+    except ValueError:
+        return url
+
+    netloc = f"[{host}]" if ':' in host else host
+    if port and DEFAULT_PORTS.get(scheme) != port:
+        netloc = f"{netloc}:{port}"
+    if parts.username:
+        credentials = parts.username + (f":{parts.password}" if parts.password else '')
+        netloc = f"{credentials}@{netloc}"
+
+    path = parts.path or '/'
+    if len(path) > 1 and path.endswith('/'):
+        path = path.rstrip('/') or '/'
+
+    query = ''
+    if parts.query:
+        params = [
+            (key, value)
+            for key, value in parse_qsl(parts.query, keep_blank_values=True)
+            if key.lower() not in TRACKING_PARAMS and not key.lower().startswith(TRACKING_PREFIXES)
+        ]
+        query = urlencode(sorted(params))
+
+    return urlunsplit((scheme, netloc, path, query, ''))
+
+
+def url_fingerprint(canonical_url: str) -> int:
+    """Return a 64-bit fingerprint of an already canonical URL."""
+    digest = hashlib.blake2b(canonical_url.encode('utf-8', 'surrogatepass'), digest_size=8).digest()
+    return int.from_bytes(digest, 'little')
+
+
+class BloomFilter:
+    """Fixed-capacity Bloom filter over 64-bit fingerprints (double hashing)."""
+
+    __slots__ = ('capacity', 'error_rate', 'num_bits', 'num_hashes', 'count', '_bits')
+
+    def __init__(self, capacity: int, error_rate: float):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.num_bits = max(64, int(math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2))))
+        self.num_hashes = max(1, int(round(self.num_bits / capacity * math.log(2))))
+        self.count = 0
+        self._bits = bytearray((self.num_bits + 7) // 8)
+
+    def _positions(self, fingerprint: int):
+        h1 = fingerprint & 0xFFFFFFFF
+        h2 = (fingerprint >> 32) | 1
+        num_bits = self.num_bits
+        return [(h1 + i * h2) % num_bits for i in range(self.num_hashes)]
+
+    def add(self, fingerprint: int):
+        bits = self._bits
+        for position in self._positions(fingerprint):
+            bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, fingerprint: int) -> bool:
+        bits = self._bits
+        for position in self._positions(fingerprint):
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+
+    @property
+    def nbytes(self) -> int:
+        return len(self._bits)
+
+
+class ScalableBloomFilter:
+    """Bloom filter that adds tighter, larger slices as it fills up.
+
+    Each new slice is `growth` times larger with its error rate scaled by
+    `tightening`, so the compound false-positive rate stays below `error_rate`
+    no matter how many URLs are added.
+    """
+
+    def __init__(self, initial_capacity: int = 4096, error_rate: float = 0.001,
+                 growth: int = 4, tightening: float = 0.5):
+        self.initial_capacity = initial_capacity
+        self.error_rate = error_rate
+        self.growth = growth
+        self.tightening = tightening
+        self.filters: List[BloomFilter] = []
+        self._add_slice()
+
+    def _add_slice(self):
+        index = len(self.filters)
+        capacity = self.initial_capacity * (self.growth ** index)
+        # Geometric series keeps the sum of slice error rates under error_rate
+        slice_error = self.error_rate * (1 - self.tightening) * (self.tightening ** index)
+        self.filters.append(BloomFilter(capacity, slice_error))
+
+    def add(self, fingerprint: int):
+        current = self.filters[-1]
+        if current.count >= current.capacity:
+            self._add_slice()
+            current = self.filters[-1]
+        current.add(fingerprint)
+
+    def __contains__(self, fingerprint: int) -> bool:
+        # Newest slice first: it holds most of the entries
+        return any(fingerprint in bloom for bloom in reversed(self.filters))
+
+    def __len__(self) -> int:
+        return sum(bloom.count for bloom in self.filters)
+
+    @property
+    def nbytes(self) -> int:
+        return sum(bloom.nbytes for bloom in self.filters)
+
+
+class FingerprintSet:
+    """Exact set of 64-bit fingerprints in a flat open-addressing table.
+
+    Stores 8 bytes per slot instead of a Python object per entry. Zero marks an
+    empty slot, so a zero fingerprint is stored as 1.
+    """
+
+    __slots__ = ('_table', '_mask', '_count')
+
+    MAX_LOAD = 0.5
+
+    def __init__(self, initial_slots: int = 1024):
+        slots = 1 << max(4, (initial_slots - 1).bit_length())
+        self._table = array('Q', bytes(8 * slots))
+        self._mask = slots - 1
+        self._count = 0
+
+    def _probe(self, fingerprint: int) -> int:
+        """Return the slot holding `fingerprint`, or the empty slot where it belongs."""
+        table = self._table
+        mask = self._mask
+        index = fingerprint & mask
+        while True:
+            slot = table[index]
+            if slot == 0 or slot == fingerprint:
+                return index
+            index = (index + 1) & mask
+
+    def add(self, fingerprint: int) -> bool:
+        """Insert a fingerprint; returns False if it was already present."""
+        fingerprint = fingerprint or 1
+        index = self._probe(fingerprint)
+        if self._table[index]:
+            return False
+        self._table[index] = fingerprint
+        self._count += 1
+        if self._count > len(self._table) * self.MAX_LOAD:
+            self._resize(len(self._table) * 2)
+        return True
+
+    def __contains__(self, fingerprint: int) -> bool:
+        fingerprint = fingerprint or 1
+        return self._table[self._probe(fingerprint)] == fingerprint
+
+    def _resize(self, slots: int):
+        old_table = self._table
+        self._table = array('Q', bytes(8 * slots))
+        self._mask = slots - 1
+        for fingerprint in old_table:
+            if fingerprint:
+                self._table[self._probe(fingerprint)] = fingerprint
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def nbytes(self) -> int:
+        return self._table.itemsize * len(self._table)
+
+
+class VisitedSet:
+    """Compact set of canonical URLs.
+
+    The Bloom filter answers the common "never seen" case without touching the
+    exact table; the fingerprint table confirms Bloom positives so URLs are
+    never dropped on a false positive. With `exact=False` only the Bloom
+    filter is kept (about 2 bytes per URL at the default error rate).
+    """
+
+    def __init__(self, exact: bool = True, error_rate: float = 0.001, initial_capacity: int = 4096):
+        self.exact = exact
+        self.error_rate = error_rate
+        self.initial_capacity = initial_capacity
+        self.clear()
+
+    def clear(self):
+        self._bloom = ScalableBloomFilter(self.initial_capacity, self.error_rate)
+        self._fingerprints: Optional[FingerprintSet] = FingerprintSet(self.initial_capacity) if self.exact else None
+
+    def _contains_fingerprint(self, fingerprint: int) -> bool:
+        if fingerprint not in self._bloom:
+            return False
+        return self._fingerprints is None or fingerprint in self._fingerprints
+
+    def add(self, url: str) -> bool:
+        """Mark a URL as seen; returns False if it already was."""
+        return self.add_canonical(canonicalize_url(url))
+
+    def add_canonical(self, canonical_url: str) -> bool:
+        """Same as `add` for a URL that already went through `canonicalize_url`."""
+        fingerprint = url_fingerprint(canonical_url)
+        if self._contains_fingerprint(fingerprint):
+            return False
+        self._bloom.add(fingerprint)
+        if self._fingerprints is not None:
+            self._fingerprints.add(fingerprint)
+        return True
+
+    def __contains__(self, url: str) -> bool:
+        return self._contains_fingerprint(url_fingerprint(canonicalize_url(url)))
+
+    def __len__(self) -> int:
+        return len(self._bloom)
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the Bloom slices and fingerprint table."""
+        total = self._bloom.nbytes
+        if self._fingerprints is not None:
+            total += self._fingerprints.nbytes
+        return total
+
+
+class FrontierEntry(NamedTuple):
+    """A URL popped from the frontier with the depth it was found at.
+
+    `url` is the URL as it was pushed (the one to fetch); `canonical` is its
+    duplicate-detection key, for bookkeeping keyed on the page.
+    """
+    url: str
+    depth: int
+    score: float
+    canonical: str
+
+
+class CrawlFrontier:
+    """Priority queue of URLs that admits each canonical URL at most once.
+
+    URLs are canonicalized and checked against everything already queued or
+    crawled when they are pushed, so duplicates never reach the fetch loop.
+    The canonical form is only the duplicate key: the URL is queued and
+    popped as it was pushed, since some servers do not serve the canonical
+    form (case-sensitive hosts behind proxies, required trailing slashes,
+    order-sensitive query strings).
+    The highest-scored URL is popped first; equal scores come out in push
+    order. URLs deeper than `max_depth` are rejected without being marked
+    seen, so they can still be queued if found again closer to the start.
+    """
+
+    def __init__(self, visited: Optional[VisitedSet] = None, max_depth: Optional[int] = None):
+        self.visited = visited if visited is not None else VisitedSet()
+        self.max_depth = max_depth
+        self._heap: List[Tuple[float, int, str, int]] = []
+        self._counter = itertools.count()
+        self.duplicates_rejected = 0
+        self.depth_rejected = 0
+
+    def push(self, url: str, score: float = 0.0, depth: int = 0) -> bool:
+        """Queue a URL unless it has been seen or is too deep; returns True if it was queued."""
+        if self.max_depth is not None and depth > self.max_depth:
+            self.depth_rejected += 1
+            return False
+        canonical = canonicalize_url(url)
+        if not self.visited.add_canonical(canonical):
+            self.duplicates_rejected += 1
+            return False
+        heapq.heappush(self._heap, (-score, next(self._counter), url, depth))
+        return True
+
+    def extend(self, urls: Iterable[str], score: float = 0.0, depth: int = 0) -> int:
+        """Queue many URLs with the same score and depth; returns how many were new."""
+        return sum(1 for url in urls if self.push(url, score, depth))
+
+    def mark_seen(self, url: str):
+        """Record a URL as handled without queueing it."""
+        self.visited.add(url)
+
+    def pop(self) -> FrontierEntry:
+        """Return the highest-scored URL still queued."""
+        negative_score, _, url, depth = heapq.heappop(self._heap)
+        return FrontierEntry(url, depth, -negative_score, canonicalize_url(url))
+
+    def clear(self):
+        self._heap.clear()
+        self.visited.clear()
+        self.duplicates_rejected = 0
+        self.depth_rejected = 0
+
+    def __contains__(self, url: str) -> bool:
+        return url in self.visited
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def __bool__(self) -> bool:
+        return bool(self._heap)
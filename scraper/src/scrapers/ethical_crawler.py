@@ -9,15 +9,31 @@ import time
 import logging
 import requests
 import random
-from typing import List, Dict, Any, Optional, Set, Deque
+import threading
+from typing import List, Dict, Any, Optional, Set, Tuple
 from urllib.parse import urljoin, urlparse, parse_qs
-from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 import xml.etree.ElementTree as ET
-from bs4 import BeautifulSoup
 import re
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 
+from .chunked_extractor import blocks_from_plain_text
+from .crawl_frontier import CrawlFrontier, canonicalize_url
+from .constants import HTTP_MAX_BODY_BYTES
+from .http_client import BOT_HEADERS, HTML_MEDIA_TYPES, create_session, media_type, read_text
+from .link_scorer import is_relevant_url, score_link
+from .parsed_document import ParsedDocument
+from .pdf_extractor import DEFAULT_MAX_PDF_BYTES, DEFAULT_MAX_PDF_PAGES, DEFAULT_PDF_WORKERS, PdfTextExtractor
+from .robots_txt import (
+    DEFAULT_ROBOTS_CACHE_PATH, DEFAULT_ROBOTS_CACHE_TTL, CachedRobotsTxt, RobotsCache, RobotsTxtRules,
+    parse_robots_txt
+)
+from .sitemap_reader import (
+    DEFAULT_LASTMOD_STORE_PATH, SitemapEntry, SitemapLastmodStore, iter_sitemap, open_sitemap_stream
+)
+from ..utils_python.revisit_policy import RevisitPolicy, fingerprint
+
 logger = logging.getLogger(__name__)
 
 
@@ -35,209 +51,203 @@ class CrawlConfig:
     follow_links: bool = True
     extract_pdfs: bool = True
     extract_news: bool = True
-
-
-@dataclass
-class RobotsTxtRules:
-    """Parsed robots.txt rules"""
-    allowed: Set[str] = None
-    disallowed: Set[str] = None
-    crawl_delay: Optional[float] = None
-    sitemap_urls: List[str] = None
-    
-    def __post_init__(self):
-        if self.allowed is None:
-            self.allowed = set()
-        if self.disallowed is None:
-            self.disallowed = set()
-        if self.sitemap_urls is None:
-            self.sitemap_urls = []
+    sitemap_workers: int = 4  # Child sitemaps of an index fetched in parallel
+    sitemap_lastmod_store: Optional[str] = DEFAULT_LASTMOD_STORE_PATH  # None re-crawls every sitemap URL
+    robots_cache_path: Optional[str] = DEFAULT_ROBOTS_CACHE_PATH  # None keeps robots.txt in memory only
+    robots_cache_ttl: float = DEFAULT_ROBOTS_CACHE_TTL
+    max_pdf_bytes: int = DEFAULT_MAX_PDF_BYTES
+    max_pdf_pages: int = DEFAULT_MAX_PDF_PAGES
+    pdf_workers: int = DEFAULT_PDF_WORKERS
+    max_page_bytes: int = HTTP_MAX_BODY_BYTES  # HTML pages larger than this are abandoned mid-download
 
 
 class RobotsTxtParser:
     """Parse and handle robots.txt files"""
     
-    def __init__(self, user_agent: str = "*"):
+    def __init__(self, user_agent: str = "*", cache: Optional[RobotsCache] = None):
         self.user_agent = user_agent
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'ScholarshipTrackerBot/1.0'
-        })
+        self.cache = cache
+        self._parsed: Dict[str, Tuple[float, RobotsTxtRules]] = {}
+        # No urllib3 status retries: a 5xx answer falls back to the cached copy right away
+        self.session = create_session(BOT_HEADERS, retry_statuses=())
     
     def fetch_and_parse(self, domain: str) -> RobotsTxtRules:
-        """Fetch and parse robots.txt for a domain"""
-        rules = RobotsTxtRules()
-        
+        """Fetch and parse robots.txt for a domain, using the cache while it is fresh"""
         # Ensure domain has protocol
         if not domain.startswith(('http://', 'https://')):
             domain = 'https://' + domain
         
+        cached = self.cache.get(domain) if self.cache else None
+        if cached:
+            return self._rules_for(domain, cached)
+        
         robots_url = urljoin(domain, '/robots.txt')
         
         try:
             logger.info(f"Fetching robots.txt from {robots_url}")
             response = self.session.get(robots_url, timeout=10)
-            
-            if response.status_code == 200:
-                return self._parse_robots_content(response.text, domain)
-            else:
-                logger.info(f"No robots.txt found at {robots_url} (Status: {response.status_code})")
-                return rules
-                
+            status = response.status_code
+            content = response.text if status == 200 else ''
         except Exception as e:
             logger.warning(f"Error fetching robots.txt from {robots_url}: {e}")
-            return rules
+            status, content = None, ''
+        
+        if status is None or status >= 500:
+            # Unreachable: reuse the last copy we had, otherwise assume complete disallow
+            stale = self.cache.get(domain, allow_stale=True) if self.cache else None
+            if stale:
+                logger.info(f"robots.txt unavailable at {robots_url}, using cached copy")
+                return self._rules_for(domain, stale)
+            logger.warning(f"robots.txt unavailable at {robots_url} (Status: {status}), not crawling {domain}")
+            return RobotsTxtRules.disallow_all()
+        
+        if status != 200:
+            logger.info(f"No robots.txt found at {robots_url} (Status: {status})")
+        
+        if self.cache:
+            return self._rules_for(domain, self.cache.put(domain, status, content))
+        return self._rules_from_response(status, content, domain)
+    
+    def _rules_for(self, domain: str, cached: CachedRobotsTxt) -> RobotsTxtRules:
+        """Parse a cached robots.txt once per fetch"""
+        parsed = self._parsed.get(domain)
+        if parsed and parsed[0] == cached.fetched_at:
+            return parsed[1]
+        rules = self._rules_from_response(cached.status, cached.content, domain)
+        self._parsed[domain] = (cached.fetched_at, rules)
+        return rules
+    
+    def _rules_from_response(self, status: int, content: str, domain: str) -> RobotsTxtRules:
+        # 2xx is parsed; 3xx (after redirects) and 4xx mean no restrictions
+        if 200 <= status < 300:
+            return self._parse_robots_content(content, domain)
+        return RobotsTxtRules()
     
     def _parse_robots_content(self, content: str, domain: str) -> RobotsTxtRules:
         """Parse robots.txt content"""
-        rules = RobotsTxtRules()
-        current_user_agent = None
-        
-        for line in content.split('\n'):
-            line = line.strip()
-            if not line or line.startswith('#'):
-                continue
-            
-            if ':' in line:
-                directive, value = line.split(':', 1)
-                directive = directive.strip().lower()
-                value = value.strip()
-                
-                if directive == 'user-agent':
-                    current_user_agent = value
-                elif directive == 'disallow' and (current_user_agent == '*' or current_user_agent == self.user_agent):
-                    if value:
-                        rules.disallowed.add(value)
-                elif directive == 'allow' and (current_user_agent == '*' or current_user_agent == self.user_agent):
-                    if value:
-                        rules.allowed.add(value)
-                elif directive == 'crawl-delay' and (current_user_agent == '*' or current_user_agent == self.user_agent):
-                    try:
-                        rules.crawl_delay = float(value)
-                    except ValueError:
-                        pass
-                elif directive == 'sitemap':
-                    rules.sitemap_urls.append(value)
-        
-        logger.info(f"Parsed robots.txt: {len(rules.disallowed)} disallowed, {len(rules.allowed)} allowed, "
-                   f"crawl-delay: {rules.crawl_delay}, sitemaps: {len(rules.sitemap_urls)}")
-        return rules
+        return parse_robots_txt(content, self.user_agent)
     
     def can_fetch(self, url: str, rules: RobotsTxtRules) -> bool:
         """Check if URL can be fetched according to robots.txt rules"""
-        parsed_url = urlparse(url)
-        path = parsed_url.path
-        
-        # Check disallowed patterns
-        for disallowed in rules.disallowed:
-            if path.startswith(disallowed):
-                return False
-        
-        # Check allowed patterns (if any specific allows exist)
-        if rules.allowed:
-            for allowed in rules.allowed:
-                if path.startswith(allowed):
-                    return True
-            return False
-        
-        return True
+        return rules.can_fetch(url)
 
 
 class SitemapProcessor:
     """Process sitemaps for efficient URL discovery"""
     
-    def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'ScholarshipTrackerBot/1.0'
-        })
+    def __init__(self, lastmod_store: Optional[SitemapLastmodStore] = None, max_workers: int = 4,
+                 max_index_depth: int = 3):
+        self.lastmod_store = lastmod_store
+        self.max_workers = max_workers
+        self.max_index_depth = max_index_depth
+        self._local = threading.local()
+    
+    @property
+    def session(self) -> requests.Session:
+        """Per-thread session, child sitemaps are fetched from a thread pool"""
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = create_session(BOT_HEADERS, pool_maxsize=1)
+            self._local.session = session
+        return session
     
     def extract_urls_from_sitemaps(self, sitemap_urls: List[str], domain: str) -> List[str]:
         """Extract URLs from sitemap files"""
-        all_urls = []
-        
-        for sitemap_url in sitemap_urls:
-            try:
-                logger.info(f"Processing sitemap: {sitemap_url}")
-                response = self.session.get(sitemap_url, timeout=15)
-                response.raise_for_status()
-                
-                urls = self._parse_sitemap(response.text, domain)
-                all_urls.extend(urls)
-                
-                time.sleep(1)  # Be respectful
-                
-            except Exception as e:
-                logger.error(f"Error processing sitemap {sitemap_url}: {e}")
-        
-        # Remove duplicates and filter for relevant URLs
-        unique_urls = list(set(all_urls))
-        relevant_urls = self._filter_relevant_urls(unique_urls)
-        
-        logger.info(f"Extracted {len(relevant_urls)} relevant URLs from sitemaps")
-        return relevant_urls
+        return [entry.url for entry in self.extract_entries_from_sitemaps(sitemap_urls, domain)]
+    
+    def extract_entries_from_sitemaps(self, sitemap_urls: List[str], domain: str) -> List[SitemapEntry]:
+        """Extract relevant URL entries (with priority/lastmod) from sitemap files
+        
+        Sitemaps are streamed, child sitemaps of an index are fetched concurrently
+        and, when a lastmod store is configured, entries whose lastmod matches the
+        one recorded at the last crawl are skipped. Order follows the sitemaps.
+        """
+        seen_urls: Set[str] = set()
+        seen_sitemaps: Set[str] = set()
+        relevant_entries: List[SitemapEntry] = []
+        unchanged = 0
+        
+        pending = list(dict.fromkeys(sitemap_urls))
+        depth = 0
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while pending and depth <= self.max_index_depth:
+                seen_sitemaps.update(pending)
+                # Results are consumed in submission order to keep output deterministic
+                futures = [executor.submit(self._read_sitemap, url, domain) for url in pending]
+                pending = []
+                for future in futures:
+                    entries, child_sitemaps, skipped = future.result()
+                    unchanged += skipped
+                    for entry in entries:
+                        if entry.url not in seen_urls:
+                            seen_urls.add(entry.url)
+                            relevant_entries.append(entry)
+                    pending.extend(url for url in child_sitemaps if url not in seen_sitemaps and url not in pending)
+                depth += 1
+        
+        logger.info(f"Extracted {len(relevant_entries)} relevant URLs from sitemaps"
+                    + (f" ({unchanged} unchanged since last crawl)" if unchanged else ""))
+        return relevant_entries
     
-    def _parse_sitemap(self, content: str, domain: str) -> List[str]:
-        """Parse sitemap XML content"""
-        urls = []
+    def _read_sitemap(self, sitemap_url: str, domain: str) -> Tuple[List[SitemapEntry], List[str], int]:
+        """Stream one sitemap; returns (changed relevant entries, child sitemap URLs, unchanged count)"""
+        entries: List[SitemapEntry] = []
+        child_sitemaps: List[str] = []
+        unchanged = 0
         
         try:
-            root = ET.fromstring(content)
-            
-            # Handle both sitemap and sitemapindex
-            for loc in root.findall('.//{http://www.sitemaps.org/schemas/sitemap/0.9}loc'):
-                url = loc.text.strip()
+            logger.info(f"Processing sitemap: {sitemap_url}")
+            with self.session.get(sitemap_url, timeout=15, stream=True) as response:
+                response.raise_for_status()
+                response.raw.decode_content = True
+                
+                # Entries are only built for relevant pages (and child sitemaps)
+                for kind, entry in iter_sitemap(open_sitemap_stream(response.raw), is_relevant_url):
+                    if kind == 'sitemap':
+                        child_sitemaps.append(entry.url)
+                    elif self.lastmod_store and not self.lastmod_store.is_changed(domain, entry):
+                        unchanged += 1
+                    else:
+                        entries.append(entry)
                 
-                # If it's a sitemap index, recursively process
-                if 'sitemap' in url.lower():
-                    sub_urls = self.extract_urls_from_sitemaps([url], domain)
-                    urls.extend(sub_urls)
-                else:
-                    urls.append(url)
-                    
         except ET.ParseError as e:
-            logger.error(f"Error parsing sitemap XML: {e}")
+            logger.error(f"Error parsing sitemap XML {sitemap_url}: {e}")
+        except Exception as e:
+            logger.error(f"Error processing sitemap {sitemap_url}: {e}")
         
-        return urls
+        return entries, child_sitemaps, unchanged
     
     def _filter_relevant_urls(self, urls: List[str]) -> List[str]:
         """Filter URLs for scholarship-relevant content"""
-        relevant_keywords = [
-            'scholarship', 'award', 'grant', 'financial-aid', 'student',
-            'education', 'academic', 'tuition', 'funding', 'opportunity'
-        ]
-        
-        filtered_urls = []
-        for url in urls:
-            url_lower = url.lower()
-            
-            # Check for scholarship-related keywords
-            if any(keyword in url_lower for keyword in relevant_keywords):
-                filtered_urls.append(url)
-            # Also include pages that might contain scholarship info
-            elif any(term in url_lower for term in ['about', 'programs', 'services', 'community']):
-                filtered_urls.append(url)
-        
-        return filtered_urls
+        return [url for url in urls if is_relevant_url(url)]
 
 
 class EthicalCrawler:
     """Main ethical web crawler class"""
     
-    def __init__(self, config: CrawlConfig = None):
+    def __init__(self, config: CrawlConfig = None, revisit_policy: Optional[RevisitPolicy] = None):
         self.config = config or CrawlConfig()
-        self.robots_parser = RobotsTxtParser(self.config.user_agent)
-        self.sitemap_processor = SitemapProcessor()
-        
-        # Crawling state
-        self.crawled_urls: Set[str] = set()
-        self.urls_to_crawl: Deque[str] = deque()
+        # Pages reached by following links are skipped until they are due again
+        self.revisit_policy = revisit_policy
+        self.robots_parser = RobotsTxtParser(
+            self.config.user_agent, RobotsCache(self.config.robots_cache_path, self.config.robots_cache_ttl)
+        )
+        self.lastmod_store = (
+            SitemapLastmodStore(self.config.sitemap_lastmod_store) if self.config.sitemap_lastmod_store else None
+        )
+        self.sitemap_processor = SitemapProcessor(self.lastmod_store, self.config.sitemap_workers)
+        self.pdf_extractor = PdfTextExtractor(
+            self.config.max_pdf_bytes, self.config.max_pdf_pages, self.config.pdf_workers
+        ) if self.config.extract_pdfs else None
+        
+        # Crawling state: the frontier canonicalizes URLs and remembers every
+        # URL it has queued, so duplicates are rejected before they are fetched
+        self.frontier = CrawlFrontier(max_depth=self.config.max_depth)
         self.domain_rules: Dict[str, RobotsTxtRules] = {}
         self.domain_last_crawl: Dict[str, datetime] = {}
         
         # Session for requests
-        self.session = requests.Session()
-        self.session.headers.update({
+        self.session = create_session({
             'User-Agent': self.config.user_agent,
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.5',
@@ -245,7 +255,12 @@ class EthicalCrawler:
             'DNT': '1',
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1'
-        })
+        }, max_retries=self.config.max_retries, read_timeout=self.config.timeout)
+    
+    def close(self):
+        """Stop the PDF worker pool (it restarts if another PDF is crawled)."""
+        if self.pdf_extractor is not None:
+            self.pdf_extractor.shutdown()
     
     def crawl_url(self, url: str) -> Dict[str, Any]:
         """Crawl a single URL and return content"""
@@ -266,6 +281,10 @@ class EthicalCrawler:
                     logger.warning(f"Robots.txt disallows crawling {url}")
                     return {'success': False, 'reason': 'robots_txt_disallows'}
             
+            if not self._is_due(url):
+                logger.info(f"Skipping {url} (not due for a revisit)")
+                return {'success': False, 'reason': 'not_due'}
+            
             # Respect crawl delay
             self._respect_crawl_delay(domain)
             
@@ -273,10 +292,13 @@ class EthicalCrawler:
             result = self._crawl_page(url)
             
             if result['success']:
+                self._record_revisit(url, result)
                 return {
                     'success': True,
                     'content': result.get('content', ''),
                     'title': result.get('title', ''),
+                    'meta_description': result.get('meta_description', ''),
+                    'blocks': result.get('blocks', []),
                     'links': result.get('links', []),
                     'scholarship_data': result.get('scholarship_data', [])
                 }
@@ -295,8 +317,7 @@ class EthicalCrawler:
         logger.info(f"Starting ethical crawl of {start_url} (max {max_pages} pages)")
         
         # Initialize crawl
-        self.crawled_urls.clear()
-        self.urls_to_crawl.clear()
+        self.frontier.clear()
         
         parsed_url = urlparse(start_url)
         domain = f"{parsed_url.scheme}://{parsed_url.netloc}"
@@ -310,35 +331,43 @@ class EthicalCrawler:
                 logger.warning(f"Robots.txt disallows crawling {start_url}")
                 return {'success': False, 'reason': 'robots_txt_disallows'}
         
-        # Get sitemap URLs if available
+        # Get sitemap URLs if available (only those changed since the last crawl)
+        sitemap_entries: Dict[str, SitemapEntry] = {}
         if self.config.respect_sitemaps and domain in self.domain_rules:
             sitemap_urls = self.domain_rules[domain].sitemap_urls
             if sitemap_urls:
-                sitemap_urls = self.sitemap_processor.extract_urls_from_sitemaps(sitemap_urls, domain)
-                self.urls_to_crawl.extend(sitemap_urls)
+                for entry in self.sitemap_processor.extract_entries_from_sitemaps(sitemap_urls, domain):
+                    score = score_link(entry.url, sitemap_priority=entry.priority, lastmod=entry.lastmod)
+                    if self.frontier.push(entry.url, score, depth=0):
+                        sitemap_entries[canonicalize_url(entry.url)] = entry
         
         # Add start URL if no sitemap URLs found
-        if not self.urls_to_crawl:
-            self.urls_to_crawl.append(start_url)
+        if not self.frontier:
+            self.frontier.push(start_url, score_link(start_url), depth=0)
         
         # Start crawling
         pages_crawled = 0
+        pages_not_due = 0
+        pages_to_first_scholarship = None
         scholarship_data = []
         errors = []
         
-        while self.urls_to_crawl and pages_crawled < max_pages:
-            url = self.urls_to_crawl.popleft()
-            
-            if url in self.crawled_urls:
-                continue
+        while self.frontier and pages_crawled < max_pages:
+            # Fetch the URL as linked; revisit and sitemap state are keyed on its canonical form
+            entry = self.frontier.pop()
+            url, depth, page_key = entry.url, entry.depth, entry.canonical
             
             # Check robots.txt
             if self.config.respect_robots_txt and domain in self.domain_rules:
                 if not self.robots_parser.can_fetch(url, self.domain_rules[domain]):
                     logger.info(f"Skipping {url} (robots.txt disallows)")
-                    self.crawled_urls.add(url)
                     continue
             
+            # Entry pages are always fetched so links to due pages are still found
+            if depth > 0 and not self._is_due(page_key):
+                pages_not_due += 1
+                continue
+            
             # Respect crawl delay
             self._respect_crawl_delay(domain)
             
@@ -347,48 +376,73 @@ class EthicalCrawler:
                 result = self._crawl_page(url)
                 if result['success']:
                     pages_crawled += 1
+                    self._record_revisit(page_key, result)
+                    if self.lastmod_store and page_key in sitemap_entries:
+                        self.lastmod_store.record(domain, sitemap_entries[page_key])
                     if result.get('scholarship_data'):
                         scholarship_data.extend(result['scholarship_data'])
+                        if pages_to_first_scholarship is None:
+                            pages_to_first_scholarship = pages_crawled
                     
-                    # Extract new URLs if following links
+                    # Queue new URLs one level deeper if following links
                     if self.config.follow_links and result.get('links'):
-                        new_urls = self._filter_new_urls(result['links'], domain)
-                        self.urls_to_crawl.extend(new_urls)
-                
-                self.crawled_urls.add(url)
+                        self._enqueue_links(result['links'], result.get('link_texts', {}), domain, depth + 1)
                 
             except Exception as e:
                 error_msg = f"Error crawling {url}: {str(e)}"
                 logger.error(error_msg)
                 errors.append(error_msg)
-                self.crawled_urls.add(url)
         
-        logger.info(f"Crawl complete: {pages_crawled} pages crawled, {len(scholarship_data)} scholarship opportunities found")
+        if self.lastmod_store:
+            self.lastmod_store.save()
+        
+        logger.info(f"Crawl complete: {pages_crawled} pages crawled, {len(scholarship_data)} scholarship opportunities found, "
+                    f"first after {pages_to_first_scholarship} pages, "
+                    f"{self.frontier.duplicates_rejected} duplicate URLs skipped, {pages_not_due} pages not due")
         
         return {
             'success': True,
             'pages_crawled': pages_crawled,
             'scholarship_data': scholarship_data,
             'errors': errors,
-            'domain': domain
+            'domain': domain,
+            'duplicate_urls_skipped': self.frontier.duplicates_rejected,
+            'pages_not_due': pages_not_due,
+            'pages_to_first_scholarship': pages_to_first_scholarship
         }
     
+    def _is_due(self, url: str) -> bool:
+        """Whether the revisit policy (if any) wants this page fetched now"""
+        return self.revisit_policy is None or url in self.revisit_policy.due([url])
+    
+    def _record_revisit(self, url: str, result: Dict[str, Any]):
+        """Record what a crawled page yielded, so unchanged pages are revisited less often"""
+        if self.revisit_policy is None:
+            return
+        data = [{k: v for k, v in item.items() if k != 'extracted_at'} for item in result.get('scholarship_data', [])]
+        page = {'scholarship_data': data, 'links': sorted(set(result.get('links', [])))}
+        deadlines = [item['deadline'] for item in data if isinstance(item.get('deadline'), str)]
+        self.revisit_policy.record_many([(url, fingerprint(page), deadlines[0] if deadlines else None)])
+    
     def _crawl_page(self, url: str) -> Dict[str, Any]:
         """Crawl a single page"""
         try:
             logger.info(f"Crawling: {url}")
             
-            response = self.session.get(url, timeout=self.config.timeout)
-            response.raise_for_status()
-            
-            content_type = response.headers.get('Content-Type', '').lower()
-            
-            if 'text/html' in content_type:
-                return self._process_html_page(url, response.text)
-            elif 'application/pdf' in content_type and self.config.extract_pdfs:
-                return self._process_pdf_page(url, response.content)
-            else:
-                return {'success': True, 'content_type': content_type}
+            # Streamed: the type is checked from the headers, so PDFs go to disk, other
+            # types are never downloaded and HTML is read up to max_page_bytes
+            with self.session.get(url, timeout=self.config.timeout, stream=True) as response:
+                response.raise_for_status()
+                
+                content_type = media_type(response)
+                
+                if content_type in HTML_MEDIA_TYPES:
+                    html_content, _ = read_text(response, self.config.max_page_bytes)
+                    return self._process_html_page(url, html_content)
+                elif content_type == 'application/pdf' and self.pdf_extractor:
+                    return self._process_pdf_page(url, response)
+                else:
+                    return {'success': True, 'content_type': content_type}
                 
         except requests.RequestException as e:
             logger.error(f"Request error for {url}: {e}")
@@ -396,47 +450,59 @@ class EthicalCrawler:
     
     def _process_html_page(self, url: str, html_content: str) -> Dict[str, Any]:
         """Process HTML page content"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        doc = ParsedDocument.parse(html_content, url)
         
         # Extract scholarship data
-        scholarship_data = self._extract_scholarship_data(soup, url)
-        
-        # Extract links for further crawling
-        links = []
-        if self.config.follow_links:
-            for a in soup.find_all('a', href=True):
-                href = a['href']
-                full_url = urljoin(url, href)
-                links.append(full_url)
-        
-        # Extract PDF links
-        pdf_links = []
-        if self.config.extract_pdfs:
-            for a in soup.find_all('a', href=True):
-                href = a['href']
-                if href.lower().endswith('.pdf'):
-                    full_url = urljoin(url, href)
-                    pdf_links.append(full_url)
+        scholarship_data = self._extract_scholarship_data(doc, url)
+        
+        # Links for further crawling and PDF links, both collected by the one parse
+        links = doc.links if self.config.follow_links else []
+        link_texts = doc.link_texts if self.config.follow_links else {}
+        pdf_links = doc.pdf_links if self.config.extract_pdfs else []
         
         return {
             'success': True,
+            # Boilerplate-free page text and blocks, for LLM extraction by the caller
+            'content': doc.normalized_text,
+            'title': doc.title,
+            'meta_description': doc.meta_description,
+            'blocks': doc.blocks,
             'scholarship_data': scholarship_data,
             'links': links,
+            'link_texts': link_texts,
             'pdf_links': pdf_links
         }
     
-    def _process_pdf_page(self, url: str, pdf_content: bytes) -> Dict[str, Any]:
-        """Process PDF content (placeholder for PDF extraction)"""
-        # TODO: Implement PDF text extraction
-        logger.info(f"PDF found: {url} (extraction not yet implemented)")
-        return {
+    def _process_pdf_page(self, url: str, response: requests.Response) -> Dict[str, Any]:
+        """Process a streamed PDF response"""
+        result = {
             'success': True,
             'content_type': 'application/pdf',
             'pdf_url': url
         }
+        
+        try:
+            pdf_text = self.pdf_extractor.extract_response(url, response)
+        except Exception as e:
+            logger.error(f"Error extracting PDF {url}: {e}")
+            return result
+        
+        if pdf_text:
+            result['content'] = ' '.join(pdf_text.text.split())
+            result['title'] = pdf_text.title
+            result['blocks'] = blocks_from_plain_text(pdf_text.text)
+            result['scholarship_data'] = self._scholarship_data_from_text(url, pdf_text.title, '', pdf_text.text)
+            result['pdf_pages_read'] = pdf_text.pages_read
+            result['pdf_total_pages'] = pdf_text.total_pages
+        return result
     
-    def _extract_scholarship_data(self, soup: BeautifulSoup, url: str) -> List[Dict[str, Any]]:
+    def _extract_scholarship_data(self, doc: ParsedDocument, url: str) -> List[Dict[str, Any]]:
         """Extract scholarship information from page content"""
+        # Page title and meta description come from the parsed document
+        return self._scholarship_data_from_text(url, doc.title, doc.meta_description, doc.text)
+    
+    def _scholarship_data_from_text(self, url: str, title_text: str, meta_text: str, text: str) -> List[Dict[str, Any]]:
+        """Extract scholarship information from page text (HTML or PDF)"""
         scholarship_data = []
         
         # Look for scholarship-related content
@@ -445,15 +511,8 @@ class EthicalCrawler:
             'educational opportunity', 'tuition assistance', 'academic award'
         ]
         
-        # Check page title and meta description
-        title = soup.find('title')
-        title_text = title.get_text() if title else ""
-        
-        meta_desc = soup.find('meta', attrs={'name': 'description'})
-        meta_text = meta_desc.get('content', '') if meta_desc else ""
-        
         # Check if page is scholarship-related
-        page_text = soup.get_text().lower()
+        page_text = text.lower()
         is_scholarship_page = any(keyword in page_text for keyword in scholarship_keywords)
         
         if is_scholarship_page:
@@ -467,12 +526,12 @@ class EthicalCrawler:
             }
             
             # Try to extract more specific details
-            data.update(self._extract_scholarship_details(soup))
+            data.update(self._extract_scholarship_details(text))
             scholarship_data.append(data)
         
         return scholarship_data
     
-    def _extract_scholarship_details(self, soup: BeautifulSoup) -> Dict[str, Any]:
+    def _extract_scholarship_details(self, page_text: str) -> Dict[str, Any]:
         """Extract specific scholarship details from page"""
         details = {}
         
@@ -484,8 +543,6 @@ class EthicalCrawler:
             'contact': r'(contact|email|phone)[:\s]*([^\n]+)'
         }
         
-        page_text = soup.get_text()
-        
         for key, pattern in patterns.items():
             matches = re.findall(pattern, page_text, re.IGNORECASE)
             if matches:
@@ -493,21 +550,23 @@ class EthicalCrawler:
         
         return details
     
-    def _filter_new_urls(self, urls: List[str], domain: str) -> List[str]:
-        """Filter URLs to only include new ones from the same domain"""
-        filtered = []
-        parsed_domain = urlparse(domain)
+    def _enqueue_links(self, urls: List[str], link_texts: Dict[str, str], domain: str, depth: int) -> int:
+        """Score same-domain links and push them onto the frontier at `depth`"""
+        domain_netloc = urlparse(canonicalize_url(domain)).netloc
+        queued = 0
         
         for url in urls:
-            parsed_url = urlparse(url)
+            canonical = canonicalize_url(url)
             
             # Only include URLs from the same domain
-            if parsed_url.netloc == parsed_domain.netloc:
-                # Only include URLs we haven't crawled
-                if url not in self.crawled_urls:
-                    filtered.append(url)
+            if urlparse(canonical).netloc != domain_netloc:
+                continue
+            
+            score = score_link(canonical, link_texts.get(url, ''), depth)
+            if self.frontier.push(url, score, depth):
+                queued += 1
         
-        return filtered[:20]  # Limit to avoid overwhelming
+        return queued
     
     def _respect_crawl_delay(self, domain: str):
         """Respect crawl delay for domain"""
@@ -539,5 +598,6 @@ if __name__ == "__main__":
     # Test with a sample domain
     test_url = "https://example.com/scholarships"
     result = crawler.crawl_domain(test_url, max_pages=5)
+    crawler.close()
     
     print(f"Crawl result: {result}")
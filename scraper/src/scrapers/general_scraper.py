@@ -5,13 +5,13 @@ Efficient Scraper - Uses broader search terms and website-specific approaches
 
 import os
 import logging
-import requests
 import time
 from datetime import datetime
 from typing import List, Dict, Any, Optional
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin, urlparse
 from .base_scraper import BaseScraper
+from .http_client import BROWSER_HEADERS, create_session
 from ..utils_python import Scholarship, ScrapingResult, ScrapingMetadata
 
 logger = logging.getLogger(__name__)
@@ -24,15 +24,7 @@ class GeneralScraper(BaseScraper):
         super().__init__(**kwargs)
         self.base_url = "https://www.careeronestop.org"
         self.search_url = "https://www.careeronestop.org/Toolkit/Training/find-scholarships.aspx"
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-        })
+        self.session = create_session(BROWSER_HEADERS)
         
         # Use only 2-3 broad search terms
         self.search_keywords = ['scholarship', 'financial aid', 'grant']
@@ -53,12 +45,14 @@ class GeneralScraper(BaseScraper):
             errors = []
             
             # Search for each broad keyword
+            self.heartbeat.pages_total = len(self.search_keywords)
             for keyword in self.search_keywords:
                 keyword = keyword.strip()
                 logger.info(f"Searching for keyword: {keyword}")
                 
                 try:
                     keyword_scholarships = self._search_broad_keyword(keyword)
+                    self.heartbeat.page_done()
                     scholarships.extend(keyword_scholarships)
                     logger.info(f"Found {len(keyword_scholarships)} scholarships for '{keyword}'")
                     
@@ -0,0 +1,383 @@
+#!/usr/bin/env python3
+"""
+HTTP Client
+Shared factory for the tuned `requests` sessions every scraper uses
+
+Sessions from `create_session` get:
+- a connection pool sized per host (`pool_maxsize` kept-alive connections to
+  each host, `pool_connections` hosts);
+- urllib3-level retries with exponential backoff for connection errors and
+  5xx/429 responses, honouring `Retry-After` (capped, so one host cannot
+  park a thread for an hour);
+- split connect/read timeouts: a bare `timeout=30` still means 30 s to read,
+  but a host that does not accept the connection fails after the connect
+  timeout;
+- a process-wide DNS cache, so a new connection to a known host skips the
+  resolver;
+- per-host request and new-connection counters (`connection_stats`) that
+  show how often connections are reused.
+
+`read_text` reads a response opened with `stream=True`: callers check
+`media_type` first so unwanted bodies are never downloaded, the body is
+abandoned once it passes a byte cap, and it is decoded chunk by chunk with
+the charset from the header, a BOM or a `<meta charset>` near the top
+instead of a detection pass over the whole body.
+"""
+
+import re
+import codecs
+import socket
+import logging
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import ConnectTimeoutError, NewConnectionError
+from urllib3.util.connection import allowed_gai_family
+from urllib3.util.retry import Retry
+
+from .constants import (HTTP_POOL_CONNECTIONS, HTTP_POOL_MAXSIZE, HTTP_MAX_RETRIES, HTTP_BACKOFF_FACTOR,
+                        HTTP_MAX_RETRY_AFTER_SEC, HTTP_CONNECT_TIMEOUT_SEC, HTTP_READ_TIMEOUT_SEC,
+                        HTTP_DNS_CACHE_TTL_SEC, HTTP_MAX_BODY_BYTES, HTTP_CHARSET_SNIFF_BYTES)
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# Desktop browser headers for sites that serve bots a different page
+BROWSER_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'Accept-Encoding': 'gzip, deflate',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+}
+BOT_HEADERS = {'User-Agent': 'ScholarshipTrackerBot/1.0'}
+
+HTML_MEDIA_TYPES = frozenset({'text/html', 'application/xhtml+xml'})
+BODY_CHUNK_SIZE = 64 * 1024
+
+_BOMS = ((codecs.BOM_UTF8, 'utf-8-sig'), (codecs.BOM_UTF16_LE, 'utf-16'), (codecs.BOM_UTF16_BE, 'utf-16'))
+# <meta charset="x"> and <meta http-equiv="Content-Type" content="text/html; charset=x">
+_META_CHARSET = re.compile(rb'<meta[^>]+charset\s*=\s*["\']?\s*([a-zA-Z0-9_:.\-]+)', re.IGNORECASE)
+
+logger = logging.getLogger(__name__)
+
+
+class DnsCache:
+    """Resolved addresses per (host, port), kept for `ttl` seconds."""
+
+    def __init__(self, ttl: float = HTTP_DNS_CACHE_TTL_SEC):
+        self.ttl = ttl
+        self._entries: Dict[Tuple[str, int], Tuple[float, List[str]]] = {}
+        self._lock = threading.Lock()
+
+    def resolve(self, host: str, port: int) -> List[str]:
+        """Addresses of `host` in resolver order; empty if it does not resolve."""
+        key = (host, port)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[0] > time.monotonic():
+                return entry[1]
+        try:
+            infos = socket.getaddrinfo(host, port, allowed_gai_family(), socket.SOCK_STREAM)
+        except (socket.gaierror, UnicodeError):
+            return []
+        addresses = list(dict.fromkeys(info[4][0] for info in infos))
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, addresses)
+        return addresses
+
+    def forget(self, host: str, port: int):
+        """Drop a host whose cached addresses stopped accepting connections."""
+        with self._lock:
+            self._entries.pop((host, port), None)
+
+
+class ConnectionStats:
+    """Per-host counts of requests sent and connections opened."""
+
+    def __init__(self):
+        self._requests: Dict[str, int] = {}
+        self._connections: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def request(self, host: str):
+        with self._lock:
+            self._requests[host] = self._requests.get(host, 0) + 1
+
+    def connection(self, host: str):
+        with self._lock:
+            self._connections[host] = self._connections.get(host, 0) + 1
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """{host: {'requests', 'connections', 'reuse_ratio'}}; reuse is the share of
+        requests that went out on an already open connection."""
+        with self._lock:
+            hosts = set(self._requests) | set(self._connections)
+            stats = {}
+            for host in sorted(hosts):
+                requests_sent = self._requests.get(host, 0)
+                connections = self._connections.get(host, 0)
+                reuse = 1 - connections / requests_sent if requests_sent else 0.0
+                stats[host] = {'requests': requests_sent, 'connections': connections,
+                               'reuse_ratio': round(max(reuse, 0.0), 3)}
+            return stats
+
+    def reset(self):
+        with self._lock:
+            self._requests.clear()
+            self._connections.clear()
+
+
+dns_cache = DnsCache()
+stats = ConnectionStats()
+
+
+def connection_stats() -> Dict[str, Dict[str, float]]:
+    """Connection reuse per host since the process started."""
+    return stats.snapshot()
+
+
+class _CachedDnsConnectionMixin:
+    """Opens connections to addresses from `dns_cache` and counts them.
+
+    TLS still uses the hostname for SNI and certificate checks; only the
+    socket is pointed at the cached address.
+    """
+
+    def _new_conn(self):
+        stats.connection(self.host.lower())
+        host = self._dns_host
+        addresses = dns_cache.resolve(host, self.port)
+        if not addresses:
+            return super()._new_conn()  # Let urllib3 report the resolution error
+        error = None
+        for address in addresses:
+            self._dns_host = address
+            try:
+                return super()._new_conn()
+            except (ConnectTimeoutError, NewConnectionError) as e:
+                error = e
+            finally:
+                self._dns_host = host
+        dns_cache.forget(host, self.port)
+        raise error
+
+
+class _HTTPConnection(_CachedDnsConnectionMixin, HTTPConnection):
+    pass
+
+
+class _HTTPSConnection(_CachedDnsConnectionMixin, HTTPSConnection):
+    pass
+
+
+class _HTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _HTTPConnection
+
+
+class _HTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _HTTPSConnection
+
+
+class _CappedRetry(Retry):
+    """Retry that waits at most HTTP_MAX_RETRY_AFTER_SEC for a `Retry-After`."""
+
+    def get_retry_after(self, response) -> Optional[float]:
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, HTTP_MAX_RETRY_AFTER_SEC)
+
+
+class TunedHTTPAdapter(HTTPAdapter):
+    """Adapter whose pools use the DNS cache and whose requests are counted."""
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {'http': _HTTPConnectionPool, 'https': _HTTPSConnectionPool}
+
+    def send(self, request, *args, **kwargs):
+        stats.request((urlsplit(request.url).hostname or '').lower())
+        return super().send(request, *args, **kwargs)
+
+
+class HttpSession(requests.Session):
+    """Session that applies split connect/read timeouts to every request.
+
+    A missing timeout becomes (connect_timeout, read_timeout); a single
+    number is taken as the read timeout, with the connect timeout capped.
+    """
+
+    def __init__(self, connect_timeout: float = HTTP_CONNECT_TIMEOUT_SEC,
+                 read_timeout: float = HTTP_READ_TIMEOUT_SEC):
+        super().__init__()
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+
+    def request(self, method, url, **kwargs):
+        timeout = kwargs.get('timeout')
+        if timeout is None:
+            kwargs['timeout'] = (self.connect_timeout, self.read_timeout)
+        elif isinstance(timeout, (int, float)):
+            kwargs['timeout'] = (min(self.connect_timeout, timeout), timeout)
+        return super().request(method, url, **kwargs)
+
+
+class ResponseTooLargeError(requests.RequestException):
+    """Raised when a streamed body passes the byte cap"""
+
+
+def media_type(response: requests.Response) -> str:
+    """Lowercased Content-Type without parameters ('' when missing)."""
+    return response.headers.get('Content-Type', '').split(';', 1)[0].strip().lower()
+
+
+def header_charset(response: requests.Response) -> Optional[str]:
+    """Charset named in the Content-Type header, if any."""
+    for param in response.headers.get('Content-Type', '').split(';')[1:]:
+        name, _, value = param.partition('=')
+        if name.strip().lower() == 'charset' and value.strip(' "\''):
+            return value.strip(' "\'')
+    return None
+
+
+def sniff_charset(head: bytes) -> Optional[str]:
+    """Charset from a byte-order mark or a `<meta charset>` in the first bytes of a page."""
+    for bom, encoding in _BOMS:
+        if head.startswith(bom):
+            return encoding
+    match = _META_CHARSET.search(head[:HTTP_CHARSET_SNIFF_BYTES])
+    return match.group(1).decode('ascii') if match else None
+
+
+class _IncrementalTextDecoder:
+    """Decodes chunks as they arrive.
+
+    A known charset decodes with replacement characters. With none, UTF-8 is
+    assumed until a chunk fails to decode, and the rest of the body is read
+    as windows-1252 (what browsers fall back to).
+    """
+
+    def __init__(self, encoding: Optional[str]):
+        self.guessed = encoding is None
+        self.encoding = 'utf-8' if encoding is None else encoding
+        try:
+            decoder_cls = codecs.getincrementaldecoder(self.encoding)
+        except LookupError:
+            self.guessed, self.encoding = True, 'utf-8'
+            decoder_cls = codecs.getincrementaldecoder(self.encoding)
+        self._decoder = decoder_cls(errors='strict' if self.guessed else 'replace')
+
+    def decode(self, chunk: bytes, final: bool = False) -> str:
+        pending = self._decoder.getstate()[0]
+        try:
+            return self._decoder.decode(chunk, final)
+        except UnicodeDecodeError:
+            self.guessed, self.encoding = False, 'cp1252'
+            self._decoder = codecs.getincrementaldecoder(self.encoding)(errors='replace')
+            return self._decoder.decode(pending + chunk, final)
+
+
+def iter_body(response: requests.Response, max_bytes: int = HTTP_MAX_BODY_BYTES) -> Iterable[bytes]:
+    """Chunks of a streamed body, raising ResponseTooLargeError past `max_bytes`.
+
+    A Content-Length over the cap is rejected before anything is read.
+    """
+    declared = response.headers.get('Content-Length', '')
+    if declared.isdigit() and int(declared) > max_bytes:
+        raise ResponseTooLargeError(f"{response.url} is {int(declared)} bytes (limit {max_bytes})")
+    read = 0
+    for chunk in response.iter_content(chunk_size=BODY_CHUNK_SIZE):
+        read += len(chunk)
+        if read > max_bytes:
+            raise ResponseTooLargeError(f"{response.url} exceeds {max_bytes} bytes")
+        yield chunk
+
+
+def read_text(response: requests.Response, max_bytes: int = HTTP_MAX_BODY_BYTES) -> Tuple[str, str]:
+    """Read and decode a body opened with `stream=True`.
+
+    The charset comes from the Content-Type header, else a BOM or
+    `<meta charset>` in the first HTTP_CHARSET_SNIFF_BYTES, else UTF-8 with a
+    windows-1252 fallback; the body is never scanned as a whole to guess it.
+
+    Parameters:
+        response: Streaming response whose headers have been checked.
+        max_bytes: Largest body read; bigger ones raise ResponseTooLargeError
+            (a RequestException) and the connection is dropped by the caller's
+            `with` block.
+
+    Returns:
+        (text, encoding used)
+    """
+    encoding = header_charset(response)
+    decoder = None
+    head = b''
+    parts: List[str] = []
+    for chunk in iter_body(response, max_bytes):
+        if decoder is None:
+            head += chunk
+            if encoding is None and len(head) < HTTP_CHARSET_SNIFF_BYTES:
+                continue
+            decoder = _IncrementalTextDecoder(encoding or sniff_charset(head))
+            chunk, head = head, b''
+        parts.append(decoder.decode(chunk))
+    if decoder is None:
+        decoder = _IncrementalTextDecoder(encoding or sniff_charset(head))
+    parts.append(decoder.decode(head, final=True))
+    return ''.join(parts), decoder.encoding
+
+
+def create_session(headers: Optional[Dict[str, str]] = None,
+                   pool_maxsize: int = HTTP_POOL_MAXSIZE,
+                   pool_connections: int = HTTP_POOL_CONNECTIONS,
+                   max_retries: int = HTTP_MAX_RETRIES,
+                   retry_statuses: Sequence[int] = RETRY_STATUSES,
+                   connect_timeout: float = HTTP_CONNECT_TIMEOUT_SEC,
+                   read_timeout: float = HTTP_READ_TIMEOUT_SEC) -> HttpSession:
+    """Create a tuned session.
+
+    Parameters:
+        headers: Default headers (e.g. `BROWSER_HEADERS`, `BOT_HEADERS`).
+        pool_maxsize: Connections kept alive per host; match the number of
+            threads that fetch from one host at once.
+        pool_connections: Hosts whose pools are kept.
+        max_retries: Retries of idempotent requests on connection errors and
+            `retry_statuses`; 0 disables them.
+        retry_statuses: Response codes that are retried (after `Retry-After`
+            when the server sends one). The last response is returned when
+            retries run out, so `raise_for_status` still sees it.
+        connect_timeout: Seconds to establish a connection.
+        read_timeout: Seconds to wait for data once connected.
+
+    Returns:
+        An `HttpSession`.
+    """
+    session = HttpSession(connect_timeout, read_timeout)
+    if headers:
+        session.headers.update(headers)
+    retry = _CappedRetry(
+        total=max_retries,
+        backoff_factor=HTTP_BACKOFF_FACTOR,
+        status_forcelist=tuple(retry_statuses),
+        allowed_methods=frozenset({'GET', 'HEAD', 'OPTIONS'}),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    ) if max_retries else Retry(0, read=False)
+    adapter = TunedHTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=retry)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+def log_connection_stats(level: int = logging.INFO):
+    """Log connection reuse per host."""
+    for host, host_stats in connection_stats().items():
+        logger.log(level, f"HTTP {host}: {host_stats['requests']} requests on {host_stats['connections']} "
+                          f"connections ({host_stats['reuse_ratio']:.0%} reused)")
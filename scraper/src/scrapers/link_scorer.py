@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Link Scorer
+Scores discovered links by how likely they are to lead to scholarship pages
+"""
+
+import math
+import logging
+from datetime import datetime, timezone
+from typing import Optional
+from urllib.parse import urlsplit
+
+from ..utils_python import SCHOLARSHIP_KEYWORDS
+
+logger = logging.getLogger(__name__)
+
+# URL keywords that mark scholarship-relevant pages (also used to filter sitemaps)
+RELEVANT_URL_KEYWORDS = [
+    'scholarship', 'award', 'grant', 'financial-aid', 'student',
+    'education', 'academic', 'tuition', 'funding', 'opportunity'
+]
+
+# Pages that might link to or describe scholarship programs
+RELATED_URL_TERMS = ['about', 'programs', 'services', 'community']
+
+# Paths that never contain scholarship listings
+LOW_VALUE_URL_TERMS = [
+    'login', 'signin', 'register', 'cart', 'checkout', 'privacy', 'terms',
+    'cookie', 'careers', 'jobs', 'press', 'feed', 'rss', 'wp-json', 'tag/', 'author/'
+]
+SKIPPED_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.gif', '.svg', '.css', '.js', '.zip', '.mp4', '.mp3', '.ico')
+
+ANCHOR_KEYWORDS = [keyword.lower() for keyword in SCHOLARSHIP_KEYWORDS] + [
+    'apply', 'eligibility', 'deadline', 'financial aid', 'tuition'
+]
+
+# Weights for each signal; scores are only compared with each other
+URL_KEYWORD_WEIGHT = 2.0
+PRIMARY_URL_KEYWORD_WEIGHT = 3.0
+RELATED_TERM_WEIGHT = 0.5
+ANCHOR_KEYWORD_WEIGHT = 2.0
+MAX_ANCHOR_MATCHES = 2
+SITEMAP_PRIORITY_WEIGHT = 2.0
+FRESHNESS_WEIGHT = 1.0
+FRESHNESS_HALF_LIFE_DAYS = 180
+LOW_VALUE_PENALTY = 4.0
+DEPTH_PENALTY = 0.5
+
+
+def is_relevant_url(url: str) -> bool:
+    """Check a URL for scholarship or related-page keywords."""
+    url_lower = url.lower()
+    return (any(keyword in url_lower for keyword in RELEVANT_URL_KEYWORDS)
+            or any(term in url_lower for term in RELATED_URL_TERMS))
+
+
+def _parse_lastmod(lastmod: str) -> Optional[datetime]:
+    text = lastmod.strip()
+    if text.endswith('Z'):
+        text = text[:-1] + '+00:00'
+    try:
+        parsed = datetime.fromisoformat(text)
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+def score_link(url: str, anchor_text: str = '', depth: int = 0,
+               sitemap_priority: Optional[float] = None,
+               lastmod: Optional[str] = None) -> float:
+    """Score a link for crawl ordering; higher is crawled first.
+
+    Parameters:
+        url: Absolute URL of the link.
+        anchor_text: Visible text of the <a> element, if the link came from a page.
+        depth: Link distance from the start URL.
+        sitemap_priority: <priority> from the sitemap (0.0-1.0), if any.
+        lastmod: <lastmod> from the sitemap (W3C datetime), if any.
+
+    Returns:
+        Relevance score.
+    """
+    path = urlsplit(url).path.lower()
+    url_lower = url.lower()
+    score = 0.0
+
+    if path.endswith(SKIPPED_EXTENSIONS):
+        return -LOW_VALUE_PENALTY * 2
+
+    if 'scholarship' in url_lower:
+        score += PRIMARY_URL_KEYWORD_WEIGHT
+    if any(keyword in url_lower for keyword in RELEVANT_URL_KEYWORDS if keyword != 'scholarship'):
+        score += URL_KEYWORD_WEIGHT
+    elif any(term in url_lower for term in RELATED_URL_TERMS):
+        score += RELATED_TERM_WEIGHT
+
+    if any(term in path for term in LOW_VALUE_URL_TERMS):
+        score -= LOW_VALUE_PENALTY
+
+    if anchor_text:
+        anchor_lower = anchor_text.lower()
+        matches = sum(1 for keyword in ANCHOR_KEYWORDS if keyword in anchor_lower)
+        score += ANCHOR_KEYWORD_WEIGHT * min(matches, MAX_ANCHOR_MATCHES)
+
+    if sitemap_priority is not None:
+        score += SITEMAP_PRIORITY_WEIGHT * max(0.0, min(1.0, sitemap_priority))
+
+    if lastmod:
+        modified = _parse_lastmod(lastmod)
+        if modified:
+            age_days = max(0.0, (datetime.now(timezone.utc) - modified).total_seconds() / 86400)
+            score += FRESHNESS_WEIGHT * math.pow(0.5, age_days / FRESHNESS_HALF_LIFE_DAYS)
+
+    return score - DEPTH_PENALTY * depth
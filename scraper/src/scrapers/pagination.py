@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+Pagination Controller
+Adapts listing crawl depth to how many rows are actually new
+
+Listing scrapers used to walk pages 1..max_pages on every run. On a
+newest-first listing, new scholarships show up on the first pages and
+everything after them is already known. The controller compares each page's
+row keys with a local index of rows seen on earlier runs:
+- after `stop_after_known` consecutive pages with no new rows it stops early;
+- while the last allowed page still has new rows it raises the page limit
+  one page at a time, up to `ceiling`, so bursts of new listings are not cut
+  off by a static SCRAPER_MAX_PAGES.
+Rows deeper in the listing are still revisited: every `full_walk_interval`
+seconds a run walks all pages without stopping early.
+
+Once a listing page's pager shows how many pages there are, the pages the
+controller is going to need are fetched ahead on a small thread pool
+(`ListingPrefetcher`) while the scraper works through the current page; the
+scraper's host rate limiter still spaces the requests.
+"""
+
+import os
+import re
+import json
+import math
+import time
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+
+from .constants import (LISTING_KNOWN_PAGES_TO_STOP, LISTING_FULL_WALK_INTERVAL_SEC, LISTING_MAX_PAGES_CEILING,
+                        LISTING_PREFETCH_WORKERS)
+from ..utils_python import Scholarship
+
+DEFAULT_LISTING_INDEX_PATH = os.path.join('local_data', 'listing_index.json')
+# Path of the index of listing rows seen on earlier runs; empty disables early stopping
+LISTING_INDEX_ENV = 'SCRAPER_LISTING_INDEX'
+
+# "Showing 1 - 25 of 1,234 results" and similar pager captions
+_RESULT_COUNT = re.compile(r'\bof\s+([\d,]+)\s+(?:results|scholarships|awards|records|items|matches)\b', re.IGNORECASE)
+
+logger = logging.getLogger(__name__)
+
+
+def pager_page_count(html: bytes, encoding: Optional[str], page_param: str, page_size: int) -> Optional[int]:
+    """Number of listing pages shown by a page's pager, if it shows one.
+
+    Looks at links carrying the page parameter (`?curPage=7`, `&amp;page=7`)
+    and at a result-count caption divided by the page size. A pager that
+    only links a window of pages gives a lower bound; later pages reveal
+    more.
+
+    Parameters:
+        html: Raw listing page bytes.
+        encoding: Charset declared by the response, if any.
+        page_param: Query parameter holding the page number.
+        page_size: Rows on a full page (for the result-count caption); not the
+            row count of a short last page, which would inflate the estimate.
+
+    Returns:
+        The highest page number found, or None.
+    """
+    text = html.decode(encoding or 'utf-8', errors='replace')
+    pages = [int(number) for number in re.findall(rf'[?&;]{re.escape(page_param)}=(\d+)', text)]
+    if page_size > 0:
+        pages.extend(math.ceil(int(total.replace(',', '')) / page_size)
+                     for total in _RESULT_COUNT.findall(text) if total.replace(',', ''))
+    return max(pages) if pages else None
+
+
+def listing_key(row: Scholarship) -> str:
+    """Key of a listing row: its detail URL, or title and organization without one."""
+    if row.source_url:
+        return row.source_url
+    return f"{(row.title or '').strip().lower()}|{(row.organization or '').strip().lower()}"
+
+
+class ListingIndex:
+    """Per-listing record of the row keys seen on earlier runs.
+
+    Backed by a JSON file ({scope: {"keys": [...], "full_walk_at": ts}});
+    missing or corrupt files start empty.
+    """
+
+    def __init__(self, path: Optional[str] = DEFAULT_LISTING_INDEX_PATH):
+        self.path = path
+        self._keys: Dict[str, set] = {}
+        self._full_walk_at: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._dirty = False
+        self.load()
+
+    def load(self):
+        """Load the index from disk."""
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as handle:
+                data = json.load(handle)
+            if isinstance(data, dict):
+                for scope, entry in data.items():
+                    if isinstance(entry, dict):
+                        self._keys[scope] = set(entry.get('keys') or [])
+                        self._full_walk_at[scope] = float(entry.get('full_walk_at') or 0)
+        except (OSError, ValueError, TypeError) as e:
+            logger.warning(f"Could not read listing index {self.path}: {e}")
+
+    def knows(self, scope: str) -> bool:
+        """Whether any run of this listing has been recorded."""
+        return bool(self._keys.get(scope))
+
+    def unknown(self, scope: str, keys: Sequence[str]) -> List[str]:
+        """Keys not seen on earlier runs."""
+        with self._lock:
+            known = self._keys.get(scope, set())
+            return [key for key in keys if key not in known]
+
+    def full_walk_at(self, scope: str) -> float:
+        return self._full_walk_at.get(scope, 0.0)
+
+    def record(self, scope: str, keys: Sequence[str], full_walk: bool = False):
+        """Remember keys seen by a finished run (and when the listing was last walked fully)."""
+        with self._lock:
+            self._keys.setdefault(scope, set()).update(keys)
+            if full_walk:
+                self._full_walk_at[scope] = time.time()
+            self._dirty = True
+
+    def save(self):
+        """Write the index to disk if anything was recorded."""
+        if not self.path or not self._dirty:
+            return
+        with self._lock:
+            snapshot = json.dumps({scope: {'keys': sorted(keys), 'full_walk_at': self._full_walk_at.get(scope, 0.0)}
+                                   for scope, keys in self._keys.items()}, separators=(',', ':'))
+            self._dirty = False
+        try:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            temp_path = f"{self.path}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as handle:
+                handle.write(snapshot)
+            os.replace(temp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Could not write listing index {self.path}: {e}")
+
+
+class PaginationController:
+    """Decide after each listing page whether to fetch the next one.
+
+    Parameters:
+        max_pages: Page limit to start from (SCRAPER_MAX_PAGES).
+        index: Rows seen on earlier runs; None walks up to `max_pages` and
+            stops only at an empty page, as before.
+        scope: Listing name in the index (one per scraper).
+        stop_after_known: Consecutive fully-known pages that end the walk.
+        ceiling: Highest page the limit may be raised to.
+        full_walk_interval: Seconds between runs that walk every page.
+    """
+
+    def __init__(self, max_pages: int, index: Optional[ListingIndex], scope: str,
+                 stop_after_known: int = LISTING_KNOWN_PAGES_TO_STOP,
+                 ceiling: int = LISTING_MAX_PAGES_CEILING,
+                 full_walk_interval: float = LISTING_FULL_WALK_INTERVAL_SEC):
+        self.page_limit = max_pages
+        self.index = index
+        self.scope = scope
+        self.stop_after_known = stop_after_known
+        self.ceiling = max(ceiling, max_pages)
+        self.seen: List[str] = []
+        self.new_rows = 0
+        self.known_streak = 0
+        self.stop_reason: Optional[str] = None
+        # The first run has nothing to compare against; periodic full walks revisit deep pages
+        self.adaptive = index is not None and index.knows(scope)
+        self.full_walk = not self.adaptive or time.time() - index.full_walk_at(scope) >= full_walk_interval
+
+    def observe(self, page: int, keys: Sequence[str]) -> bool:
+        """Account for one listing page's row keys.
+
+        Returns:
+            True to fetch page + 1, False to stop (see `stop_reason`).
+        """
+        if not keys:
+            self.stop_reason = 'empty page'
+            return False
+        self.seen.extend(keys)
+        if self.adaptive:
+            new = len(self.index.unknown(self.scope, keys))
+            self.new_rows += new
+            if new:
+                self.known_streak = 0
+                if page >= self.page_limit and self.page_limit < self.ceiling:
+                    self.page_limit += 1
+                    logger.info(f"New rows still appearing on page {page}, raising the page limit to {self.page_limit}")
+            else:
+                self.known_streak += 1
+                if not self.full_walk and self.known_streak >= self.stop_after_known:
+                    self.stop_reason = f'{self.known_streak} consecutive pages without new rows'
+                    return False
+        if page >= self.page_limit:
+            self.stop_reason = f'page limit {self.page_limit}'
+            return False
+        return True
+
+    def ahead(self, page: int, page_count: Optional[int]) -> range:
+        """Pages after `page` worth fetching ahead, given the pager's page count.
+
+        Nothing is fetched ahead before the page count is known. When the
+        walk may stop early, only the next `stop_after_known` pages are, so
+        at most that many fetches are wasted.
+        """
+        if not page_count:
+            return range(0)
+        last = min(self.page_limit, page_count)
+        if self.adaptive and not self.full_walk:
+            last = min(last, page + self.stop_after_known)
+        return range(page + 1, last + 1)
+
+    def finish(self):
+        """Record this run's rows so the next run can recognize them."""
+        if self.index is None or not self.seen:
+            return
+        # A walk that ended at an empty page or the page limit saw the whole listing
+        complete = self.stop_reason is not None and not self.stop_reason.endswith('without new rows')
+        self.index.record(self.scope, self.seen, full_walk=self.full_walk and complete)
+        self.index.save()
+
+
+class ListingPrefetcher:
+    """Fetch listing pages ahead of the page loop on a thread pool.
+
+    Parameters:
+        fetch: Fetches one page (called with the page number); it should
+            apply the host rate limit itself.
+        max_workers: Pages fetched at once.
+    """
+
+    def __init__(self, fetch: Callable[[int], Any], max_workers: int = LISTING_PREFETCH_WORKERS):
+        self.fetch = fetch
+        self.max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._futures: Dict[int, Future] = {}
+
+    def schedule(self, pages: Iterable[int]):
+        """Start fetching pages that are not fetched or scheduled yet."""
+        for page in pages:
+            if page not in self._futures:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                                        thread_name_prefix='listing-prefetch')
+                self._futures[page] = self._executor.submit(self.fetch, page)
+
+    def take(self, page: int) -> Any:
+        """Result of fetching `page`: from its prefetch, or fetched now if it was not scheduled.
+
+        Exceptions raised by `fetch` are re-raised here.
+        """
+        future = self._futures.pop(page, None)
+        if future is None:
+            return self.fetch(page)
+        return future.result()
+
+    def close(self):
+        """Cancel pages not started yet, drop unused results and stop the threads."""
+        for future in self._futures.values():
+            future.cancel()
+        self._futures.clear()
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
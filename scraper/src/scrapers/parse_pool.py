@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Parse Pool
+Runs CPU-bound HTML parsing in worker processes, fed by the network fetchers
+"""
+
+import os
+import logging
+import threading
+import multiprocessing
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Callable, Deque, Iterable, Iterator, Optional, Sequence
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+PARSE_WORKERS_ENV = 'SCRAPER_PARSE_WORKERS'
+
+# Parse jobs allowed in flight per worker before fetchers are held back
+PENDING_JOBS_PER_WORKER = 2
+
+
+def worker_context():
+    """Multiprocessing context for worker pools: forkserver where available, else spawn.
+
+    Pools are started from processes that already run threads (the write-behind
+    writer, heartbeat, prefetchers, the daemon's HTTP server); a plain fork
+    copies their held locks (logging, urllib3, pymysql) into the children,
+    where nothing will ever release them.
+    """
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
+
+
+def default_parse_workers() -> int:
+    """Worker count from SCRAPER_PARSE_WORKERS, else one per CPU (0 parses inline)."""
+    try:
+        configured = int(os.getenv(PARSE_WORKERS_ENV, ''))
+    except ValueError:
+        configured = -1
+    if configured >= 0:
+        return configured
+    return os.cpu_count() or 1
+
+
+def response_encoding(response: requests.Response) -> Optional[str]:
+    """Charset declared in the Content-Type header, if any.
+
+    Unlike `response.encoding` this does not fall back to ISO-8859-1 for text
+    types, so workers given the raw bytes can let BeautifulSoup sniff the
+    document's <meta charset> instead.
+    """
+    content_type = response.headers.get('Content-Type', '')
+    if 'charset' not in content_type.lower():
+        return None
+    return requests.utils.get_encoding_from_headers(response.headers)
+
+
+class ParsePool:
+    """Process pool for parse workers with a bounded number of jobs in flight.
+
+    Fetchers keep doing network I/O on their own threads and hand raw HTML
+    bytes to the pool; workers return plain records (e.g. `Scholarship`
+    objects). `imap` pulls jobs from its input lazily and stops pulling once
+    `max_pending` jobs are queued or running, so a generator that fetches pages
+    is held back until a worker frees up instead of buffering pages in memory.
+
+    Parse functions must be module-level so they can be pickled. With
+    `max_workers=0` they run inline in the calling process.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, max_pending: Optional[int] = None):
+        self.max_workers = default_parse_workers() if max_workers is None else max_workers
+        self.max_pending = max_pending or max(1, self.max_workers) * PENDING_JOBS_PER_WORKER
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        # Fetcher threads may submit concurrently; start exactly one pool
+        with self._lock:
+            if self._executor is None:
+                logger.debug(f"Starting {self.max_workers} parse workers")
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers, mp_context=worker_context())
+            return self._executor
+
+    def run(self, fn: Callable, *args) -> Any:
+        """Run one parse job in a worker and wait for its result."""
+        if not self.max_workers:
+            return fn(*args)
+        return self._get_executor().submit(fn, *args).result()
+
+    def imap(self, fn: Callable, jobs: Iterable[Sequence[Any]]) -> Iterator[Any]:
+        """Run `fn(*job)` for each job in the workers, yielding results in input order.
+
+        Parameters:
+            fn: Module-level parse function.
+            jobs: Argument tuples; may be a generator that fetches as it goes.
+
+        Returns:
+            Iterator of parse results. Exceptions raised by `fn` are re-raised
+            when their result is reached.
+        """
+        if not self.max_workers:
+            for job in jobs:
+                yield fn(*job)
+            return
+
+        executor = self._get_executor()
+        pending: Deque[Future] = deque()
+        try:
+            for job in jobs:
+                if len(pending) >= self.max_pending:
+                    yield pending.popleft().result()
+                pending.append(executor.submit(fn, *job))
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def shutdown(self):
+        """Stop the worker processes (they are restarted on next use)."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def __enter__(self) -> 'ParsePool':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.shutdown()
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Parsed Document
+Everything the extraction helpers read from an HTML page, collected in one pass
+
+`ParsedDocument.parse` parses a page once and walks the tree once, picking up
+the title, meta description, headings, links (with anchor text), PDF links,
+the full page text and the boilerplate-free text and blocks that LLM
+extraction uses. The result holds plain strings and lists only, so it is
+cheap to pickle back from a `ParsePool` worker.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple, Union
+from urllib.parse import urljoin
+
+from bs4 import BeautifulSoup, CData, NavigableString, Tag
+
+from .chunked_extractor import HEADING_MARKER
+
+# Elements whose text is kept together as one block when chunking for the LLM
+BLOCK_TAGS = frozenset({
+    'p', 'li', 'tr', 'dt', 'dd', 'td', 'th', 'div', 'section', 'article', 'main', 'aside',
+    'blockquote', 'pre', 'table', 'ul', 'ol', 'dl', 'form', 'body',
+    'h1', 'h2', 'h3', 'h4', 'h5', 'h6',
+})
+HEADING_TAGS = frozenset({'h1', 'h2', 'h3', 'h4', 'h5', 'h6'})
+# Left out of `normalized_text` and `blocks`
+BOILERPLATE_TAGS = frozenset({'script', 'style', 'nav', 'footer', 'header'})
+
+
+@dataclass
+class ParsedDocument:
+    """One HTML page, reduced to what extraction needs.
+
+    `text` is the page text as `soup.get_text()` returns it (line breaks
+    kept, for line-based patterns); `normalized_text` and `blocks` leave out
+    script, style, nav, header and footer and collapse whitespace. `links`
+    are absolute, in document order, repeats included; `link_texts` maps each
+    to its anchor text (or title).
+    """
+    url: str = ""
+    title: str = ""
+    meta_description: str = ""
+    text: str = ""
+    normalized_text: str = ""
+    blocks: List[str] = field(default_factory=list)
+    headings: List[str] = field(default_factory=list)
+    links: List[str] = field(default_factory=list)
+    link_texts: Dict[str, str] = field(default_factory=dict)
+    pdf_links: List[str] = field(default_factory=list)
+
+    @classmethod
+    def parse(cls, html: Union[str, bytes], url: str = "", encoding: Optional[str] = None) -> 'ParsedDocument':
+        """Parse a page and collect its fields in a single walk over the tree.
+
+        Parameters:
+            html: Page markup; bytes are decoded with `encoding`, or sniffed
+                by BeautifulSoup when it is None.
+            url: Page URL that relative links are resolved against.
+            encoding: Charset of `html` when it is bytes.
+
+        Returns:
+            A ParsedDocument.
+        """
+        soup = BeautifulSoup(html, 'html.parser', from_encoding=encoding if isinstance(html, bytes) else None)
+        return cls.from_soup(soup, url)
+
+    @classmethod
+    def from_soup(cls, soup: BeautifulSoup, url: str = "") -> 'ParsedDocument':
+        """Collect the fields of an already parsed page (the tree is not modified)."""
+        doc = cls(url=url)
+        title_tag = meta_tag = None
+        text_parts: List[str] = []
+        kept_parts: List[str] = []
+        block_parts: List[str] = []
+        current_block = None
+        # (link, href, title attribute, anchor text parts) per <a href>, and text parts per heading
+        anchors: List[Tuple[str, str, str, List[str]]] = []
+        headings: List[List[str]] = []
+        # Per element: (inside boilerplate, nearest block element, text parts of the
+        # enclosing anchors and heading). Parents come before their descendants in
+        # document order, so one lookup per node suffices.
+        context = {id(soup): (False, None, ())}
+
+        for node in soup.descendants:
+            node_type = type(node)
+            if node_type is Tag:
+                boilerplate, block, collectors = context[id(node.parent)]
+                name = node.name
+                if name in BLOCK_TAGS:
+                    block = node
+                    if name in HEADING_TAGS and not boilerplate:
+                        headings.append([])
+                        collectors = collectors + (headings[-1],)
+                elif name == 'a':
+                    href = node.get('href')
+                    if href is not None:
+                        anchors.append((urljoin(url, href), href, node.get('title', ''), []))
+                        collectors = collectors + (anchors[-1][3],)
+                elif name in BOILERPLATE_TAGS:
+                    boilerplate = True
+                elif name == 'title' and title_tag is None:
+                    title_tag = node
+                elif name == 'meta' and meta_tag is None and node.get('name') == 'description':
+                    meta_tag = node
+                context[id(node)] = (boilerplate, block, collectors)
+                continue
+
+            if node_type is not NavigableString and node_type is not CData:
+                continue  # comments, doctype, script and style bodies
+            text_parts.append(node)
+            boilerplate, block, collectors = context[id(node.parent)]
+            if collectors:
+                stripped = node.strip()
+                if stripped:
+                    for parts in collectors:
+                        parts.append(stripped)
+            if boilerplate:
+                continue
+            kept_parts.append(node)
+            if node_type is CData:
+                continue
+            # Blocks: consecutive strings under the same block element, headings marked
+            string = ' '.join(node.split())
+            if not string:
+                continue
+            if block is not current_block and block_parts:
+                doc.blocks.append(' '.join(block_parts))
+                block_parts = []
+            if block is not current_block and block is not None and block.name in HEADING_TAGS:
+                block_parts.append(HEADING_MARKER.rstrip())
+            current_block = block
+            block_parts.append(string)
+
+        if block_parts:
+            doc.blocks.append(' '.join(block_parts))
+        doc.text = ''.join(text_parts)
+        doc.normalized_text = ' '.join(''.join(kept_parts).split())
+        doc.title = title_tag.get_text() if title_tag is not None else ""
+        doc.meta_description = meta_tag.get('content', '') if meta_tag is not None else ""
+        doc.headings = [' '.join(parts) for parts in headings if parts]
+        for link, href, title, parts in anchors:
+            doc.links.append(link)
+            anchor_text = ' '.join(parts) or title
+            if anchor_text:
+                doc.link_texts[link] = f"{doc.link_texts.get(link, '')} {anchor_text}".strip()
+            if href.lower().endswith('.pdf'):
+                doc.pdf_links.append(link)
+        return doc
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+PDF Text Extractor
+Streams PDFs to disk and extracts their text in a worker process pool
+"""
+
+import os
+import logging
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+import requests
+
+from .parse_pool import worker_context
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_PDF_BYTES = 20 * 1024 * 1024
+DEFAULT_MAX_PDF_PAGES = 50
+DEFAULT_PDF_WORKERS = 2
+DEFAULT_PDF_TIMEOUT = 60
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+
+@dataclass
+class PdfText:
+    """Text extracted from a PDF (one line per text line, whitespace collapsed within lines)"""
+    url: str
+    text: str
+    title: str = ""
+    pages_read: int = 0
+    total_pages: int = 0
+    size_bytes: int = 0
+
+    @property
+    def truncated(self) -> bool:
+        return self.pages_read < self.total_pages
+
+
+class PdfTooLargeError(Exception):
+    """Raised when a PDF exceeds the configured download size"""
+
+
+def _extract_pdf_text(path: str, max_pages: int) -> Tuple[str, str, int, int]:
+    """Worker: read up to `max_pages` pages of a PDF file.
+
+    Runs in a separate process; pypdf parses pages lazily from the file so only
+    the pages being read are held in memory.
+
+    Returns:
+        (text, document title, pages read, total pages)
+    """
+    from pypdf import PdfReader
+
+    reader = PdfReader(path)
+    total_pages = len(reader.pages)
+    parts = []
+    pages_read = 0
+    for page in reader.pages[:max_pages]:
+        try:
+            parts.append(page.extract_text() or '')
+        except Exception:
+            # One malformed page should not lose the rest of the document
+            parts.append('')
+        pages_read += 1
+
+    title = ''
+    try:
+        if reader.metadata and reader.metadata.title:
+            title = str(reader.metadata.title)
+    except Exception:
+        pass
+
+    return '\n'.join(parts), title, pages_read, total_pages
+
+
+class PdfTextExtractor:
+    """Download PDFs to temp files and extract text off the calling thread.
+
+    Text extraction is CPU-bound, so it runs in a small process pool created on
+    first use. Downloads are streamed to disk and abandoned once they exceed
+    `max_bytes`; only the first `max_pages` pages are read. A parse that runs
+    past `timeout`, or a worker that dies, takes the pool down with it; the
+    next PDF starts a fresh one.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_PDF_BYTES, max_pages: int = DEFAULT_MAX_PDF_PAGES,
+                 max_workers: int = DEFAULT_PDF_WORKERS, timeout: float = DEFAULT_PDF_TIMEOUT):
+        self.max_bytes = max_bytes
+        self.max_pages = max_pages
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self.available = self._check_pdf_support()
+
+    @staticmethod
+    def _check_pdf_support() -> bool:
+        try:
+            import pypdf  # noqa: F401
+            return True
+        except ImportError:
+            logger.warning("pypdf package not installed, PDF text extraction disabled. Install with: pip install pypdf")
+            return False
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers, mp_context=worker_context())
+            return self._executor
+
+    def download(self, response: requests.Response) -> Tuple[str, int]:
+        """Stream a PDF response body to a temp file.
+
+        Parameters:
+            response: Response opened with `stream=True`.
+
+        Returns:
+            (temp file path, bytes written). The caller deletes the file.
+        """
+        declared = response.headers.get('Content-Length')
+        if declared and declared.isdigit() and int(declared) > self.max_bytes:
+            raise PdfTooLargeError(f"PDF is {int(declared)} bytes (limit {self.max_bytes})")
+
+        handle = tempfile.NamedTemporaryFile(prefix='scholarship_', suffix='.pdf', delete=False)
+        written = 0
+        try:
+            with handle:
+                for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    written += len(chunk)
+                    if written > self.max_bytes:
+                        raise PdfTooLargeError(f"PDF exceeds {self.max_bytes} bytes")
+                    handle.write(chunk)
+        except Exception:
+            os.unlink(handle.name)
+            raise
+        return handle.name, written
+
+    def _discard_executor(self, executor: ProcessPoolExecutor, kill: bool = False):
+        """Drop `executor` (if still current) so the next call starts a new pool.
+
+        `future.cancel()` cannot stop a parse that is already running, so a
+        timed-out pool has its workers killed rather than left to finish.
+        """
+        with self._lock:
+            if self._executor is executor:
+                self._executor = None
+        if kill:
+            # ProcessPoolExecutor has no public way to stop busy workers
+            for process in list((getattr(executor, '_processes', None) or {}).values()):
+                process.kill()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def extract_file(self, path: str) -> Tuple[str, str, int, int]:
+        """Extract text from a PDF on disk in the worker pool.
+
+        A broken pool (a worker died, e.g. on a PDF that exhausted memory) is
+        replaced and the file retried once; a timeout kills the pool.
+        """
+        for attempt in range(2):
+            executor = self._get_executor()
+            try:
+                future = executor.submit(_extract_pdf_text, path, self.max_pages)
+                return future.result(timeout=self.timeout)
+            except FutureTimeoutError:
+                self._discard_executor(executor, kill=True)
+                raise TimeoutError(f"PDF text extraction took longer than {self.timeout}s")
+            except BrokenProcessPool:
+                self._discard_executor(executor)
+                if attempt:
+                    raise
+                logger.warning("PDF worker pool broke, restarting it")
+
+    def extract_response(self, url: str, response: requests.Response) -> Optional[PdfText]:
+        """Download and extract a PDF from an open streaming response.
+
+        Returns:
+            PdfText, or None when PDF support is unavailable or the file is
+            over the size cap.
+        """
+        if not self.available:
+            return None
+
+        try:
+            path, size = self.download(response)
+        except PdfTooLargeError as e:
+            logger.info(f"Skipping PDF {url}: {e}")
+            return None
+
+        try:
+            text, title, pages_read, total_pages = self.extract_file(path)
+        finally:
+            os.unlink(path)
+
+        logger.info(f"Extracted {pages_read}/{total_pages} PDF pages ({size} bytes) from {url}")
+        # Keep line breaks for line-based patterns; callers flatten where they need to
+        lines = (' '.join(line.split()) for line in text.splitlines())
+        return PdfText(url, '\n'.join(line for line in lines if line), title, pages_read, total_pages, size)
+
+    def shutdown(self):
+        """Stop the worker pool (it is restarted on next use)."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Host Rate Limiter
+Spaces out requests to the same host across threads
+"""
+
+import time
+import logging
+import threading
+from typing import Dict
+from urllib.parse import urlsplit
+
+from .constants import SCRAPER_MIN_REQUEST_DELAY_SEC
+
+logger = logging.getLogger(__name__)
+
+
+class HostRateLimiter:
+    """Allow at most one request per `min_interval` seconds to each host.
+
+    `wait` reserves the next free slot for the URL's host under a lock and
+    sleeps outside it, so threads fetching from different hosts never wait on
+    each other and threads sharing a host go out `min_interval` apart.
+    """
+
+    def __init__(self, min_interval: float = SCRAPER_MIN_REQUEST_DELAY_SEC):
+        self.min_interval = min_interval
+        self._next_slot: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def reserve(self, url: str) -> float:
+        """Claim the next request slot for the URL's host.
+
+        Returns:
+            Seconds to wait before sending the request.
+        """
+        host = urlsplit(url).netloc.lower()
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + self.min_interval
+        return slot - now
+
+    def wait(self, url: str):
+        """Block until a request to the URL's host is allowed."""
+        delay = self.reserve(url)
+        if delay > 0:
+            time.sleep(delay)
+
+
+class DatabaseHostRateLimiter(HostRateLimiter):
+    """Per-host spacing shared by every process through the task queue tables.
+
+    Slots are reserved with `TaskQueue.reserve_host_slot`, so workers on
+    different nodes together send at most one request per `min_interval` to
+    a host. While the database is unreachable it falls back to spacing this
+    process's requests only.
+    """
+
+    def __init__(self, task_queue, min_interval: float = SCRAPER_MIN_REQUEST_DELAY_SEC):
+        super().__init__(min_interval)
+        self.task_queue = task_queue
+
+    def reserve(self, url: str) -> float:
+        host = urlsplit(url).netloc.lower()
+        try:
+            return self.task_queue.reserve_host_slot(host, self.min_interval)
+        except Exception as e:
+            logger.warning(f"Shared rate limit for {host} unavailable, limiting locally: {e}")
+            return super().reserve(url)
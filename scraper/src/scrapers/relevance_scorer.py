@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Relevance Scorer
+Cheap, CPU-only estimate of whether a page or search result describes scholarships
+"""
+
+import os
+import re
+import json
+import logging
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+RELEVANCE_MODEL_ENV = 'SCRAPER_RELEVANCE_MODEL'
+
+# Pages scoring below this are not sent to the LLM. Set low on purpose: a missed
+# scholarship page costs more than one wasted call
+DEFAULT_PAGE_THRESHOLD = 0.3
+# Search results only have a title and a snippet, so less evidence is expected
+DEFAULT_SOURCE_THRESHOLD = 0.25
+
+# Each feature is log(1 + matches) of its pattern in the lowercased text
+FEATURE_PATTERNS: Dict[str, str] = {
+    'scholarship': r'\bscholarships?\b|\bfellowships?\b|\bbursar(?:y|ies)\b',
+    'award_amount': r'\$\s?\d[\d,]*(?:\.\d\d)?\b',
+    'deadline': r'\bdeadlines?\b|\bapply by\b|\bdue date\b|\bapplications? (?:open|close|due)\b',
+    'eligibility': r'\beligib\w*|\bapplicants? must\b|\bopen to\b|\brequirements?\b|\bgpa\b',
+    'apply': r'\bapply\b|\bapplication\b|\bnominat\w*',
+    'student': r'\bstudents?\b|\bundergraduate\b|\bgraduate\b|\bhigh school\b|\benrolled\b|\bfull-time\b',
+    'award_terms': r'\bawards?\b|\bgrants?\b|\bfinancial aid\b|\btuition\b|\bstipend\b',
+    'award_winning': r'\baward[- ]winning\b|\bwon (?:the|an?) \w+ award\b|\bgrant funding\b|\bresearch grants?\b',
+    'news': r'\bnews\b|\bpress release\b|\bblog\b|\bposted (?:on|by)\b|\bread more\b|\bevents?\b|\bwebinar\b',
+    'organization': r'\bour (?:team|mission|history|story|staff)\b|\bboard of directors\b|\bcareers\b|\bjob openings?\b',
+    'commerce': r'\bcart\b|\bcheckout\b|\bshop\b|\bprice\b|\bshipping\b',
+}
+FEATURE_NAMES = list(FEATURE_PATTERNS)
+SCHOLARSHIP_FEATURE = FEATURE_NAMES.index('scholarship')
+
+# Hand-set starting weights; `fit` replaces them with weights learned from labelled pages
+DEFAULT_WEIGHTS: Dict[str, float] = {
+    'scholarship': 2.0,
+    'award_amount': 0.9,
+    'deadline': 1.0,
+    'eligibility': 0.8,
+    'apply': 0.4,
+    'student': 0.3,
+    'award_terms': 0.4,
+    'award_winning': -1.5,
+    'news': -0.9,
+    'organization': -0.8,
+    'commerce': -1.0,
+}
+DEFAULT_BIAS = -2.5
+
+# URL path words that count as a `scholarship` match for search results
+SOURCE_URL_TERMS = re.compile(r'scholarship|fellowship|financial-aid|award', re.IGNORECASE)
+
+# Gradient descent settings for `fit`
+FIT_LEARNING_RATE = 0.5
+FIT_EPOCHS = 500
+FIT_L2 = 0.01
+
+
+class RelevanceScorer:
+    """Logistic model over a handful of weighted keyword features.
+
+    `score` returns a probability-like value in [0, 1] from pattern counts,
+    so it costs a few regex scans per page and never touches the network.
+    The default weights are hand-tuned; `fit` learns new ones from labelled
+    pages (e.g. known scholarship pages from the database plus pages that
+    were rejected) and `save`/`load` keep them as JSON. Set
+    SCRAPER_RELEVANCE_MODEL to a saved model to use it everywhere.
+    """
+
+    def __init__(self, weights: Optional[Dict[str, float]] = None, bias: float = DEFAULT_BIAS,
+                 threshold: float = DEFAULT_PAGE_THRESHOLD, source_threshold: float = DEFAULT_SOURCE_THRESHOLD):
+        weights = weights or DEFAULT_WEIGHTS
+        self.weights = np.array([weights.get(name, 0.0) for name in FEATURE_NAMES], dtype=float)
+        self.bias = bias
+        self.threshold = threshold
+        self.source_threshold = source_threshold
+        self._patterns = [re.compile(pattern) for pattern in FEATURE_PATTERNS.values()]
+
+    def _counts(self, text: str) -> List[int]:
+        text_lower = text.lower()
+        return [len(pattern.findall(text_lower)) for pattern in self._patterns]
+
+    def features(self, text: str) -> np.ndarray:
+        """Feature vector for `text` (see FEATURE_PATTERNS)."""
+        return np.log1p(np.array(self._counts(text), dtype=float))
+
+    def _probability(self, features: np.ndarray) -> float:
+        return float(1.0 / (1.0 + np.exp(-(features @ self.weights + self.bias))))
+
+    def score(self, text: str) -> float:
+        """Relevance of page text in [0, 1]."""
+        return self._probability(self.features(text))
+
+    def is_relevant(self, text: str) -> bool:
+        """Check whether page text scores at or above the page threshold."""
+        return self.score(text) >= self.threshold
+
+    def score_source(self, url: str, title: str, description: str) -> float:
+        """Relevance of a search result from its URL, title and snippet."""
+        counts = self._counts(f"{title}\n{description}")
+        if SOURCE_URL_TERMS.search(url):
+            counts[SCHOLARSHIP_FEATURE] += 1
+        return self._probability(np.log1p(np.array(counts, dtype=float)))
+
+    def is_relevant_source(self, url: str, title: str, description: str) -> bool:
+        """Check whether a search result scores at or above the source threshold."""
+        return self.score_source(url, title, description) >= self.source_threshold
+
+    def fit(self, texts: Sequence[str], labels: Sequence[bool]) -> 'RelevanceScorer':
+        """Learn weights from labelled texts with L2-regularised logistic regression.
+
+        Parameters:
+            texts: Page texts.
+            labels: True for scholarship pages.
+
+        Returns:
+            self, for chaining.
+        """
+        features = np.array([self.features(text) for text in texts])
+        y = np.array([1.0 if label else 0.0 for label in labels])
+        weights = np.zeros(features.shape[1])
+        bias = 0.0
+        for _ in range(FIT_EPOCHS):
+            predictions = 1.0 / (1.0 + np.exp(-(features @ weights + bias)))
+            error = predictions - y
+            weights -= FIT_LEARNING_RATE * (features.T @ error / len(y) + FIT_L2 * weights)
+            bias -= FIT_LEARNING_RATE * float(error.mean())
+        self.weights = weights
+        self.bias = bias
+        return self
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            'weights': dict(zip(FEATURE_NAMES, (round(float(w), 4) for w in self.weights))),
+            'bias': round(self.bias, 4),
+            'threshold': self.threshold,
+            'source_threshold': self.source_threshold,
+        }
+
+    def save(self, path: str):
+        """Write the model to a JSON file."""
+        with open(path, 'w') as handle:
+            json.dump(self.to_dict(), handle, indent=2)
+
+    @classmethod
+    def load(cls, path: str) -> 'RelevanceScorer':
+        """Read a model written by `save`."""
+        with open(path) as handle:
+            data = json.load(handle)
+        return cls(weights=data['weights'], bias=data['bias'],
+                   threshold=data.get('threshold', DEFAULT_PAGE_THRESHOLD),
+                   source_threshold=data.get('source_threshold', DEFAULT_SOURCE_THRESHOLD))
+
+
+def default_relevance_scorer() -> RelevanceScorer:
+    """Scorer from SCRAPER_RELEVANCE_MODEL if set and readable, else the default weights."""
+    path = os.getenv(RELEVANCE_MODEL_ENV)
+    if path:
+        try:
+            return RelevanceScorer.load(path)
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Could not load relevance model {path}: {e}; using default weights")
+    return RelevanceScorer()
@@ -0,0 +1,354 @@
+#!/usr/bin/env python3
+"""
+Robots.txt Rules
+RFC 9309 parsing, a compiled path matcher and a persistent per-domain cache
+"""
+
+import os
+import re
+import json
+import time
+import logging
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set, Tuple
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+# RFC 9309 2.5: crawlers must parse at least the first 500 KiB
+MAX_ROBOTS_TXT_BYTES = 500 * 1024
+
+# RFC 9309 2.4: cached copies should not be used for more than 24 hours
+DEFAULT_ROBOTS_CACHE_TTL = 24 * 60 * 60
+DEFAULT_ROBOTS_CACHE_PATH = os.path.join('local_data', 'robots_cache.json')
+
+# RFC 3986 2.3: escapes of these characters are equivalent to the characters themselves
+_UNRESERVED = frozenset('ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-._~')
+_PERCENT_ESCAPE = re.compile(r'%([0-9A-Fa-f]{2})')
+
+_TERMINAL = None  # Trie key holding the plain rule that ends at a node
+_WILDCARDS = object()  # Trie key holding wildcard rules whose literal prefix ends at a node
+
+
+def _normalize_escapes(text: str) -> str:
+    if not text.isascii():
+        text = ''.join(char if char.isascii() else ''.join(f'%{byte:02X}' for byte in char.encode('utf-8'))
+                       for char in text)
+    if '%' in text:
+        text = _PERCENT_ESCAPE.sub(_normalize_escape, text)
+    return text
+
+
+def _normalize_escape(match: re.Match) -> str:
+    char = chr(int(match.group(1), 16))
+    return char if char in _UNRESERVED else f'%{match.group(1).upper()}'
+
+
+def normalize_robots_path(value: str, pattern: bool = False) -> str:
+    """Percent-encoding normal form used to compare rules and paths (RFC 9309 2.2.2).
+
+    Non-ASCII characters become UTF-8 escapes, escapes get uppercase hex and
+    escapes of unreserved characters (`%7E` -> `~`) are decoded, so
+    `Disallow: /%7Ejoe` covers `/~joe/` and the other way round. Reserved
+    characters stay as written: `%2F` is not `/`.
+
+    Parameters:
+        value: Rule pattern or request path (with query).
+        pattern: Keep `*` and a trailing `$` as rule operators; in a path
+            they are literal characters and are escaped, so only rules
+            spelling them `%2A`/`%24` match them.
+
+    Returns:
+        The normalized string (`value` itself when nothing changes).
+    """
+    if pattern:
+        if value.endswith('$'):
+            return normalize_robots_path(value[:-1], pattern=True) + '$'
+        if value.isascii() and '%' not in value and '$' not in value:
+            return value
+        return _normalize_escapes(value).replace('$', '%24')
+    if value.isascii() and '%' not in value and '*' not in value and '$' not in value:
+        return value
+    return _normalize_escapes(value).replace('*', '%2A').replace('$', '%24')
+
+
+class _WildcardGroup:
+    """Wildcard rules sharing a literal prefix, compiled into one alternation.
+
+    Alternatives are ordered longest rule first (allow first on ties), so the
+    first alternative that matches is the one RFC 9309 precedence picks.
+    """
+
+    __slots__ = ('rules', 'regex')
+
+    def __init__(self):
+        self.rules: List[Tuple[int, bool, str]] = []
+        self.regex: Optional[re.Pattern] = None
+
+    def compile(self):
+        self.rules.sort(key=lambda rule: (-rule[0], not rule[1]))
+        self.regex = re.compile('|'.join(f'({rule[2]})' for rule in self.rules), re.DOTALL)
+
+    def match(self, path: str, position: int) -> Optional[Tuple[int, bool]]:
+        found = self.regex.match(path, position)
+        if found is None:
+            return None
+        length, allow, _ = self.rules[found.lastindex - 1]
+        return length, allow
+
+
+class RobotsMatcher:
+    """Longest-match allow/disallow lookup compiled from robots.txt rules.
+
+    Rules are stored in a character trie keyed on their literal prefix (the
+    text before the first `*`), so a lookup walks the path once. Plain prefix
+    rules sit on their final node, `$`-anchored literals in an exact-match
+    dict, and wildcard rules as one combined regex on the node where their
+    literal prefix ends, tried only when the path reaches that node. Rules
+    and paths are compared in `normalize_robots_path` form.
+    """
+
+    def __init__(self, rules: List[Tuple[str, bool]]):
+        self._trie: Dict = {}
+        self._exact: Dict[str, Tuple[int, bool]] = {}
+        self.rule_count = 0
+        groups: List[_WildcardGroup] = []
+
+        for pattern, allow in rules:
+            if not pattern:
+                continue
+            pattern = normalize_robots_path(pattern, pattern=True)
+            self.rule_count += 1
+            length = len(pattern)
+            anchored = pattern.endswith('$')
+            body = pattern[:-1] if anchored else pattern
+            if '*' in body:
+                prefix, remainder = body.split('*', 1)
+                regex = '.*' + '.*'.join(re.escape(part) for part in re.split(r'\*+', remainder))
+                node = self._node_for(prefix)
+                group = node.get(_WILDCARDS)
+                if group is None:
+                    group = node[_WILDCARDS] = _WildcardGroup()
+                    groups.append(group)
+                group.rules.append((length, allow, regex + (r'\Z' if anchored else '')))
+            elif anchored:
+                self._exact[body] = self._better(self._exact.get(body), (length, allow))
+            else:
+                node = self._node_for(body)
+                node[_TERMINAL] = self._better(node.get(_TERMINAL), (length, allow))
+
+        for group in groups:
+            group.compile()
+
+    def _node_for(self, literal: str) -> Dict:
+        node = self._trie
+        for char in literal:
+            node = node.setdefault(char, {})
+        return node
+
+    @staticmethod
+    def _better(current: Optional[Tuple[int, bool]], candidate: Tuple[int, bool]) -> Tuple[int, bool]:
+        """Longer rule wins; on equal length allow wins (RFC 9309 2.2.2)."""
+        if current is None or candidate[0] > current[0] or (candidate[0] == current[0] and candidate[1]):
+            return candidate
+        return current
+
+    def is_allowed(self, path: str) -> bool:
+        """Check a path (including any query string) against the rules."""
+        path = normalize_robots_path(path)
+        best = self._exact.get(path)
+
+        node = self._trie
+        position = 0
+        while True:
+            terminal = node.get(_TERMINAL)
+            if terminal:
+                best = self._better(best, terminal)
+            group = node.get(_WILDCARDS)
+            if group:
+                matched = group.match(path, position)
+                if matched:
+                    best = self._better(best, matched)
+            if position == len(path):
+                break
+            node = node.get(path[position])
+            if node is None:
+                break
+            position += 1
+
+        return best is None or best[1]
+
+
+@dataclass
+class RobotsTxtRules:
+    """Parsed robots.txt rules"""
+    allowed: Set[str] = None
+    disallowed: Set[str] = None
+    crawl_delay: Optional[float] = None
+    sitemap_urls: List[str] = None
+    rules: List[Tuple[str, bool]] = field(default_factory=list)  # (pattern, allow) in file order
+
+    def __post_init__(self):
+        if self.allowed is None:
+            self.allowed = set()
+        if self.disallowed is None:
+            self.disallowed = set()
+        if self.sitemap_urls is None:
+            self.sitemap_urls = []
+        self._matcher: Optional[RobotsMatcher] = None
+
+    @classmethod
+    def disallow_all(cls) -> 'RobotsTxtRules':
+        """Rules used when robots.txt is unreachable (RFC 9309 2.3.1.4)."""
+        return cls(disallowed={'/'}, rules=[('/', False)])
+
+    def can_fetch(self, url: str) -> bool:
+        """Check whether a URL may be crawled under these rules."""
+        parts = urlsplit(url)
+        path = parts.path or '/'
+        if path == '/robots.txt':
+            return True
+        if parts.query:
+            path = f"{path}?{parts.query}"
+        if self._matcher is None:
+            self._matcher = RobotsMatcher(self.rules)
+        return self._matcher.is_allowed(path)
+
+
+def product_token(user_agent: str) -> str:
+    """Return the lowercased product token of a User-Agent (e.g. 'scholarshiptrackerbot')."""
+    match = re.match(r'[A-Za-z_-]+', user_agent.strip())
+    return match.group(0).lower() if match else user_agent.strip().lower()
+
+
+def parse_robots_txt(content: str, user_agent: str) -> RobotsTxtRules:
+    """Parse robots.txt per RFC 9309.
+
+    Rules come from every group naming our product token, or from the `*`
+    groups if none does; groups with the same agent are merged.
+
+    Parameters:
+        content: robots.txt body.
+        user_agent: Crawler User-Agent (only its product token is matched).
+
+    Returns:
+        RobotsTxtRules for this crawler.
+    """
+    token = product_token(user_agent)
+    groups: List[Tuple[List[str], List[Tuple[str, str]]]] = []
+    sitemap_urls: List[str] = []
+    current_agents: Optional[List[str]] = None
+    current_lines: List[Tuple[str, str]] = []
+
+    for raw_line in content[:MAX_ROBOTS_TXT_BYTES].splitlines():
+        line = raw_line.split('#', 1)[0].strip()
+        if ':' not in line:
+            continue
+        directive, value = line.split(':', 1)
+        directive = directive.strip().lower()
+        value = value.strip()
+
+        if directive == 'user-agent':
+            # Consecutive user-agent lines share one group
+            if current_agents is None or current_lines:
+                current_agents = []
+                current_lines = []
+                groups.append((current_agents, current_lines))
+            current_agents.append(value.lower())
+        elif directive == 'sitemap':
+            if value:
+                sitemap_urls.append(value)
+        elif current_agents is not None and directive in ('allow', 'disallow', 'crawl-delay'):
+            current_lines.append((directive, value))
+
+    selected = [lines for agents, lines in groups if token in agents]
+    if not selected:
+        selected = [lines for agents, lines in groups if '*' in agents]
+
+    rules = RobotsTxtRules(sitemap_urls=sitemap_urls)
+    for lines in selected:
+        for directive, value in lines:
+            if directive == 'crawl-delay':
+                try:
+                    rules.crawl_delay = float(value)
+                except ValueError:
+                    pass
+            elif value:
+                allow = directive == 'allow'
+                (rules.allowed if allow else rules.disallowed).add(value)
+                rules.rules.append((value, allow))
+
+    logger.info(f"Parsed robots.txt: {len(rules.disallowed)} disallowed, {len(rules.allowed)} allowed, "
+                f"crawl-delay: {rules.crawl_delay}, sitemaps: {len(rules.sitemap_urls)}")
+    return rules
+
+
+@dataclass
+class CachedRobotsTxt:
+    """A fetched robots.txt as stored in the cache"""
+    status: int
+    content: str
+    fetched_at: float
+
+
+class RobotsCache:
+    """Per-domain robots.txt cache persisted as JSON with a TTL.
+
+    Only definitive answers (2xx bodies and 4xx "no robots.txt") are cached;
+    expired entries are kept so they can stand in when a refetch fails.
+    """
+
+    def __init__(self, path: Optional[str] = DEFAULT_ROBOTS_CACHE_PATH,
+                 ttl_seconds: float = DEFAULT_ROBOTS_CACHE_TTL):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self._entries: Dict[str, CachedRobotsTxt] = {}
+        self._lock = threading.Lock()
+        self.load()
+
+    def load(self):
+        """Load cached entries from disk (missing or corrupt files start empty)."""
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as handle:
+                data = json.load(handle)
+            self._entries = {domain: CachedRobotsTxt(**entry) for domain, entry in data.items()}
+        except (OSError, ValueError, TypeError) as e:
+            logger.warning(f"Could not read robots cache {self.path}: {e}")
+
+    def get(self, domain: str, allow_stale: bool = False) -> Optional[CachedRobotsTxt]:
+        """Return the cached robots.txt for a domain if present and fresh."""
+        with self._lock:
+            entry = self._entries.get(domain)
+        if entry is None:
+            return None
+        if not allow_stale and time.time() - entry.fetched_at > self.ttl_seconds:
+            return None
+        return entry
+
+    def put(self, domain: str, status: int, content: str) -> CachedRobotsTxt:
+        """Store a fetched robots.txt and persist the cache."""
+        entry = CachedRobotsTxt(status, content[:MAX_ROBOTS_TXT_BYTES], time.time())
+        with self._lock:
+            self._entries[domain] = entry
+        self.save()
+        return entry
+
+    def save(self):
+        """Write the cache to disk."""
+        if not self.path:
+            return
+        with self._lock:
+            snapshot = json.dumps({domain: entry.__dict__ for domain, entry in self._entries.items()})
+        try:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            temp_path = f"{self.path}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as handle:
+                handle.write(snapshot)
+            os.replace(temp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Could not write robots cache {self.path}: {e}")
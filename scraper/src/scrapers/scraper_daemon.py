@@ -0,0 +1,333 @@
+#!/usr/bin/env python3
+"""
+Scraper Daemon
+Long-running scheduler that reuses warm scrapers between runs
+
+`main.py` from cron pays interpreter startup, `.env` loading, OpenAI client
+construction and new DB/HTTP connections on every run. The daemon keeps one
+persistent scraper instance per website (with its HTTP session, extraction
+pipeline, DB connection and write-behind writer) and runs it on the cadence
+configured in the `websites` table (`config.cadence_minutes`), so frequent
+small runs are cheap. Runs happen one at a time on the scheduler thread.
+
+A localhost HTTP endpoint serves `/healthz` (JSON) and `/metrics`
+(Prometheus text). SIGTERM/SIGINT drain: the current run finishes and its
+scholarships are flushed, then the daemon exits.
+"""
+
+import os
+import json
+import time
+import heapq
+import signal
+import logging
+import threading
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+
+from .base_scraper import BaseScraper, scholarships_found
+from .http_client import connection_stats
+from .constants import DAEMON_DEFAULT_CADENCE_MIN, DAEMON_SCHEDULE_REFRESH_SEC, DAEMON_METRICS_PORT
+from .scraper_factory import ScraperFactory
+from ..utils_python.config_manager import ConfigManager
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class WebsiteStats:
+    """Run counters for one website, exported on /metrics."""
+    cadence_sec: float
+    next_run_at: float = 0.0
+    runs_succeeded: int = 0
+    runs_failed: int = 0
+    scholarships_found: int = 0
+    last_duration_sec: float = 0.0
+    last_success_at: float = 0.0
+
+
+def load_cadences(environment: str, default_minutes: float = DAEMON_DEFAULT_CADENCE_MIN) -> Dict[str, float]:
+    """Read per-website cadence (seconds) for enabled websites with a Python scraper.
+
+    Only websites with `scraper_type = 'python'` are read, so sites the
+    TypeScript scrapers own are not scheduled twice. Websites map to scrapers
+    by `website_id` (a `_python` suffix is ignored); the cadence comes from `config.cadence_minutes` or `default_minutes`.
+
+    Returns:
+        Mapping of scraper name -> seconds between runs (empty when the
+        websites table cannot be read).
+    """
+    available = set(ScraperFactory.get_available_scrapers())
+    config_manager = ConfigManager(environment)
+    try:
+        websites = config_manager.get_enabled_websites('python')
+    finally:
+        config_manager.close_db_connection()
+    cadences: Dict[str, float] = {}
+    for website in websites:
+        name = str(website.get('website_id') or website.get('name') or '').lower()
+        if name.endswith('_python'):
+            name = name[:-len('_python')]
+        if name not in available:
+            continue
+        config = website.get('config') or {}
+        if isinstance(config, str):
+            try:
+                config = json.loads(config)
+            except ValueError:
+                config = {}
+        try:
+            minutes = float(config.get('cadence_minutes', default_minutes))
+        except (TypeError, ValueError):
+            minutes = default_minutes
+        if minutes > 0:
+            cadences[name] = minutes * 60
+    return cadences
+
+
+class ScraperDaemon:
+    """Run scrapers on their cadence, keeping their resources warm between runs.
+
+    Parameters:
+        environment: Database environment ('local', 'dev', 'staging', 'prod').
+        cadences: Fixed scraper name -> seconds between runs; read from the
+            websites table (and refreshed periodically) when omitted.
+        metrics_port: Localhost port for /healthz and /metrics (0 disables).
+    """
+
+    def __init__(self, environment: str = "local", cadences: Optional[Dict[str, float]] = None,
+                 metrics_port: int = DAEMON_METRICS_PORT,
+                 refresh_interval: float = DAEMON_SCHEDULE_REFRESH_SEC):
+        self.environment = environment
+        self.fixed_cadences = cadences
+        self.metrics_port = metrics_port
+        self.refresh_interval = refresh_interval
+        self.stats: Dict[str, WebsiteStats] = {}
+        self.scrapers: Dict[str, BaseScraper] = {}
+        self.running: Optional[str] = None
+        self.started_at = time.time()
+        self._queue: List[Tuple[float, str]] = []
+        self._stopping = threading.Event()
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    @property
+    def draining(self) -> bool:
+        return self._stopping.is_set()
+
+    def stop(self, *_):
+        """Ask the daemon to drain: finish the current run, then exit."""
+        if not self._stopping.is_set():
+            logger.info("Stop requested, draining after the current run")
+        self._stopping.set()
+
+    def install_signal_handlers(self):
+        """Drain on SIGTERM and SIGINT (must be called from the main thread)."""
+        signal.signal(signal.SIGTERM, self.stop)
+        signal.signal(signal.SIGINT, self.stop)
+
+    def refresh_schedule(self):
+        """Apply the current cadences: new websites run now, removed ones stop.
+
+        An empty result from the websites table leaves the schedule as it is.
+        """
+        if self.fixed_cadences is not None:
+            cadences = dict(self.fixed_cadences)
+        else:
+            try:
+                cadences = load_cadences(self.environment)
+            except Exception as e:
+                logger.warning(f"Could not read website cadences: {e}")
+                cadences = {}
+            if not cadences:
+                # An unreadable websites table also reads as empty: keep the current
+                # schedule (or schedule nothing yet) rather than guessing which sites
+                # are ours, and try again at the next refresh
+                logger.warning(f"No website cadences found, {'keeping the current schedule' if self.stats else 'nothing scheduled'}; "
+                               f"retrying in {self.refresh_interval:.0f}s")
+                return
+        now = time.time()
+        with self._lock:
+            for name, cadence in cadences.items():
+                stats = self.stats.get(name)
+                if stats is None:
+                    self.stats[name] = WebsiteStats(cadence_sec=cadence, next_run_at=now)
+                    heapq.heappush(self._queue, (now, name))
+                elif stats.cadence_sec != cadence:
+                    stats.cadence_sec = cadence
+            for name in set(self.stats) - set(cadences):
+                del self.stats[name]
+                scraper = self.scrapers.pop(name, None)
+                if scraper is not None:
+                    scraper.close()
+
+    def _scraper(self, name: str) -> Optional[BaseScraper]:
+        scraper = self.scrapers.get(name)
+        if scraper is None:
+            scraper = ScraperFactory.create_scraper(name, environment=self.environment)
+            if scraper is None:
+                return None
+            scraper.persistent = True
+            self.scrapers[name] = scraper
+        return scraper
+
+    def run_once(self, name: str) -> bool:
+        """Run one website's scraper now; returns whether the run succeeded."""
+        stats = self.stats[name]
+        scraper = self._scraper(name)
+        started = time.time()
+        success = False
+        self.running = name
+        try:
+            if scraper is None:
+                logger.error(f"Could not create scraper {name}, retrying at its next run")
+                return False
+            scraper.job_id = f"daemon_{name}_{int(started)}"
+            scraper.db_manager.ping()
+            result = scraper.run()
+            success = result.success
+            stats.scholarships_found += scholarships_found(result)
+            return success
+        except Exception as e:
+            logger.error(f"Daemon run of {name} failed: {e}")
+            return False
+        finally:
+            self.running = None
+            stats.last_duration_sec = time.time() - started
+            if success:
+                stats.runs_succeeded += 1
+                stats.last_success_at = time.time()
+            else:
+                stats.runs_failed += 1
+
+    def serve_forever(self):
+        """Run the scheduler until stopped, then release every scraper."""
+        self._start_metrics_server()
+        self.refresh_schedule()
+        next_refresh = time.time() + self.refresh_interval
+        try:
+            while not self._stopping.is_set():
+                now = time.time()
+                if now >= next_refresh:
+                    self.refresh_schedule()
+                    next_refresh = now + self.refresh_interval
+                with self._lock:
+                    due = self._queue[0] if self._queue else None
+                if due is None or due[0] > now:
+                    wake = min(due[0] if due else next_refresh, next_refresh)
+                    self._stopping.wait(max(0.0, wake - now))
+                    continue
+                with self._lock:
+                    run_at, name = heapq.heappop(self._queue)
+                    stats = self.stats.get(name)
+                if stats is None or stats.next_run_at != run_at:
+                    continue  # removed from (or re-added to) the schedule since queued
+                logger.info(f"Daemon running {name}")
+                self.run_once(name)
+                with self._lock:
+                    stats.next_run_at = time.time() + stats.cadence_sec
+                    if name in self.stats:
+                        heapq.heappush(self._queue, (stats.next_run_at, name))
+        finally:
+            self.shutdown()
+
+    def shutdown(self):
+        """Flush and close every scraper and stop the metrics endpoint."""
+        for name, scraper in list(self.scrapers.items()):
+            try:
+                scraper.close()
+            except Exception as e:
+                logger.warning(f"Error closing scraper {name}: {e}")
+        self.scrapers.clear()
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        logger.info("Scraper daemon stopped")
+
+    def health(self) -> Dict:
+        now = time.time()
+        with self._lock:
+            websites = {name: {'cadence_sec': stats.cadence_sec,
+                               'next_run_in_sec': round(max(stats.next_run_at - now, 0), 1),
+                               'runs_succeeded': stats.runs_succeeded,
+                               'runs_failed': stats.runs_failed}
+                        for name, stats in self.stats.items()}
+        return {'status': 'draining' if self.draining else 'ok',
+                'uptime_sec': round(now - self.started_at, 1),
+                'running': self.running,
+                'websites': websites}
+
+    def metrics(self) -> str:
+        lines = [
+            '# TYPE scraper_daemon_up gauge', 'scraper_daemon_up 1',
+            '# TYPE scraper_daemon_draining gauge', f'scraper_daemon_draining {int(self.draining)}',
+            '# TYPE scraper_runs_total counter',
+            '# TYPE scraper_scholarships_found_total counter',
+            '# TYPE scraper_last_run_duration_seconds gauge',
+            '# TYPE scraper_last_success_timestamp_seconds gauge',
+            '# TYPE scraper_next_run_timestamp_seconds gauge',
+            '# TYPE scraper_http_requests_total counter',
+            '# TYPE scraper_http_connections_total counter',
+        ]
+        with self._lock:
+            for name, stats in sorted(self.stats.items()):
+                label = f'website="{name}"'
+                lines += [
+                    f'scraper_runs_total{{{label},status="success"}} {stats.runs_succeeded}',
+                    f'scraper_runs_total{{{label},status="failure"}} {stats.runs_failed}',
+                    f'scraper_scholarships_found_total{{{label}}} {stats.scholarships_found}',
+                    f'scraper_last_run_duration_seconds{{{label}}} {stats.last_duration_sec:.3f}',
+                    f'scraper_last_success_timestamp_seconds{{{label}}} {stats.last_success_at:.0f}',
+                    f'scraper_next_run_timestamp_seconds{{{label}}} {stats.next_run_at:.0f}',
+                ]
+        # Connection reuse per host: requests sent vs connections opened
+        for host, host_stats in connection_stats().items():
+            label = f'host="{host}"'
+            lines += [
+                f'scraper_http_requests_total{{{label}}} {host_stats["requests"]}',
+                f'scraper_http_connections_total{{{label}}} {host_stats["connections"]}',
+            ]
+        return '\n'.join(lines) + '\n'
+
+    def _start_metrics_server(self):
+        if not self.metrics_port:
+            return
+        daemon = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path == '/healthz':
+                    health = daemon.health()
+                    body = json.dumps(health).encode('utf-8')
+                    content_type = 'application/json'
+                    status = 200 if health['status'] == 'ok' else 503
+                elif self.path == '/metrics':
+                    body = daemon.metrics().encode('utf-8')
+                    content_type = 'text/plain; version=0.0.4'
+                    status = 200
+                else:
+                    body, content_type, status = b'not found\n', 'text/plain', 404
+                self.send_response(status)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(('127.0.0.1', self.metrics_port), Handler)
+        self.metrics_port = self._server.server_address[1]
+        threading.Thread(target=self._server.serve_forever, name='daemon-metrics', daemon=True).start()
+        logger.info(f"Health and metrics on http://127.0.0.1:{self.metrics_port}/healthz and /metrics")
+
+
+def run_daemon(environment: str = "local", metrics_port: Optional[int] = None):
+    """Run the scraper daemon in the foreground until SIGTERM/SIGINT."""
+    if metrics_port is None:
+        metrics_port = int(os.getenv('SCRAPER_DAEMON_PORT', DAEMON_METRICS_PORT))
+    daemon = ScraperDaemon(environment, metrics_port=metrics_port)
+    daemon.install_signal_handlers()
+    daemon.serve_forever()
@@ -147,6 +147,23 @@ class ScraperFactory:
             logger.error(f"     - 'ai_discovery' (AI Discovery)")
             return None
     
+    @classmethod
+    def create_task_scraper(cls, kind: str, environment: str = "local") -> Optional[BaseScraper]:
+        """Create the Python scraper that processes queued tasks of `kind`.
+
+        Tasks are only queued by Python scrapers, so the websites table's
+        scraper type is not consulted (except through `create_scraper` for
+        the AI discovery scraper, which needs its API keys).
+        """
+        for name, scraper_class in cls._scrapers.items():
+            if kind not in scraper_class.task_kinds:
+                continue
+            if name == 'ai_discovery':
+                return cls.create_scraper(name, environment=environment)
+            return scraper_class(environment=environment)
+        logger.error(f"No scraper processes {kind} tasks")
+        return None
+    
     @classmethod
     def _create_typescript_scraper(cls, **kwargs):
         """
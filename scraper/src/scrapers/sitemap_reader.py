@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+Sitemap Reader
+Streaming sitemap parsing and per-domain lastmod tracking for incremental crawls
+"""
+
+import os
+import gzip
+import json
+import logging
+import threading
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, BinaryIO
+
+logger = logging.getLogger(__name__)
+
+SITEMAP_NAMESPACE = '{http://www.sitemaps.org/schemas/sitemap/0.9}'
+URL_TAG = f'{SITEMAP_NAMESPACE}url'
+SITEMAP_TAG = f'{SITEMAP_NAMESPACE}sitemap'
+LOC_TAG = f'{SITEMAP_NAMESPACE}loc'
+LASTMOD_TAG = f'{SITEMAP_NAMESPACE}lastmod'
+PRIORITY_TAG = f'{SITEMAP_NAMESPACE}priority'
+_ENTRY_FIELD_TAGS = frozenset({LOC_TAG, LASTMOD_TAG, PRIORITY_TAG})
+SITEMAP_READ_CHUNK_BYTES = 64 * 1024
+GZIP_MAGIC = b'\x1f\x8b'
+
+DEFAULT_LASTMOD_STORE_PATH = os.path.join('local_data', 'sitemap_lastmod.json')
+
+
+@dataclass
+class SitemapEntry:
+    """A <url> entry from a sitemap"""
+    url: str
+    priority: Optional[float] = None
+    lastmod: Optional[str] = None
+
+
+class _PrefixedReader:
+    """Read-only stream that replays bytes already consumed from `raw`."""
+
+    def __init__(self, prefix: bytes, raw: BinaryIO):
+        self._prefix = prefix
+        self._raw = raw
+
+    def read(self, size: int = -1) -> bytes:
+        if self._prefix:
+            if size is None or size < 0:
+                data, self._prefix = self._prefix + (self._raw.read() or b''), b''
+                return data
+            data, self._prefix = self._prefix[:size], self._prefix[size:]
+            if len(data) < size:
+                data += self._raw.read(size - len(data)) or b''
+            return data
+        return self._raw.read(size) or b''
+
+
+def open_sitemap_stream(raw: BinaryIO) -> BinaryIO:
+    """Wrap a byte stream so gzipped sitemaps (.xml.gz) are decompressed on the fly.
+
+    Parameters:
+        raw: File-like object with the sitemap bytes (e.g. `response.raw`).
+
+    Returns:
+        Readable stream of the XML bytes.
+    """
+    head = raw.read(2) or b''
+    stream = _PrefixedReader(head, raw)
+    if head == GZIP_MAGIC:
+        return gzip.GzipFile(fileobj=stream)
+    return stream
+
+
+class _SitemapTarget:
+    """XMLParser target that turns <url>/<sitemap> elements into entries.
+
+    Gets expat's callbacks directly, so no Element tree is built: only the
+    text of <loc>, <lastmod> and <priority> is kept until its entry closes.
+    """
+
+    def __init__(self, accept: Optional[Callable[[str], bool]]):
+        self.accept = accept
+        self.entries: List[Tuple[str, SitemapEntry]] = []
+        self._text: Optional[List[str]] = None
+        self._fields: Dict[str, str] = {}
+
+    def start(self, tag: str, attrib: Dict[str, str]):
+        self._text = [] if tag in _ENTRY_FIELD_TAGS else None
+
+    def data(self, data: str):
+        if self._text is not None:
+            self._text.append(data)
+
+    def end(self, tag: str):
+        if self._text is not None:
+            self._fields[tag] = ''.join(self._text)
+            self._text = None
+        elif tag == URL_TAG or tag == SITEMAP_TAG:
+            fields, self._fields = self._fields, {}
+            self._add(tag, fields)
+
+    def _add(self, tag: str, fields: Dict[str, str]):
+        loc = (fields.get(LOC_TAG) or '').strip()
+        if not loc:
+            return
+        lowered = loc.lower()
+        is_child_sitemap = tag == SITEMAP_TAG or (
+            'sitemap' in lowered and lowered.endswith(('.xml', '.xml.gz'))
+        )
+        if not is_child_sitemap and self.accept is not None and not self.accept(loc):
+            return
+        priority = None
+        priority_text = (fields.get(PRIORITY_TAG) or '').strip()
+        if priority_text:
+            try:
+                priority = float(priority_text)
+            except ValueError:
+                pass
+        lastmod = (fields.get(LASTMOD_TAG) or '').strip() or None
+        self.entries.append(('sitemap' if is_child_sitemap else 'url', SitemapEntry(loc, priority, lastmod)))
+
+    def close(self):
+        return None
+
+
+def iter_sitemap(stream: BinaryIO,
+                 accept: Optional[Callable[[str], bool]] = None) -> Iterator[Tuple[str, SitemapEntry]]:
+    """Stream entries out of a sitemap or sitemap index.
+
+    The XML is fed to the parser in chunks and entries are yielded as each
+    chunk completes them; no element tree is kept, so memory stays flat
+    regardless of sitemap size.
+
+    Parameters:
+        stream: Byte stream of (decompressed) sitemap XML.
+        accept: Only build entries for page URLs it returns True for (child
+            sitemaps are always yielded); every page when omitted.
+
+    Returns:
+        Iterator of ('url', entry) for pages and ('sitemap', entry) for child
+        sitemaps listed by an index.
+
+    Raises:
+        xml.etree.ElementTree.ParseError: The XML is malformed.
+    """
+    target = _SitemapTarget(accept)
+    parser = ET.XMLParser(target=target)
+    while True:
+        chunk = stream.read(SITEMAP_READ_CHUNK_BYTES)
+        if not chunk:
+            break
+        parser.feed(chunk)
+        if target.entries:
+            yield from target.entries
+            target.entries.clear()
+    parser.close()
+    yield from target.entries
+
+
+class SitemapLastmodStore:
+    """Per-domain record of the sitemap <lastmod> each URL had when last crawled.
+
+    Backed by a JSON file so recrawls can skip pages whose lastmod has not
+    changed. URLs without a lastmod are always treated as changed.
+    """
+
+    def __init__(self, path: Optional[str] = DEFAULT_LASTMOD_STORE_PATH):
+        self.path = path
+        self._lastmods: Dict[str, Dict[str, str]] = {}
+        self._lock = threading.Lock()
+        self._dirty = False
+        self.load()
+
+    def load(self):
+        """Load the store from disk (missing or corrupt files start empty)."""
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as handle:
+                data = json.load(handle)
+            if isinstance(data, dict):
+                self._lastmods = {domain: dict(urls) for domain, urls in data.items() if isinstance(urls, dict)}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not read sitemap lastmod store {self.path}: {e}")
+
+    def is_changed(self, domain: str, entry: SitemapEntry) -> bool:
+        """Check whether a sitemap entry changed since it was last recorded."""
+        if not entry.lastmod:
+            return True
+        with self._lock:
+            return self._lastmods.get(domain, {}).get(entry.url) != entry.lastmod
+
+    def record(self, domain: str, entry: SitemapEntry):
+        """Remember an entry's lastmod once its page has been crawled."""
+        if not entry.lastmod:
+            return
+        with self._lock:
+            self._lastmods.setdefault(domain, {})[entry.url] = entry.lastmod
+            self._dirty = True
+
+    def save(self):
+        """Write the store to disk if anything was recorded."""
+        if not self.path or not self._dirty:
+            return
+        with self._lock:
+            snapshot = json.dumps(self._lastmods, separators=(',', ':'))
+            self._dirty = False
+        try:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            temp_path = f"{self.path}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as handle:
+                handle.write(snapshot)
+            os.replace(temp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Could not write sitemap lastmod store {self.path}: {e}")
+
+    def __len__(self) -> int:
+        return sum(len(urls) for urls in self._lastmods.values())
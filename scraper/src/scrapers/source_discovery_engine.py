@@ -14,6 +14,8 @@ from dataclasses import dataclass
 from openai import OpenAI
 import requests
 from .config.config_loader import SourceCategoryConfig
+from .relevance_scorer import default_relevance_scorer
+from .http_client import create_session
 from .constants import (
     MAX_GOOGLE_SEARCH_RESULTS,
     MAX_SOURCES_PER_CATEGORY_DEFAULT,
@@ -57,6 +59,9 @@ class SourceDiscoveryEngine:
         self.google_api_key = google_api_key
         self.google_cse_id = google_cse_id
         self.config = SourceCategoryConfig()
+        self.relevance_scorer = default_relevance_scorer()
+        # Kept-alive connection to the search API; 429s are backed off in `_search_google`
+        self.session = create_session(retry_statuses=(500, 502, 503, 504))
         
     def discover_sources(self, categories: Optional[List[str]] = None, max_sources_per_category: int = MAX_SOURCES_PER_CATEGORY_DEFAULT) -> List[DiscoverySource]:
         """Discover scholarship sources for specified categories.
@@ -196,7 +201,7 @@ class SourceDiscoveryEngine:
                 
                 self._last_google_request = time.time()
                 
-                response = requests.get(url, params=params, timeout=30)
+                response = self.session.get(url, params=params, timeout=30)
                 
                 # Handle rate limiting specifically
                 if response.status_code == 429:
@@ -244,6 +249,8 @@ class SourceDiscoveryEngine:
             sources: Search results returned by `_search_google`.
             category_id: The category context to include in the AI prompt for relevance.
 
+        Results the local relevance scorer rejects are dropped without an AI call.
+
         Returns:
             A list of `DiscoverySource` entries filtered to those that the AI considers
             likely to offer scholarships, each with a confidence score.
@@ -252,8 +259,14 @@ class SourceDiscoveryEngine:
         category_name = category.get('name', category_id) if category else category_id
         
         verified_sources = []
+        skipped = 0
         
         for source in sources:
+            if not self.relevance_scorer.is_relevant_source(source.url, source.title, source.description):
+                logger.debug(f"Skipping low-relevance search result {source.url}")
+                skipped += 1
+                continue
+            
             prompt = f"""
             Analyze this website to determine if it offers scholarships for students in {category_name}.
             
@@ -307,6 +320,8 @@ class SourceDiscoveryEngine:
                 logger.error(f"Error verifying source {source.url}: {e}")
                 continue
         
+        if skipped:
+            logger.info(f"Relevance scorer skipped {skipped}/{len(sources)} search results for {category_id}")
         return verified_sources
     
     def get_discovery_statistics(self) -> Dict:
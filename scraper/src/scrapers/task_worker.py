@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Task Worker
+Processes queued detail-page tasks from the shared MySQL task queue
+
+With SCRAPER_TASK_QUEUE set, listing scrapers (and AI discovery) queue their
+detail pages in `scrape_tasks` instead of fetching them. Any number of
+`main.py --worker` processes, on any node pointed at the same database, claim
+batches of tasks, fetch and parse them with the scraper that queued them, and
+save the scholarships through its write-behind writer. Requests to a host are
+spaced `min_interval` apart across all workers via `scrape_host_slots`.
+
+A batch is acknowledged only after its scholarships are written (or
+journaled); tasks of a worker that dies are picked up again when their lease
+expires. While a batch is in progress its leases are renewed from a
+background thread on a second connection; a task whose lease is lost is
+dropped without saving, since another worker now owns it. SIGTERM/SIGINT drain: the task in progress finishes, the rest of the
+batch is handed back, and the worker exits.
+"""
+
+import os
+import signal
+import socket
+import logging
+import threading
+from typing import Dict, List, Optional
+
+from .base_scraper import BaseScraper
+from .constants import SCRAPER_MIN_REQUEST_DELAY_SEC, WORKER_POLL_INTERVAL_SEC
+from .rate_limiter import DatabaseHostRateLimiter
+from .scraper_factory import ScraperFactory
+from ..utils_python.database_manager import DatabaseManagerFactory
+from ..utils_python.task_queue import Task, TaskQueue, LeaseKeeper, DEFAULT_CLAIM_BATCH, DEFAULT_LEASE_SEC
+
+logger = logging.getLogger(__name__)
+
+
+class TaskWorker:
+    """Claim and process tasks until stopped.
+
+    Parameters:
+        environment: Database environment ('local', 'dev', 'staging', 'prod').
+        worker_id: Lease owner name; defaults to hostname:pid.
+        batch_size: Tasks claimed per round trip.
+        lease_sec: Visibility timeout of a claimed batch.
+        poll_interval: Seconds to wait when the queue is empty.
+        min_interval: Seconds between requests to one host, across all workers.
+        kinds: Only claim these task kinds (all kinds when omitted).
+    """
+
+    def __init__(self, environment: str = "local", worker_id: Optional[str] = None,
+                 batch_size: int = DEFAULT_CLAIM_BATCH, lease_sec: float = DEFAULT_LEASE_SEC,
+                 poll_interval: float = WORKER_POLL_INTERVAL_SEC,
+                 min_interval: float = SCRAPER_MIN_REQUEST_DELAY_SEC,
+                 kinds: Optional[List[str]] = None):
+        self.environment = environment
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.kinds = kinds
+        self.db_manager = DatabaseManagerFactory.create_database_manager(environment)
+        self.queue = TaskQueue(self.db_manager, lease_sec=lease_sec)
+        # Lease renewal runs in its own thread, and pymysql connections are not thread-safe
+        self.lease_db_manager = DatabaseManagerFactory.create_database_manager(environment)
+        self.lease_queue = TaskQueue(self.lease_db_manager, lease_sec=lease_sec)
+        self.rate_limiter = DatabaseHostRateLimiter(self.queue, min_interval)
+        self.scrapers: Dict[str, Optional[BaseScraper]] = {}
+        self.completed = 0
+        self.failed = 0
+        self._stopping = threading.Event()
+
+    def stop(self, *_):
+        """Ask the worker to drain: finish the current task, then exit."""
+        if not self._stopping.is_set():
+            logger.info("Stop requested, draining after the current task")
+        self._stopping.set()
+
+    def install_signal_handlers(self):
+        """Drain on SIGTERM and SIGINT (must be called from the main thread)."""
+        signal.signal(signal.SIGTERM, self.stop)
+        signal.signal(signal.SIGINT, self.stop)
+
+    def _scraper(self, kind: str) -> Optional[BaseScraper]:
+        if kind not in self.scrapers:
+            scraper = ScraperFactory.create_task_scraper(kind, self.environment)
+            if scraper is not None:
+                scraper.persistent = True
+                scraper.distributed = False
+            self.scrapers[kind] = scraper
+        return self.scrapers[kind]
+
+    def process(self, task: Task, leases: LeaseKeeper) -> bool:
+        """Fetch, parse and queue the scholarships of one task; returns whether it succeeded."""
+        try:
+            scraper = self._scraper(task.kind)
+            if scraper is None:
+                raise LookupError(f"No scraper available for {task.kind} tasks")
+            self.rate_limiter.wait(task.url)
+            if not leases.holds(task):
+                return False
+            scholarships = scraper.process_task(task)
+            if not leases.holds(task):
+                logger.warning(f"Dropping {len(scholarships)} scholarships of task {task.task_id}: lease lost")
+                return False
+            for scholarship in scholarships:
+                scraper.save_scholarship(scholarship)
+            return True
+        except Exception as e:
+            logger.warning(f"Task {task.task_id} ({task.kind} {task.url}) failed, attempt "
+                           f"{task.attempts}/{task.max_attempts}: {e}")
+            leases.drop([task])
+            try:
+                self.queue.fail(task, str(e), self.worker_id)
+            except Exception as fail_error:
+                logger.error(f"Could not record failure of task {task.task_id}: {fail_error}")
+            self.failed += 1
+            return False
+
+    def run_batch(self) -> int:
+        """Claim and process one batch; returns the number of tasks claimed."""
+        tasks = self.queue.claim(self.worker_id, self.batch_size, self.kinds)
+        done: List[int] = []
+        with LeaseKeeper(self.lease_queue, self.worker_id, tasks) as leases:
+            for index, task in enumerate(tasks):
+                if self._stopping.is_set():
+                    leases.drop(tasks[index:])
+                    self.queue.release(tasks[index:], self.worker_id)
+                    break
+                if self.process(task, leases):
+                    done.append(task.task_id)
+            if done:
+                # Acknowledge only what is written (or journaled) locally
+                for scraper in self.scrapers.values():
+                    if scraper is not None:
+                        scraper.flush_scholarships()
+                self.queue.complete(done, self.worker_id)
+                self.completed += len(done)
+        return len(tasks)
+
+    def serve_forever(self):
+        """Process tasks until stopped, then release every scraper."""
+        logger.info(f"Task worker {self.worker_id} started ({self.environment})")
+        try:
+            self.queue.ensure_tables()
+            while not self._stopping.is_set():
+                try:
+                    claimed = self.run_batch()
+                except Exception as e:
+                    logger.error(f"Task queue unavailable: {e}")
+                    self.db_manager.ping()
+                    self.lease_db_manager.ping()
+                    claimed = 0
+                if not claimed:
+                    self._stopping.wait(self.poll_interval)
+        finally:
+            self.shutdown()
+
+    def shutdown(self):
+        """Flush and close every scraper and the queue connection."""
+        for kind, scraper in list(self.scrapers.items()):
+            if scraper is None:
+                continue
+            try:
+                scraper.close()
+            except Exception as e:
+                logger.warning(f"Error closing scraper for {kind}: {e}")
+        self.scrapers.clear()
+        self.db_manager.disconnect()
+        self.lease_db_manager.disconnect()
+        logger.info(f"Task worker {self.worker_id} stopped: {self.completed} tasks done, {self.failed} failed attempts")
+
+
+def run_worker(environment: str = "local", worker_id: Optional[str] = None):
+    """Run a task worker in the foreground until SIGTERM/SIGINT."""
+    worker = TaskWorker(environment, worker_id=worker_id or os.getenv('SCRAPER_WORKER_ID'))
+    worker.install_signal_handlers()
+    worker.serve_forever()
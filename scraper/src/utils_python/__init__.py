@@ -3,7 +3,8 @@ Python utilities package for the scholarship tracker scraper system.
 """
 
 from .config_manager import get_scraper_type
-from .scholarship_types import Scholarship, ScrapingResult, ScrapingMetadata
+from .scholarship_types import Scholarship, ScrapingResult, ScrapingMetadata, SCHOLARSHIP_FIELDS
+from .scholarship_batch import ScholarshipBatch
 from .shared_keywords import (
     SCHOLARSHIP_KEYWORDS,
     ACADEMIC_LEVEL_KEYWORDS,
@@ -13,6 +14,7 @@ from .shared_keywords import (
     get_keywords_by_category
 )
 from .helper import normalize_deadline_value
+from .deadline_parser import parse_deadline
 
 __all__ = [
     # Config manager
@@ -22,6 +24,8 @@ __all__ = [
     'Scholarship',
     'ScrapingResult', 
     'ScrapingMetadata',
+    'SCHOLARSHIP_FIELDS',
+    'ScholarshipBatch',
     
     # Keywords
     'SCHOLARSHIP_KEYWORDS',
@@ -33,4 +37,5 @@ __all__ = [
     
     # Data normalization
     'normalize_deadline_value',
+    'parse_deadline',
 ]
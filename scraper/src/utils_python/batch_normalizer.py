@@ -0,0 +1,161 @@
+"""
+Column-wise normalization of scholarship batches for bulk upserts.
+
+`DatabaseManager._scholarship_params` normalizes one row at a time. For large
+batches this module does the same work a column at a time:
+
+- repeated values (deadlines, organizations, eligibility lists, GPAs) are
+  dictionary-encoded with pandas and each distinct value is normalized once,
+- the per-row "which columns are non-null" masks are computed with numpy and
+  rows sharing a mask are emitted together as one upsert group.
+
+The output is identical to running the per-row path over every row.
+"""
+
+import logging
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .scholarship_types import Scholarship, SCHOLARSHIP_FIELDS
+from .scholarship_batch import ScholarshipBatch
+
+logger = logging.getLogger(__name__)
+
+UpsertGroups = Dict[Tuple[str, ...], List[Tuple[Any, ...]]]
+
+_KEY_TEXT_FIELDS = ('title', 'organization')
+
+
+def _columns_of(scholarships: Iterable[Scholarship]) -> Dict[str, List[Any]]:
+    if isinstance(scholarships, ScholarshipBatch):
+        return scholarships.columns()
+    batch = ScholarshipBatch(scholarships)
+    return batch.columns()
+
+
+def _map_distinct(values: List[Any], normalize: Callable[[Any], Any], hashable: bool = True) -> np.ndarray:
+    """Apply `normalize` once per distinct value and broadcast back to every row."""
+    if not values:
+        return np.empty(0, dtype=object)
+    if hashable:
+        codes, uniques = pd.factorize(pd.Series(values, dtype=object))
+        normalized = np.empty(len(uniques) + 1, dtype=object)
+        normalized[:-1] = [normalize(value) for value in uniques]
+        out = normalized.take(codes)
+        # factorize folds None/NaN into the -1 sentinel; normalize those rows as-is
+        for index in np.flatnonzero(codes < 0):
+            out[index] = normalize(values[index])
+        return out
+
+    # Collections are keyed on (type, *items); unhashable items fall back to per-row work
+    cache: Dict[Any, Any] = {}
+    out = np.empty(len(values), dtype=object)
+    for index, value in enumerate(values):
+        value_type = value.__class__
+        if value_type is list or value_type is tuple:
+            key = (value_type, *value)
+        elif value_type is set or value_type is frozenset:
+            # Set iteration order is per-object, so never share results
+            out[index] = normalize(value)
+            continue
+        else:
+            key = (value_type, value)
+        try:
+            out[index] = cache[key]
+        except KeyError:
+            out[index] = cache[key] = normalize(value)
+        except TypeError:
+            out[index] = normalize(value)
+    return out
+
+
+def _object_array(values: List[Any]) -> np.ndarray:
+    array = np.empty(len(values), dtype=object)
+    array[:] = values
+    return array
+
+
+def normalize_scholarship_batch(scholarships: Iterable[Scholarship],
+                                now: Optional[datetime] = None) -> UpsertGroups:
+    """Normalize a batch of scholarships into grouped upsert parameters.
+
+    Parameters:
+        scholarships: A `ScholarshipBatch` or any iterable of `Scholarship`.
+        now: Timestamp used for updated_at (and created_at when missing);
+            defaults to the current time.
+
+    Returns:
+        Mapping of column tuple -> parameter tuples, in first-seen order. Each
+        entry matches what `_scholarship_params(_stamp_row(row, now))` yields
+        for the rows in that group.
+    """
+    # Imported here to avoid a circular import at module load
+    from .database_manager import DatabaseManager, COLLECTION_FIELDS
+
+    now = now or datetime.now()
+    raw = _columns_of(scholarships)
+    row_count = len(raw['title'])
+    if not row_count:
+        return {}
+
+    normalized: Dict[str, np.ndarray] = {}
+
+    for name in _KEY_TEXT_FIELDS:
+        series = pd.Series(raw[name], dtype=object)
+        series = series.where(series.astype(bool), '')
+        normalized[name] = series.str.strip().to_numpy(dtype=object)
+
+    normalized['deadline'] = _map_distinct(
+        raw['deadline'],
+        lambda value: (DatabaseManager._normalize_deadline(value) or "").strip(),
+    )
+
+    created = [value if value else now for value in raw['created_at']]
+    normalized['created_at'] = _map_distinct(
+        created, lambda value: value.isoformat() if isinstance(value, datetime) else value
+    )
+    normalized['updated_at'] = np.full(row_count, now.isoformat(), dtype=object)
+
+    for name in COLLECTION_FIELDS:
+        normalized[name] = _map_distinct(
+            raw[name],
+            lambda value: DatabaseManager._normalize_string_collection(value, lowercase=True),
+            hashable=False,
+        )
+
+    def normalize_gpa(value: Any) -> Any:
+        if value is None or value == '':
+            return None
+        try:
+            return round(float(value), 2)
+        except (TypeError, ValueError):
+            return None
+
+    normalized['min_gpa'] = _map_distinct(raw['min_gpa'], normalize_gpa, hashable=False)
+
+    for name in SCHOLARSHIP_FIELDS:
+        if name not in normalized:
+            normalized[name] = _object_array(raw[name])
+
+    # Presence mask -> one integer signature per row
+    present = np.column_stack([normalized[name] != None for name in SCHOLARSHIP_FIELDS])  # noqa: E711
+    weights = np.left_shift(np.int64(1), np.arange(len(SCHOLARSHIP_FIELDS), dtype=np.int64))
+    signatures = present.astype(np.int64) @ weights
+
+    _, first_index, inverse = np.unique(signatures, return_index=True, return_inverse=True)
+    order = np.argsort(inverse, kind='stable')
+    boundaries = np.cumsum(np.bincount(inverse))[:-1]
+    members_by_group = np.split(order, boundaries)
+
+    groups: UpsertGroups = {}
+    for group in np.argsort(first_index, kind='stable'):
+        members = members_by_group[group]
+        mask = present[members[0]]
+        columns = tuple(name for name, keep in zip(SCHOLARSHIP_FIELDS, mask) if keep)
+        groups[columns] = list(zip(*(normalized[name].take(members) for name in columns)))
+
+    logger.debug(f"Normalized {row_count} scholarships into {len(groups)} upsert groups")
+    return groups
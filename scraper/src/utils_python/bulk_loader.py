@@ -0,0 +1,208 @@
+"""
+Bulk ingest of scholarships with LOAD DATA LOCAL INFILE.
+
+`DatabaseManager.save_scholarships` sends batched upserts, which is fine for a
+scrape but slow for full re-syncs or replays of archived pages. `BulkLoader`
+instead:
+
+1. normalizes the scholarships chunk by chunk with `batch_normalizer` (and the
+   near-duplicate index, like the upsert path) and streams them to a TSV temp
+   file,
+2. loads that file into a staging table with one `LOAD DATA LOCAL INFILE`,
+3. keeps only the last row per (title, organization, deadline) key, flags the
+   staged rows that match an existing row and whether they would change it,
+4. merges every new or changed row into `scholarships` with one set-based
+   `INSERT ... SELECT ... ON DUPLICATE KEY UPDATE`.
+
+Unchanged rows are not touched, so their updated_at stays put. Like the
+upsert path, NULL columns never overwrite stored values. The server must allow
+`local_infile` (e.g. start the MySQL/MariaDB container with --local-infile=1).
+"""
+
+import os
+import json
+import logging
+import tempfile
+from dataclasses import dataclass
+from datetime import datetime
+from itertools import islice
+from typing import Any, Iterable, Iterator, List, Tuple
+
+from .scholarship_types import Scholarship, SCHOLARSHIP_FIELDS
+
+DEFAULT_BULK_CHUNK_ROWS = 50_000
+
+# Loaded columns; rows are matched on the unique key, never on scholarship_id
+BULK_COLUMNS: Tuple[str, ...] = tuple(name for name in SCHOLARSHIP_FIELDS if name != 'scholarship_id')
+KEY_COLUMNS = ('title', 'organization', 'deadline')
+# Columns compared to decide whether a staged row changes the stored one
+COMPARED_COLUMNS = tuple(name for name in BULK_COLUMNS if name not in KEY_COLUMNS + ('created_at', 'updated_at'))
+
+_TSV_ESCAPES = str.maketrans({'\\': '\\\\', '\t': '\\t', '\n': '\\n', '\r': '\\r', '\0': '\\0'})
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class BulkLoadResult:
+    """Row counts of a bulk load."""
+    rows: int = 0
+    inserted: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    duplicates: int = 0
+
+
+def tsv_field(value: Any) -> str:
+    """Render one value the way LOAD DATA reads it with its default escaping."""
+    if value is None:
+        return '\\N'
+    if isinstance(value, bool):
+        return '1' if value else '0'
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value).translate(_TSV_ESCAPES)
+
+
+def read_scholarships_jsonl(path: str) -> Iterator[Scholarship]:
+    """Stream scholarships from a JSON Lines file (one `Scholarship.to_dict()` per line)."""
+    with open(path, 'r', encoding='utf-8') as handle:
+        for number, line in enumerate(handle, 1):
+            if not line.strip():
+                continue
+            try:
+                yield Scholarship.from_dict(json.loads(line))
+            except (ValueError, TypeError) as e:
+                logger.warning(f"Skipping unreadable scholarship on line {number} of {path}: {e}")
+
+
+class BulkLoader:
+    """Load many scholarships through a staging table in a few statements.
+
+    Parameters:
+        db_manager: Database manager to load through. Its connection is
+            reopened with `local_infile` enabled.
+        chunk_rows: Scholarships normalized at a time while writing the file.
+    """
+
+    def __init__(self, db_manager, chunk_rows: int = DEFAULT_BULK_CHUNK_ROWS):
+        self.db_manager = db_manager
+        self.chunk_rows = max(1, chunk_rows)
+        if not db_manager.local_infile:
+            db_manager.local_infile = True
+            if db_manager.connection and db_manager.connection.open:
+                db_manager.connection.close()
+
+    def write_tsv(self, scholarships: Iterable[Scholarship], handle) -> int:
+        """Normalize scholarships and write them as LOAD DATA rows in `BULK_COLUMNS` order.
+
+        Returns:
+            Number of rows written.
+        """
+        # pandas/numpy are only needed on the bulk path, keep them off the import path
+        from .batch_normalizer import normalize_scholarship_batch
+
+        position = {name: index for index, name in enumerate(BULK_COLUMNS)}
+        now = datetime.now()
+        written = 0
+        iterator = iter(scholarships)
+        while True:
+            chunk = list(islice(iterator, self.chunk_rows))
+            if not chunk:
+                return written
+            for columns, params in normalize_scholarship_batch(chunk, now).items():
+                slots = [position.get(name) for name in columns]
+                for row in self.db_manager._merge_near_duplicate_params(columns, params):
+                    values: List[Any] = [None] * len(BULK_COLUMNS)
+                    for slot, value in zip(slots, row):
+                        if slot is not None:
+                            values[slot] = value
+                    handle.write('\t'.join(tsv_field(value) for value in values))
+                    handle.write('\n')
+                    written += 1
+
+    def load(self, scholarships: Iterable[Scholarship]) -> BulkLoadResult:
+        """Stage and merge scholarships into the scholarships table.
+
+        Parameters:
+            scholarships: Any iterable of `Scholarship`; consumed in chunks.
+
+        Returns:
+            A `BulkLoadResult` with inserted, updated and unchanged counts
+            (rows repeating a key earlier in the input count as duplicates).
+        """
+        result = BulkLoadResult()
+        handle = tempfile.NamedTemporaryFile('w', encoding='utf-8', newline='\n',
+                                             suffix='.tsv', delete=False)
+        try:
+            with handle:
+                result.rows = self.write_tsv(scholarships, handle)
+            if not result.rows:
+                return result
+            self._merge_file(handle.name, result)
+        finally:
+            os.unlink(handle.name)
+        self.db_manager.save_near_duplicate_index()
+        logger.info(f"Bulk loaded {result.rows} scholarships ({self.db_manager.environment} DB): "
+                    f"{result.inserted} inserted, {result.updated} updated, {result.unchanged} unchanged, "
+                    f"{result.duplicates} duplicates in input")
+        return result
+
+    def _merge_file(self, path: str, result: BulkLoadResult):
+        conn = self.db_manager.get_connection()
+        if not conn:
+            raise ConnectionError(f"No {self.db_manager.environment} database connection for bulk load")
+        staging = f"scholarships_staging_{os.getpid()}"
+        column_list = ', '.join(BULK_COLUMNS)
+        key_match = ' AND '.join(f"t.{name} = s.{name}" for name in KEY_COLUMNS)
+        unchanged = ' AND '.join(f"(s.{name} IS NULL OR s.{name} <=> t.{name})" for name in COMPARED_COLUMNS)
+        updates = ', '.join(f"{name} = COALESCE(VALUES({name}), scholarships.{name})"
+                            for name in BULK_COLUMNS if name != 'created_at' and name != 'updated_at')
+
+        cursor = conn.cursor()
+        try:
+            cursor.execute(f"DROP TABLE IF EXISTS {staging}")
+            # Regular table: MySQL cannot self-join a TEMPORARY table for the dedupe below
+            cursor.execute(
+                f"CREATE TABLE {staging} ("
+                f"seq BIGINT AUTO_INCREMENT PRIMARY KEY, "
+                f"matched TINYINT NOT NULL DEFAULT 0, "
+                f"unchanged TINYINT NOT NULL DEFAULT 0, "
+                f"INDEX idx_key (title(191), organization(191), deadline(191))"
+                f") SELECT {column_list} FROM scholarships WHERE 1 = 0"
+            )
+            cursor.execute(
+                f"LOAD DATA LOCAL INFILE %s INTO TABLE {staging} CHARACTER SET utf8mb4 "
+                f"FIELDS TERMINATED BY '\\t' ESCAPED BY '\\\\' LINES TERMINATED BY '\\n' ({column_list})",
+                (path,)
+            )
+            result.duplicates = cursor.execute(
+                f"DELETE s FROM {staging} s JOIN {staging} t ON {key_match} AND s.seq < t.seq"
+            )
+            cursor.execute(
+                f"UPDATE {staging} s JOIN scholarships t ON {key_match} "
+                f"SET s.matched = 1, s.unchanged = ({unchanged})"
+            )
+            cursor.execute(f"SELECT COUNT(*) AS staged, COALESCE(SUM(matched), 0) AS matched, "
+                           f"COALESCE(SUM(unchanged), 0) AS unchanged FROM {staging}")
+            counts = cursor.fetchone()
+            if not isinstance(counts, dict):
+                counts = dict(zip(('staged', 'matched', 'unchanged'), counts))
+            result.inserted = int(counts['staged']) - int(counts['matched'])
+            result.unchanged = int(counts['unchanged'])
+            result.updated = int(counts['matched']) - result.unchanged
+            cursor.execute(
+                f"INSERT INTO scholarships ({column_list}) "
+                f"SELECT {column_list} FROM {staging} WHERE unchanged = 0 ORDER BY seq "
+                f"ON DUPLICATE KEY UPDATE {updates}, updated_at = CURRENT_TIMESTAMP"
+            )
+            conn.commit()
+        except Exception as e:
+            conn.rollback()
+            logger.error(f"Bulk load failed ({self.db_manager.environment} DB): {e}")
+            raise
+        finally:
+            try:
+                cursor.execute(f"DROP TABLE IF EXISTS {staging}")
+            finally:
+                cursor.close()
@@ -6,15 +6,77 @@ Database Manager - Abstract database operations for different environments
 import os
 import json
 import logging
-import re
+import threading
 import pymysql
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any
+from functools import lru_cache
+from itertools import compress, repeat
+from typing import Optional, Dict, Any, Iterable, List, Sequence, Tuple
 from datetime import datetime
-from calendar import month_abbr
+from json.encoder import encode_basestring_ascii
+
+from .scholarship_types import Scholarship, SCHOLARSHIP_FIELDS
+from .scholarship_batch import scholarship_row
+from .deadline_parser import parse_deadline
+from .near_duplicates import DEFAULT_NEAR_DUPLICATE_INDEX_PATH, NearDuplicateIndex, ScholarshipKey
+
+# Fields stored as normalized, lowercased JSON string arrays
+COLLECTION_FIELDS = frozenset({
+    'subject_areas', 'eligibility', 'academic_level', 'geographic_restrictions', 'ethnicity'
+})
+
+_FIELD_INDEX = {name: index for index, name in enumerate(SCHOLARSHIP_FIELDS)}
+
+# Row positions `_scholarship_params` converts; every other value is passed through as is
+_COLLECTION_INDEXES = tuple(index for index, name in enumerate(SCHOLARSHIP_FIELDS) if name in COLLECTION_FIELDS)
+_DATETIME_INDEXES = (_FIELD_INDEX['created_at'], _FIELD_INDEX['updated_at'])
+_MIN_GPA_INDEX = _FIELD_INDEX['min_gpa']
+# Collection values (states, levels, ethnicities) repeat across rows; their JSON is cached
+COLLECTION_CACHE_SIZE = 4096
+
+# Path of the near-duplicate index file; set to an empty string to write exact keys only
+NEAR_DUPLICATE_INDEX_ENV = 'SCRAPER_NEAR_DUPLICATE_INDEX'
+NEAR_DUPLICATE_REBUILD_FETCH_SIZE = 5000
+# Single-row saves rewrite the index file once this many spellings are pending
+# (batches save after each transaction, and every manager saves on disconnect)
+NEAR_DUPLICATE_SAVE_EVERY = 1000
+
+# One near-duplicate index per file for the whole process, shared by every manager
+# (each scraper's writer, the bulk loader, task workers)
+_near_duplicate_indexes: Dict[str, NearDuplicateIndex] = {}
+_near_duplicate_indexes_lock = threading.Lock()
+
+JOB_FINAL_STATUSES = ('completed', 'failed')
+
+# One round trip per status change: insert the job or update it in place
+JOB_STATUS_UPSERT = """
+    INSERT INTO jobs (
+        job_id, website, status, records_found, records_processed,
+        records_inserted, records_updated, errors, metadata,
+        started_at, completed_at, created_at, updated_at
+    ) VALUES (
+        %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP
+    )
+    ON DUPLICATE KEY UPDATE
+        started_at = IF(VALUES(status) = 'running', VALUES(started_at), started_at),
+        records_found = IF(VALUES(status) IN ('completed', 'failed'), VALUES(records_found), records_found),
+        records_processed = IF(VALUES(status) IN ('completed', 'failed'), VALUES(records_processed), records_processed),
+        records_inserted = IF(VALUES(status) IN ('completed', 'failed'), VALUES(records_inserted), records_inserted),
+        records_updated = IF(VALUES(status) IN ('completed', 'failed'), VALUES(records_updated), records_updated),
+        errors = IF(VALUES(status) IN ('completed', 'failed'), VALUES(errors), errors),
+        metadata = IF(VALUES(status) IN ('completed', 'failed'), VALUES(metadata), metadata),
+        completed_at = IF(VALUES(status) IN ('completed', 'failed'), VALUES(completed_at), completed_at),
+        status = VALUES(status),
+        updated_at = CURRENT_TIMESTAMP
+"""
 
-MONTH_LOOKUP = {abbr.lower(): index for index, abbr in enumerate(month_abbr) if abbr}
-from .scholarship_types import Scholarship
+# Progress heartbeat of a running job; JSON_EXTRACT parses the JSON text on MySQL and MariaDB
+JOB_PROGRESS_UPDATE = """
+    UPDATE jobs SET
+        metadata = JSON_SET(COALESCE(metadata, JSON_OBJECT()), '$.progress', JSON_EXTRACT(%s, '$')),
+        updated_at = CURRENT_TIMESTAMP
+    WHERE job_id = %s AND status = 'running'
+"""
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +87,10 @@ class DatabaseManager(ABC):
     def __init__(self, environment: str):
         self.environment = environment
         self.connection = None
+        # Allow LOAD DATA LOCAL INFILE on new connections (set by `BulkLoader`)
+        self.local_infile = False
+        self._near_duplicates: Optional[NearDuplicateIndex] = None
+        self._near_duplicates_loaded = False
     
     @abstractmethod
     def connect(self) -> bool:
@@ -46,6 +112,103 @@ class DatabaseManager(ABC):
         """Update job status"""
         pass
 
+    @staticmethod
+    def _job_website(metadata: Any) -> str:
+        """Website a job belongs to, from its metadata."""
+        if hasattr(metadata, 'website') and metadata.website:
+            return metadata.website
+        if isinstance(metadata, dict) and metadata.get('website'):
+            return metadata['website']
+        # Fallback: try to extract from class name or use default
+        class_name = metadata.__class__.__name__
+        if 'Scraper' in class_name:
+            return class_name.replace('Scraper', '').lower()
+        return 'unknown'
+
+    def _upsert_job_status(self, status: str, metadata: Any, job_id_prefix: str):
+        """Write a job status change with a single INSERT ... ON DUPLICATE KEY UPDATE.
+
+        A 'running' update (re)sets started_at; 'completed' and 'failed' set
+        the record counts, errors, metadata and completed_at. Other statuses
+        only change the status. Errors are logged, never raised, so status
+        bookkeeping cannot fail a scrape.
+
+        Parameters:
+            status: One of 'running', 'completed', 'failed' (or 'pending').
+            metadata: `ScrapingMetadata` or dict with job_id, website and counts.
+            job_id_prefix: Prefix of the job_id generated when metadata has none.
+        """
+        try:
+            conn = self.get_connection()
+            if not conn:
+                logger.error(f"Failed to get database connection for job status update. Host: {self.host}, Database: {self.database}")
+                return
+        except Exception as e:
+            logger.error(f"Exception getting database connection for job status update: {e}")
+            return
+
+        cursor = conn.cursor()
+        try:
+            job_id = getattr(metadata, 'job_id', None) or (metadata.get('job_id') if isinstance(metadata, dict) else None)
+            if not job_id:
+                # Generate a job_id if not provided
+                job_id = f"{job_id_prefix}_{int(datetime.now().timestamp())}"
+            website = self._job_website(metadata)
+
+            # Convert metadata to JSON-serializable format
+            metadata_dict = {}
+            if hasattr(metadata, '__dict__'):
+                metadata_dict = {k: v for k, v in metadata.__dict__.items() if v is not None}
+            elif isinstance(metadata, dict):
+                metadata_dict = metadata
+            errors = metadata_dict.get('errors')
+            now = datetime.now()
+
+            cursor.execute(JOB_STATUS_UPSERT, (
+                job_id,
+                website,
+                status,
+                metadata_dict.get('records_found', 0),
+                metadata_dict.get('records_processed', 0),
+                metadata_dict.get('records_inserted', 0),
+                metadata_dict.get('records_updated', 0),
+                json.dumps(errors) if errors else None,
+                json.dumps(metadata_dict, default=str),
+                now if status == 'running' else None,
+                now if status in JOB_FINAL_STATUSES else None,
+            ))
+            conn.commit()
+            logger.info(f"Job status updated in {self.environment} DB: {job_id} - {status} - Website: {website}")
+        except Exception as e:
+            conn.rollback()
+            logger.error(f"Failed to update job status in {self.environment} DB: {e}")
+        finally:
+            cursor.close()
+
+    def record_job_progress(self, job_id: str, progress: Dict[str, Any]) -> bool:
+        """Store a progress heartbeat on a running job.
+
+        The progress lands in metadata.progress and bumps updated_at, so a
+        running job whose updated_at stops moving belongs to a stalled worker.
+
+        Returns:
+            True if a running job row was updated.
+        """
+        conn = self.get_connection()
+        if not conn:
+            return False
+        cursor = conn.cursor()
+        try:
+            updated = cursor.execute(JOB_PROGRESS_UPDATE, (json.dumps(progress), job_id))
+            conn.commit()
+            return bool(updated)
+        except Exception as e:
+            conn.rollback()
+            logger.warning(f"Failed to record progress for job {job_id} in {self.environment} DB: {e}")
+            return False
+        finally:
+            cursor.close()
+
     @staticmethod
     def _normalize_string_collection(value: Any, lowercase: bool = True) -> Optional[str]:
         def normalize_items(items) -> list[str]:
@@ -123,25 +286,246 @@ class DatabaseManager(ABC):
         if not trimmed:
             return None
 
-        if re.fullmatch(r"\d{4}-\d{2}-\d{2}", trimmed):
-            return trimmed
+        # Keep free-text deadlines ("Rolling", "Varies by program") as scraped
+        return parse_deadline(trimmed) or trimmed
+
+    @classmethod
+    def _stamp_row(cls, row: Sequence[Any], now: datetime) -> List[Any]:
+        """Apply the timestamp and dedupe-key defaults `save_scholarship` sets on the object.
+
+        Parameters:
+            row: Field values in `SCHOLARSHIP_FIELDS` order.
+            now: Timestamp to use for created_at (when missing) and updated_at.
+
+        Returns:
+            A new list of field values ready for `_scholarship_params`.
+        """
+        values = list(row)
+        if not values[_FIELD_INDEX['created_at']]:
+            values[_FIELD_INDEX['created_at']] = now
+        values[_FIELD_INDEX['updated_at']] = now
+        values[_FIELD_INDEX['title']] = (values[_FIELD_INDEX['title']] or "").strip()
+        values[_FIELD_INDEX['organization']] = (values[_FIELD_INDEX['organization']] or "").strip()
+        deadline = cls._normalize_deadline(values[_FIELD_INDEX['deadline']])
+        values[_FIELD_INDEX['deadline']] = (deadline or "").strip()
+        return values
+
+    @classmethod
+    def _scholarship_params(cls, row: Sequence[Any]) -> Tuple[Tuple[str, ...], Tuple[Any, ...]]:
+        """Turn a scholarship row into the column names and parameters to upsert.
+
+        None values are omitted so AUTO_INCREMENT and column defaults apply,
+        created_at/updated_at are serialized, list fields become JSON arrays and min_gpa is
+        rounded to two decimals (dropped when it is not numeric).
+
+        Parameters:
+            row: Field values in `SCHOLARSHIP_FIELDS` order.
+
+        Returns:
+            A `(columns, params)` pair of equal-length tuples.
+        """
+        values = list(row)
+        for index in _COLLECTION_INDEXES:
+            if values[index] is not None:
+                values[index] = cls._collection_param(values[index])
+        for index in _DATETIME_INDEXES:
+            if isinstance(values[index], datetime):
+                values[index] = values[index].isoformat()
+        gpa = values[_MIN_GPA_INDEX]
+        if gpa is not None:
+            try:
+                values[_MIN_GPA_INDEX] = round(float(gpa), 2) if gpa != '' else None
+            except (TypeError, ValueError):
+                values[_MIN_GPA_INDEX] = None
+        present = [value is not None for value in values]
+        return tuple(compress(SCHOLARSHIP_FIELDS, present)), tuple(compress(values, present))
+
+    @staticmethod
+    def _collection_param(value: Any) -> Optional[str]:
+        """`_normalize_string_collection` for a row value, cached for lists of strings and plain strings."""
+        if isinstance(value, (list, tuple)):
+            # Only all-string keys: 1, 1.0 and True hash alike but normalize differently
+            if all(map(isinstance, value, repeat(str))):
+                return DatabaseManager._string_list_json(tuple(value))
+        elif isinstance(value, str):
+            trimmed = value.strip()
+            # Only a JSON array can come out of json.loads as a list; anything else is comma-separated
+            if not trimmed.startswith('['):
+                return DatabaseManager._string_list_json(tuple(trimmed.split(',')))
+        return DatabaseManager._normalize_string_collection(value, lowercase=True)
+
+    @staticmethod
+    @lru_cache(maxsize=COLLECTION_CACHE_SIZE)
+    def _string_list_json(items: Tuple[str, ...]) -> Optional[str]:
+        """`_normalize_string_collection` of a sequence of strings, without the per-item type checks.
+
+        Joins the C string encoder's output the way `json.dumps` lays out a
+        list (", " separators, ASCII escapes), minus its per-call overhead.
+        """
+        normalized = [item for item in [item.strip().lower() for item in items] if item]
+        return f"[{', '.join(map(encode_basestring_ascii, normalized))}]" if normalized else None
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _upsert_query(columns: Tuple[str, ...]) -> str:
+        """Build (and cache) the INSERT ... ON DUPLICATE KEY UPDATE for a column set."""
+        placeholders = ', '.join(['%s'] * len(columns))
+        updates = ', '.join([f"{k} = VALUES({k})" for k in columns if k not in ['scholarship_id', 'created_at']])
+        return (
+            f"INSERT INTO scholarships ({', '.join(columns)}) VALUES ({placeholders}) "
+            f"ON DUPLICATE KEY UPDATE {updates}, updated_at = CURRENT_TIMESTAMP"
+        )
+
+    def near_duplicate_index(self) -> Optional[NearDuplicateIndex]:
+        """Index used to merge near-duplicate scholarships into existing rows.
+
+        Loaded from its file on first use, or rebuilt from the scholarships
+        table when there is no file yet, and shared by every manager in the
+        process. None when disabled via SCRAPER_NEAR_DUPLICATE_INDEX=''.
+        """
+        if self._near_duplicates_loaded:
+            return self._near_duplicates
+        self._near_duplicates_loaded = True
+        path = os.getenv(NEAR_DUPLICATE_INDEX_ENV, DEFAULT_NEAR_DUPLICATE_INDEX_PATH)
+        if not path:
+            return None
+        with _near_duplicate_indexes_lock:
+            index = _near_duplicate_indexes.get(path)
+            if index is None:
+                index = NearDuplicateIndex(path)
+                if index.exists or self._rebuild_near_duplicate_index(index):
+                    _near_duplicate_indexes[path] = index
+                else:
+                    # Without the stored rows the file would look complete; keep this one
+                    # in memory and let the next manager (or run) try the rebuild again
+                    index.path = None
+        self._near_duplicates = index
+        return index
+
+    def _rebuild_near_duplicate_index(self, index: NearDuplicateIndex) -> bool:
+        """Index every stored scholarship, streaming rows from the server.
+
+        Returns:
+            True if every row was indexed.
+        """
+        conn = self.get_connection()
+        if not conn:
+            return False
+        cursor = conn.cursor(pymysql.cursors.SSCursor)
+        try:
+            cursor.execute("SELECT title, organization, deadline, description, apply_url FROM scholarships")
+            count = 0
+            while True:
+                rows = cursor.fetchmany(NEAR_DUPLICATE_REBUILD_FETCH_SIZE)
+                if not rows:
+                    break
+                count += index.add_rows(rows)
+            logger.info(f"Built near-duplicate index from {count} scholarships ({self.environment} DB)")
+        except Exception as e:
+            logger.warning(f"Could not build near-duplicate index from {self.environment} DB: {e}")
+            return False
+        finally:
+            cursor.close()
+        index.save()
+        return True
+
+    def _canonical_key(self, title: str, organization: str, deadline: str,
+                       description: Optional[str], apply_url: Optional[str]) -> ScholarshipKey:
+        """Key of the existing row a scholarship near-duplicates, else its own key."""
+        index = self.near_duplicate_index()
+        if index is None:
+            return title, organization, deadline
+        return index.canonical_key(title, organization, deadline, description, apply_url)
+
+    def _merge_near_duplicate_params(self, columns: Tuple[str, ...], params: List[Tuple[Any, ...]]) -> List[Tuple[Any, ...]]:
+        """Rewrite the key columns of upsert parameters to their canonical keys."""
+        if self.near_duplicate_index() is None:
+            return params
+        position = {name: index for index, name in enumerate(columns)}
+        key_positions = (position['title'], position['organization'], position['deadline'])
+        description_at = position.get('description')
+        apply_url_at = position.get('apply_url')
+        merged = []
+        for row in params:
+            key = self._canonical_key(
+                *(row[at] for at in key_positions),
+                row[description_at] if description_at is not None else None,
+                row[apply_url_at] if apply_url_at is not None else None,
+            )
+            if key != tuple(row[at] for at in key_positions):
+                row = list(row)
+                for at, value in zip(key_positions, key):
+                    row[at] = value
+                row = tuple(row)
+            merged.append(row)
+        return merged
+
+    def save_near_duplicate_index(self, min_unsaved: int = 1):
+        """Persist spellings added to the near-duplicate index.
+
+        Parameters:
+            min_unsaved: Only write once at least this many spellings are
+                pending; saving merges and rewrites the whole file.
+        """
+        if self._near_duplicates is not None and self._near_duplicates.unsaved >= min_unsaved:
+            self._near_duplicates.save()
+
+    def save_scholarships(self, scholarships: Iterable[Scholarship]) -> int:
+        """Upsert many scholarships in one transaction.
+
+        Rows are normalized column-wise (see `batch_normalizer`) and grouped by
+        the set of non-null columns they carry, so each group is written with a
+        single multi-row `executemany` carrying the same values
+        `save_scholarship` would write row by row. Near-duplicates of stored
+        scholarships are written under the existing row's key.
+
+        Parameters:
+            scholarships: A `ScholarshipBatch` or any iterable of `Scholarship`.
+
+        Returns:
+            Number of rows sent to the database.
+        """
+        conn = self.get_connection()
+        if not conn:
+            return 0
 
-        short_month_match = re.fullmatch(r"(?i)([A-Za-z]{3})\s+(\d{1,2})(st|nd|rd|th)?", trimmed)
-        if short_month_match:
-            month_token = short_month_match.group(1).lower()
-            day_token = short_month_match.group(2)
+        # pandas/numpy are only needed on the bulk path, keep them off the import path
+        from .batch_normalizer import normalize_scholarship_batch
+        groups = normalize_scholarship_batch(scholarships, datetime.now())
 
-            month_number = MONTH_LOOKUP.get(month_token)
+        total = sum(len(params) for params in groups.values())
+        if not total:
+            return 0
 
-            if month_number:
-                try:
-                    current_year = datetime.now().year
-                    normalized_date = datetime(current_year, month_number, int(day_token))
-                    return normalized_date.strftime('%Y-%m-%d')
-                except ValueError:
-                    return trimmed
+        cursor = conn.cursor()
+        try:
+            for columns, params in groups.items():
+                cursor.executemany(self._upsert_query(columns), self._merge_near_duplicate_params(columns, params))
+            conn.commit()
+            self.save_near_duplicate_index()
+            logger.info(f"Upserted {total} scholarships in {len(groups)} batches ({self.environment} DB)")
+            return total
+        except Exception as e:
+            conn.rollback()
+            logger.error(f"Batch upsert failed ({self.environment} DB): {e}")
+            raise
+        finally:
+            cursor.close()
+    
+    def ping(self) -> bool:
+        """Make sure the connection is usable, reconnecting if the server dropped it.
 
-        return trimmed
+        Long-lived processes (daemon mode) call this before reusing a
+        connection that may have sat idle past the server's wait_timeout.
+        """
+        if self.connection and self.connection.open:
+            try:
+                self.connection.ping(reconnect=True)
+                return True
+            except Exception as e:
+                logger.warning(f"Database connection lost ({self.environment} DB), reconnecting: {e}")
+                self.connection = None
+        return self.get_connection() is not None
     
     def get_connection(self):
         """Get database connection"""
@@ -173,7 +557,8 @@ class LocalDatabaseManager(DatabaseManager):
                 password=self.password,
                 database=self.database,
                 charset='utf8mb4',
-                cursorclass=pymysql.cursors.DictCursor
+                cursorclass=pymysql.cursors.DictCursor,
+                local_infile=self.local_infile
             )
             logger.debug(f"Connected to local MySQL database: {self.database}")
             return True
@@ -183,6 +568,7 @@ class LocalDatabaseManager(DatabaseManager):
     
     def disconnect(self):
         """Close local database connection"""
+        self.save_near_duplicate_index()
         if self.connection and self.connection.open:
             self.connection.close()
             logger.debug("Disconnected from local MySQL database")
@@ -207,68 +593,19 @@ class LocalDatabaseManager(DatabaseManager):
             scholarship.deadline = self._normalize_deadline(scholarship.deadline)
             scholarship.deadline = (scholarship.deadline or "").strip()
             
-            # Convert to dict and omit scholarship_id if None to let AUTO_INCREMENT handle it
-            data = scholarship.to_dict()
-            if 'scholarship_id' in data and data['scholarship_id'] is None:
-                del data['scholarship_id']
-
-            if 'subject_areas' in data:
-                normalized_subjects = self._normalize_subject_areas(data['subject_areas'])
-                if normalized_subjects is None:
-                    data.pop('subject_areas', None)
-                else:
-                    data['subject_areas'] = normalized_subjects
-
-            if 'eligibility' in data:
-                normalized_eligibility = self._normalize_eligibility(data['eligibility'])
-                if normalized_eligibility is None:
-                    data.pop('eligibility', None)
-                else:
-                    data['eligibility'] = normalized_eligibility
-
-            if 'academic_level' in data:
-                normalized_academic_level = self._normalize_academic_level(data['academic_level'])
-                if normalized_academic_level is None:
-                    data.pop('academic_level', None)
-                else:
-                    data['academic_level'] = normalized_academic_level
-
-            if 'geographic_restrictions' in data:
-                normalized_geo = self._normalize_geographic_restrictions(data['geographic_restrictions'])
-                if normalized_geo is None:
-                    data.pop('geographic_restrictions', None)
-                else:
-                    data['geographic_restrictions'] = normalized_geo
-
-            if 'ethnicity' in data:
-                normalized_ethnicity = self._normalize_ethnicity(data['ethnicity'])
-                if normalized_ethnicity is None:
-                    data.pop('ethnicity', None)
-                else:
-                    data['ethnicity'] = normalized_ethnicity
-
-            if 'min_gpa' in data:
-                min_gpa_value = data['min_gpa']
-                if min_gpa_value is None or min_gpa_value == '':
-                    data.pop('min_gpa', None)
-                else:
-                    try:
-                        data['min_gpa'] = round(float(min_gpa_value), 2)
-                    except (TypeError, ValueError):
-                        data.pop('min_gpa', None)
+            # Write near-duplicates of a stored scholarship under that row's key
+            scholarship.title, scholarship.organization, scholarship.deadline = self._canonical_key(
+                scholarship.title, scholarship.organization, scholarship.deadline,
+                scholarship.description, scholarship.apply_url
+            )
             
             # Build INSERT ... ON DUPLICATE KEY UPDATE using unique(title, organization, deadline)
-            placeholders = ', '.join(['%s'] * len(data))
-            columns = ', '.join(data.keys())
-            updates = ', '.join([f"{k} = VALUES({k})" for k in data.keys() if k not in ['scholarship_id', 'created_at']])
-            query = (
-                f"INSERT INTO scholarships ({columns}) VALUES ({placeholders}) "
-                f"ON DUPLICATE KEY UPDATE {updates}, updated_at = CURRENT_TIMESTAMP"
-            )
-            cursor.execute(query, list(data.values()))
+            columns, params = self._scholarship_params(scholarship_row(scholarship))
+            cursor.execute(self._upsert_query(columns), params)
             logger.info(f"Upserted scholarship in local DB: {scholarship.title}")
             
             conn.commit()
+            self.save_near_duplicate_index(NEAR_DUPLICATE_SAVE_EVERY)
             return True
             
         except Exception as e:
@@ -288,129 +625,7 @@ class LocalDatabaseManager(DatabaseManager):
         else:
             logger.debug(f"[LOCAL] No website found in metadata")
         
-        try:
-            conn = self.get_connection()
-            if not conn:
-                logger.error(f"Failed to get database connection for job status update. Host: {self.host}, Database: {self.database}")
-                return
-        except Exception as e:
-            logger.error(f"Exception getting database connection for job status update: {e}")
-            return
-        
-        cursor = conn.cursor()
-        
-        try:
-            # Extract job_id from metadata if available
-            job_id = getattr(metadata, 'job_id', None) if hasattr(metadata, 'job_id') else None
-            if not job_id:
-                # Generate a job_id if not provided
-                job_id = f"local_{int(datetime.now().timestamp())}"
-            
-            # Extract website name from metadata or use default
-            if hasattr(metadata, 'website') and metadata.website:
-                website = metadata.website
-            elif isinstance(metadata, dict) and metadata.get('website'):
-                website = metadata['website']
-            else:
-                # Fallback: try to extract from class name or use default
-                website = 'unknown'
-                if hasattr(metadata, '__class__') and hasattr(metadata.__class__, '__name__'):
-                    class_name = metadata.__class__.__name__
-                    if 'Scraper' in class_name:
-                        website = class_name.replace('Scraper', '').lower()
-            
-            # Convert metadata to JSON-serializable format
-            metadata_dict = {}
-            if hasattr(metadata, '__dict__'):
-                metadata_dict = {k: v for k, v in metadata.__dict__.items() if v is not None}
-            elif isinstance(metadata, dict):
-                metadata_dict = metadata
-            
-            # Prepare errors as JSON
-            errors_json = None
-            if hasattr(metadata, 'errors') and metadata.errors:
-                errors_json = json.dumps(metadata.errors)
-            
-            # Check if job exists
-            cursor.execute("SELECT job_id FROM jobs WHERE job_id = %s", (job_id,))
-            job_exists = cursor.fetchone()
-            
-            if job_exists:
-                # Update existing job
-                if status == 'running':
-                    query = """
-                        UPDATE jobs SET 
-                        status = %s, 
-                        started_at = %s,
-                        updated_at = CURRENT_TIMESTAMP
-                        WHERE job_id = %s
-                    """
-                    cursor.execute(query, (status, datetime.now(), job_id))
-                elif status in ['completed', 'failed']:
-                    query = """
-                        UPDATE jobs SET 
-                        status = %s,
-                        records_found = %s,
-                        records_processed = %s,
-                        records_inserted = %s,
-                        records_updated = %s,
-                        errors = %s,
-                        metadata = %s,
-                        completed_at = %s,
-                        updated_at = CURRENT_TIMESTAMP
-                        WHERE job_id = %s
-                    """
-                    cursor.execute(query, (
-                        status,
-                        metadata_dict.get('records_found', 0),
-                        metadata_dict.get('records_processed', 0),
-                        metadata_dict.get('records_inserted', 0),
-                        metadata_dict.get('records_updated', 0),
-                        errors_json,
-                        json.dumps(metadata_dict),
-                        datetime.now(),
-                        job_id
-                    ))
-                else:
-                    query = """
-                        UPDATE jobs SET 
-                        status = %s,
-                        updated_at = CURRENT_TIMESTAMP
-                        WHERE job_id = %s
-                    """
-                    cursor.execute(query, (status, job_id))
-            else:
-                # Insert new job
-                query = """
-                    INSERT INTO jobs (
-                        job_id, website, status, records_found, records_processed, 
-                        records_inserted, records_updated, errors, metadata, 
-                        started_at, created_at, updated_at
-                    ) VALUES (
-                        %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP
-                    )
-                """
-                cursor.execute(query, (
-                    job_id,
-                    website,
-                    status,
-                    metadata_dict.get('records_found', 0),
-                    metadata_dict.get('records_processed', 0),
-                    metadata_dict.get('records_inserted', 0),
-                    metadata_dict.get('records_updated', 0),
-                    errors_json,
-                    json.dumps(metadata_dict),
-                    datetime.now() if status == 'running' else None
-                ))
-            
-            conn.commit()
-            logger.info(f"Job status updated in local DB: {job_id} - {status} - Website: {website}")
-            
-        except Exception as e:
-            conn.rollback()
-            logger.error(f"Failed to update job status in local DB: {e}")
-        finally:
-            cursor.close()
+        self._upsert_job_status(status, metadata, job_id_prefix='local')
     
     def _create_scholarship_id(self) -> str:
         """Generate a unique scholarship ID"""
@@ -439,7 +654,8 @@ class ProductionDatabaseManager(DatabaseManager):
                 password=self.password,
                 database=self.database,
                 charset='utf8mb4',
-                cursorclass=pymysql.cursors.DictCursor
+                cursorclass=pymysql.cursors.DictCursor,
+                local_infile=self.local_infile
             )
             logger.debug(f"Connected to production MySQL database: {self.database}")
             return True
@@ -449,6 +665,7 @@ class ProductionDatabaseManager(DatabaseManager):
     
     def disconnect(self):
         """Close production database connection"""
+        self.save_near_duplicate_index()
         if self.connection and self.connection.open:
             self.connection.close()
             logger.debug("Disconnected from production MySQL database")
@@ -473,68 +690,19 @@ class ProductionDatabaseManager(DatabaseManager):
             scholarship.deadline = self._normalize_deadline(scholarship.deadline)
             scholarship.deadline = (scholarship.deadline or "").strip()
             
-            # Convert to dict and omit scholarship_id if None to let AUTO_INCREMENT handle it
-            data = scholarship.to_dict()
-            if 'scholarship_id' in data and data['scholarship_id'] is None:
-                del data['scholarship_id']
-
-            if 'subject_areas' in data:
-                normalized_subjects = self._normalize_subject_areas(data['subject_areas'])
-                if normalized_subjects is None:
-                    data.pop('subject_areas', None)
-                else:
-                    data['subject_areas'] = normalized_subjects
-
-            if 'eligibility' in data:
-                normalized_eligibility = self._normalize_eligibility(data['eligibility'])
-                if normalized_eligibility is None:
-                    data.pop('eligibility', None)
-                else:
-                    data['eligibility'] = normalized_eligibility
-
-            if 'academic_level' in data:
-                normalized_academic_level = self._normalize_academic_level(data['academic_level'])
-                if normalized_academic_level is None:
-                    data.pop('academic_level', None)
-                else:
-                    data['academic_level'] = normalized_academic_level
-
-            if 'geographic_restrictions' in data:
-                normalized_geo = self._normalize_geographic_restrictions(data['geographic_restrictions'])
-                if normalized_geo is None:
-                    data.pop('geographic_restrictions', None)
-                else:
-                    data['geographic_restrictions'] = normalized_geo
-
-            if 'ethnicity' in data:
-                normalized_ethnicity = self._normalize_ethnicity(data['ethnicity'])
-                if normalized_ethnicity is None:
-                    data.pop('ethnicity', None)
-                else:
-                    data['ethnicity'] = normalized_ethnicity
-
-            if 'min_gpa' in data:
-                min_gpa_value = data['min_gpa']
-                if min_gpa_value is None or min_gpa_value == '':
-                    data.pop('min_gpa', None)
-                else:
-                    try:
-                        data['min_gpa'] = round(float(min_gpa_value), 2)
-                    except (TypeError, ValueError):
-                        data.pop('min_gpa', None)
+            # Write near-duplicates of a stored scholarship under that row's key
+            scholarship.title, scholarship.organization, scholarship.deadline = self._canonical_key(
+                scholarship.title, scholarship.organization, scholarship.deadline,
+                scholarship.description, scholarship.apply_url
+            )
             
             # Build INSERT ... ON DUPLICATE KEY UPDATE using unique(title, organization, deadline)
-            placeholders = ', '.join(['%s'] * len(data))
-            columns = ', '.join(data.keys())
-            updates = ', '.join([f"{k} = VALUES({k})" for k in data.keys() if k not in ['scholarship_id', 'created_at']])
-            query = (
-                f"INSERT INTO scholarships ({columns}) VALUES ({placeholders}) "
-                f"ON DUPLICATE KEY UPDATE {updates}, updated_at = CURRENT_TIMESTAMP"
-            )
-            cursor.execute(query, list(data.values()))
+            columns, params = self._scholarship_params(scholarship_row(scholarship))
+            cursor.execute(self._upsert_query(columns), params)
             logger.info(f"Upserted scholarship in production DB: {scholarship.title}")
             
             conn.commit()
+            self.save_near_duplicate_index(NEAR_DUPLICATE_SAVE_EVERY)
             return True
             
         except Exception as e:
@@ -546,129 +714,7 @@ class ProductionDatabaseManager(DatabaseManager):
     
     def update_job_status(self, status: str, metadata: Any):
         """Update job status in production MySQL database"""
-        try:
-            conn = self.get_connection()
-            if not conn:
-                logger.error(f"Failed to get database connection for job status update. Host: {self.host}, Database: {self.database}")
-                return
-        except Exception as e:
-            logger.error(f"Exception getting database connection for job status update: {e}")
-            return
-        
-        cursor = conn.cursor()
-        
-        try:
-            # Extract job_id from metadata if available
-            job_id = getattr(metadata, 'job_id', None) if hasattr(metadata, 'job_id') else None
-            if not job_id:
-                # Generate a job_id if not provided
-                job_id = f"prod_{int(datetime.now().timestamp())}"
-            
-            # Extract website name from metadata or use default
-            if hasattr(metadata, 'website') and metadata.website:
-                website = metadata.website
-            elif isinstance(metadata, dict) and metadata.get('website'):
-                website = metadata['website']
-            else:
-                # Fallback: try to extract from class name or use default
-                website = 'unknown'
-                if hasattr(metadata, '__class__') and hasattr(metadata.__class__, '__name__'):
-                    class_name = metadata.__class__.__name__
-                    if 'Scraper' in class_name:
-                        website = class_name.replace('Scraper', '').lower()
-            
-            # Convert metadata to JSON-serializable format
-            metadata_dict = {}
-            if hasattr(metadata, '__dict__'):
-                metadata_dict = {k: v for k, v in metadata.__dict__.items() if v is not None}
-            elif isinstance(metadata, dict):
-                metadata_dict = metadata
-            
-            # Prepare errors as JSON
-            errors_json = None
-            if hasattr(metadata, 'errors') and metadata.errors:
-                errors_json = json.dumps(metadata.errors)
-            
-            # Check if job exists
-            cursor.execute("SELECT job_id FROM jobs WHERE job_id = %s", (job_id,))
-            job_exists = cursor.fetchone()
-            
-            if job_exists:
-                # Update existing job
-                if status == 'running':
-                    query = """
-                        UPDATE jobs SET 
-                        status = %s, 
-                        started_at = %s,
-                        updated_at = CURRENT_TIMESTAMP
-                        WHERE job_id = %s
-                    """
-                    cursor.execute(query, (status, datetime.now(), job_id))
-                elif status in ['completed', 'failed']:
-                    query = """
-                        UPDATE jobs SET 
-                        status = %s,
-                        records_found = %s,
-                        records_processed = %s,
-                        records_inserted = %s,
-                        records_updated = %s,
-                        errors = %s,
-                        metadata = %s,
-                        completed_at = %s,
-                        updated_at = CURRENT_TIMESTAMP
-                        WHERE job_id = %s
-                    """
-                    cursor.execute(query, (
-                        status,
-                        metadata_dict.get('records_found', 0),
-                        metadata_dict.get('records_processed', 0),
-                        metadata_dict.get('records_inserted', 0),
-                        metadata_dict.get('records_updated', 0),
-                        errors_json,
-                        json.dumps(metadata_dict),
-                        datetime.now(),
-                        job_id
-                    ))
-                else:
-                    query = """
-                        UPDATE jobs SET 
-                        status = %s,
-                        updated_at = CURRENT_TIMESTAMP
-                        WHERE job_id = %s
-                    """
-                    cursor.execute(query, (status, job_id))
-            else:
-                # Insert new job
-                query = """
-                    INSERT INTO jobs (
-                        job_id, website, status, records_found, records_processed, 
-                        records_inserted, records_updated, errors, metadata, 
-                        started_at, created_at, updated_at
-                    ) VALUES (
-                        %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP
-                    )
-                """
-                cursor.execute(query, (
-                    job_id,
-                    website,
-                    status,
-                    metadata_dict.get('records_found', 0),
-                    metadata_dict.get('records_processed', 0),
-                    metadata_dict.get('records_inserted', 0),
-                    metadata_dict.get('records_updated', 0),
-                    errors_json,
-                    json.dumps(metadata_dict),
-                    datetime.now() if status == 'running' else None
-                ))
-            
-            conn.commit()
-            logger.info(f"Job status updated in production DB: {job_id} - {status}")
-            
-        except Exception as e:
-            conn.rollback()
-            logger.error(f"Failed to update job status in production DB: {e}")
-        finally:
-            cursor.close()
+        self._upsert_job_status(status, metadata, job_id_prefix='prod')
     
     def _create_scholarship_id(self) -> str:
         """Generate a unique scholarship ID"""
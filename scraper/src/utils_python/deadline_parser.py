@@ -0,0 +1,151 @@
+"""
+Deadline parsing shared by the scrapers and the DB layer.
+
+Scraped deadlines come from a small vocabulary ("Mar 1", "April 15, 2026",
+"Jan 31st", "Rolling") repeated across thousands of rows, so results are kept
+in a bounded LRU memo. Misses go through a hand-written tokenizer for the
+month/day[/year] forms instead of trying `strptime` formats one by one.
+
+Accepted forms (month names are English, full or three-letter, any case):
+- `YYYY-MM-DD`, returned unchanged
+- `Month D` / `Month Dth`, dated in the current year
+- `Month D, YYYY`
+- `Month D YY[YY]` with space, `/` or `-` separators (two-digit years are 20YY)
+
+Rolling/varies style deadlines and anything else parse to None.
+"""
+
+import re
+import logging
+from datetime import datetime
+from functools import lru_cache
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+DEADLINE_CACHE_SIZE = 4096
+
+# Deadlines that mean "no fixed date"
+NO_DATE_KEYWORDS = ('rolling', 'varies', 'open', 'ongoing', 'continuous', 'not specified')
+
+MONTH_NUMBERS = {
+    'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'may': 5, 'jun': 6,
+    'jul': 7, 'aug': 8, 'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12,
+    'january': 1, 'february': 2, 'march': 3, 'april': 4, 'june': 6, 'july': 7,
+    'august': 8, 'september': 9, 'october': 10, 'november': 11, 'december': 12,
+}
+
+_ISO_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+_ORDINAL_RE = re.compile(r"(\d{1,2})(st|nd|rd|th)", re.IGNORECASE)
+_DATE_SEPARATORS = ' \t\n\r\f\v/-'
+
+
+def _skip(text: str, index: int, separators: Optional[str]) -> int:
+    """Return the index after a run of separators (whitespace when None)."""
+    length = len(text)
+    if separators is None:
+        while index < length and text[index].isspace():
+            index += 1
+    else:
+        while index < length and (text[index] in separators or text[index].isspace()):
+            index += 1
+    return index
+
+
+def _digits(text: str, index: int) -> int:
+    length = len(text)
+    while index < length and '0' <= text[index] <= '9':
+        index += 1
+    return index
+
+
+def _format_date(year: int, month: int, day: int) -> Optional[str]:
+    try:
+        return datetime(year, month, day).strftime('%Y-%m-%d')
+    except ValueError:
+        return None
+
+
+def _tokenize_month_day_year(text: str, current_year: int) -> Optional[str]:
+    """Parse `Month D`, `Month D, YYYY` and `Month D YY[YY]` without regex or strptime."""
+    index = 0
+    length = len(text)
+    while index < length and text[index].isascii() and text[index].isalpha():
+        index += 1
+    month = MONTH_NUMBERS.get(text[:index].lower())
+    if not month:
+        return None
+
+    day_start = _skip(text, index, _DATE_SEPARATORS)
+    if day_start == index:
+        return None
+    whitespace_only = _skip(text, index, None) == day_start
+    day_end = _digits(text, day_start)
+    if not 0 < day_end - day_start <= 2:
+        return None
+    day = int(text[day_start:day_end])
+
+    if day_end == length:
+        # Month D
+        return _format_date(current_year, month, day) if whitespace_only else None
+
+    if text[day_end] == ',':
+        # Month D, YYYY
+        year_start = _skip(text, day_end + 1, None)
+        year_end = _digits(text, year_start)
+        if not whitespace_only or year_start == day_end + 1 or year_end != length or year_end - year_start != 4:
+            return None
+        return _format_date(int(text[year_start:year_end]), month, day)
+
+    # Month D YY[YY] with space, slash or dash separators
+    year_start = _skip(text, day_end, _DATE_SEPARATORS)
+    year_end = _digits(text, year_start)
+    if year_start == day_end or year_end != length or not 2 <= year_end - year_start <= 4:
+        return None
+    year = int(text[year_start:year_end])
+    if year < 100:
+        year += 2000
+    return _format_date(year, month, day)
+
+
+@lru_cache(maxsize=DEADLINE_CACHE_SIZE)
+def _parse_deadline_cached(text: str, current_year: int) -> Optional[str]:
+    if _ISO_DATE_RE.fullmatch(text):
+        return text
+
+    lowered = text.lower()
+    if any(keyword in lowered for keyword in NO_DATE_KEYWORDS):
+        return None
+
+    return _tokenize_month_day_year(_ORDINAL_RE.sub(r"\1", text), current_year)
+
+
+def parse_deadline(value: Optional[str]) -> Optional[str]:
+    """Parse a scraped deadline into YYYY-MM-DD.
+
+    Parameters:
+        value: Raw deadline string.
+
+    Returns:
+        Date string in YYYY-MM-DD format, or None for empty, rolling/varies
+        and unrecognized deadlines.
+    """
+    if not value:
+        return None
+
+    text = value.strip()
+    if not text:
+        return None
+
+    # The year is part of the key so year-less deadlines roll over on Jan 1
+    return _parse_deadline_cached(text, datetime.now().year)
+
+
+def clear_deadline_cache():
+    """Drop all memoized deadline parses."""
+    _parse_deadline_cached.cache_clear()
+
+
+def deadline_cache_info():
+    """Return hit/miss statistics for the deadline memo."""
+    return _parse_deadline_cached.cache_info()
@@ -0,0 +1,127 @@
+"""
+Progress heartbeats for running scrape jobs.
+
+The scraping thread only bumps plain counters (`page_done`, `add_rows`); a
+background thread turns them into a progress snapshot (pages done, rows
+saved, current rate, ETA) every `interval` seconds and stores it on the job
+row with `DatabaseManager.record_job_progress`. The job row then shows live
+throughput, and a running job whose updated_at stops advancing points at a
+stalled worker.
+"""
+
+import os
+import time
+import logging
+import threading
+from typing import Any, Dict, Optional
+
+DEFAULT_HEARTBEAT_INTERVAL_SEC = 30.0
+HEARTBEAT_INTERVAL_ENV = 'SCRAPER_HEARTBEAT_SEC'
+
+logger = logging.getLogger(__name__)
+
+
+def heartbeat_interval() -> float:
+    """Heartbeat interval from SCRAPER_HEARTBEAT_SEC; 0 or less disables heartbeats."""
+    try:
+        return float(os.getenv(HEARTBEAT_INTERVAL_ENV, DEFAULT_HEARTBEAT_INTERVAL_SEC))
+    except ValueError:
+        return DEFAULT_HEARTBEAT_INTERVAL_SEC
+
+
+class JobHeartbeat:
+    """Periodically record a job's progress from a background thread.
+
+    Counters are only written by the scraping thread and read by the
+    heartbeat thread, so updating them needs no lock. The heartbeat owns
+    `db_manager`: give it a manager no other thread uses.
+
+    Parameters:
+        db_manager: Database manager to record progress through.
+        job_id: Job row to update.
+        interval: Seconds between heartbeats.
+        pages_total: Expected number of pages, used for the ETA (optional).
+    """
+
+    def __init__(self, db_manager, job_id: str, interval: float = DEFAULT_HEARTBEAT_INTERVAL_SEC,
+                 pages_total: Optional[int] = None):
+        self.db_manager = db_manager
+        self.job_id = job_id
+        self.interval = interval
+        self.pages_total = pages_total
+        self.pages_done = 0
+        self.rows_saved = 0
+        self.beats = 0
+        self._started_at = time.monotonic()
+        self._last_beat = (self._started_at, 0, 0)
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def page_done(self, count: int = 1):
+        """Count pages (or other work units) finished by the scraper."""
+        self.pages_done += count
+
+    def add_rows(self, count: int = 1):
+        """Count scholarships handed to the writer."""
+        self.rows_saved += count
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Progress since start, with rates over the last heartbeat interval."""
+        now = time.monotonic()
+        pages, rows = self.pages_done, self.rows_saved
+        last_time, last_pages, last_rows = self._last_beat
+        window = max(now - last_time, 1e-9)
+        elapsed = now - self._started_at
+        progress: Dict[str, Any] = {
+            'pages_done': pages,
+            'pages_total': self.pages_total,
+            'rows_saved': rows,
+            'pages_per_min': round((pages - last_pages) * 60 / window, 2),
+            'rows_per_min': round((rows - last_rows) * 60 / window, 2),
+            'elapsed_sec': round(elapsed, 1),
+            'eta_sec': None,
+        }
+        if self.pages_total and pages:
+            # Average pace since start: steadier than the last window
+            remaining = max(self.pages_total - pages, 0)
+            progress['eta_sec'] = round(remaining * elapsed / pages, 1)
+        self._last_beat = (now, pages, rows)
+        return progress
+
+    def beat(self) -> bool:
+        """Record one heartbeat now; returns whether the job row was updated."""
+        self.beats += 1
+        try:
+            return self.db_manager.record_job_progress(self.job_id, self.snapshot())
+        except Exception as e:
+            logger.warning(f"Heartbeat for job {self.job_id} failed: {e}")
+            return False
+
+    def start(self):
+        """Start the heartbeat thread (no-op when the interval is not positive)."""
+        if self._thread is not None or self.interval <= 0:
+            return
+        # A scraper reused across runs (daemon mode) restarts its heartbeat per job
+        self.pages_done = 0
+        self.rows_saved = 0
+        self._stop.clear()
+        self._started_at = time.monotonic()
+        self._last_beat = (self._started_at, 0, 0)
+        self._thread = threading.Thread(target=self._run, name=f'heartbeat-{self.job_id}', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop the heartbeat thread and release its DB connection."""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        try:
+            self.db_manager.disconnect()
+        except Exception as e:
+            logger.warning(f"Error closing heartbeat DB connection: {e}")
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.beat()
@@ -0,0 +1,380 @@
+"""
+Near-duplicate detection for scholarships scraped from different sources.
+
+The DB unique key is the exact (title, organization, deadline) triple, so the
+same scholarship scraped from CareerOneStop, CollegeScholarship and AI
+discovery lands as separate rows whenever a title or organization is spelled
+slightly differently. This module fingerprints each scholarship with a 64-bit
+SimHash of its normalized title words and keeps a signature of the other
+identifying fields (organization words, a description SimHash, the normalized
+apply URL) to confirm matches.
+
+Lookups use the pigeonhole trick: the fingerprint is cut into
+`max_distance + 1` bands, and two fingerprints within `max_distance` bits
+must agree exactly on at least one band. Each band has its own hash table, and
+apply URLs have an exact table, so a lookup only compares against the few rows
+sharing a band value or URL instead of every row in the table.
+
+The index maps fingerprints to the DB key of the row they were first written
+as, so the write path can rewrite a near-duplicate's key and let the upsert
+merge it into the existing row. It is kept in a JSON file between runs and
+rebuilt from the scholarships table when that file is missing. Saving merges
+with what other processes wrote to the file since it was read, under a file
+lock, so concurrent writers never drop each other's entries.
+"""
+
+import os
+import re
+import json
+import hashlib
+import logging
+import tempfile
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+from urllib.parse import urlsplit
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_NEAR_DUPLICATE_INDEX_PATH = os.path.join('local_data', 'scholarship_simhash.json')
+
+SIMHASH_BITS = 64
+# Fingerprints at most this many bits apart are treated as the same scholarship
+DEFAULT_MAX_DISTANCE = 3
+
+# A match needs this much title word overlap (Jaccard) plus the same
+# organization; without an organization, a matching description. The same
+# apply URL needs less title overlap.
+MIN_TITLE_SIMILARITY = 0.75
+MIN_TITLE_SIMILARITY_SAME_URL = 0.5
+MIN_ORGANIZATION_SIMILARITY = 0.6
+# Description SimHashes this close count as the same text reworded
+MAX_DESCRIPTION_DISTANCE = 12
+MAX_DESCRIPTION_WORDS = 60
+
+# Words that vary between sources without changing which scholarship it is
+STOP_WORDS = frozenset({
+    'a', 'an', 'the', 'of', 'for', 'and', 'in', 'to', 'at', 'on', 'by', 'with',
+    'scholarship', 'scholarships', 'program', 'programs', 'award', 'awards', 'fund',
+})
+ORGANIZATION_SUFFIXES = frozenset({'inc', 'incorporated', 'llc', 'ltd', 'corp', 'corporation', 'co'})
+ORGANIZATION_ABBREVIATIONS = {
+    'fdn': 'foundation', 'assn': 'association', 'assoc': 'association', 'soc': 'society',
+    'univ': 'university', 'intl': 'international', 'natl': 'national', 'dept': 'department',
+}
+
+ISO_DATE = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+_NON_WORD = re.compile(r'[^a-z0-9]+')
+
+ScholarshipKey = Tuple[str, str, str]
+
+
+def normalize_words(text: Optional[str], drop: frozenset = STOP_WORDS) -> List[str]:
+    """Lowercase `text`, strip punctuation and drop words in `drop`."""
+    if not text:
+        return []
+    return [word for word in _NON_WORD.sub(' ', text.lower()).split() if word not in drop]
+
+
+def normalize_apply_url(url: Optional[str]) -> str:
+    """Host (without www) and path of an apply URL, ignoring scheme, fragment and trailing slash."""
+    if not url:
+        return ''
+    parts = urlsplit(url.strip().lower())
+    host = parts.netloc[4:] if parts.netloc.startswith('www.') else parts.netloc
+    path = parts.path.rstrip('/')
+    return f"{host}{path}?{parts.query}" if parts.query else f"{host}{path}"
+
+
+@lru_cache(maxsize=65536)
+def _word_bits(word: str) -> np.ndarray:
+    digest = hashlib.blake2b(word.encode('utf-8'), digest_size=SIMHASH_BITS // 8).digest()
+    # +1 for each set bit, -1 for each clear bit
+    votes = np.unpackbits(np.frombuffer(digest, dtype=np.uint8)).astype(np.int64) * 2 - 1
+    votes.flags.writeable = False
+    return votes
+
+
+def simhash(words: Sequence[str]) -> int:
+    """64-bit SimHash of a bag of words (0 for no words)."""
+    if not words:
+        return 0
+    totals = np.sum([_word_bits(word) for word in words], axis=0)
+    return int.from_bytes(np.packbits(totals > 0).tobytes(), 'big')
+
+
+def hamming_distance(first: int, second: int) -> int:
+    return bin(first ^ second).count('1')
+
+
+def jaccard(first: Sequence[str], second: Sequence[str]) -> float:
+    first_set, second_set = set(first), set(second)
+    if not first_set and not second_set:
+        return 1.0
+    return len(first_set & second_set) / len(first_set | second_set)
+
+
+@dataclass(frozen=True)
+class ScholarshipSignature:
+    """Normalized fields of one scholarship spelling, as stored in the index."""
+    title_words: Tuple[str, ...]
+    organization_words: Tuple[str, ...]
+    description_hash: int
+    apply_url: str
+    # SimHash of the title words, used for candidate lookup
+    fingerprint: int
+
+    @classmethod
+    def of(cls, title: Optional[str], organization: Optional[str], description: Optional[str] = None,
+           apply_url: Optional[str] = None) -> 'ScholarshipSignature':
+        title_words = tuple(sorted(set(normalize_words(title))))
+        return cls(
+            title_words=title_words,
+            organization_words=tuple(sorted({
+                ORGANIZATION_ABBREVIATIONS.get(word, word)
+                for word in normalize_words(organization, STOP_WORDS | ORGANIZATION_SUFFIXES)
+            })),
+            description_hash=simhash(normalize_words(description)[:MAX_DESCRIPTION_WORDS]),
+            apply_url=normalize_apply_url(apply_url),
+            fingerprint=simhash(title_words),
+        )
+
+    def matches(self, other: 'ScholarshipSignature') -> bool:
+        """Check whether two spellings describe the same scholarship."""
+        title_similarity = jaccard(self.title_words, other.title_words)
+        same_url = bool(self.apply_url) and self.apply_url == other.apply_url
+        if same_url:
+            return title_similarity >= MIN_TITLE_SIMILARITY_SAME_URL
+        if title_similarity < MIN_TITLE_SIMILARITY:
+            return False
+        if self.organization_words and other.organization_words:
+            return jaccard(self.organization_words, other.organization_words) >= MIN_ORGANIZATION_SIMILARITY
+        return (bool(self.description_hash) and bool(other.description_hash)
+                and hamming_distance(self.description_hash, other.description_hash) <= MAX_DESCRIPTION_DISTANCE)
+
+
+@contextmanager
+def _file_lock(path: str):
+    """Exclusive advisory lock on `path` (no-op where fcntl is unavailable)."""
+    try:
+        import fcntl
+    except ImportError:
+        yield
+        return
+    with open(path, 'a') as handle:
+        fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+
+def _deadlines_conflict(first: str, second: str) -> bool:
+    """Two parsed (ISO) deadlines that differ mark different award cycles."""
+    return bool(ISO_DATE.match(first) and ISO_DATE.match(second) and first != second)
+
+
+class NearDuplicateIndex:
+    """Index from scholarship signatures to the DB key they were stored under.
+
+    Candidates come from the title SimHash bands and from an exact table of
+    normalized apply URLs; each candidate is then checked with
+    `ScholarshipSignature.matches`.
+
+    Parameters:
+        path: JSON file the index is loaded from and saved to (None keeps it in memory).
+        max_distance: Largest title SimHash distance (bits) looked up as a candidate.
+    """
+
+    def __init__(self, path: Optional[str] = DEFAULT_NEAR_DUPLICATE_INDEX_PATH,
+                 max_distance: int = DEFAULT_MAX_DISTANCE):
+        self.path = path
+        self.max_distance = max_distance
+        edges = np.linspace(0, SIMHASH_BITS, max_distance + 2).astype(int)
+        self._bands = [(int(start), (1 << int(end - start)) - 1) for start, end in zip(edges, edges[1:])]
+        self._fingerprints: List[int] = []
+        self._signatures: List[ScholarshipSignature] = []
+        self._keys: List[ScholarshipKey] = []
+        self._tables: List[Dict[int, List[int]]] = [{} for _ in self._bands]
+        self._urls: Dict[str, List[int]] = {}
+        self._entries: Set[Tuple[ScholarshipSignature, ScholarshipKey]] = set()
+        self._row_keys: Set[ScholarshipKey] = set()
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()
+        # Entries added since the index was loaded or last saved
+        self.unsaved = 0
+        self.exists = self.load()
+
+    def load(self) -> bool:
+        """Load the index from disk.
+
+        Returns:
+            True if a saved index was read (missing or corrupt files start empty).
+        """
+        entries = self._read_file()
+        if entries is None:
+            return False
+        with self._lock:
+            for signature, key in entries:
+                self._insert(signature, key)
+            self.unsaved = 0
+        return True
+
+    def _read_file(self) -> Optional[List[Tuple[ScholarshipSignature, ScholarshipKey]]]:
+        if not self.path or not os.path.exists(self.path):
+            return None
+        try:
+            with open(self.path, 'r', encoding='utf-8') as handle:
+                data = json.load(handle)
+            entries = []
+            for fingerprint, title_words, organization_words, description_hash, apply_url, *key in data.get('entries', []):
+                signature = ScholarshipSignature(tuple(title_words.split()), tuple(organization_words.split()),
+                                                 int(description_hash, 16), apply_url, int(fingerprint, 16))
+                entries.append((signature, tuple(key)))
+            return entries
+        except (OSError, ValueError, TypeError) as e:
+            logger.warning(f"Could not read near-duplicate index {self.path}: {e}")
+            return None
+
+    def save(self):
+        """Write the index to disk if anything was added.
+
+        Entries other processes saved since this index was read are merged in
+        first (and kept in memory too), under a lock file next to the index,
+        and the file is replaced through a temp file of its own.
+        """
+        if not self.path or not self.unsaved:
+            return
+        with self._save_lock:
+            unsaved = 0
+            try:
+                directory = os.path.dirname(self.path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                with _file_lock(f"{self.path}.lock"):
+                    empty = not os.path.exists(self.path) or os.path.getsize(self.path) == 0
+                    on_disk = [] if empty else self._read_file() or []
+                    with self._lock:
+                        for signature, key in on_disk:
+                            self._insert(signature, key)
+                        entries = [
+                            [f"{signature.fingerprint:x}", ' '.join(signature.title_words),
+                             ' '.join(signature.organization_words), f"{signature.description_hash:x}",
+                             signature.apply_url, *key]
+                            for signature, key in zip(self._signatures, self._keys)
+                        ]
+                        unsaved, self.unsaved = self.unsaved, 0
+                    fd, temp_path = tempfile.mkstemp(prefix=f"{os.path.basename(self.path)}.", suffix='.tmp',
+                                                     dir=directory or '.')
+                    try:
+                        with os.fdopen(fd, 'w', encoding='utf-8') as handle:
+                            json.dump({'entries': entries}, handle, separators=(',', ':'))
+                        os.replace(temp_path, self.path)
+                    except BaseException:
+                        os.unlink(temp_path)
+                        raise
+            except OSError as e:
+                self.unsaved += unsaved
+                logger.warning(f"Could not write near-duplicate index {self.path}: {e}")
+
+    def _band_values(self, fingerprint: int):
+        for shift, mask in self._bands:
+            yield (fingerprint >> shift) & mask
+
+    def _insert(self, signature: ScholarshipSignature, key: ScholarshipKey):
+        if (signature, key) in self._entries:
+            return
+        self._entries.add((signature, key))
+        self._row_keys.add(key)
+        entry = len(self._signatures)
+        fingerprint = signature.fingerprint
+        self._fingerprints.append(fingerprint)
+        self._signatures.append(signature)
+        self._keys.append(key)
+        for table, value in zip(self._tables, self._band_values(fingerprint)):
+            table.setdefault(value, []).append(entry)
+        if signature.apply_url:
+            self._urls.setdefault(signature.apply_url, []).append(entry)
+        self.unsaved += 1
+
+    def _candidates(self, signature: ScholarshipSignature, fingerprint: int) -> Iterator[int]:
+        seen = set()
+        for entry in self._urls.get(signature.apply_url, ()) if signature.apply_url else ():
+            seen.add(entry)
+            yield entry
+        for table, value in zip(self._tables, self._band_values(fingerprint)):
+            for entry in table.get(value, ()):
+                if entry not in seen and hamming_distance(fingerprint, self._fingerprints[entry]) <= self.max_distance:
+                    seen.add(entry)
+                    yield entry
+
+    def find(self, signature: ScholarshipSignature, deadline: str = '') -> Optional[ScholarshipKey]:
+        """Key of an indexed scholarship that `signature` is a spelling of.
+
+        Entries whose deadline is a different parsed date are skipped, since
+        the DB keeps each award cycle as its own row. A match with the same
+        deadline is preferred over one with a blank or unparsed deadline.
+        """
+        fingerprint = signature.fingerprint
+        fallback = None
+        with self._lock:
+            for entry in self._candidates(signature, fingerprint):
+                key = self._keys[entry]
+                if _deadlines_conflict(deadline, key[2]) or not signature.matches(self._signatures[entry]):
+                    continue
+                if key[2] == deadline:
+                    return key
+                if fallback is None:
+                    fallback = key
+        return fallback
+
+    def add(self, signature: ScholarshipSignature, key: ScholarshipKey):
+        """Index `signature` as a spelling of the row stored under `key`."""
+        with self._lock:
+            self._insert(signature, key)
+
+    def canonical_key(self, title: str, organization: str, deadline: str,
+                      description: Optional[str] = None, apply_url: Optional[str] = None) -> ScholarshipKey:
+        """DB key to write a scholarship under.
+
+        A key already stored as a row is returned as is. Otherwise a
+        near-duplicate's title and organization are used, with this
+        scholarship's own deadline: a dated row is never rewritten under an
+        undated key (or the other way round), so the upsert never blanks or
+        changes a deadline. The spelling is remembered, so later variants of
+        it match; without a near-duplicate the scholarship is indexed under
+        its own key.
+        """
+        key = (title, organization, deadline)
+        if key in self._row_keys:
+            return key
+        signature = ScholarshipSignature.of(title, organization, description, apply_url)
+        existing = self.find(signature, deadline)
+        if existing is None:
+            self.add(signature, key)
+            return key
+        merged = (existing[0], existing[1], deadline)
+        if merged != key:
+            logger.debug(f"Merging near-duplicate '{title}' ({organization}) into '{existing[0]}' ({existing[1]})")
+        self.add(signature, merged)
+        return merged
+
+    def add_rows(self, rows: Iterable[Sequence[Optional[str]]]) -> int:
+        """Index existing DB rows given as (title, organization, deadline, description, apply_url).
+
+        Returns:
+            Number of rows indexed.
+        """
+        count = 0
+        for title, organization, deadline, description, apply_url in rows:
+            key = (title or '', organization or '', deadline or '')
+            self.add(ScholarshipSignature.of(title, organization, description, apply_url), key)
+            count += 1
+        return count
+
+    def __len__(self) -> int:
+        return len(self._signatures)
@@ -0,0 +1,281 @@
+"""
+Adaptive revisit scheduling from observed page change rates.
+
+Every fetch of a page records a fingerprint of what was parsed from it in the
+`page_revisits` side table. From the number of revisits and the number of
+times the fingerprint changed, the policy estimates the page's change rate
+and schedules its next fetch so that about `target_changes` changes are
+expected in between: pages that change weekly are checked about twice a
+week, pages unchanged for months only monthly.
+
+Deadlines override the estimate: a page whose deadline is within
+`deadline_window_days` is revisited every `min_interval` (starting the day
+the window opens), and a page whose deadline has passed waits
+`max_interval`, so expired scholarships are only checked for a new cycle.
+
+Scrapers ask `due` which URLs to fetch and `record_many` what they found;
+pages never seen before are always due. While the database is unavailable
+every page is treated as due, so a run never silently fetches less.
+"""
+
+import os
+import json
+import math
+import logging
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from .deadline_parser import parse_deadline
+from .task_queue import url_hash
+
+DEFAULT_MIN_REVISIT_SEC = 24 * 3600.0
+DEFAULT_MAX_REVISIT_SEC = 30 * 24 * 3600.0
+DEFAULT_TARGET_CHANGES = 0.5
+DEFAULT_DEADLINE_WINDOW_DAYS = 30
+# Nightly runs drift; a page due a little after the run starts is fetched by that run
+DUE_SLACK_SEC = 2 * 3600.0
+LOOKUP_CHUNK_ROWS = 500
+
+# Set to 0/false/off to fetch every page on every run (full refresh)
+REVISIT_POLICY_ENV = 'SCRAPER_REVISIT_POLICY'
+
+REVISIT_TABLE_DDL = """
+    CREATE TABLE IF NOT EXISTS page_revisits (
+        url_hash CHAR(40) PRIMARY KEY,
+        url VARCHAR(2048) NOT NULL,
+        fingerprint CHAR(40) NOT NULL,
+        deadline DATE NULL,
+        fetches INT NOT NULL DEFAULT 1,
+        changes INT NOT NULL DEFAULT 0,
+        change_rate_per_day DOUBLE NULL,
+        first_fetched_at DATETIME NOT NULL,
+        last_fetched_at DATETIME NOT NULL,
+        last_changed_at DATETIME NOT NULL,
+        next_due_at DATETIME NOT NULL,
+
+        INDEX idx_next_due (next_due_at)
+    ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+"""
+
+REVISIT_UPSERT = """
+    INSERT INTO page_revisits (
+        url_hash, url, fingerprint, deadline, fetches, changes, change_rate_per_day,
+        first_fetched_at, last_fetched_at, last_changed_at, next_due_at
+    ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+    ON DUPLICATE KEY UPDATE
+        fingerprint = VALUES(fingerprint), deadline = VALUES(deadline), fetches = VALUES(fetches),
+        changes = VALUES(changes), change_rate_per_day = VALUES(change_rate_per_day),
+        last_fetched_at = VALUES(last_fetched_at), last_changed_at = VALUES(last_changed_at),
+        next_due_at = VALUES(next_due_at)
+"""
+
+logger = logging.getLogger(__name__)
+
+
+def revisit_policy_enabled() -> bool:
+    """Whether scrapers skip pages that are not due (on unless SCRAPER_REVISIT_POLICY is 0/false/off)."""
+    return os.getenv(REVISIT_POLICY_ENV, '1').strip().lower() not in ('0', 'false', 'off', 'no', '')
+
+
+def fingerprint(value: Any) -> str:
+    """Stable hash of parsed page data (dicts, lists, scholarships' `to_dict()`)."""
+    return url_hash(json.dumps(value, sort_keys=True, default=str))
+
+
+def estimate_change_rate(fetches: int, changes: int, observed_sec: float) -> Optional[float]:
+    """Estimate a page's change rate (changes per second) from its revisit history.
+
+    A revisit only shows whether the page changed at least once since the
+    previous fetch, so changes/time undercounts fast-changing pages. This is
+    the Cho & Garcia-Molina estimator for that case,
+    -ln((n - X + 0.5) / (n + 0.5)) / I, with n revisits, X of them changed
+    and I the mean interval; it stays finite even when every revisit changed.
+
+    Returns:
+        The rate, or None before the first revisit.
+    """
+    revisits = fetches - 1
+    if revisits <= 0 or observed_sec <= 0:
+        return None
+    changes = min(max(changes, 0), revisits)
+    mean_interval = observed_sec / revisits
+    return -math.log((revisits - changes + 0.5) / (revisits + 0.5)) / mean_interval
+
+
+@dataclass
+class PageHistory:
+    """Stored change history of one page."""
+    fingerprint: str
+    fetches: int
+    changes: int
+    first_fetched_at: datetime
+    last_changed_at: datetime
+
+
+class RevisitPolicy:
+    """Decide which pages are due and schedule their next fetch.
+
+    Parameters:
+        db_manager: Database manager holding the `page_revisits` table.
+        min_interval: Shortest revisit interval (also used for new pages and
+            approaching deadlines).
+        max_interval: Longest revisit interval (also used for expired deadlines).
+        target_changes: Expected page changes per revisit interval.
+        deadline_window_days: Deadlines this close are revisited every `min_interval`.
+    """
+
+    def __init__(self, db_manager, min_interval: float = DEFAULT_MIN_REVISIT_SEC,
+                 max_interval: float = DEFAULT_MAX_REVISIT_SEC,
+                 target_changes: float = DEFAULT_TARGET_CHANGES,
+                 deadline_window_days: int = DEFAULT_DEADLINE_WINDOW_DAYS):
+        self.db_manager = db_manager
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.target_changes = target_changes
+        self.deadline_window_days = deadline_window_days
+        self._table_ready = False
+
+    def _cursor(self):
+        conn = self.db_manager.get_connection()
+        if not conn:
+            raise ConnectionError(f"No database connection for the revisit policy ({self.db_manager.environment} DB)")
+        if not self._table_ready:
+            cursor = conn.cursor()
+            try:
+                cursor.execute(REVISIT_TABLE_DDL)
+                conn.commit()
+            finally:
+                cursor.close()
+            self._table_ready = True
+        return conn, conn.cursor()
+
+    @staticmethod
+    def advance(previous: Optional[PageHistory], page_fingerprint: str, now: datetime) -> PageHistory:
+        """History of a page after a fetch at `now` that parsed to `page_fingerprint`."""
+        if previous is None:
+            return PageHistory(page_fingerprint, 1, 0, now, now)
+        changed = previous.fingerprint != page_fingerprint
+        return PageHistory(page_fingerprint, previous.fetches + 1, previous.changes + changed,
+                           previous.first_fetched_at, now if changed else previous.last_changed_at)
+
+    def interval(self, history: PageHistory, deadline: Optional[str], now: datetime) -> float:
+        """Seconds until the next fetch of a page just fetched at `now`."""
+        rate = estimate_change_rate(history.fetches, history.changes,
+                                    (now - history.first_fetched_at).total_seconds())
+        if rate is None:
+            interval = self.min_interval
+        elif history.changes == 0:
+            # Nothing seen changing yet: back off to about the time observed so far
+            interval = (now - history.first_fetched_at).total_seconds()
+        else:
+            interval = self.target_changes / rate
+        interval = min(max(interval, self.min_interval), self.max_interval)
+
+        deadline_date = _deadline_date(deadline)
+        if deadline_date is not None:
+            days_left = (deadline_date - now.date()).days
+            if days_left < 0:
+                interval = self.max_interval
+            elif days_left <= self.deadline_window_days:
+                interval = self.min_interval
+            else:
+                # Come back no later than the day the deadline window opens
+                window_opens = datetime.combine(deadline_date - timedelta(days=self.deadline_window_days),
+                                                datetime.min.time())
+                interval = min(interval, max((window_opens - now).total_seconds(), self.min_interval))
+        return interval
+
+    def due(self, urls: Iterable[str], now: Optional[datetime] = None) -> Set[str]:
+        """Subset of `urls` to fetch now: new pages and pages whose revisit time has come."""
+        urls = [url for url in dict.fromkeys(urls) if url]
+        if not urls:
+            return set()
+        cutoff = (now or datetime.now()) + timedelta(seconds=DUE_SLACK_SEC)
+        hashes = {url_hash(url): url for url in urls}
+        not_due: Set[str] = set()
+        try:
+            conn, cursor = self._cursor()
+            try:
+                keys = list(hashes)
+                for offset in range(0, len(keys), LOOKUP_CHUNK_ROWS):
+                    chunk = keys[offset:offset + LOOKUP_CHUNK_ROWS]
+                    cursor.execute(
+                        f"SELECT url_hash FROM page_revisits WHERE url_hash IN ({', '.join(['%s'] * len(chunk))}) "
+                        f"AND next_due_at > %s",
+                        chunk + [cutoff]
+                    )
+                    not_due.update(hashes[row['url_hash']] for row in cursor.fetchall())
+                conn.commit()
+            finally:
+                cursor.close()
+        except Exception as e:
+            logger.warning(f"Revisit schedule unavailable, fetching every page: {e}")
+            return set(urls)
+        return set(urls) - not_due
+
+    def record_many(self, pages: Sequence[Tuple[str, str, Optional[str]]], now: Optional[datetime] = None) -> int:
+        """Record fetched pages and schedule their next fetch.
+
+        Parameters:
+            pages: (url, fingerprint of the parsed data, raw deadline or None).
+
+        Returns:
+            Number of pages whose fingerprint changed since their last fetch.
+        """
+        now = (now or datetime.now()).replace(microsecond=0)
+        latest: Dict[str, Tuple[str, str, Optional[str]]] = {url_hash(url): (url, fp, deadline)
+                                                              for url, fp, deadline in pages if url}
+        if not latest:
+            return 0
+        changed = 0
+        try:
+            conn, cursor = self._cursor()
+            try:
+                history = self._load(cursor, list(latest))
+                rows = []
+                for key, (url, fp, deadline) in latest.items():
+                    previous = history.get(key)
+                    page = self.advance(previous, fp, now)
+                    changed += previous is not None and page.last_changed_at == now
+                    interval = self.interval(page, deadline, now)
+                    rate = estimate_change_rate(page.fetches, page.changes,
+                                                (now - page.first_fetched_at).total_seconds())
+                    rows.append((key, url[:2048], fp, _deadline_date(deadline), page.fetches, page.changes,
+                                 rate * 86400 if rate is not None else None, page.first_fetched_at, now,
+                                 page.last_changed_at, now + timedelta(seconds=interval)))
+                cursor.executemany(REVISIT_UPSERT, rows)
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+            finally:
+                cursor.close()
+        except Exception as e:
+            logger.warning(f"Could not record page revisits: {e}")
+        return changed
+
+    @staticmethod
+    def _load(cursor, keys: List[str]) -> Dict[str, PageHistory]:
+        history: Dict[str, PageHistory] = {}
+        for offset in range(0, len(keys), LOOKUP_CHUNK_ROWS):
+            chunk = keys[offset:offset + LOOKUP_CHUNK_ROWS]
+            cursor.execute(
+                f"SELECT url_hash, fingerprint, fetches, changes, first_fetched_at, last_changed_at "
+                f"FROM page_revisits WHERE url_hash IN ({', '.join(['%s'] * len(chunk))})",
+                chunk
+            )
+            for row in cursor.fetchall():
+                history[row['url_hash']] = PageHistory(row['fingerprint'], row['fetches'], row['changes'],
+                                                       row['first_fetched_at'], row['last_changed_at'])
+        return history
+
+
+def _deadline_date(deadline: Optional[str]) -> Optional[date]:
+    parsed = parse_deadline(deadline) if isinstance(deadline, str) else None
+    if not parsed:
+        return None
+    try:
+        return datetime.strptime(parsed, '%Y-%m-%d').date()
+    except ValueError:
+        return None
@@ -0,0 +1,109 @@
+"""
+Columnar container for large batches of scholarships.
+
+Bulk scraping paths can hold tens of thousands of rows at once. Storing them
+column by column keeps one list per field instead of one object per row and
+lets the DB layer pull parameter tuples straight out of the columns.
+"""
+
+import logging
+from operator import attrgetter
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from .scholarship_types import Scholarship, SCHOLARSHIP_FIELDS
+
+logger = logging.getLogger(__name__)
+
+# Pull every field off a Scholarship in SCHOLARSHIP_FIELDS order in one C call
+scholarship_row = attrgetter(*SCHOLARSHIP_FIELDS)
+
+_FIELD_INDEX = {name: index for index, name in enumerate(SCHOLARSHIP_FIELDS)}
+
+
+class ScholarshipBatch:
+    """Append-only, column-oriented collection of scholarships.
+
+    Behaves like a read-only sequence of `Scholarship` objects (len, iteration,
+    indexing) so it can stand in for the lists scrapers pass around, but rows
+    are only materialized as objects when they are actually read that way.
+    """
+
+    __slots__ = ('_columns', '_length')
+
+    def __init__(self, scholarships: Optional[Iterable[Scholarship]] = None):
+        self._columns: Tuple[List[Any], ...] = tuple([] for _ in SCHOLARSHIP_FIELDS)
+        self._length = 0
+        if scholarships is not None:
+            self.extend(scholarships)
+
+    def append(self, scholarship: Scholarship):
+        """Add one scholarship to the batch."""
+        self.append_row(scholarship_row(scholarship))
+
+    def append_row(self, row: Sequence[Any]):
+        """Add one row given as values in `SCHOLARSHIP_FIELDS` order."""
+        if len(row) != len(self._columns):
+            raise ValueError(f"Expected {len(self._columns)} values, got {len(row)}")
+        for column, value in zip(self._columns, row):
+            column.append(value)
+        self._length += 1
+
+    def extend(self, scholarships: Iterable[Scholarship]):
+        """Add many scholarships to the batch."""
+        if isinstance(scholarships, ScholarshipBatch):
+            for column, other in zip(self._columns, scholarships._columns):
+                column.extend(other)
+            self._length += scholarships._length
+            return
+        for scholarship in scholarships:
+            self.append(scholarship)
+
+    def column(self, name: str) -> List[Any]:
+        """Return the underlying list for a field (do not mutate it)."""
+        return self._columns[_FIELD_INDEX[name]]
+
+    def columns(self) -> Dict[str, List[Any]]:
+        """Return all columns keyed by field name."""
+        return dict(zip(SCHOLARSHIP_FIELDS, self._columns))
+
+    def iter_rows(self) -> Iterator[Tuple[Any, ...]]:
+        """Yield each row as a tuple in `SCHOLARSHIP_FIELDS` order."""
+        return zip(*self._columns)
+
+    def to_param_tuples(self, columns: Sequence[str]) -> List[Tuple[Any, ...]]:
+        """Project the batch onto `columns` as DB parameter tuples.
+
+        Parameters:
+            columns: Field names in the order the SQL statement expects.
+
+        Returns:
+            One tuple per row, built directly from the column lists.
+        """
+        selected = [self._columns[_FIELD_INDEX[name]] for name in columns]
+        return list(zip(*selected))
+
+    def clear(self):
+        """Drop every row while keeping the batch reusable."""
+        for column in self._columns:
+            column.clear()
+        self._length = 0
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __bool__(self) -> bool:
+        return self._length > 0
+
+    def __getitem__(self, index: int) -> Scholarship:
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError('ScholarshipBatch index out of range')
+        return Scholarship(*(column[index] for column in self._columns))
+
+    def __iter__(self) -> Iterator[Scholarship]:
+        for row in self.iter_rows():
+            yield Scholarship(*row)
+
+    def __repr__(self) -> str:
+        return f"ScholarshipBatch(rows={self._length})"
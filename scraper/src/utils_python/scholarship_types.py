@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 from enum import Enum
@@ -17,9 +17,12 @@ class AcademicLevel(str, Enum):
     BOTH = "both"
 
 
-@dataclass
+@dataclass(slots=True)
 class Scholarship:
-    """Python equivalent of the TypeScript Scholarship interface"""
+    """Python equivalent of the TypeScript Scholarship interface.
+
+    Slotted so that large scrape runs do not pay for a per-instance __dict__.
+    """
     scholarship_id: Optional[int] = None
     title: str = ""
     description: Optional[str] = None
@@ -50,7 +53,8 @@ class Scholarship:
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for database storage"""
         result = {}
-        for field, value in self.__dict__.items():
+        for field in SCHOLARSHIP_FIELDS:
+            value = getattr(self, field)
             if value is not None:
                 if isinstance(value, datetime):
                     result[field] = value.isoformat()
@@ -70,9 +74,20 @@ class Scholarship:
         return cls(**data)
 
 
+# Column order shared by the columnar batch container and the DB layer
+SCHOLARSHIP_FIELDS = tuple(f.name for f in fields(Scholarship))
+
+
 @dataclass
 class ScrapingResult:
-    """Result of a scraping operation"""
+    """Result of a scraping operation
+
+    Streaming scrapers return no rows in `scholarships`; `metadata['total_found']`
+    counts them. `total_inserted` from a bare `scrape()` counts rows queued for
+    the write-behind writer; `BaseScraper.run` replaces it with the rows the
+    database took once the writer is flushed, and adds `total_journaled` and
+    `total_dead_lettered`.
+    """
     success: bool
     scholarships: List[Scholarship]
     errors: List[str]
@@ -0,0 +1,421 @@
+"""
+Durable work queue in MySQL for detail-page work shared across nodes.
+
+Listing scrapers enqueue one task per detail URL; any number of
+`main.py --worker` processes claim batches with `SELECT ... FOR UPDATE SKIP
+LOCKED`, so workers never block on or double-claim each other's rows.
+
+A claim is a lease: the row turns 'leased' and becomes claimable again at
+`available_at` (the visibility timeout) unless the worker completes or fails
+it first, so tasks held by a crashed worker are picked up by another one.
+`LeaseKeeper` renews the leases of a batch while a live worker works on it.
+Failed tasks are retried with exponential backoff until `max_attempts`, then
+kept as 'failed' with their last error. Enqueueing a URL that is already
+queued is a no-op; a done or failed one is reset to pending for the new run.
+
+`scrape_host_slots` keeps the next free request slot per host on the DB
+clock, which spaces requests to a host across every worker on every node.
+"""
+
+import os
+import json
+import time
+import hashlib
+import logging
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+DEFAULT_LEASE_SEC = 300.0
+DEFAULT_MAX_ATTEMPTS = 5
+DEFAULT_RETRY_DELAY_SEC = 60.0
+DEFAULT_CLAIM_BATCH = 10
+# Leases are renewed this many times per lease period while a worker holds them
+LEASE_RENEWALS_PER_PERIOD = 3
+ENQUEUE_CHUNK_ROWS = 500
+
+# Set to any non-empty value to have listing scrapers queue their detail pages for workers
+TASK_QUEUE_ENV = 'SCRAPER_TASK_QUEUE'
+
+TASK_TABLE_DDL = """
+    CREATE TABLE IF NOT EXISTS scrape_tasks (
+        task_id BIGINT AUTO_INCREMENT PRIMARY KEY,
+        kind VARCHAR(100) NOT NULL,
+        url VARCHAR(2048) NOT NULL,
+        url_hash CHAR(40) NOT NULL,
+        payload JSON,
+        job_id VARCHAR(100),
+        status ENUM('pending', 'leased', 'done', 'failed') NOT NULL DEFAULT 'pending',
+        attempts INT NOT NULL DEFAULT 0,
+        max_attempts INT NOT NULL DEFAULT 5,
+        available_at DATETIME(3) NOT NULL DEFAULT CURRENT_TIMESTAMP(3),
+        leased_by VARCHAR(255),
+        last_error TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+
+        UNIQUE KEY uq_kind_url (kind, url_hash),
+        INDEX idx_claim (status, available_at)
+    ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+"""
+
+HOST_SLOT_TABLE_DDL = """
+    CREATE TABLE IF NOT EXISTS scrape_host_slots (
+        host VARCHAR(255) PRIMARY KEY,
+        next_slot_at DATETIME(3) NOT NULL
+    ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+"""
+
+# A done or failed task is queued again for the new run; a pending or leased one is left alone.
+# Assignments apply left to right, so status is reset last.
+TASK_ENQUEUE = """
+    INSERT INTO scrape_tasks (kind, url, url_hash, payload, job_id, max_attempts)
+    VALUES (%s, %s, %s, %s, %s, %s)
+    ON DUPLICATE KEY UPDATE
+        payload = IF(status IN ('done', 'failed'), VALUES(payload), payload),
+        job_id = IF(status IN ('done', 'failed'), VALUES(job_id), job_id),
+        max_attempts = IF(status IN ('done', 'failed'), VALUES(max_attempts), max_attempts),
+        attempts = IF(status IN ('done', 'failed'), 0, attempts),
+        last_error = IF(status IN ('done', 'failed'), NULL, last_error),
+        available_at = IF(status IN ('done', 'failed'), CURRENT_TIMESTAMP(3), available_at),
+        status = IF(status IN ('done', 'failed'), 'pending', status)
+"""
+
+# Leases that expired on their last attempt will never be claimed again
+TASK_EXPIRE = """
+    UPDATE scrape_tasks SET status = 'failed', leased_by = NULL,
+        last_error = COALESCE(last_error, 'lease expired on the last attempt')
+    WHERE status = 'leased' AND available_at <= CURRENT_TIMESTAMP(3) AND attempts >= max_attempts
+"""
+
+# Pending tasks and expired leases, oldest first; rows locked by other claims are skipped
+TASK_CLAIM = """
+    SELECT task_id, kind, url, payload, job_id, attempts, max_attempts
+    FROM scrape_tasks
+    WHERE status IN ('pending', 'leased') AND available_at <= CURRENT_TIMESTAMP(3)
+        AND attempts < max_attempts{kind_filter}
+    ORDER BY available_at
+    LIMIT %s
+    FOR UPDATE SKIP LOCKED
+"""
+
+# Backoff doubles per attempt (capped at 2^10 x the base delay)
+TASK_FAIL = """
+    UPDATE scrape_tasks SET
+        last_error = %s,
+        leased_by = NULL,
+        available_at = CURRENT_TIMESTAMP(3)
+            + INTERVAL ROUND(%s * POW(2, LEAST(GREATEST(attempts, 1), 11) - 1)) MICROSECOND,
+        status = IF(attempts >= max_attempts, 'failed', 'pending')
+    WHERE task_id = %s AND leased_by = %s AND status = 'leased'
+"""
+
+HOST_SLOT_RESERVE = """
+    INSERT INTO scrape_host_slots (host, next_slot_at)
+    VALUES (%s, CURRENT_TIMESTAMP(3) + INTERVAL %s MICROSECOND)
+    ON DUPLICATE KEY UPDATE
+        next_slot_at = GREATEST(next_slot_at, CURRENT_TIMESTAMP(3)) + INTERVAL %s MICROSECOND
+"""
+
+logger = logging.getLogger(__name__)
+
+
+def task_queue_enabled() -> bool:
+    """Whether scrapers should queue detail pages for workers (SCRAPER_TASK_QUEUE)."""
+    return bool(os.getenv(TASK_QUEUE_ENV, '').strip())
+
+
+def url_hash(url: str) -> str:
+    """Fixed-width key for the unique (kind, url) index; URLs outgrow index prefixes."""
+    return hashlib.sha1(url.encode('utf-8')).hexdigest()
+
+
+def _microseconds(seconds: float) -> int:
+    return max(int(round(seconds * 1_000_000)), 0)
+
+
+@dataclass
+class Task:
+    """A claimed unit of work."""
+    task_id: int
+    kind: str
+    url: str
+    payload: Dict[str, Any] = field(default_factory=dict)
+    job_id: Optional[str] = None
+    attempts: int = 0
+    max_attempts: int = DEFAULT_MAX_ATTEMPTS
+
+
+class TaskQueue:
+    """Enqueue, claim, complete and retry tasks stored in `scrape_tasks`.
+
+    Every method runs on the given manager's connection and commits its own
+    transaction; use one `TaskQueue` (and manager) per thread.
+
+    Parameters:
+        db_manager: Database manager whose connection holds the queue tables.
+        lease_sec: Visibility timeout of a claim.
+        retry_delay: Base delay before a failed task is retried.
+    """
+
+    def __init__(self, db_manager, lease_sec: float = DEFAULT_LEASE_SEC,
+                 retry_delay: float = DEFAULT_RETRY_DELAY_SEC):
+        self.db_manager = db_manager
+        self.lease_sec = lease_sec
+        self.retry_delay = retry_delay
+
+    def _connection(self):
+        conn = self.db_manager.get_connection()
+        if not conn:
+            raise ConnectionError(f"No database connection for the task queue ({self.db_manager.environment} DB)")
+        return conn
+
+    def _execute(self, statements: Sequence[Tuple[str, Any]], many: bool = False) -> int:
+        """Run statements in one transaction; returns the affected row count."""
+        conn = self._connection()
+        cursor = conn.cursor()
+        affected = 0
+        try:
+            for query, params in statements:
+                if many:
+                    affected += cursor.executemany(query, params) or 0
+                else:
+                    affected += cursor.execute(query, params) or 0
+            conn.commit()
+            return affected
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            cursor.close()
+
+    def ensure_tables(self):
+        """Create the queue tables if they do not exist yet."""
+        self._execute([(TASK_TABLE_DDL, None), (HOST_SLOT_TABLE_DDL, None)])
+
+    def enqueue(self, kind: str, items: Iterable[Tuple[str, Optional[Dict[str, Any]]]],
+                job_id: Optional[str] = None, max_attempts: int = DEFAULT_MAX_ATTEMPTS) -> int:
+        """Queue (url, payload) pairs as tasks of `kind`.
+
+        Returns:
+            Number of tasks sent (URLs already pending or leased are left as they are).
+        """
+        rows = [(kind, url, url_hash(url), json.dumps(payload or {}, default=str), job_id, max_attempts)
+                for url, payload in items if url]
+        for offset in range(0, len(rows), ENQUEUE_CHUNK_ROWS):
+            self._execute([(TASK_ENQUEUE, rows[offset:offset + ENQUEUE_CHUNK_ROWS])], many=True)
+        if rows:
+            logger.info(f"Queued {len(rows)} {kind} tasks")
+        return len(rows)
+
+    def claim(self, worker_id: str, limit: int = DEFAULT_CLAIM_BATCH,
+              kinds: Optional[Sequence[str]] = None) -> List[Task]:
+        """Lease up to `limit` available tasks for `worker_id`.
+
+        Each claim counts as an attempt. The lease lasts `lease_sec`; after
+        that the task is visible to other workers again.
+        """
+        kind_filter, params = '', []
+        if kinds:
+            kind_filter = f" AND kind IN ({', '.join(['%s'] * len(kinds))})"
+            params.extend(kinds)
+        params.append(limit)
+
+        conn = self._connection()
+        cursor = conn.cursor()
+        try:
+            cursor.execute(TASK_EXPIRE)
+            conn.commit()
+            cursor.execute(TASK_CLAIM.format(kind_filter=kind_filter), params)
+            rows = cursor.fetchall()
+            if rows:
+                placeholders = ', '.join(['%s'] * len(rows))
+                cursor.execute(
+                    f"UPDATE scrape_tasks SET status = 'leased', leased_by = %s, attempts = attempts + 1, "
+                    f"available_at = CURRENT_TIMESTAMP(3) + INTERVAL %s MICROSECOND "
+                    f"WHERE task_id IN ({placeholders})",
+                    [worker_id, _microseconds(self.lease_sec)] + [row['task_id'] for row in rows]
+                )
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            cursor.close()
+
+        tasks = []
+        for row in rows:
+            payload = row['payload']
+            if isinstance(payload, (str, bytes)):
+                payload = json.loads(payload) if payload else {}
+            tasks.append(Task(task_id=row['task_id'], kind=row['kind'], url=row['url'],
+                              payload=payload or {}, job_id=row['job_id'],
+                              attempts=row['attempts'] + 1, max_attempts=row['max_attempts']))
+        return tasks
+
+    def complete(self, task_ids: Sequence[int], worker_id: str) -> int:
+        """Mark tasks done; tasks whose lease passed to another worker are left alone.
+
+        Returns:
+            Number of tasks marked done.
+        """
+        if not task_ids:
+            return 0
+        placeholders = ', '.join(['%s'] * len(task_ids))
+        return self._execute([(
+            f"UPDATE scrape_tasks SET status = 'done', leased_by = NULL, last_error = NULL "
+            f"WHERE task_id IN ({placeholders}) AND leased_by = %s AND status = 'leased'",
+            list(task_ids) + [worker_id]
+        )])
+
+    def fail(self, task: Task, error: str, worker_id: str) -> bool:
+        """Record a failed attempt: retry later with backoff, or give up after max_attempts.
+
+        Returns:
+            True if the task is still leased by `worker_id` and was updated.
+        """
+        return bool(self._execute([(
+            TASK_FAIL, (error[:2000], _microseconds(self.retry_delay), task.task_id, worker_id)
+        )]))
+
+    def release(self, tasks: Sequence[Task], worker_id: str) -> int:
+        """Hand unstarted tasks back to the queue without counting an attempt."""
+        if not tasks:
+            return 0
+        placeholders = ', '.join(['%s'] * len(tasks))
+        return self._execute([(
+            f"UPDATE scrape_tasks SET status = 'pending', leased_by = NULL, "
+            f"attempts = GREATEST(attempts - 1, 0), available_at = CURRENT_TIMESTAMP(3) "
+            f"WHERE task_id IN ({placeholders}) AND leased_by = %s AND status = 'leased'",
+            [task.task_id for task in tasks] + [worker_id]
+        )])
+
+    def extend_lease(self, task: Task, worker_id: str, lease_sec: Optional[float] = None) -> bool:
+        """Push back the visibility timeout of a task that is taking long."""
+        return bool(self._execute([(
+            "UPDATE scrape_tasks SET available_at = CURRENT_TIMESTAMP(3) + INTERVAL %s MICROSECOND "
+            "WHERE task_id = %s AND leased_by = %s AND status = 'leased'",
+            (_microseconds(lease_sec if lease_sec is not None else self.lease_sec), task.task_id, worker_id)
+        )]))
+
+    def counts(self) -> Dict[str, int]:
+        """Number of tasks per status."""
+        conn = self._connection()
+        cursor = conn.cursor()
+        try:
+            cursor.execute("SELECT status, COUNT(*) AS n FROM scrape_tasks GROUP BY status")
+            counts = {row['status']: int(row['n']) for row in cursor.fetchall()}
+            conn.commit()
+            return counts
+        finally:
+            cursor.close()
+
+    def reserve_host_slot(self, host: str, min_interval: float) -> float:
+        """Claim the next request slot for `host`, shared by every worker.
+
+        Slots are kept on the database clock, so nodes with skewed clocks
+        still space their requests `min_interval` apart.
+
+        Returns:
+            Seconds to wait before sending the request.
+        """
+        interval = _microseconds(min_interval)
+        conn = self._connection()
+        cursor = conn.cursor()
+        try:
+            cursor.execute(HOST_SLOT_RESERVE, (host, interval, interval))
+            cursor.execute(
+                "SELECT next_slot_at, CURRENT_TIMESTAMP(3) AS now FROM scrape_host_slots WHERE host = %s",
+                (host,)
+            )
+            row = cursor.fetchone()
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            cursor.close()
+        delay = (row['next_slot_at'] - row['now']).total_seconds() - min_interval
+        return max(delay, 0.0)
+
+
+class LeaseKeeper:
+    """Renew the leases of a claimed batch from a background thread.
+
+    A batch is leased at claim time and acknowledged only after its last
+    task, so both the task in progress and the ones waiting their turn are
+    renewed every `lease_sec / LEASE_RENEWALS_PER_PERIOD` seconds. A task
+    whose renewal is refused now belongs to another worker; when renewals
+    keep failing for a whole lease period, every task is treated as lost.
+    Check `holds` before doing or saving a task's work.
+
+    The thread runs on the given queue's connection, which must not be
+    shared with the worker thread.
+
+    Parameters:
+        queue: Task queue on a connection of its own.
+        worker_id: Lease owner name.
+        tasks: Tasks claimed by `worker_id`.
+    """
+
+    def __init__(self, queue: TaskQueue, worker_id: str, tasks: Sequence[Task]):
+        self.queue = queue
+        self.worker_id = worker_id
+        self.interval = queue.lease_sec / LEASE_RENEWALS_PER_PERIOD
+        self._held = {task.task_id: task for task in tasks}
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._renewed_at = time.monotonic()
+        self._thread: Optional[threading.Thread] = None
+
+    def __enter__(self) -> 'LeaseKeeper':
+        if self._held:
+            self._thread = threading.Thread(target=self._run, name=f"lease-keeper-{self.worker_id}", daemon=True)
+            self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def holds(self, task: Task) -> bool:
+        """Whether the lease on `task` is still ours."""
+        with self._lock:
+            return task.task_id in self._held
+
+    def drop(self, tasks: Sequence[Task]):
+        """Stop renewing tasks that were failed or released."""
+        with self._lock:
+            for task in tasks:
+                self._held.pop(task.task_id, None)
+
+    def renew(self):
+        """Extend every held lease once; forget the ones another worker took over."""
+        with self._lock:
+            tasks = list(self._held.values())
+        failed = False
+        for task in tasks:
+            try:
+                renewed = self.queue.extend_lease(task, self.worker_id)
+            except Exception as e:
+                logger.warning(f"Could not renew the lease on task {task.task_id}: {e}")
+                failed = True
+                continue
+            if not renewed:
+                logger.warning(f"Lost the lease on task {task.task_id} ({task.url}) to another worker")
+                self.drop([task])
+        if not failed:
+            self._renewed_at = time.monotonic()
+        elif time.monotonic() - self._renewed_at >= self.queue.lease_sec:
+            logger.error(f"Leases of worker {self.worker_id} not renewed for {self.queue.lease_sec:.0f}s, "
+                         f"giving up {len(self._held)} tasks")
+            with self._lock:
+                self._held.clear()
+
+    def _run(self):
+        while not self._stopped.wait(self.interval):
+            with self._lock:
+                if not self._held:
+                    return
+            self.renew()
@@ -0,0 +1,387 @@
+"""
+Write-behind persistence for scraped scholarships.
+
+Scrapers used to upsert every scholarship synchronously from their main loop,
+behind a tenacity retry with 4-10 s waits, so a slow or briefly unavailable
+database stalled the whole scrape. `WriteBehindWriter` takes rows from the
+scraper through an in-memory queue and a background thread upserts them with
+`DatabaseManager.save_scholarships`, one batch per `batch_size` rows or
+`flush_interval` seconds, whichever comes first.
+
+When the database is unavailable (connection and operational errors) the
+rows are appended to a local JSONL journal (fsynced) instead of being retried
+in the scraper's thread, and the writer keeps journaling until
+`retry_interval` has passed. Journaled rows are replayed, oldest first, before
+the next batch once the database is back and when a writer starts, so rows
+spilled by a previous run are written on the next one. Upserts are keyed on
+(title, organization, deadline), so replaying a row that did reach the
+database is harmless.
+
+When the database rejects rows (pymysql `IntegrityError`/`DataError`: data
+too long, constraint errors) the batch is split in halves down to single
+rows, and the rows it still rejects go to a dead-letter file and the log, so
+they never hold up the journal. Any other error is a bug rather than bad
+data: it is logged with its traceback and the rows are journaled like in an
+outage, so nothing is lost while it is fixed.
+
+Each writer journals to its own file, `<journal>.<name>.<pid>.jsonl`, so
+writers in other threads and processes never rewrite each other's lines. A
+starting writer adopts the journals of processes that are no longer running.
+"""
+
+import os
+import glob
+import json
+import time
+import queue
+import logging
+import threading
+from datetime import datetime
+from typing import Iterable, List, Optional, Tuple
+
+from .scholarship_types import Scholarship
+from .scholarship_batch import ScholarshipBatch
+
+DEFAULT_WRITE_JOURNAL_PATH = os.path.join('local_data', 'scholarship_journal.jsonl')
+DEFAULT_DEAD_LETTER_PATH = os.path.join('local_data', 'scholarship_dead_letter.jsonl')
+DEFAULT_WRITE_BATCH_SIZE = 200
+DEFAULT_FLUSH_INTERVAL_SEC = 2.0
+DEFAULT_RETRY_INTERVAL_SEC = 30.0
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+def is_transient_db_error(error: Exception) -> bool:
+    """Whether an error means the database is unavailable, rather than a row was rejected."""
+    if isinstance(error, (ConnectionError, TimeoutError)):
+        return True
+    try:
+        import pymysql
+    except ImportError:
+        return False
+    return isinstance(error, (pymysql.err.OperationalError, pymysql.err.InterfaceError))
+
+
+def is_rejected_row_error(error: Exception) -> bool:
+    """Whether the database refused the rows themselves (constraint or data errors)."""
+    try:
+        import pymysql
+    except ImportError:
+        return False
+    return isinstance(error, (pymysql.err.IntegrityError, pymysql.err.DataError))
+
+
+def _pid_running(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class WriteBehindWriter:
+    """Queue scholarships for a background thread that upserts them in batches.
+
+    The writer owns `db_manager`: pymysql connections are not thread-safe, so
+    give it a manager no other thread uses. `name` tells apart the journals of
+    writers in one process (e.g. one per scraper in the daemon).
+    """
+
+    def __init__(self, db_manager, journal_path: Optional[str] = DEFAULT_WRITE_JOURNAL_PATH,
+                 batch_size: int = DEFAULT_WRITE_BATCH_SIZE,
+                 flush_interval: float = DEFAULT_FLUSH_INTERVAL_SEC,
+                 retry_interval: float = DEFAULT_RETRY_INTERVAL_SEC,
+                 name: str = 'writer',
+                 dead_letter_path: Optional[str] = DEFAULT_DEAD_LETTER_PATH):
+        self.db_manager = db_manager
+        self.journal_base = journal_path
+        self.journal_path = None
+        if journal_path:
+            stem = journal_path[:-len('.jsonl')] if journal_path.endswith('.jsonl') else journal_path
+            self.journal_path = f"{stem}.{name}.{os.getpid()}.jsonl"
+        self.dead_letter_path = dead_letter_path
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.retry_interval = retry_interval
+        self.written = 0
+        self.journaled = 0
+        self.replayed = 0
+        self.dead_lettered = 0
+        self._queue: queue.Queue = queue.Queue()
+        self._retry_at = 0.0
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        self._closed = False
+
+    def start(self):
+        """Start the writer thread (it replays any journal left by a previous run first)."""
+        with self._start_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='scholarship-writer', daemon=True)
+                self._thread.start()
+
+    def enqueue(self, scholarship: Scholarship):
+        """Hand a scholarship to the writer without waiting for the database.
+
+        Raises:
+            TypeError: `scholarship` is not a `Scholarship`; it would only fail
+                later, in the writer thread.
+        """
+        if not isinstance(scholarship, Scholarship):
+            raise TypeError(f"WriteBehindWriter takes Scholarship objects, not {type(scholarship).__name__}")
+        if self._closed:
+            raise RuntimeError('WriteBehindWriter is closed')
+        self.start()
+        self._queue.put(scholarship)
+
+    def enqueue_many(self, scholarships: Iterable[Scholarship]) -> int:
+        """Queue every scholarship; returns how many were queued."""
+        count = 0
+        for scholarship in scholarships:
+            self.enqueue(scholarship)
+            count += 1
+        return count
+
+    def flush(self):
+        """Block until every queued scholarship is written or journaled."""
+        if self._thread is not None:
+            self._queue.join()
+
+    def close(self):
+        """Drain the queue, stop the writer thread and release its DB connection."""
+        if self._closed:
+            return
+        self._closed = True
+        if self._thread is not None:
+            self._queue.put(_STOP)
+            self._thread.join()
+        try:
+            self.db_manager.disconnect()
+        except Exception as e:
+            logger.warning(f"Error closing writer DB connection: {e}")
+        logger.info(f"Write-behind writer closed: {self.written} written, {self.replayed} replayed "
+                     f"from journal, {self.journaled} journaled, {self.dead_lettered} dead-lettered")
+
+    @property
+    def pending_journal(self) -> bool:
+        """Whether rows are waiting in the journal for the database."""
+        return bool(self.journal_path) and os.path.exists(self.journal_path) and os.path.getsize(self.journal_path) > 0
+
+    def _run(self):
+        try:
+            self._adopt_orphaned_journals()
+            self._write_journal()
+        except Exception as e:
+            logger.error(f"Could not replay write journal: {e}")
+        stopping = False
+        while not stopping:
+            batch, stopping = self._collect()
+            try:
+                if batch:
+                    self._write(batch)
+                elif self.pending_journal:
+                    self._write_journal()
+            except Exception as e:
+                logger.error(f"Write-behind writer error: {e}")
+            finally:
+                for _ in range(len(batch)):
+                    self._queue.task_done()
+        self._queue.task_done()  # the stop marker
+
+    def _collect(self):
+        """Take up to `batch_size` rows, waiting at most `flush_interval` after the first.
+
+        Returns:
+            (rows, stop requested)
+        """
+        batch: List[Scholarship] = []
+        try:
+            item = self._queue.get(timeout=self.flush_interval)
+        except queue.Empty:
+            return batch, False
+        if item is _STOP:
+            return batch, True
+        batch.append(item)
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            try:
+                item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is _STOP:
+                self._queue.task_done()
+                self._queue.put(_STOP)  # finish this batch, then stop
+                break
+            batch.append(item)
+        return batch, False
+
+    def _save(self, scholarships: List[Scholarship]):
+        """Upsert rows, raising if the database did not take all of them."""
+        written = self.db_manager.save_scholarships(ScholarshipBatch(scholarships))
+        if written < len(scholarships):
+            raise ConnectionError('database unavailable')
+
+    def _save_rows(self, scholarships: List[Scholarship]) -> Tuple[int, List[Scholarship], Optional[Exception]]:
+        """Upsert rows, isolating rows the database rejects.
+
+        A batch the database rejects is split in halves until the rejected
+        rows are alone; those are dead-lettered and the rest written. Any other
+        error stops the writes.
+
+        Returns:
+            (rows written, rows left unwritten, in order, the error that
+            stopped the writes)
+        """
+        saved = 0
+        pending = [scholarships]  # stack, next part last
+        while pending:
+            part = pending.pop()
+            try:
+                self._save(part)
+                saved += len(part)
+            except Exception as e:
+                if not is_rejected_row_error(e):
+                    return saved, part + [row for rest in reversed(pending) for row in rest], e
+                if len(part) == 1:
+                    self._dead_letter(part[0], e)
+                else:
+                    middle = len(part) // 2
+                    pending.append(part[middle:])
+                    pending.append(part[:middle])
+        return saved, [], None
+
+    def _dead_letter(self, scholarship: Scholarship, error: Exception):
+        """Set aside a row the database rejects so it does not block later writes."""
+        self.dead_lettered += 1
+        logger.error(f"Database rejected scholarship {scholarship.title!r} ({scholarship.organization!r}), "
+                     f"moved to dead-letter file: {error}")
+        if not self.dead_letter_path:
+            return
+        directory = os.path.dirname(self.dead_letter_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        entry = {'failed_at': datetime.now().isoformat(), 'error': str(error), 'scholarship': scholarship.to_dict()}
+        # One O_APPEND write per line, so concurrent writers do not interleave
+        with open(self.dead_letter_path, 'a', encoding='utf-8') as handle:
+            handle.write(json.dumps(entry, default=str) + '\n')
+
+    def _write(self, batch: List[Scholarship]):
+        if not self._write_journal():
+            self._append_journal(batch)
+            return
+        saved, unwritten, error = self._save_rows(batch)
+        self.written += saved
+        if unwritten:
+            self._log_unwritten(f"Could not write {len(unwritten)} scholarships, journaling them", error)
+            self._retry_at = time.monotonic() + self.retry_interval
+            self._append_journal(unwritten)
+
+    @staticmethod
+    def _log_unwritten(message: str, error: Exception):
+        if is_transient_db_error(error):
+            logger.warning(f"{message}: {error}")
+        else:
+            logger.error(f"{message}: unexpected {type(error).__name__}: {error}", exc_info=error)
+
+    def _append_journal(self, batch: List[Scholarship]):
+        self._append_journal_lines([json.dumps(scholarship.to_dict()) + '\n' for scholarship in batch])
+        self.journaled += len(batch)
+
+    def _append_journal_lines(self, lines: List[str]):
+        if not self.journal_path:
+            logger.error(f"No write journal configured, dropping {len(lines)} scholarships")
+            return
+        directory = os.path.dirname(self.journal_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.journal_path, 'a', encoding='utf-8') as handle:
+            handle.writelines(lines)
+            handle.flush()
+            os.fsync(handle.fileno())
+
+    def _adopt_orphaned_journals(self):
+        """Move journals left by processes that are no longer running into this writer's journal.
+
+        The file is renamed first, so only one adopting writer gets it; a
+        crash after the rename leaves it under this process's pid for the
+        next run to adopt.
+        """
+        if not self.journal_path:
+            return
+        stem = self.journal_base[:-len('.jsonl')] if self.journal_base.endswith('.jsonl') else self.journal_base
+        candidates = glob.glob(f"{glob.escape(stem)}.*.jsonl")
+        if os.path.exists(self.journal_base):
+            candidates.append(self.journal_base)  # single shared journal of older versions
+        for path in candidates:
+            if path == self.journal_path:
+                continue
+            if path != self.journal_base:
+                pid = path[:-len('.jsonl')].rsplit('.', 1)[-1]
+                if not pid.isdigit() or _pid_running(int(pid)):
+                    continue
+            claimed = f"{stem}.adopted-{os.path.basename(path)[:-len('.jsonl')].replace('.', '-')}.{os.getpid()}.jsonl"
+            try:
+                os.rename(path, claimed)
+            except FileNotFoundError:
+                continue  # another writer adopted it first
+            with open(claimed, 'r', encoding='utf-8') as handle:
+                lines = [line if line.endswith('\n') else line + '\n' for line in handle]
+            self._append_journal_lines(lines)
+            os.remove(claimed)
+            logger.info(f"Adopted {len(lines)} journaled scholarships from {path}")
+
+    def _write_journal(self) -> bool:
+        """Replay journaled rows in order, keeping whatever could not be written.
+
+        Returns:
+            True if the journal is now empty.
+        """
+        if not self.pending_journal:
+            return True
+        if time.monotonic() < self._retry_at:
+            return False
+        replayed = 0
+        with open(self.journal_path, 'r', encoding='utf-8') as handle:
+            while True:
+                lines = [line for line in (handle.readline() for _ in range(self.batch_size)) if line]
+                if not lines:
+                    break
+                scholarships = []
+                for line in lines:
+                    try:
+                        scholarships.append(Scholarship.from_dict(json.loads(line)))
+                    except (ValueError, TypeError):
+                        # A line cut short by a crash mid-append
+                        logger.warning('Skipping unreadable write journal line')
+                saved, unwritten, error = self._save_rows(scholarships)
+                replayed += saved
+                self.replayed += saved
+                if unwritten:
+                    self._keep_journal_tail(handle, [json.dumps(s.to_dict()) + '\n' for s in unwritten], error)
+                    return False
+        os.remove(self.journal_path)
+        if replayed:
+            logger.info(f"Replayed {replayed} journaled scholarships")
+        return True
+
+    def _keep_journal_tail(self, handle, lines: List[str], error: Exception):
+        """Rewrite the journal with the unwritten lines and retry later.
+
+        Only this writer's thread appends to its journal, so nothing can be
+        appended between reading the tail and replacing the file.
+        """
+        self._log_unwritten(f"Could not replay write journal, retrying in {self.retry_interval:.0f}s", error)
+        self._retry_at = time.monotonic() + self.retry_interval
+        temp_path = f"{self.journal_path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as out:
+            out.writelines(lines)
+            for line in handle:
+                out.write(line)
+            out.flush()
+            os.fsync(out.fileno())
+        os.replace(temp_path, self.journal_path)